@@ -0,0 +1,39 @@
+"""Add composite indexes matching list endpoint sort keys.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17
+
+Cursor pagination seeks on (organization_id, <ORDER BY keys>, id); with
+these indexes a page is an index range scan whatever its depth.
+"""
+
+from alembic import op
+
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+KEYSET_INDEXES = (
+    ("ix_processes_org_list_order", "processes",
+     ["organization_id", "level", "sort_order", "code", "id"]),
+    ("ix_riada_items_org_created", "riada_items",
+     ["organization_id", "created_at", "id"]),
+    ("ix_portfolio_items_org_sort", "portfolio_items",
+     ["organization_id", "sort_order", "id"]),
+    ("ix_reference_catalogues_org_list_order", "reference_catalogues",
+     ["organization_id", "catalogue_type", "sort_order", "name", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,59 @@
+"""Add full-text and trigram search indexes.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17
+
+- Generated, weighted search_vector tsvector columns (code/name weight A,
+  description weight B) on processes, riada_items and reference_catalogues,
+  each with a GIN index.
+- pg_trgm GIN indexes on the columns the list endpoints filter with ILIKE,
+  so substring and fuzzy (word_similarity) matches use an index too.
+"""
+
+from alembic import op
+
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+# (table, title column, ILIKE/trigram columns)
+SEARCH_TABLES = (
+    ("processes", "name", ("name", "description", "code")),
+    ("riada_items", "title", ("title", "description", "code")),
+    ("reference_catalogues", "name", ("name", "description", "code")),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, title, trigram_columns in SEARCH_TABLES:
+        op.execute(f"""
+            ALTER TABLE {table} ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english'::regconfig, coalesce(code, '')), 'A') ||
+                setweight(to_tsvector('english'::regconfig, coalesce({title}, '')), 'A') ||
+                setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')
+            ) STORED
+        """)
+        op.create_index(
+            f"ix_{table}_search_vector", table, ["search_vector"],
+            postgresql_using="gin",
+        )
+        for column in trigram_columns:
+            op.create_index(
+                f"ix_{table}_{column}_trgm", table, [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade() -> None:
+    for table, _, trigram_columns in reversed(SEARCH_TABLES):
+        for column in trigram_columns:
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,86 @@
+"""Add prompt batch jobs.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17
+
+A prompt_batch_jobs row records a template fanned out over a set of
+processes: the target list, progress counters and a heartbeat. Each
+completed call is a prompt_executions row linked by batch_job_id, which
+doubles as the checkpoint a resumed job skips past.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+# Same tenant check as every other tenant table (migration 002)
+_TENANT_CHECK = "organization_id = current_setting('app.current_organization_id', true)::uuid"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "prompt_batch_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=False),
+                  sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("template_id", postgresql.UUID(as_uuid=False),
+                  sa.ForeignKey("prompt_templates.id"), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="running"),
+        sa.Column("target_ids", postgresql.JSONB, nullable=False),
+        sa.Column("total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("completed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("temperature", sa.Numeric(3, 2)),
+        sa.Column("max_tokens", sa.Integer),
+        sa.Column("error_message", sa.Text),
+        sa.Column("started_at", sa.DateTime(timezone=True)),
+        sa.Column("finished_at", sa.DateTime(timezone=True)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_prompt_batch_jobs_org_created", "prompt_batch_jobs",
+                    ["organization_id", "created_at"])
+
+    op.execute("ALTER TABLE prompt_batch_jobs ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE prompt_batch_jobs FORCE ROW LEVEL SECURITY")
+    op.execute(f"""
+        CREATE POLICY prompt_batch_jobs_select_policy ON prompt_batch_jobs
+        FOR SELECT USING ({_TENANT_CHECK})
+    """)
+    op.execute(f"""
+        CREATE POLICY prompt_batch_jobs_insert_policy ON prompt_batch_jobs
+        FOR INSERT WITH CHECK ({_TENANT_CHECK})
+    """)
+    op.execute(f"""
+        CREATE POLICY prompt_batch_jobs_update_policy ON prompt_batch_jobs
+        FOR UPDATE USING ({_TENANT_CHECK}) WITH CHECK ({_TENANT_CHECK})
+    """)
+    op.execute(f"""
+        CREATE POLICY prompt_batch_jobs_delete_policy ON prompt_batch_jobs
+        FOR DELETE USING ({_TENANT_CHECK})
+    """)
+
+    op.add_column(
+        "prompt_executions",
+        sa.Column("batch_job_id", postgresql.UUID(as_uuid=False),
+                  sa.ForeignKey("prompt_batch_jobs.id", ondelete="CASCADE")),
+    )
+    op.create_index("ix_prompt_executions_batch_target", "prompt_executions",
+                    ["batch_job_id", "target_entity_id"],
+                    postgresql_where=sa.text("batch_job_id IS NOT NULL"))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_prompt_executions_batch_target", table_name="prompt_executions")
+    op.drop_column("prompt_executions", "batch_job_id")
+    for action in ("select", "insert", "update", "delete"):
+        op.execute(f"DROP POLICY IF EXISTS prompt_batch_jobs_{action}_policy ON prompt_batch_jobs")
+    op.drop_index("ix_prompt_batch_jobs_org_created", table_name="prompt_batch_jobs")
+    op.drop_table("prompt_batch_jobs")
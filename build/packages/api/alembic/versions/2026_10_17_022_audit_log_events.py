@@ -0,0 +1,44 @@
+"""Store security audit events in audit_logs.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17
+
+The audit pipeline writes auth and security events (login, logout, token
+refresh, suspicious requests) alongside the CRUD trail. Such events carry
+an event type, an outcome and free-form details, and often have no entity,
+so entity_type/entity_id become optional and action is widened to hold
+event type names. Rows are listed per organization, newest first.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("audit_logs", sa.Column("event_type", sa.String(50)))
+    op.add_column("audit_logs", sa.Column("success", sa.Boolean))
+    op.add_column("audit_logs", sa.Column("details", postgresql.JSONB))
+    op.alter_column("audit_logs", "action", type_=sa.String(50))
+    op.alter_column("audit_logs", "entity_type", nullable=True)
+    op.alter_column("audit_logs", "entity_id", nullable=True)
+    op.create_index(
+        "ix_audit_logs_org_created", "audit_logs", ["organization_id", sa.text("created_at DESC")]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_org_created", table_name="audit_logs")
+    op.execute("DELETE FROM audit_logs WHERE entity_type IS NULL OR entity_id IS NULL")
+    op.alter_column("audit_logs", "entity_id", nullable=False)
+    op.alter_column("audit_logs", "entity_type", nullable=False)
+    op.alter_column("audit_logs", "action", type_=sa.String(20))
+    op.drop_column("audit_logs", "details")
+    op.drop_column("audit_logs", "success")
+    op.drop_column("audit_logs", "event_type")
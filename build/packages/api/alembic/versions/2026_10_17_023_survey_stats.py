@@ -0,0 +1,77 @@
+"""Add survey_stats aggregates.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17
+
+survey_stats holds running counters per survey question (answers, score
+sum and sum of squares, a histogram of answer values) plus one row per
+survey with question_id NULL. Submissions add their deltas with an upsert
+on (survey_id, question_id); NULLS NOT DISTINCT lets the survey row take
+part. Existing responses are folded in by the survey results rebuild job
+(POST /surveys/results/rebuild) after upgrading.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+# Same tenant check as every other tenant table (migration 002)
+_TENANT_CHECK = "organization_id = current_setting('app.current_organization_id', true)::uuid"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "survey_stats",
+        sa.Column("id", postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=False),
+                  sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("survey_id", postgresql.UUID(as_uuid=False),
+                  sa.ForeignKey("surveys.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("question_id", postgresql.UUID(as_uuid=False),
+                  sa.ForeignKey("survey_questions.id", ondelete="CASCADE")),
+        sa.Column("count", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("score_count", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float, nullable=False, server_default="0"),
+        sa.Column("score_sq_sum", sa.Float, nullable=False, server_default="0"),
+        sa.Column("value_counts", postgresql.JSONB, nullable=False, server_default="{}"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_survey_stats_organization_id", "survey_stats", ["organization_id"])
+    op.execute(
+        "CREATE UNIQUE INDEX ix_survey_stats_survey_question "
+        "ON survey_stats (survey_id, question_id) NULLS NOT DISTINCT"
+    )
+
+    op.execute("ALTER TABLE survey_stats ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE survey_stats FORCE ROW LEVEL SECURITY")
+    op.execute(f"""
+        CREATE POLICY survey_stats_select_policy ON survey_stats
+        FOR SELECT USING ({_TENANT_CHECK})
+    """)
+    op.execute(f"""
+        CREATE POLICY survey_stats_insert_policy ON survey_stats
+        FOR INSERT WITH CHECK ({_TENANT_CHECK})
+    """)
+    op.execute(f"""
+        CREATE POLICY survey_stats_update_policy ON survey_stats
+        FOR UPDATE USING ({_TENANT_CHECK}) WITH CHECK ({_TENANT_CHECK})
+    """)
+    op.execute(f"""
+        CREATE POLICY survey_stats_delete_policy ON survey_stats
+        FOR DELETE USING ({_TENANT_CHECK})
+    """)
+
+
+def downgrade() -> None:
+    for action in ("select", "insert", "update", "delete"):
+        op.execute(f"DROP POLICY IF EXISTS survey_stats_{action}_policy ON survey_stats")
+    op.drop_index("ix_survey_stats_survey_question", table_name="survey_stats")
+    op.drop_index("ix_survey_stats_organization_id", table_name="survey_stats")
+    op.drop_table("survey_stats")
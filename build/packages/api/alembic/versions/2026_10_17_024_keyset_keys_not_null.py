@@ -0,0 +1,39 @@
+"""Make keyset pagination sort keys NOT NULL.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17
+
+Cursor pagination seeks with a row-value comparison on the ORDER BY keys
+(migration 019); a NULL key compares as unknown, so such rows would be
+skipped or repeated between pages. The models already declare these
+columns non-nullable; existing NULLs are backfilled with the column's
+default first.
+"""
+
+from alembic import op
+
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, backfill for existing NULLs)
+KEYSET_COLUMNS = (
+    ("processes", "sort_order", "0"),
+    ("portfolio_items", "sort_order", "0"),
+    ("reference_catalogues", "sort_order", "0"),
+    ("riada_items", "created_at", "coalesce(updated_at, now())"),
+)
+
+
+def upgrade() -> None:
+    for table, column, backfill in KEYSET_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = {backfill} WHERE {column} IS NULL")
+        op.alter_column(table, column, nullable=False)
+
+
+def downgrade() -> None:
+    for table, column, _ in reversed(KEYSET_COLUMNS):
+        op.alter_column(table, column, nullable=True)
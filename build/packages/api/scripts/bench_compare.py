@@ -0,0 +1,72 @@
+"""
+Compare two benchmark result files written by tests/benchmarks.
+
+Prints the median wall time of every benchmark in both runs with the
+relative change, and the median CPU time where both runs recorded it,
+flagging slowdowns beyond the threshold (and added SQL statements) as
+regressions. Exits 1 if there is any regression, so it can gate CI.
+
+Run with: python -m scripts.bench_compare base.json head.json [--threshold 0.15]
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(base: dict, head: dict, threshold: float) -> list[str]:
+    """Print the comparison table; return the names of regressed benchmarks."""
+    if base["meta"].get("sizes") != head["meta"].get("sizes"):
+        print("warning: the runs used tenants of different sizes\n")
+
+    regressions = []
+    names = sorted(set(base["results"]) | set(head["results"]))
+    width = max(len(name) for name in names)
+    print(f"{'benchmark':<{width}}{'base ms':>11}{'head ms':>11}{'change':>9}"
+          f"{'base cpu':>11}{'head cpu':>11}  queries")
+    for name in names:
+        old, new = base["results"].get(name), head["results"].get(name)
+        if old is None or new is None:
+            print(f"{name:<{width}}{'only in ' + ('head' if old is None else 'base'):>31}")
+            continue
+
+        change = new["median_ms"] / old["median_ms"] - 1 if old["median_ms"] else 0.0
+        queries = ""
+        if old.get("queries") is not None and new.get("queries") is not None:
+            queries = f"{old['queries']} -> {new['queries']}"
+        cpu = f"{'-':>11}{'-':>11}"
+        if "cpu_median_ms" in old and "cpu_median_ms" in new:
+            cpu = f"{old['cpu_median_ms']:>11.2f}{new['cpu_median_ms']:>11.2f}"
+        regressed = change > threshold or (queries and new["queries"] > old["queries"])
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<{width}}{old['median_ms']:>11.2f}{new['median_ms']:>11.2f}"
+            f"{change:>+9.1%}{cpu}  {queries}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main(args: argparse.Namespace) -> int:
+    base, head = load(args.base), load(args.head)
+    print(f"base {base['meta'].get('commit')}  head {head['meta'].get('commit')}  "
+          f"scale {head['meta'].get('scale')}\n")
+    regressions = compare(base, head, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative median slowdown counted as a regression")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,82 @@
+"""
+Benchmark harness for per-middleware request latency.
+
+Runs a trivial endpoint bare and behind each middleware on its own, and
+reports the p50/p99 latency each middleware adds.
+Run with: python -m scripts.bench_middleware [requests]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.config import settings
+from src.core import rate_limit
+from src.core.rate_limit import RateLimitConfig, RateLimitMiddleware
+from src.core.security import SecurityHeadersMiddleware, SuspiciousActivityMiddleware
+
+MIDDLEWARES = {
+    "SecurityHeadersMiddleware": SecurityHeadersMiddleware,
+    "SuspiciousActivityMiddleware": SuspiciousActivityMiddleware,
+    "RateLimitMiddleware": RateLimitMiddleware,
+}
+
+# Representative request: API path with a couple of query params
+PATH = "/api/v1/processes?search=order+to+cash&level=L2"
+
+
+def build_app(middleware=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/processes")
+    async def processes():
+        return {"ok": True}
+
+    if middleware:
+        app.add_middleware(middleware)
+    return app
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(pct) - 1]
+
+
+async def sample_latencies(app: FastAPI, n: int) -> list[float]:
+    """Per-request latencies in seconds over n sequential requests."""
+    transport = ASGITransport(app=app)
+    samples = []
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):  # warm up
+            await client.get(PATH)
+        for _ in range(n):
+            start = time.perf_counter()
+            await client.get(PATH)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def main(n: int):
+    # Rate limiting is a no-op in the test environment; never trip the limit
+    settings.ENVIRONMENT = "development"
+    rate_limit.RATE_LIMITS["api"] = RateLimitConfig(requests=10_000_000, window=60)
+
+    baseline = await sample_latencies(build_app(), n)
+    base_p50, base_p99 = percentile(baseline, 50), percentile(baseline, 99)
+
+    print(f"Requests per run: {n}")
+    print(f"{'baseline':<30} p50 {base_p50 * 1e6:8.1f} us   p99 {base_p99 * 1e6:8.1f} us")
+    for name, middleware in MIDDLEWARES.items():
+        samples = await sample_latencies(build_app(middleware), n)
+        p50, p99 = percentile(samples, 50), percentile(samples, 99)
+        print(
+            f"{name:<30} p50 {(p50 - base_p50) * 1e6:+8.1f} us   "
+            f"p99 {(p99 - base_p99) * 1e6:+8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark for RateLimitMiddleware per-request overhead.
+
+Times a trivial endpoint with and without the middleware, and the raw
+limiter check, using the configured limiter backend (CACHE_PROVIDER).
+Run with: python -m scripts.bench_rate_limit [requests]
+"""
+
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.config import settings
+from src.core.rate_limit import RateLimitConfig, RateLimitMiddleware, get_rate_limiter
+
+# Limit high enough that the benchmark never trips it
+BENCH_LIMIT = RateLimitConfig(requests=10_000_000, window=60)
+
+
+def build_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    if with_middleware:
+        app.add_middleware(RateLimitMiddleware)
+    return app
+
+
+async def time_requests(app: FastAPI, n: int) -> float:
+    """Mean seconds per request over n sequential requests."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):  # warm up
+            await client.get("/api/v1/ping")
+        start = time.perf_counter()
+        for _ in range(n):
+            await client.get("/api/v1/ping")
+        return (time.perf_counter() - start) / n
+
+
+async def time_limiter(n: int) -> float:
+    """Mean seconds per raw limiter check for a single hot key."""
+    limiter = get_rate_limiter()
+    start = time.perf_counter()
+    for _ in range(n):
+        await limiter.is_allowed("bench:hot", BENCH_LIMIT)
+    return (time.perf_counter() - start) / n
+
+
+async def main(n: int):
+    # The middleware is a no-op in the test environment
+    settings.ENVIRONMENT = "development"
+
+    from src.core import rate_limit
+    rate_limit.RATE_LIMITS["api"] = BENCH_LIMIT
+
+    baseline = await time_requests(build_app(False), n)
+    limited = await time_requests(build_app(True), n)
+    check = await time_limiter(n)
+
+    print(f"Backend:            {type(get_rate_limiter()).__name__}")
+    print(f"Requests:           {n}")
+    print(f"Without middleware: {baseline * 1e6:8.1f} us/request")
+    print(f"With middleware:    {limited * 1e6:8.1f} us/request")
+    print(f"Middleware cost:    {(limited - baseline) * 1e6:8.1f} us/request")
+    print(f"Limiter check only: {check * 1e6:8.1f} us/check")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
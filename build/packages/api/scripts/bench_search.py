@@ -0,0 +1,134 @@
+"""
+Benchmark process/RIADA search: legacy ILIKE scan vs indexed search.
+
+Seeds a throwaway tenant with N processes and N RIADA items inside one
+transaction (rolled back at the end) and times, per term:
+
+- legacy:  the old name/description ILIKE filter with index scans disabled,
+           i.e. the pre-migration sequential scan
+- filter:  the list endpoints' search_filter (tsvector + trigram indexes)
+- ranked:  the unified /search query across both entity types
+
+Needs a database migrated to head (pg_trgm installed).
+Run with: python -m scripts.bench_search [rows ...]   (default: 10000 100000)
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from uuid import uuid4
+
+from sqlalchemy import func, select, text
+
+from src.core.database import async_session_factory
+from src.models.process import Process
+from src.services.search import SEARCH_TARGETS, search_entities, search_filter
+
+# Timed runs per query (after one warm-up run)
+RUNS = 20
+
+# A rare word, a common word and a prefix as typed mid-keystroke
+TERMS = ("escalation", "vendor", "onboa")
+
+WORDS = (
+    "vendor", "quote", "brief", "invoice", "contract", "supplier", "client",
+    "review", "approval", "payment", "onboarding", "forecast", "audit",
+    "delivery", "schedule", "budget", "compliance", "report", "intake",
+    "reconciliation", "planning", "sourcing", "tender", "claim",
+)
+
+_SEED_SQL = """
+    INSERT INTO {table} (id, organization_id, code, {title}, description{extra_columns})
+    SELECT gen_random_uuid(), :org, :prefix || g,
+           initcap(w[1 + (g * 7) % n]) || ' ' || w[1 + (g * 13) % n],
+           'Handles ' || w[1 + (g * 3) % n] || ' and ' || w[1 + (g * 11) % n]
+               || CASE WHEN g % 997 = 0 THEN ' escalation' ELSE '' END{extra_values}
+    FROM generate_series(1, :rows) AS g,
+         (SELECT CAST(:words AS text[]) AS w, cardinality(CAST(:words AS text[])) AS n) AS v
+"""
+
+
+async def seed(db, rows: int) -> str:
+    org = str(uuid4())
+    await db.execute(
+        text("INSERT INTO organizations (id, name, slug) VALUES (:id, 'bench', :slug)"),
+        {"id": org, "slug": f"bench-{org[:8]}"},
+    )
+    params = {"org": org, "rows": rows, "words": list(WORDS)}
+    await db.execute(
+        text(_SEED_SQL.format(
+            table="processes", title="name",
+            extra_columns=", level", extra_values=", 'L2'",
+        )),
+        {**params, "prefix": "P-"},
+    )
+    await db.execute(
+        text(_SEED_SQL.format(
+            table="riada_items", title="title",
+            extra_columns=", riada_type, category", extra_values=", 'risk', 'process'",
+        )),
+        {**params, "prefix": "R-"},
+    )
+    await db.execute(text("ANALYZE processes"))
+    await db.execute(text("ANALYZE riada_items"))
+    return org
+
+
+async def timed(run) -> list[float]:
+    await run()
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def bench(rows: int):
+    async with async_session_factory() as db:
+        org = await seed(db, rows)
+        print(f"\n{rows} processes + {rows} RIADA items")
+        print(f"{'term':<12}{'path':<8}{'matches':>9}{'p50 ms':>10}{'p95 ms':>10}")
+
+        for term in TERMS:
+            legacy = select(func.count()).where(
+                Process.organization_id == org,
+                Process.name.ilike(f"%{term}%") | Process.description.ilike(f"%{term}%"),
+            )
+            indexed = select(func.count()).where(
+                Process.organization_id == org,
+                search_filter(SEARCH_TARGETS["process"], term),
+            )
+
+            async def run_legacy():
+                await db.execute(text("SET LOCAL enable_bitmapscan = off"))
+                await db.execute(text("SET LOCAL enable_indexscan = off"))
+                try:
+                    return (await db.execute(legacy)).scalar()
+                finally:
+                    await db.execute(text("RESET enable_bitmapscan"))
+                    await db.execute(text("RESET enable_indexscan"))
+
+            async def run_filter():
+                return (await db.execute(indexed)).scalar()
+
+            async def run_ranked():
+                return len(await search_entities(db, org, term, ["process", "riada"], 20))
+
+            for name, run in (("legacy", run_legacy), ("filter", run_filter), ("ranked", run_ranked)):
+                matches = await run()
+                samples = await timed(run)
+                p95 = statistics.quantiles(samples, n=20)[-1]
+                print(f"{term:<12}{name:<8}{matches:>9}{statistics.median(samples):>10.2f}{p95:>10.2f}")
+
+        await db.rollback()
+
+
+async def main(sizes: list[int]):
+    for rows in sizes:
+        await bench(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]))
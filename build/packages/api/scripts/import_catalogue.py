@@ -0,0 +1,56 @@
+"""
+Import a process catalogue file (XLSX, CSV or JSON) into an organization.
+
+Same pipeline as POST /api/v1/processes/import, for initial loads and
+files too large to upload. Nothing is written if any row is invalid.
+
+Run with: python -m scripts.import_catalogue FILE --org ORG_ID --user USER_ID [--dry-run]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.core.database import async_session_factory
+from src.core.tenancy import apply_tenant_context
+from src.services.process_import import import_catalogue, read_catalogue
+from src.services.result_cache import bump_data_version
+from src.services.tree_cache import PROCESS_TREE, invalidate_tree
+
+
+async def main(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    with open(args.file, "rb") as f:
+        catalogue = read_catalogue(args.file, f)
+    parsed = time.perf_counter()
+
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, args.org)
+        result = await import_catalogue(db, args.org, args.user, catalogue, dry_run=args.dry_run)
+        if not result.errors and not args.dry_run:
+            await db.commit()
+            await invalidate_tree(PROCESS_TREE, args.org)
+            await bump_data_version(args.org)
+    done = time.perf_counter()
+
+    for error in result.errors:
+        print(f"{error.sheet} row {error.row}: {error.message}")
+    print(
+        f"{result.processes} processes, {result.raci_entries} RACI entries, "
+        f"{result.kpis} KPIs, {result.system_links} system links, {result.issues} issues"
+    )
+    if result.errors:
+        print(f"Not imported: {len(result.errors)} errors")
+    elif args.dry_run:
+        print("Dry run: nothing written")
+    print(f"Parsed in {parsed - start:.2f}s, imported in {done - parsed:.2f}s")
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("--org", required=True, help="organization id")
+    parser.add_argument("--user", required=True, help="user recorded as raising imported issues")
+    parser.add_argument("--dry-run", action="store_true")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
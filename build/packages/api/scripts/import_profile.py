@@ -0,0 +1,100 @@
+"""
+Import-time profile of the API (what a new worker or container pays).
+
+Times a cold `import src.main` in fresh interpreters and breaks one run
+down with -X importtime: the slowest modules by cumulative and by self
+time, totals per top-level package, and which optional SDKs got loaded.
+Exits 1 if the median exceeds --budget, so it can gate CI.
+
+Run with: python -m scripts.import_profile [--runs 5] [--top 20] [--budget 3.0]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+# Heavy SDKs that must only load where they are used, never at startup
+OPTIONAL_SDKS = (
+    "anthropic", "boto3", "botocore", "dashscope", "openai",
+    "openpyxl", "oss2", "redis", "resend", "sentry_sdk",
+)
+
+_TIMER = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, *(m for m in {sdks!r} if m in sys.modules))
+"""
+
+
+def time_import(module: str) -> tuple[float, list[str]]:
+    """Seconds to import module in a fresh interpreter, and the optional SDKs it loaded."""
+    out = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(module=module, sdks=OPTIONAL_SDKS)],
+        capture_output=True, text=True, check=True,
+    ).stdout.splitlines()[-1].split()
+    return float(out[0]), out[1:]
+
+
+def import_tree(module: str) -> list[tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every module imported, from -X importtime."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(own), int(cumulative)))
+    return rows
+
+
+def report(rows: list[tuple[str, int, int]], top: int) -> None:
+    def table(title: str, items: list[tuple[str, int]]) -> None:
+        print(f"\n{title}")
+        for name, us in items[:top]:
+            print(f"  {us / 1000:>8.1f} ms  {name}")
+
+    table("Slowest by cumulative time",
+          sorted(((n, c) for n, _, c in rows), key=lambda r: r[1], reverse=True))
+    table("Slowest by self time",
+          sorted(((n, s) for n, s, _ in rows), key=lambda r: r[1], reverse=True))
+
+    packages: dict[str, int] = defaultdict(int)
+    for name, own, _ in rows:
+        packages[name.split(".")[0]] += own
+    table("Self time by top-level package",
+          sorted(packages.items(), key=lambda r: r[1], reverse=True))
+
+
+def main(args: argparse.Namespace) -> int:
+    samples, loaded = [], []
+    for _ in range(args.runs):
+        elapsed, loaded = time_import(args.module)
+        samples.append(elapsed)
+    median = statistics.median(samples)
+    print(f"import {args.module}: median {median:.3f}s  min {min(samples):.3f}s  "
+          f"max {max(samples):.3f}s over {args.runs} runs")
+    print(f"optional SDKs loaded: {', '.join(loaded) or 'none'}")
+
+    report(import_tree(args.module), args.top)
+
+    if args.budget and median > args.budget:
+        print(f"\nmedian import time {median:.3f}s exceeds the {args.budget:.3f}s budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=0.0,
+                        help="fail if the median import takes longer (seconds)")
+    sys.exit(main(parser.parse_args()))
@@ -7,8 +7,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
+from src.core.audit import AuditEvent, log_request_audit_event
 from src.core.auth import create_magic_link_token, verify_magic_link_token
 from src.core.database import get_db
+from src.core.instrumentation import InstrumentedRoute
 from src.models.organization import AllowedDomain, MagicLinkToken, Organization
 from src.schemas.auth import MagicLinkRequest, MagicLinkResponse
 from src.services.auth_service import (
@@ -18,11 +20,18 @@ from src.services.auth_service import (
     find_or_create_user,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+def _login_failed(request: Request, reason: str, status_code: int = 400) -> HTTPException:
+    log_request_audit_event(
+        request, AuditEvent.LOGIN_FAILURE, details={"reason": reason}, success=False
+    )
+    return HTTPException(status_code=status_code, detail=reason)
 
 
 @router.post("/dev-login")
-async def dev_login(db: AsyncSession = Depends(get_db)):
+async def dev_login(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Development-only: Auto-login as admin without magic link.
     Creates test org/user if they don't exist.
@@ -30,7 +39,15 @@ async def dev_login(db: AsyncSession = Depends(get_db)):
     if settings.ENVIRONMENT not in ("development", "local", "test"):
         raise HTTPException(status_code=404, detail="Not found")
 
-    return await create_dev_session(db)
+    session = await create_dev_session(db)
+    log_request_audit_event(
+        request,
+        AuditEvent.LOGIN_SUCCESS,
+        user_id=session.user.id,
+        organization_id=session.user.organization_id,
+        details={"method": "dev_login"},
+    )
+    return session
 
 
 @router.post("/magic-link", response_model=MagicLinkResponse)
@@ -70,14 +87,22 @@ async def request_magic_link(
         magic_link_url = f"{settings.FRONTEND_URL}/auth/verify?token={full_token}"
 
         from src.services.email import send_magic_link_email
-        await send_magic_link_email(email, magic_link_url)
-
+        await send_magic_link_email(email, magic_link_url, expires_at=expires_at)
+
+    log_request_audit_event(
+        request,
+        AuditEvent.LOGIN_ATTEMPT,
+        organization_id=allowed.organization_id if allowed else None,
+        details={"method": "magic_link", "domain": domain},
+        success=allowed is not None,
+    )
     return MagicLinkResponse()
 
 
 @router.get("/verify/{token}")
 async def verify_magic_link(
     token: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -86,7 +111,7 @@ async def verify_magic_link(
     try:
         token_id = token.split(".")[0]
     except (ValueError, IndexError):
-        raise HTTPException(status_code=400, detail="Invalid token format")
+        raise _login_failed(request, "Invalid token format")
 
     result = await db.execute(
         select(MagicLinkToken).where(
@@ -97,13 +122,13 @@ async def verify_magic_link(
     magic_token = result.scalar_one_or_none()
 
     if not magic_token:
-        raise HTTPException(status_code=400, detail="Invalid or expired token")
+        raise _login_failed(request, "Invalid or expired token")
 
     if magic_token.expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
-        raise HTTPException(status_code=400, detail="Token has expired")
+        raise _login_failed(request, "Token has expired")
 
     if not verify_magic_link_token(token, magic_token.email, magic_token.token_hash):
-        raise HTTPException(status_code=400, detail="Invalid token")
+        raise _login_failed(request, "Invalid token")
 
     magic_token.is_used = True
     magic_token.used_at = datetime.now(timezone.utc)
@@ -119,7 +144,7 @@ async def verify_magic_link(
     allowed_domain = result.scalar_one_or_none()
 
     if not allowed_domain:
-        raise HTTPException(status_code=403, detail="Organization not found for this domain")
+        raise _login_failed(request, "Organization not found for this domain", 403)
 
     org_id = allowed_domain.organization_id
     membership = await ensure_org_membership(db, user.id, org_id)
@@ -131,4 +156,11 @@ async def verify_magic_link(
     result = await db.execute(select(Organization).where(Organization.id == org_id))
     org = result.scalar_one()
 
+    log_request_audit_event(
+        request,
+        AuditEvent.LOGIN_SUCCESS,
+        user_id=user.id,
+        organization_id=org_id,
+        details={"method": "magic_link"},
+    )
     return build_token_response(user, org, role=membership.role)
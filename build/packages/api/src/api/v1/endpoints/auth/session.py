@@ -1,9 +1,10 @@
 """Session management endpoints (refresh, logout, profile)."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.audit import AuditEvent, log_request_audit_event
 from src.core.auth import (
     CurrentUser,
     create_access_token,
@@ -11,6 +12,7 @@ from src.core.auth import (
     get_current_user,
 )
 from src.core.database import get_db
+from src.core.instrumentation import InstrumentedRoute
 from src.models.organization import Organization, User, UserOrganization
 from src.schemas.auth import (
     OrganizationBrief,
@@ -18,15 +20,23 @@ from src.schemas.auth import (
     UserProfile,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.post("/refresh")
-async def refresh_token(body: TokenRefreshRequest):
+async def refresh_token(body: TokenRefreshRequest, request: Request):
     """Refresh an access token using a refresh token."""
     payload = decode_token(body.refresh_token)
 
     if payload.get("type") != "refresh":
+        log_request_audit_event(
+            request,
+            AuditEvent.TOKEN_REFRESH,
+            user_id=payload.get("sub"),
+            organization_id=payload.get("org"),
+            details={"reason": "Invalid token type"},
+            success=False,
+        )
         raise HTTPException(status_code=400, detail="Invalid token type")
 
     access_token = create_access_token(
@@ -36,12 +46,21 @@ async def refresh_token(body: TokenRefreshRequest):
         email="",
     )
 
+    log_request_audit_event(
+        request,
+        AuditEvent.TOKEN_REFRESH,
+        user_id=payload["sub"],
+        organization_id=payload["org"],
+    )
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/logout")
-async def logout(user: CurrentUser = Depends(get_current_user)):
+async def logout(request: Request, user: CurrentUser = Depends(get_current_user)):
     """Invalidate the current session."""
+    log_request_audit_event(
+        request, AuditEvent.LOGOUT, user_id=user.id, organization_id=user.organization_id
+    )
     # In a JWT-based system, client deletes the token
     # For added security, add token to a denylist (Redis)
     return {"message": "Logged out successfully"}
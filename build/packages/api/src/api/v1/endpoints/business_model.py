@@ -10,6 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.business_model import BusinessModel, BusinessModelEntry
 from src.schemas.common import (
@@ -18,7 +19,7 @@ from src.schemas.common import (
     BusinessModelEntryResponse,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/canvas", response_model=BusinessModelCanvasResponse)
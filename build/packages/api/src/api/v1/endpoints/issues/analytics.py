@@ -1,23 +1,34 @@
 """Issue analytics endpoints — heatmap, summary, history."""
 
 from datetime import date, timedelta
+from typing import Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select, text
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
-from src.models.issue_log import IssueLog, IssueLogHistory
+from src.models.issue_log import (
+    IssueClassification,
+    IssueCriticality,
+    IssueLog,
+    IssueLogHistory,
+    IssueStatus,
+)
 from src.schemas.issue_log import (
     HeatmapCell,
+    HeatmapColumnarResponse,
     HeatmapResponse,
     IssueHistoryEntry,
     IssueHistoryResponse,
     IssueSummary,
 )
+from src.services.heatmap import get_heatmap
+from src.services.result_cache import cached_result
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/summary", response_model=IssueSummary)
@@ -27,149 +38,88 @@ async def get_issue_summary(
 ):
     """Get summary statistics for issues dashboard."""
     org_id = user.organization_id
-
-    # Count by status
-    status_counts = await db.execute(
-        select(IssueLog.issue_status, func.count())
-        .where(IssueLog.organization_id == org_id)
-        .group_by(IssueLog.issue_status)
-    )
-    by_status = {row[0]: row[1] for row in status_counts.fetchall()}
-
-    # Count by classification (open/in_progress only)
-    class_counts = await db.execute(
-        select(IssueLog.issue_classification, func.count())
-        .where(
-            IssueLog.organization_id == org_id,
-            IssueLog.issue_status.in_(["open", "in_progress"]),
-        )
-        .group_by(IssueLog.issue_classification)
-    )
-    by_classification = {row[0]: row[1] for row in class_counts.fetchall()}
-
-    # Count by criticality (open/in_progress only)
-    crit_counts = await db.execute(
-        select(IssueLog.issue_criticality, func.count())
-        .where(
-            IssueLog.organization_id == org_id,
-            IssueLog.issue_status.in_(["open", "in_progress"]),
-        )
-        .group_by(IssueLog.issue_criticality)
-    )
-    by_criticality = {row[0]: row[1] for row in crit_counts.fetchall()}
-
-    # Opportunity counts
-    opp_identified = await db.execute(
-        select(func.count())
-        .where(
-            IssueLog.organization_id == org_id,
-            IssueLog.opportunity_flag == True,  # noqa: E712
-        )
-    )
-    opp_delivered = await db.execute(
-        select(func.count())
-        .where(
-            IssueLog.organization_id == org_id,
-            IssueLog.opportunity_status == "delivered",
-        )
-    )
-
-    # Overdue count
     today = date.today()
-    overdue = await db.execute(
-        select(func.count())
-        .where(
-            IssueLog.organization_id == org_id,
-            IssueLog.issue_status.in_(["open", "in_progress"]),
-            IssueLog.target_resolution_date < today,
-        )
-    )
 
-    # Due this week
-    week_end = today + timedelta(days=7)
-    due_this_week = await db.execute(
-        select(func.count())
-        .where(
-            IssueLog.organization_id == org_id,
-            IssueLog.issue_status.in_(["open", "in_progress"]),
-            IssueLog.target_resolution_date >= today,
-            IssueLog.target_resolution_date <= week_end,
+    async def build() -> IssueSummary:
+        week_end = today + timedelta(days=7)
+        active = IssueLog.issue_status.in_(["open", "in_progress"])
+
+        def count_where(*conditions):
+            return func.count().filter(*conditions)
+
+        # Every figure is a filtered count over a single scan of the tenant's issues
+        row = (await db.execute(
+            select(
+                *(
+                    count_where(IssueLog.issue_status == s.value).label(f"status_{s.value}")
+                    for s in IssueStatus
+                ),
+                *(
+                    count_where(active, IssueLog.issue_classification == c.value)
+                    .label(f"class_{c.value}")
+                    for c in IssueClassification
+                ),
+                *(
+                    count_where(active, IssueLog.issue_criticality == c.value)
+                    .label(f"crit_{c.value}")
+                    for c in IssueCriticality
+                ),
+                count_where(IssueLog.opportunity_flag == True).label(  # noqa: E712
+                    "opportunities_identified"
+                ),
+                count_where(IssueLog.opportunity_status == "delivered").label(
+                    "opportunities_delivered"
+                ),
+                count_where(active, IssueLog.target_resolution_date < today).label(
+                    "overdue_count"
+                ),
+                count_where(
+                    active,
+                    IssueLog.target_resolution_date >= today,
+                    IssueLog.target_resolution_date <= week_end,
+                ).label("due_this_week"),
+            ).where(IssueLog.organization_id == org_id)
+        )).one()._mapping
+
+        return IssueSummary(
+            total_open=row["status_open"],
+            total_in_progress=row["status_in_progress"],
+            total_resolved=row["status_resolved"],
+            total_closed=row["status_closed"],
+            total_deferred=row["status_deferred"],
+            by_classification={
+                c.value: row[f"class_{c.value}"] for c in IssueClassification
+            },
+            by_criticality={c.value: row[f"crit_{c.value}"] for c in IssueCriticality},
+            opportunities_identified=row["opportunities_identified"],
+            opportunities_delivered=row["opportunities_delivered"],
+            overdue_count=row["overdue_count"],
+            due_this_week=row["due_this_week"],
         )
-    )
 
-    return IssueSummary(
-        total_open=by_status.get("open", 0),
-        total_in_progress=by_status.get("in_progress", 0),
-        total_resolved=by_status.get("resolved", 0),
-        total_closed=by_status.get("closed", 0),
-        total_deferred=by_status.get("deferred", 0),
-        by_classification={
-            "people": by_classification.get("people", 0),
-            "process": by_classification.get("process", 0),
-            "system": by_classification.get("system", 0),
-            "data": by_classification.get("data", 0),
-        },
-        by_criticality={
-            "high": by_criticality.get("high", 0),
-            "medium": by_criticality.get("medium", 0),
-            "low": by_criticality.get("low", 0),
-        },
-        opportunities_identified=opp_identified.scalar() or 0,
-        opportunities_delivered=opp_delivered.scalar() or 0,
-        overdue_count=overdue.scalar() or 0,
-        due_this_week=due_this_week.scalar() or 0,
+    return await cached_result(
+        IssueSummary, "issue-summary", org_id, build, today.isoformat()
     )
 
 
-@router.get("/heatmap", response_model=HeatmapResponse)
+@router.get("/heatmap", response_model=Union[HeatmapResponse, HeatmapColumnarResponse])
 async def get_issue_heatmap(
     rollup: bool = Query(False, description="Include descendant issue counts"),
+    columnar: bool = Query(False, description="Return parallel arrays instead of cells"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """Get process-issue heatmap data."""
-    view_name = "v_process_issue_heatmap_rollup" if rollup else "v_process_issue_heatmap"
-
-    # Note: v_process_issue_heatmap uses 'total_open_issues', rollup view uses 'total_issues'
-    total_col = "total_open_issues" if not rollup else "total_issues"
-    result = await db.execute(
-        text(f"""
-            SELECT
-                process_id, process_ref, process_name, level, parent_id,
-                people_count, process_count, system_count, data_count,
-                people_colour, process_colour, system_colour, data_colour,
-                overall_colour,
-                COALESCE({total_col}, people_count + process_count + system_count + data_count) AS total_issues
-            FROM {view_name}
-            WHERE organization_id = :org_id
-            ORDER BY process_ref
-        """),
-        {"org_id": user.organization_id},
-    )
+    heatmap = await get_heatmap(db, user.organization_id, rollup)
 
-    cells = []
-    for row in result.fetchall():
-        cells.append(
-            HeatmapCell(
-                process_id=str(row.process_id),
-                process_ref=row.process_ref,
-                process_name=row.process_name,
-                level=row.level,
-                parent_id=str(row.parent_id) if row.parent_id else None,
-                people_count=row.people_count or 0,
-                process_count=row.process_count or 0,
-                system_count=row.system_count or 0,
-                data_count=row.data_count or 0,
-                total_issues=row.total_issues or 0,
-                people_colour=row.people_colour or "neutral",
-                process_colour=row.process_colour or "neutral",
-                system_colour=row.system_colour or "neutral",
-                data_colour=row.data_colour or "neutral",
-                overall_colour=row.overall_colour or "neutral",
-            )
-        )
+    if columnar:
+        return heatmap
 
-    return HeatmapResponse(cells=cells, rollup=rollup)
+    columns = [getattr(heatmap, name) for name in HeatmapCell.model_fields]
+    return {
+        "cells": [dict(zip(HeatmapCell.model_fields, values)) for values in zip(*columns)],
+        "rollup": rollup,
+    }
 
 
 @router.get("/{issue_id}/history", response_model=IssueHistoryResponse)
@@ -5,13 +5,17 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.serialization import ListSerializer
 from src.core.tenancy import get_tenant_db
 from src.models.issue_log import IssueLog
 from src.schemas.issue_log import IssueListResponse, IssueResponse
 
-from .helpers import to_response
+from .helpers import response_columns, to_response
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+_list_serializer = ListSerializer(IssueListResponse)
 
 
 @router.get("/", response_model=IssueListResponse)
@@ -27,7 +31,7 @@ async def list_issues(
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """List issues with filtering and pagination."""
-    query = select(IssueLog).where(
+    query = _list_serializer.select(IssueLog, **response_columns()).where(
         IssueLog.organization_id == user.organization_id
     )
 
@@ -50,10 +54,9 @@ async def list_issues(
     query = query.offset((page - 1) * per_page).limit(per_page)
 
     result = await db.execute(query)
-    items = result.scalars().all()
 
-    return IssueListResponse(
-        items=[to_response(i) for i in items],
+    return _list_serializer.response(
+        result.all(),
         total=total,
         page=page,
         per_page=per_page,
@@ -1,30 +1,65 @@
-"""Issue export endpoint — CSV/XLSX download."""
+"""Issue export endpoint — CSV/XLSX download.
+
+Exports stream rows from a server-side cursor in batches, selecting only the
+exported columns, so memory stays bounded regardless of tenant size. The
+body streams after the handler returns, so it reads on a session of its own.
+"""
 
 import csv
 import io
+import tempfile
 from datetime import date
+from typing import Any, AsyncIterator, Sequence
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, select
 
 from src.core.auth import CurrentUser, get_current_user
-from src.core.tenancy import get_tenant_db
+from src.core.database import async_session_factory
+from src.core.instrumentation import InstrumentedRoute
+from src.core.tenancy import apply_tenant_context
 from src.models.issue_log import IssueLog
 from src.schemas.issue_log import IssueExportRequest
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+# Bytes per chunk when streaming the finished workbook
+XLSX_CHUNK_SIZE = 64 * 1024
+
+# (header, column, XLSX width) — widths are fixed because write-only
+# worksheets cannot be measured after the rows are written
+EXPORT_COLUMNS = (
+    ("ID", IssueLog.issue_number, 10),
+    ("Title", IssueLog.title, 50),
+    ("Classification", IssueLog.issue_classification, 16),
+    ("Criticality", IssueLog.issue_criticality, 13),
+    ("Complexity", IssueLog.issue_complexity, 12),
+    ("Status", IssueLog.issue_status, 13),
+    ("Process Ref", IssueLog.process_ref, 13),
+    ("Process Name", IssueLog.process_name, 40),
+    ("Date Raised", IssueLog.date_raised, 13),
+    ("Target Date", IssueLog.target_resolution_date, 13),
+    ("Resolution Date", IssueLog.actual_resolution_date, 17),
+    ("Resolution Summary", IssueLog.resolution_summary, 50),
+    ("Opportunity Flag", IssueLog.opportunity_flag, 18),
+    ("Opportunity Status", IssueLog.opportunity_status, 20),
+)
+
+EXPORT_HEADERS = [header for header, _, _ in EXPORT_COLUMNS]
 
 
 @router.post("/export")
 async def export_issues(
     body: IssueExportRequest,
     user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_tenant_db),
 ):
     """Export issues to CSV or XLSX format."""
-    query = select(IssueLog).where(
+    query = select(*(column for _, column, _ in EXPORT_COLUMNS)).where(
         IssueLog.organization_id == user.organization_id
     )
 
@@ -43,52 +78,75 @@ async def export_issues(
         query = query.where(IssueLog.date_raised <= body.date_to)
 
     query = query.order_by(IssueLog.issue_number)
-    result = await db.execute(query)
-    issues = result.scalars().all()
 
     if body.format == "xlsx":
-        return _export_xlsx(issues)
-
-    return _export_csv(issues)
-
-
-def _export_csv(issues: list[IssueLog]) -> StreamingResponse:
-    """Generate CSV export."""
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow([
-        "ID", "Title", "Classification", "Criticality", "Complexity",
-        "Status", "Process Ref", "Process Name", "Date Raised",
-        "Target Date", "Resolution Date", "Resolution Summary",
-        "Opportunity Flag", "Opportunity Status",
-    ])
-
-    # Data rows
-    for issue in issues:
-        writer.writerow([
-            issue.display_id,
-            issue.title,
-            issue.issue_classification,
-            issue.issue_criticality,
-            issue.issue_complexity,
-            issue.issue_status,
-            issue.process_ref,
-            issue.process_name,
-            issue.date_raised.isoformat() if issue.date_raised else "",
-            issue.target_resolution_date.isoformat() if issue.target_resolution_date else "",
-            issue.actual_resolution_date.isoformat() if issue.actual_resolution_date else "",
-            issue.resolution_summary or "",
-            "Yes" if issue.opportunity_flag else "No",
-            issue.opportunity_status or "",
-        ])
-
-    output.seek(0)
+        return _export_xlsx(user.organization_id, query)
+
+    return _export_csv(user.organization_id, query)
+
+
+async def _stream_batches(organization_id: str, query: Select) -> AsyncIterator[Sequence[Any]]:
+    """Yield result rows in EXPORT_BATCH_SIZE batches from a server-side cursor."""
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, organization_id)
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for batch in result.partitions():
+            yield batch
+
+
+def _export_values(row: Any) -> list[Any]:
+    """Map a result row to export cell values (dates kept as dates)."""
+    (
+        issue_number, title, classification, criticality, complexity, issue_status,
+        process_ref, process_name, date_raised, target_date, resolution_date,
+        resolution_summary, opportunity_flag, opportunity_status,
+    ) = row
+    return [
+        f"OPS-{issue_number:03d}",
+        title,
+        classification,
+        criticality,
+        complexity,
+        issue_status,
+        process_ref,
+        process_name,
+        date_raised,
+        target_date,
+        resolution_date,
+        resolution_summary or "",
+        "Yes" if opportunity_flag else "No",
+        opportunity_status or "",
+    ]
+
+
+def _csv_values(row: Any) -> list[Any]:
+    return [
+        value.isoformat() if isinstance(value, date) else ("" if value is None else value)
+        for value in _export_values(row)
+    ]
+
+
+def _export_csv(organization_id: str, query: Select) -> StreamingResponse:
+    """Stream a CSV export, one encoded chunk per fetched batch."""
+
+    async def generate() -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(EXPORT_HEADERS)
+        async for batch in _stream_batches(organization_id, query):
+            writer.writerows(_csv_values(row) for row in batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
     today = date.today().isoformat()
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename=ops_issues_{today}.csv"
@@ -96,61 +154,60 @@ def _export_csv(issues: list[IssueLog]) -> StreamingResponse:
     )
 
 
-def _export_xlsx(issues: list[IssueLog]) -> StreamingResponse:
-    """Generate XLSX export (requires openpyxl)."""
+def _export_xlsx(organization_id: str, query: Select) -> StreamingResponse:
+    """
+    Stream an XLSX export built with an openpyxl write-only workbook.
+
+    Write-only worksheets spill rows to disk as they are appended; the
+    finished file is spooled to a temp file and streamed back in chunks.
+    """
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font
+        from openpyxl.utils import get_column_letter
     except ImportError:
         raise HTTPException(
             status_code=500,
             detail="XLSX export requires openpyxl. Install with: pip install openpyxl",
         )
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Issue Log"
+    async def generate() -> AsyncIterator[bytes]:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Issue Log")
+
+        for idx, (_, _, width) in enumerate(EXPORT_COLUMNS, 1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
+
+        bold = Font(bold=True)
+        header_cells = []
+        for header in EXPORT_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = bold
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        def append_rows(batch: Sequence[Any]) -> None:
+            for row in batch:
+                ws.append(_export_values(row))
+
+        # Cell serialization and the spill to disk stay off the event loop
+        async for batch in _stream_batches(organization_id, query):
+            await run_in_threadpool(append_rows, batch)
+
+        output = tempfile.TemporaryFile()
+        try:
+            await run_in_threadpool(wb.save, output)
+            output.seek(0)
+            while chunk := await run_in_threadpool(output.read, XLSX_CHUNK_SIZE):
+                yield chunk
+        finally:
+            output.close()
 
-    # Header row with bold font
-    headers = [
-        "ID", "Title", "Classification", "Criticality", "Complexity",
-        "Status", "Process Ref", "Process Name", "Date Raised",
-        "Target Date", "Resolution Date", "Resolution Summary",
-        "Opportunity Flag", "Opportunity Status",
-    ]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True)
-
-    # Data rows
-    for row_num, issue in enumerate(issues, 2):
-        ws.cell(row=row_num, column=1, value=issue.display_id)
-        ws.cell(row=row_num, column=2, value=issue.title)
-        ws.cell(row=row_num, column=3, value=issue.issue_classification)
-        ws.cell(row=row_num, column=4, value=issue.issue_criticality)
-        ws.cell(row=row_num, column=5, value=issue.issue_complexity)
-        ws.cell(row=row_num, column=6, value=issue.issue_status)
-        ws.cell(row=row_num, column=7, value=issue.process_ref)
-        ws.cell(row=row_num, column=8, value=issue.process_name)
-        ws.cell(row=row_num, column=9, value=issue.date_raised)
-        ws.cell(row=row_num, column=10, value=issue.target_resolution_date)
-        ws.cell(row=row_num, column=11, value=issue.actual_resolution_date)
-        ws.cell(row=row_num, column=12, value=issue.resolution_summary or "")
-        ws.cell(row=row_num, column=13, value="Yes" if issue.opportunity_flag else "No")
-        ws.cell(row=row_num, column=14, value=issue.opportunity_status or "")
-
-    # Auto-width columns
-    for col in ws.columns:
-        max_length = max(len(str(cell.value or "")) for cell in col)
-        ws.column_dimensions[col[0].column_letter].width = min(max_length + 2, 50)
-
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
     today = date.today().isoformat()
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": f"attachment; filename=ops_issues_{today}.xlsx"
@@ -1,6 +1,8 @@
 """Shared helpers for issue endpoints."""
 
 from fastapi import HTTPException
+from sqlalchemy import ColumnElement, String, case, cast, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
 
 from src.models.issue_log import IssueLog
 from src.schemas.issue_log import IssueResponse
@@ -28,6 +30,25 @@ def validate_status_transition(current: str, new: str) -> None:
         )
 
 
+def display_id_column() -> ColumnElement:
+    """SQL twin of IssueLog.display_id (OPS- prefix, zero-padded to 3 digits)."""
+    number = cast(IssueLog.issue_number, String)
+    return literal("OPS-") + case(
+        (IssueLog.issue_number < 1000, func.lpad(number, 3, "0")),
+        else_=number,
+    )
+
+
+def response_columns() -> dict[str, ColumnElement]:
+    """Derived IssueResponse fields for column-only selects (see to_response)."""
+    return {
+        "display_id": display_id_column(),
+        "opportunity_beneficiary_roles": func.coalesce(
+            IssueLog.opportunity_beneficiary_roles, literal([], JSONB)
+        ),
+    }
+
+
 def to_response(issue: IssueLog) -> IssueResponse:
     """Convert IssueLog model to response schema."""
     return IssueResponse(
@@ -9,14 +9,16 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.issue_log import IssueLog
 from src.models.process import Process
 from src.schemas.issue_log import IssueCreate, IssueResponse, IssueUpdate
+from src.services.result_cache import bump_data_version
 
 from .helpers import level_to_int, to_response, validate_status_transition
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 MAX_RETRY_ATTEMPTS = 3  # For issue_number race condition (CONFLICT 7)
 
@@ -67,6 +69,8 @@ async def create_issue(
             db.add(issue)
             await db.flush()
             await db.refresh(issue)
+            await db.commit()
+            await bump_data_version(user.organization_id)
             return to_response(issue)
 
         except IntegrityError as e:
@@ -109,6 +113,8 @@ async def update_issue(
     issue.updated_by = user.id
     await db.flush()
     await db.refresh(issue)
+    await db.commit()
+    await bump_data_version(user.organization_id)
 
     return to_response(issue)
 
@@ -139,3 +145,5 @@ async def delete_issue(
 
     await db.delete(issue)
     await db.flush()
+    await db.commit()
+    await bump_data_version(user.organization_id)
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process, ProcessOperatingModel
 from src.schemas.operating_model import (
@@ -19,8 +20,9 @@ from src.schemas.operating_model import (
     OperatingModelComponentResponse,
     OperatingModelComponentUpdate,
 )
+from src.services.operating_model_completeness import invalidate_completeness
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 # Literal type constrains path matching — FastAPI won't match "governance" etc.
 JsonbComponentType = Literal["resources", "security", "data"]
@@ -98,6 +100,8 @@ async def create_operating_model_component(
     db.add(component)
     await db.flush()
     await db.refresh(component)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
 
     return OperatingModelComponentResponse.model_validate(component)
 
@@ -132,6 +136,8 @@ async def update_operating_model_component(
 
     await db.flush()
     await db.refresh(component)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
 
     return OperatingModelComponentResponse.model_validate(component)
 
@@ -160,4 +166,5 @@ async def delete_operating_model_component(
         raise HTTPException(status_code=404, detail=f"Component '{component_type}' not found")
 
     await db.delete(component)
-    await db.flush()
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process
 from src.models.operating_model import ProcessGovernance
@@ -15,8 +16,9 @@ from src.schemas.governance import (
     ProcessGovernanceResponse,
     ProcessGovernanceUpdate,
 )
+from src.services.operating_model_completeness import invalidate_completeness
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 async def _verify_process(
@@ -74,6 +76,8 @@ async def create_governance(
     db.add(row)
     await db.flush()
     await db.refresh(row)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
     return ProcessGovernanceResponse.model_validate(row)
 
 
@@ -104,6 +108,8 @@ async def update_governance(
         setattr(row, field, value)
     await db.flush()
     await db.refresh(row)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
     return ProcessGovernanceResponse.model_validate(row)
 
 
@@ -129,4 +135,5 @@ async def delete_governance(
     if not row:
         raise HTTPException(status_code=404, detail="Governance forum not found")
     await db.delete(row)
-    await db.flush()
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
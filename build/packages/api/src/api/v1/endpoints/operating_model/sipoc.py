@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process
 from src.models.operating_model import ProcessSipoc
@@ -15,8 +16,9 @@ from src.schemas.sipoc import (
     ProcessSipocResponse,
     ProcessSipocUpdate,
 )
+from src.services.operating_model_completeness import invalidate_completeness
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 VALID_ELEMENTS = {"supplier", "input", "output", "customer"}
 
@@ -83,6 +85,8 @@ async def create_sipoc(
     db.add(row)
     await db.flush()
     await db.refresh(row)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
     return ProcessSipocResponse.model_validate(row)
 
 
@@ -118,6 +122,8 @@ async def update_sipoc(
         setattr(row, field, value)
     await db.flush()
     await db.refresh(row)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
     return ProcessSipocResponse.model_validate(row)
 
 
@@ -143,4 +149,5 @@ async def delete_sipoc(
     if not row:
         raise HTTPException(status_code=404, detail="SIPOC element not found")
     await db.delete(row)
-    await db.flush()
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
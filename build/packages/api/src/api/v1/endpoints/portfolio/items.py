@@ -4,10 +4,12 @@ from typing import Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.serialization import ListSerializer
 from src.core.tenancy import get_tenant_db
 from src.models.portfolio import PortfolioItem
 from src.schemas.portfolio import (
@@ -16,8 +18,12 @@ from src.schemas.portfolio import (
     PortfolioItemUpdate,
     PortfolioListResponse,
 )
+from src.services.pagination import TotalMode, paginate
+from src.services.tree_cache import PORTFOLIO_TREE, invalidate_tree
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+_list_serializer = ListSerializer(PortfolioListResponse)
 
 
 @router.get("/", response_model=PortfolioListResponse)
@@ -27,11 +33,13 @@ async def list_portfolio_items(
     parent_id: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: TotalMode = Query("exact", alias="total"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """List portfolio items with filtering."""
-    query = select(PortfolioItem).where(
+    query = _list_serializer.select(PortfolioItem).where(
         PortfolioItem.organization_id == user.organization_id
     )
 
@@ -42,18 +50,23 @@ async def list_portfolio_items(
     if parent_id:
         query = query.where(PortfolioItem.parent_id == parent_id)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    query = query.order_by(PortfolioItem.sort_order)
-    query = query.offset((page - 1) * page_size).limit(page_size)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
+    result = await paginate(
+        db,
+        query,
+        (PortfolioItem.sort_order, PortfolioItem.id),
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        total_mode=total_mode,
+    )
 
-    return PortfolioListResponse(
-        items=[PortfolioItemResponse.model_validate(i) for i in items],
-        total=total,
+    return _list_serializer.response(
+        result.items,
+        total=result.total,
+        page=page,
+        per_page=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -78,6 +91,8 @@ async def create_portfolio_item(
     db.add(item)
     await db.flush()
     await db.refresh(item)
+    await db.commit()
+    await invalidate_tree(PORTFOLIO_TREE, user.organization_id)
 
     return PortfolioItemResponse.model_validate(item)
 
@@ -132,6 +147,8 @@ async def update_portfolio_item(
 
     await db.flush()
     await db.refresh(item)
+    await db.commit()
+    await invalidate_tree(PORTFOLIO_TREE, user.organization_id)
 
     return PortfolioItemResponse.model_validate(item)
 
@@ -156,3 +173,5 @@ async def delete_portfolio_item(
 
     item.status = "cancelled"
     await db.flush()
+    await db.commit()
+    await invalidate_tree(PORTFOLIO_TREE, user.organization_id)
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.portfolio import PortfolioItem, PortfolioMilestone
 from src.schemas.portfolio import (
@@ -15,7 +16,7 @@ from src.schemas.portfolio import (
     MilestoneUpdate,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/{item_id}/milestones", response_model=list[MilestoneResponse])
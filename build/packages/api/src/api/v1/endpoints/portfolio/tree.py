@@ -1,43 +1,56 @@
 """Portfolio tree endpoint."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.portfolio import PortfolioItem
 from src.schemas.portfolio import PortfolioTreeNode
 from src.services.tree_builder import build_tree
+from src.services.tree_cache import PORTFOLIO_TREE, get_tree_snapshot, snapshot_response
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+_tree_adapter = TypeAdapter(list[PortfolioTreeNode])
 
 
 @router.get("/tree", response_model=list[PortfolioTreeNode])
 async def get_portfolio_tree(
+    request: Request,
     root_level: str = Query("strategy", description="Starting level for tree"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
 ):
-    """Get portfolio hierarchy as a tree structure."""
-    result = await db.execute(
-        select(PortfolioItem)
-        .where(PortfolioItem.organization_id == user.organization_id)
-        .order_by(PortfolioItem.level, PortfolioItem.sort_order)
-    )
-    all_items = result.scalars().all()
-
-    def node_factory(item: PortfolioItem, children: list[PortfolioTreeNode]) -> PortfolioTreeNode:
-        return PortfolioTreeNode(
-            id=item.id,
-            code=item.code,
-            name=item.name,
-            level=item.level,
-            status=item.status,
-            rag_status=item.rag_status,
-            wsvf_score=float(item.wsvf_score) if item.wsvf_score else None,
-            sort_order=item.sort_order,
-            children=children,
+    """Get portfolio hierarchy as a tree structure (cached, ETag-aware)."""
+
+    async def build() -> bytes:
+        result = await db.execute(
+            select(PortfolioItem)
+            .where(PortfolioItem.organization_id == user.organization_id)
+            .order_by(PortfolioItem.level, PortfolioItem.sort_order)
+        )
+        all_items = result.scalars().all()
+
+        def node_factory(item: PortfolioItem, children: list[PortfolioTreeNode]) -> PortfolioTreeNode:
+            return PortfolioTreeNode(
+                id=item.id,
+                code=item.code,
+                name=item.name,
+                level=item.level,
+                status=item.status,
+                rag_status=item.rag_status,
+                wsvf_score=float(item.wsvf_score) if item.wsvf_score else None,
+                sort_order=item.sort_order,
+                children=children,
+            )
+
+        return _tree_adapter.dump_json(
+            build_tree(all_items, node_factory, root_parent_id=None)
         )
 
-    return build_tree(all_items, node_factory, root_parent_id=None)
+    snapshot = await get_tree_snapshot(PORTFOLIO_TREE, user.organization_id, build)
+    return snapshot_response(request, snapshot)
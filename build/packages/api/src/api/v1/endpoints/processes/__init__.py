@@ -12,13 +12,16 @@ from .reorder import router as reorder_router
 from .systems import router as systems_router
 from .issues import router as issues_router
 from .rag import router as rag_router
+from .bulk_import import router as bulk_import_router
 
 router = APIRouter()
 
 # Include all sub-routers
 router.include_router(list_router, tags=["process-list"])
 router.include_router(reorder_router, tags=["process-reorder"])
+router.include_router(bulk_import_router, tags=["process-import"])
+# Before crud: /rag-summary would otherwise match /{process_id}
+router.include_router(rag_router, tags=["process-rag"])
 router.include_router(crud_router, tags=["process-crud"])
 router.include_router(systems_router, tags=["process-systems"])
 router.include_router(issues_router, tags=["process-issues"])
-router.include_router(rag_router, tags=["process-rag"])
@@ -0,0 +1,60 @@
+"""Bulk process catalogue import endpoint — XLSX/CSV/JSON upload."""
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth import CurrentUser, require_role
+from src.core.instrumentation import InstrumentedRoute
+from src.core.tenancy import get_tenant_db
+from src.schemas.process import ProcessImportResponse
+from src.services.operating_model_completeness import invalidate_completeness
+from src.services.process_import import import_catalogue, read_catalogue
+from src.services.result_cache import bump_data_version
+from src.services.tree_cache import PROCESS_TREE, invalidate_tree
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+@router.post(
+    "/import",
+    response_model=ProcessImportResponse,
+    responses={422: {"model": ProcessImportResponse}},
+)
+async def import_processes(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="Validate and count without writing"),
+    user: CurrentUser = Depends(require_role("admin")),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """
+    Import a process catalogue with RACI, KPIs, system links and issues.
+
+    All-or-nothing: if any row is invalid nothing is written and the row
+    errors are returned with status 422.
+    """
+    try:
+        catalogue = await run_in_threadpool(read_catalogue, file.filename or "", file.file)
+    except ImportError as e:
+        raise HTTPException(
+            status_code=500,
+            detail="XLSX import requires openpyxl. Install with: pip install openpyxl",
+        ) from e
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not read catalogue: {e}") from e
+
+    result = await import_catalogue(
+        db, user.organization_id, user.id, catalogue, dry_run=dry_run
+    )
+    if result.errors:
+        return JSONResponse(status_code=422, content=result.model_dump(mode="json"))
+    if dry_run:
+        return result
+
+    await db.commit()
+    await invalidate_tree(PROCESS_TREE, user.organization_id)
+    await bump_data_version(user.organization_id)
+    await invalidate_completeness(user.organization_id, *result.operating_model_process_ids)
+    result.committed = True
+    return result
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process
 from src.schemas.process import (
@@ -20,8 +21,10 @@ from src.services.process_numbering import (
     get_next_sort_order,
     renumber_siblings,
 )
+from src.services.result_cache import bump_data_version
+from src.services.tree_cache import PROCESS_TREE, invalidate_tree
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/{process_id}", response_model=ProcessDetailResponse)
@@ -74,6 +77,9 @@ async def create_process(
     db.add(process)
     await db.flush()
     await db.refresh(process)
+    await db.commit()
+    await invalidate_tree(PROCESS_TREE, user.organization_id)
+    await bump_data_version(user.organization_id)
 
     return ProcessResponse.model_validate(process)
 
@@ -103,6 +109,9 @@ async def update_process(
 
     await db.flush()
     await db.refresh(process)
+    await db.commit()
+    await invalidate_tree(PROCESS_TREE, user.organization_id)
+    await bump_data_version(user.organization_id)
 
     return ProcessResponse.model_validate(process)
 
@@ -130,3 +139,6 @@ async def delete_process(
 
     # Renumber remaining siblings to close gaps
     await renumber_siblings(db, user.organization_id, process.parent_id)
+    await db.commit()
+    await invalidate_tree(PROCESS_TREE, user.organization_id)
+    await bump_data_version(user.organization_id)
@@ -2,21 +2,26 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
+from sqlalchemy import String, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.serialization import ListSerializer
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process
-from src.schemas.process import (
-    ProcessListResponse,
-    ProcessResponse,
-    ProcessTreeNode,
-)
+from src.schemas.process import ProcessListResponse, ProcessTreeNode
+from src.services.pagination import TotalMode, paginate
+from src.services.search import SEARCH_TARGETS, search_filter
 from src.services.tree_builder import build_tree
+from src.services.tree_cache import PROCESS_TREE, get_tree_snapshot, snapshot_response
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+_tree_adapter = TypeAdapter(list[ProcessTreeNode])
+_list_serializer = ListSerializer(ProcessListResponse)
 
 
 @router.get("/", response_model=ProcessListResponse)
@@ -28,11 +33,17 @@ async def list_processes(
     search: Optional[str] = Query(None, description="Search name/description"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: TotalMode = Query("exact", alias="total"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """List processes with filters and pagination."""
-    query = select(Process).where(
+    query = _list_serializer.select(
+        Process,
+        # rag_overall is a generated column and not mapped on the model
+        rag_overall=literal_column("processes.rag_overall", String),
+    ).where(
         Process.organization_id == user.organization_id
     )
 
@@ -45,32 +56,31 @@ async def list_processes(
     if process_type:
         query = query.where(Process.process_type == process_type)
     if search:
-        query = query.where(
-            Process.name.ilike(f"%{search}%")
-            | Process.description.ilike(f"%{search}%")
-        )
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    # Paginate
-    query = query.order_by(Process.level, Process.sort_order, Process.code)
-    query = query.offset((page - 1) * page_size).limit(page_size)
+        query = query.where(search_filter(SEARCH_TARGETS["process"], search))
 
-    result = await db.execute(query)
-    processes = result.scalars().all()
-
-    return ProcessListResponse(
-        items=[ProcessResponse.model_validate(p) for p in processes],
-        total=total,
+    result = await paginate(
+        db,
+        query,
+        (Process.level, Process.sort_order, Process.code, Process.id),
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        total_mode=total_mode,
+    )
+
+    return _list_serializer.response(
+        result.items,
+        total=result.total,
+        page=page,
+        per_page=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
     )
 
 
 @router.get("/tree", response_model=list[ProcessTreeNode])
 async def get_process_tree(
+    request: Request,
     root_level: str = Query("L0", description="Starting level for tree"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
@@ -78,29 +88,38 @@ async def get_process_tree(
     """
     Get the full process hierarchy as a tree structure.
     Used by the Process Canvas and Tree views.
+
+    Served from a per-tenant pre-encoded snapshot with ETag revalidation.
     """
-    # Get all non-archived processes for this org
-    result = await db.execute(
-        select(Process)
-        .where(
-            Process.organization_id == user.organization_id,
-            Process.status != "archived",
+
+    async def build() -> bytes:
+        # Get all non-archived processes for this org
+        result = await db.execute(
+            select(Process)
+            .where(
+                Process.organization_id == user.organization_id,
+                Process.status != "archived",
+            )
+            .order_by(Process.level, Process.sort_order)
         )
-        .order_by(Process.level, Process.sort_order)
-    )
-    all_processes = result.scalars().all()
-
-    def node_factory(p: Process, children: list[ProcessTreeNode]) -> ProcessTreeNode:
-        return ProcessTreeNode(
-            id=p.id,
-            code=p.code,
-            name=p.name,
-            level=p.level,
-            process_type=p.process_type,
-            status=p.status,
-            current_automation=p.current_automation,
-            sort_order=p.sort_order,
-            children=children,
+        all_processes = result.scalars().all()
+
+        def node_factory(p: Process, children: list[ProcessTreeNode]) -> ProcessTreeNode:
+            return ProcessTreeNode(
+                id=p.id,
+                code=p.code,
+                name=p.name,
+                level=p.level,
+                process_type=p.process_type,
+                status=p.status,
+                current_automation=p.current_automation,
+                sort_order=p.sort_order,
+                children=children,
+            )
+
+        return _tree_adapter.dump_json(
+            build_tree(all_processes, node_factory, root_parent_id=None)
         )
 
-    return build_tree(all_processes, node_factory, root_parent_id=None)
+    snapshot = await get_tree_snapshot(PROCESS_TREE, user.organization_id, build)
+    return snapshot_response(request, snapshot)
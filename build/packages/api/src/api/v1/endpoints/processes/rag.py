@@ -2,11 +2,12 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select, text
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user, require_role
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.issue_log import IssueLog
 from src.models.process import Process
@@ -15,13 +16,22 @@ from src.schemas.rag_assessment import (
     RAGAssessmentResponse,
     RAGHistoryEntry,
     RAGHistoryResponse,
+    RAGRecalculateJobResponse,
     RAGRecalculateRequest,
     RAGRecalculateResponse,
     RAGSummaryItem,
     RAGSummaryResponse,
 )
+from src.services.aggregates import grouped_counts, unpack_grouped_counts
+from src.services.rag_recalculation import (
+    create_recalculation_job,
+    get_recalculation_job,
+    recalculate_rag,
+    run_recalculation_job,
+)
+from src.services.result_cache import bump_data_version, cached_result
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 DIMENSION_COLS = {
     "people": "rag_people",
@@ -87,6 +97,8 @@ async def set_rag_assessment(
 
     await db.flush()
     await db.refresh(process)
+    await db.commit()
+    await bump_data_version(user.organization_id)
 
     return RAGAssessmentResponse(
         process_id=process.id,
@@ -156,66 +168,47 @@ async def get_rag_summary(
     """Get org-wide RAG distribution summary."""
     org_id = user.organization_id
 
-    # Overall distribution (by rag_overall)
-    overall_result = await db.execute(
-        text("""
-            SELECT rag_overall, COUNT(*) as count
-            FROM processes
-            WHERE organization_id = :org_id AND status != 'archived'
-            GROUP BY rag_overall
-        """),
-        {"org_id": org_id},
-    )
-    overall = [
-        RAGSummaryItem(status=row[0] or "neutral", count=row[1])
-        for row in overall_result.fetchall()
-    ]
-
-    # By dimension
-    by_dimension = {}
-    for dim, col in DIMENSION_COLS.items():
-        dim_result = await db.execute(
-            text(f"""
-                SELECT {col}, COUNT(*) as count
-                FROM processes
-                WHERE organization_id = :org_id AND status != 'archived'
-                GROUP BY {col}
-            """),
-            {"org_id": org_id},
-        )
-        by_dimension[dim] = [
-            RAGSummaryItem(status=row[0] or "neutral", count=row[1])
-            for row in dim_result.fetchall()
+    async def build() -> RAGSummaryResponse:
+        # rag_overall is a generated column and not mapped on the model
+        columns = [literal_column("processes.rag_overall")] + [
+            getattr(Process, col) for col in DIMENSION_COLS.values()
         ]
-
-    # Total processes
-    total_result = await db.execute(
-        select(func.count()).where(
+        with_issues = (
+            select(func.count(func.distinct(IssueLog.process_id)))
+            .where(
+                IssueLog.organization_id == org_id,
+                IssueLog.issue_status.in_(["open", "in_progress"]),
+            )
+            .scalar_subquery()
+        )
+        query = grouped_counts(
+            columns,
             Process.organization_id == org_id,
             Process.status != "archived",
+        ).add_columns(with_issues)
+
+        rows = (await db.execute(query)).fetchall()
+        names = ["overall", *DIMENSION_COLS]
+        total, counts = unpack_grouped_counts(rows, names, default="neutral")
+
+        def items(name: str) -> list[RAGSummaryItem]:
+            return [
+                RAGSummaryItem(status=value, count=count)
+                for value, count in counts[name].items()
+            ]
+
+        return RAGSummaryResponse(
+            overall_distribution=items("overall"),
+            by_dimension={dim: items(dim) for dim in DIMENSION_COLS},
+            total_processes=total,
+            processes_with_issues=rows[0][-1] if rows else 0,
         )
-    )
-    total = total_result.scalar() or 0
-
-    # Processes with open issues
-    issues_result = await db.execute(
-        select(func.count(func.distinct(IssueLog.process_id))).where(
-            IssueLog.organization_id == org_id,
-            IssueLog.issue_status.in_(["open", "in_progress"]),
-        )
-    )
-    with_issues = issues_result.scalar() or 0
 
-    return RAGSummaryResponse(
-        overall_distribution=overall,
-        by_dimension=by_dimension,
-        total_processes=total,
-        processes_with_issues=with_issues,
-    )
+    return await cached_result(RAGSummaryResponse, "rag-summary", org_id, build)
 
 
 @router.post("/rag-recalculate", response_model=RAGRecalculateResponse)
-async def recalculate_rag(
+async def recalculate_rag_statuses(
     body: RAGRecalculateRequest,
     user: CurrentUser = Depends(require_role("admin")),
     db: AsyncSession = Depends(get_tenant_db),
@@ -224,102 +217,44 @@ async def recalculate_rag(
     Admin-only: Force recalculation of RAG statuses from issue data.
 
     Useful after bulk issue imports or manual database corrections.
+    Runs as a single set-based statement; processes_updated counts the
+    processes whose RAG actually changed.
     """
-    org_id = user.organization_id
-
-    # Get target processes
-    if body.process_ids:
-        proc_result = await db.execute(
-            select(Process.id).where(
-                Process.id.in_(body.process_ids),
-                Process.organization_id == org_id,
-            )
-        )
-    else:
-        proc_result = await db.execute(
-            select(Process.id).where(
-                Process.organization_id == org_id,
-                Process.status != "archived",
-            )
-        )
+    updated_ids = await recalculate_rag(db, user.organization_id, body.process_ids)
+    if updated_ids:
+        await db.commit()
+        await bump_data_version(user.organization_id)
 
-    process_ids = [row[0] for row in proc_result.fetchall()]
-    updated = 0
-    errors = []
-
-    for pid in process_ids:
-        try:
-            # Trigger RAG sync by doing a no-op update on any issue
-            # Or call the sync function directly via raw SQL
-            await db.execute(
-                text("""
-                    SELECT sync_process_rag_from_issues_for_process(:pid)
-                """),
-                {"pid": pid},
-            )
-            updated += 1
-        except Exception as e:
-            errors.append(f"Process {pid}: {str(e)}")
+    return RAGRecalculateResponse(processes_updated=len(updated_ids))
 
-    # Alternative: call the trigger function for each process
-    # Since we don't have a dedicated recalc function, we can create
-    # a temporary issue and delete it to trigger the sync
-    # For now, just update RAG based on current issue counts
 
-    if not errors:
-        # Direct recalculation without relying on trigger
-        for pid in process_ids:
-            await _recalculate_process_rag(db, pid)
-            updated += 1
+@router.post(
+    "/rag-recalculate/jobs",
+    response_model=RAGRecalculateJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_rag_recalculation_job(
+    body: RAGRecalculateRequest,
+    background_tasks: BackgroundTasks,
+    user: CurrentUser = Depends(require_role("admin")),
+):
+    """Admin-only: Run RAG recalculation in the background in batches."""
+    job = await create_recalculation_job(user.organization_id)
+    background_tasks.add_task(
+        run_recalculation_job, job, user.organization_id, body.process_ids
+    )
+    return RAGRecalculateJobResponse(**job)
 
-    await db.flush()
 
-    return RAGRecalculateResponse(
-        processes_updated=updated,
-        errors=errors,
-    )
+@router.get("/rag-recalculate/jobs/{job_id}", response_model=RAGRecalculateJobResponse)
+async def get_rag_recalculation_job(
+    job_id: str,
+    user: CurrentUser = Depends(require_role("admin")),
+):
+    """Admin-only: Poll progress of a background RAG recalculation."""
+    job = await get_recalculation_job(user.organization_id, job_id)
 
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-async def _recalculate_process_rag(db: AsyncSession, process_id: str) -> None:
-    """Recalculate RAG for a single process based on open issues."""
-    # Get issue stats
-    result = await db.execute(
-        select(
-            IssueLog.issue_classification,
-            IssueLog.issue_criticality,
-        ).where(
-            IssueLog.process_id == process_id,
-            IssueLog.issue_status.in_(["open", "in_progress"]),
-        )
-    )
-    issues = result.fetchall()
-
-    # Initialize all as neutral
-    rag_values = {
-        "rag_people": "neutral",
-        "rag_process": "neutral",
-        "rag_system": "neutral",
-        "rag_data": "neutral",
-    }
-
-    # Process issues
-    for classification, criticality in issues:
-        col = f"rag_{classification}"
-        if col in rag_values:
-            if criticality == "high":
-                rag_values[col] = "red"
-            elif rag_values[col] != "red":
-                rag_values[col] = "amber"
-
-    # Update process
-    await db.execute(
-        text("""
-            UPDATE processes
-            SET rag_people = :rag_people,
-                rag_process = :rag_process,
-                rag_system = :rag_system,
-                rag_data = :rag_data
-            WHERE id = :pid
-        """),
-        {"pid": process_id, **rag_values},
-    )
+    return RAGRecalculateJobResponse(**job)
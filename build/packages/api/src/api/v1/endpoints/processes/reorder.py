@@ -5,17 +5,18 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process
 from src.schemas.process import ProcessReorder, ProcessResponse
 from src.services.process_numbering import (
     calculate_level_from_parent,
     renumber_all_processes,
-    renumber_siblings,
-    renumber_subtree,
+    renumber_processes,
 )
+from src.services.tree_cache import PROCESS_TREE, invalidate_tree
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.post("/reorder", response_model=ProcessResponse)
@@ -65,19 +66,16 @@ async def reorder_process(
     process.sort_order = body.new_sort_order
     await db.flush()
 
-    # Renumber old siblings (close gap where process was removed)
-    updated_ids = await renumber_siblings(db, user.organization_id, old_parent_id)
-
-    # If reparenting, also renumber new siblings
+    # Renumber old siblings (close gap where process was removed) and, if
+    # reparenting, the new siblings. Descendants cascade in the same pass.
+    affected_parents = {old_parent_id}
     if is_reparenting:
-        updated_ids.extend(
-            await renumber_siblings(db, user.organization_id, body.new_parent_id)
-        )
-
-    # Cascade code changes to children if this process's code changed
-    await renumber_subtree(db, user.organization_id, process.id)
+        affected_parents.add(body.new_parent_id)
+    await renumber_processes(db, user.organization_id, affected_parents)
 
     await db.refresh(process)
+    await db.commit()
+    await invalidate_tree(PROCESS_TREE, user.organization_id)
     return ProcessResponse.model_validate(process)
 
 
@@ -89,4 +87,5 @@ async def regenerate_process_codes(
     """Regenerate all process codes with hierarchical numbering (1, 1.1, 1.1.1, etc.)."""
     count = await renumber_all_processes(db, user.organization_id)
     await db.commit()
+    await invalidate_tree(PROCESS_TREE, user.organization_id)
     return {"message": f"Regenerated codes for {count} processes"}
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.process import Process
 from src.models.system_catalogue import ProcessSystem, SystemCatalogue
@@ -18,8 +19,9 @@ from src.schemas.system_catalogue import (
     ProcessSystemsResponse,
     SystemBrief,
 )
+from src.services.operating_model_completeness import invalidate_completeness
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/{process_id}/systems", response_model=ProcessSystemsResponse)
@@ -123,6 +125,8 @@ async def link_system_to_process(
     db.add(link)
     await db.flush()
     await db.refresh(link)
+    await db.commit()
+    await invalidate_completeness(user.organization_id, process_id)
 
     response = ProcessSystemResponse.model_validate(link)
     response.process = ProcessBrief.model_validate(process)
@@ -151,4 +155,5 @@ async def remove_process_system_link(
         raise HTTPException(status_code=404, detail="Link not found")
 
     await db.delete(link)
-    await db.flush()
+    await db.commit()
+    await invalidate_completeness(user.organization_id, link.process_id)
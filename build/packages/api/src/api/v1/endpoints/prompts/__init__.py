@@ -9,6 +9,7 @@ from fastapi import APIRouter
 
 from .templates import router as templates_router
 from .execution import router as execution_router
+from .batches import router as batches_router
 from .llm_config import router as llm_config_router
 
 router = APIRouter()
@@ -16,4 +17,5 @@ router = APIRouter()
 # Include all sub-routers
 router.include_router(templates_router, tags=["prompt-templates"])
 router.include_router(execution_router, tags=["prompt-execution"])
+router.include_router(batches_router, tags=["prompt-execution"])
 router.include_router(llm_config_router, tags=["llm-config"])
@@ -0,0 +1,160 @@
+"""Batch prompt execution endpoints.
+
+POST /batches starts a template run over a set of processes in the background.
+Progress can be polled with GET /batches/{id} or followed as server-sent events:
+
+    event: progress    PromptBatchJobResponse  whenever the counters change
+    event: done        PromptBatchJobResponse  once completed or failed
+
+Results are the job's executions: GET /executions?batch_job_id=...
+"""
+
+import asyncio
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth import CurrentUser, get_current_user
+from src.core.database import async_session_factory
+from src.core.instrumentation import InstrumentedRoute
+from src.core.tenancy import apply_tenant_context, get_tenant_db
+from src.models.reference import PromptBatchJob, PromptTemplate
+from src.schemas.prompts import PromptBatchCreate, PromptBatchJobResponse
+from src.services import prompt_batch
+
+from .execution import _sse
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+# Seconds between progress checks on the events stream
+BATCH_EVENTS_POLL_INTERVAL = 1.0
+
+
+async def _get_job(db: AsyncSession, organization_id: str, job_id: str) -> PromptBatchJob:
+    result = await db.execute(
+        select(PromptBatchJob)
+        .where(PromptBatchJob.id == job_id, PromptBatchJob.organization_id == organization_id)
+        .execution_options(populate_existing=True)
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job
+
+
+@router.post(
+    "/batches",
+    response_model=PromptBatchJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_batch(
+    body: PromptBatchCreate,
+    background_tasks: BackgroundTasks,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Run a prompt template over every matching process in the background."""
+    result = await db.execute(
+        select(PromptTemplate.id).where(
+            PromptTemplate.id == body.template_id,
+            PromptTemplate.organization_id == user.organization_id,
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Prompt template not found")
+
+    targets = await prompt_batch.resolve_targets(
+        db, user.organization_id, body.process_ids, body.root_id, body.level
+    )
+    if not targets:
+        raise HTTPException(status_code=400, detail="No processes match the selection")
+    if len(targets) > prompt_batch.BATCH_MAX_TARGETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Selection matches {len(targets)} processes; "
+                   f"the limit is {prompt_batch.BATCH_MAX_TARGETS}",
+        )
+
+    job = await prompt_batch.create_job(
+        db, user.organization_id, user.id, body.template_id, targets,
+        temperature=body.temperature, max_tokens=body.max_tokens,
+    )
+    await db.commit()
+
+    background_tasks.add_task(prompt_batch.run_job, user.organization_id, job.id)
+    return PromptBatchJobResponse.model_validate(job)
+
+
+@router.get("/batches/{job_id}", response_model=PromptBatchJobResponse)
+async def get_batch(
+    job_id: str,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Poll a batch job's progress."""
+    job = await _get_job(db, user.organization_id, job_id)
+    return PromptBatchJobResponse.model_validate(job)
+
+
+@router.get("/batches/{job_id}/events")
+async def stream_batch_events(
+    job_id: str,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Follow a batch job's progress as server-sent events until it finishes."""
+    await _get_job(db, user.organization_id, job_id)
+
+    # The body streams after the handler returns, so it polls on a session of its own
+    async def events():
+        last = None
+        async with async_session_factory() as session:
+            await apply_tenant_context(session, user.organization_id)
+            while True:
+                job = await _get_job(session, user.organization_id, job_id)
+                # End the transaction so the next poll sees the runner's checkpoints
+                await session.commit()
+                data = PromptBatchJobResponse.model_validate(job).model_dump(mode="json")
+                if job.status != "running":
+                    yield _sse(data, "done")
+                    return
+                progress = (job.completed, job.failed, job.total)
+                if progress != last:
+                    yield _sse(data, "progress")
+                    last = progress
+                await asyncio.sleep(BATCH_EVENTS_POLL_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/batches/{job_id}/resume",
+    response_model=PromptBatchJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_batch(
+    job_id: str,
+    background_tasks: BackgroundTasks,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """
+    Resume a failed or stalled job, or retry a finished job's failed
+    prompts; processes that already have a result are skipped.
+    """
+    await _get_job(db, user.organization_id, job_id)
+    if not await prompt_batch.claim_job(db, user.organization_id, job_id):
+        raise HTTPException(
+            status_code=409, detail="Batch job is still running or has nothing to retry"
+        )
+    await db.commit()
+
+    job = await _get_job(db, user.organization_id, job_id)
+    background_tasks.add_task(prompt_batch.run_job, user.organization_id, job_id)
+    return PromptBatchJobResponse.model_validate(job)
@@ -1,33 +1,50 @@
-"""Prompt execution endpoints."""
-
-from typing import Optional
+"""Prompt execution endpoints.
+
+POST /execute runs the prompt and returns the completed execution record.
+POST /execute/stream streams tokens as server-sent events:
+
+    event: execution   {"id": ...}             once, before the first token
+    data: {"text": ...}                        per chunk
+    event: done        PromptExecutionResponse once usage is recorded
+    event: error       {"detail": ...}         instead of done on failure
+"""
+
+import json
+import logging
+import time
+from contextlib import aclosing
+from typing import Any, Optional
 from uuid import uuid4
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
-from src.core.tenancy import get_tenant_db
+from src.core.database import async_session_factory
+from src.core.instrumentation import InstrumentedRoute
+from src.core.providers.llm import LLMConfig, LLMResponse
+from src.core.tenancy import apply_tenant_context, get_tenant_db
 from src.models.reference import LLMConfiguration, PromptExecution, PromptTemplate
 from src.schemas.prompts import (
     PromptExecutionCreate,
     PromptExecutionResponse,
 )
+from src.services import llm_engine
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
 
+router = APIRouter(route_class=InstrumentedRoute)
 
-@router.post("/execute", response_model=PromptExecutionResponse)
-async def execute_prompt(
+
+async def _start_execution(
     body: PromptExecutionCreate,
-    user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_tenant_db),
-):
-    """
-    Execute a prompt against a target entity.
-    This records the execution - actual LLM call is handled by the service layer.
-    """
+    user: CurrentUser,
+    db: AsyncSession,
+) -> tuple[PromptExecution, str, LLMConfig]:
+    """Record the execution and resolve the provider and request settings."""
     # Get LLM config
     result = await db.execute(
         select(LLMConfiguration).where(
@@ -43,14 +60,30 @@ async def execute_prompt(
             detail="No LLM configuration found. Please configure an LLM provider.",
         )
 
-    # Update template usage count if using a template
+    config = LLMConfig(
+        model=llm_config.model,
+        temperature=float(llm_config.default_temperature),
+        max_tokens=llm_config.default_max_tokens,
+    )
+
+    # Update template usage count if using a template; its defaults apply
     if body.template_id:
-        result = await db.execute(
+        template_result = await db.execute(
             select(PromptTemplate).where(PromptTemplate.id == body.template_id)
         )
-        template = result.scalar_one_or_none()
+        template = template_result.scalar_one_or_none()
         if template:
             template.usage_count += 1
+            config.system_prompt = template.system_prompt
+            if template.default_temperature is not None:
+                config.temperature = float(template.default_temperature)
+            if template.default_max_tokens:
+                config.max_tokens = template.default_max_tokens
+
+    if body.temperature is not None:
+        config.temperature = body.temperature
+    if body.max_tokens is not None:
+        config.max_tokens = body.max_tokens
 
     # Create execution record
     execution = PromptExecution(
@@ -62,19 +95,115 @@ async def execute_prompt(
         target_entity_id=body.target_entity_id,
         prompt_sent=body.prompt_text,
         model_used=llm_config.model,
-        # Response fields will be updated by the LLM service
     )
     db.add(execution)
     await db.flush()
     await db.refresh(execution)
 
+    return execution, llm_engine.resolve_provider_name(llm_config.provider), config
+
+
+def _record_response(execution: PromptExecution, response: LLMResponse) -> None:
+    execution.response_received = response.content
+    execution.model_used = response.model
+    execution.prompt_tokens = response.prompt_tokens
+    execution.completion_tokens = response.completion_tokens
+    execution.total_tokens = response.total_tokens
+
+
+def _sse(data: Any, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+@router.post("/execute", response_model=PromptExecutionResponse)
+async def execute_prompt(
+    body: PromptExecutionCreate,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Execute a prompt against a target entity and record the response and usage."""
+    execution, provider_name, config = await _start_execution(body, user, db)
+    # Release the template row lock and the connection before the provider call
+    await db.commit()
+
+    start = time.perf_counter()
+    try:
+        response = await llm_engine.generate(
+            user.organization_id, provider_name, body.prompt_text, config
+        )
+    except Exception as e:
+        logger.warning("LLM execution %s failed: %s", execution.id, e)
+        execution.error_message = str(e)
+    else:
+        _record_response(execution, response)
+    execution.execution_time_ms = round((time.perf_counter() - start) * 1000)
+    await db.commit()
+
+    if execution.error_message:
+        raise HTTPException(status_code=502, detail=f"LLM provider error: {execution.error_message}")
     return PromptExecutionResponse.model_validate(execution)
 
 
+@router.post("/execute/stream")
+async def execute_prompt_stream(
+    body: PromptExecutionCreate,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Execute a prompt, streaming tokens as server-sent events."""
+    execution, provider_name, config = await _start_execution(body, user, db)
+    await db.commit()
+    # The body streams after the handler returns, when the request session
+    # may already be closed; the result is recorded on a session of its own
+    db.expunge(execution)
+
+    async def events():
+        yield _sse({"id": execution.id}, "execution")
+        start = time.perf_counter()
+        try:
+            async with aclosing(
+                llm_engine.stream(user.organization_id, provider_name, body.prompt_text, config)
+            ) as chunks:
+                async for item in chunks:
+                    if isinstance(item, LLMResponse):
+                        _record_response(execution, item)
+                    else:
+                        yield _sse({"text": item})
+        except Exception as e:
+            logger.warning("LLM execution %s failed: %s", execution.id, e)
+            execution.error_message = str(e)
+        except BaseException:
+            # GeneratorExit or cancellation: the client went away mid-stream
+            execution.error_message = "client disconnected"
+            raise
+        finally:
+            execution.execution_time_ms = round((time.perf_counter() - start) * 1000)
+            # Shielded so a cancelled response task still records the outcome
+            with anyio.CancelScope(shield=True):
+                async with async_session_factory() as session:
+                    await apply_tenant_context(session, user.organization_id)
+                    session.add(execution)
+                    await session.commit()
+
+        if execution.error_message:
+            yield _sse({"detail": f"LLM provider error: {execution.error_message}"}, "error")
+        else:
+            result = PromptExecutionResponse.model_validate(execution)
+            yield _sse(result.model_dump(mode="json"), "done")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/executions", response_model=list[PromptExecutionResponse])
 async def list_executions(
     template_id: Optional[str] = Query(None),
     target_entity_type: Optional[str] = Query(None),
+    batch_job_id: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=200),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
@@ -89,6 +218,8 @@ async def list_executions(
         query = query.where(PromptExecution.template_id == template_id)
     if target_entity_type:
         query = query.where(PromptExecution.target_entity_type == target_entity_type)
+    if batch_job_id:
+        query = query.where(PromptExecution.batch_job_id == batch_job_id)
 
     query = query.order_by(PromptExecution.created_at.desc()).limit(limit)
 
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.security import encrypt_sensitive_data
 from src.core.tenancy import get_tenant_db
 from src.models.reference import LLMConfiguration
@@ -16,7 +17,7 @@ from src.schemas.prompts import (
     LLMConfigUpdate,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/llm-config", response_model=list[LLMConfigResponse])
@@ -8,6 +8,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.reference import PromptTemplate
 from src.schemas.prompts import (
@@ -17,7 +18,7 @@ from src.schemas.prompts import (
     PromptTemplateUpdate,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 VALID_CATEGORIES = {
     "documentation",
@@ -7,10 +7,11 @@ from typing import Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.reference import ReferenceCatalogue
 from src.schemas.reference import (
@@ -20,8 +21,10 @@ from src.schemas.reference import (
     ReferenceCatalogueResponse,
     ReferenceCatalogueUpdate,
 )
+from src.services.pagination import TotalMode, paginate
+from src.services.search import SEARCH_TARGETS, search_filter
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/", response_model=ReferenceCatalogueListResponse)
@@ -29,6 +32,10 @@ async def list_reference_catalogues(
     catalogue_type: Optional[str] = Query(None, description="Filter by type"),
     status: Optional[str] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search code/name"),
+    page: int = Query(1, ge=1),
+    page_size: Optional[int] = Query(None, ge=1, le=200, description="Omit to list everything"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: TotalMode = Query("exact", alias="total"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
 ):
@@ -42,28 +49,31 @@ async def list_reference_catalogues(
     if status:
         query = query.where(ReferenceCatalogue.status == status)
     if search:
-        query = query.where(
-            ReferenceCatalogue.name.ilike(f"%{search}%")
-            | ReferenceCatalogue.code.ilike(f"%{search}%")
-        )
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+        query = query.where(search_filter(SEARCH_TARGETS["reference"], search))
 
     # Order by type, then sort_order
-    query = query.order_by(
-        ReferenceCatalogue.catalogue_type,
-        ReferenceCatalogue.sort_order,
-        ReferenceCatalogue.name,
+    result = await paginate(
+        db,
+        query,
+        (
+            ReferenceCatalogue.catalogue_type,
+            ReferenceCatalogue.sort_order,
+            ReferenceCatalogue.name,
+            ReferenceCatalogue.id,
+        ),
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        total_mode=total_mode,
     )
 
-    result = await db.execute(query)
-    items = result.scalars().all()
-
     return ReferenceCatalogueListResponse(
-        items=[ReferenceCatalogueResponse.model_validate(item) for item in items],
-        total=total,
+        items=[ReferenceCatalogueResponse.model_validate(item) for item in result.items],
+        total=result.total,
+        page=page,
+        per_page=page_size or len(result.items),
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -0,0 +1,159 @@
+"""RIADA link graph endpoints: transitive impact, shortest path, cycles.
+
+Traversals run over the tenant's cached adjacency index (services/riada_graph);
+the database is only asked for the details of the items in the answer.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.tenancy import get_tenant_db
+from src.models.riada import RiadaItem
+from src.schemas.riada import (
+    RIADA_LINK_TYPES,
+    RiadaCyclesResponse,
+    RiadaGraphItem,
+    RiadaImpactResponse,
+    RiadaPathResponse,
+)
+from src.services.riada_graph import get_riada_graph
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+# Deepest traversal a client may request
+MAX_IMPACT_DEPTH = 10
+
+# Items returned by one impact query before it is marked truncated
+MAX_IMPACT_ITEMS = 2000
+
+_DIRECTION = "^(outgoing|incoming|both)$"
+
+
+def _check_link_types(link_types: Optional[list[str]]) -> None:
+    invalid = set(link_types or ()) - set(RIADA_LINK_TYPES)
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid link type. Must be one of: {', '.join(RIADA_LINK_TYPES)}",
+        )
+
+
+async def _load_items(db: AsyncSession, organization_id: str, ids: list[str]) -> dict[str, tuple]:
+    """id -> (code, title, riada_type, severity, status) for the given items."""
+    result = await db.execute(
+        select(
+            RiadaItem.id, RiadaItem.code, RiadaItem.title,
+            RiadaItem.riada_type, RiadaItem.severity, RiadaItem.status,
+        ).where(RiadaItem.organization_id == organization_id, RiadaItem.id.in_(ids))
+    )
+    return {row[0]: row[1:] for row in result}
+
+
+def _graph_item(details: tuple, item_id: str, depth: int, **edge) -> RiadaGraphItem:
+    code, title, riada_type, severity, status = details
+    return RiadaGraphItem(
+        id=item_id, code=code, title=title, riada_type=riada_type,
+        severity=severity, status=status, depth=depth, **edge,
+    )
+
+
+@router.get("/graph/cycles", response_model=RiadaCyclesResponse)
+async def get_riada_cycles(
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """
+    Groups of items that reach each other through directed links
+    (blocks, depends_on, ...). Links created through the API are checked
+    for cycles; this reports any that predate the check or bypassed it.
+    """
+    graph = await get_riada_graph(db, user.organization_id)
+    cycles = graph.cycles()
+    return RiadaCyclesResponse(cycles=cycles, total=len(cycles))
+
+
+@router.get("/{riada_id}/impact", response_model=RiadaImpactResponse)
+async def get_riada_impact(
+    riada_id: str,
+    depth: int = Query(3, ge=1, le=MAX_IMPACT_DEPTH, description="Maximum number of hops"),
+    direction: str = Query(
+        "outgoing", pattern=_DIRECTION,
+        description="outgoing: what this item affects; incoming: what affects it",
+    ),
+    link_types: Optional[list[str]] = Query(None, description="Only follow these link types"),
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Items transitively linked to a RIADA item, e.g. everything a risk blocks."""
+    _check_link_types(link_types)
+    graph = await get_riada_graph(db, user.organization_id)
+    reached, truncated = graph.reachable(
+        riada_id, depth, direction, link_types, limit=MAX_IMPACT_ITEMS
+    )
+
+    details = await _load_items(db, user.organization_id, [riada_id, *(r.id for r in reached)])
+    if riada_id not in details:
+        raise HTTPException(status_code=404, detail="RIADA item not found")
+
+    items = [
+        _graph_item(
+            details[r.id], r.id, r.depth,
+            via_id=r.via_id, link_type=r.link_type, link_direction=r.direction,
+        )
+        for r in reached
+        if r.id in details
+    ]
+    return RiadaImpactResponse(
+        riada_id=riada_id,
+        direction=direction,
+        max_depth=depth,
+        items=items,
+        total=len(items),
+        truncated=truncated,
+    )
+
+
+@router.get("/{riada_id}/path/{target_id}", response_model=RiadaPathResponse)
+async def get_riada_path(
+    riada_id: str,
+    target_id: str,
+    direction: str = Query(
+        "outgoing", pattern=_DIRECTION,
+        description="outgoing follows links as created; both ignores their direction",
+    ),
+    link_types: Optional[list[str]] = Query(None, description="Only follow these link types"),
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Shortest chain of links from one RIADA item to another."""
+    _check_link_types(link_types)
+    graph = await get_riada_graph(db, user.organization_id)
+    path = graph.shortest_path(riada_id, target_id, direction, link_types) or []
+
+    details = await _load_items(
+        db, user.organization_id, [riada_id, target_id, *(step.id for step in path)]
+    )
+    if riada_id not in details or target_id not in details:
+        raise HTTPException(status_code=404, detail="RIADA item not found")
+
+    items = [
+        _graph_item(
+            details[step.id], step.id, depth,
+            via_id=path[depth - 1].id if depth else None,
+            link_type=step.link_type, link_direction=step.direction,
+        )
+        for depth, step in enumerate(path)
+        if step.id in details
+    ]
+    return RiadaPathResponse(
+        source_id=riada_id,
+        target_id=target_id,
+        found=bool(path),
+        length=len(path) - 1 if path else None,
+        items=items,
+    )
@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.riada import RiadaItem
 from src.schemas.riada import (
@@ -14,8 +15,10 @@ from src.schemas.riada import (
     RiadaResponse,
     RiadaUpdate,
 )
+from src.services.result_cache import bump_data_version
+from src.services.riada_graph import invalidate_riada_graph
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 def _generate_riada_code(riada_type: str, sequence: int) -> str:
@@ -87,6 +90,8 @@ async def create_riada_item(
     db.add(item)
     await db.flush()
     await db.refresh(item)
+    await db.commit()
+    await bump_data_version(user.organization_id)
 
     return RiadaResponse.model_validate(item)
 
@@ -120,6 +125,8 @@ async def update_riada_item(
 
     await db.flush()
     await db.refresh(item)
+    await db.commit()
+    await bump_data_version(user.organization_id)
 
     return RiadaResponse.model_validate(item)
 
@@ -144,3 +151,7 @@ async def delete_riada_item(
 
     await db.delete(item)
     await db.flush()
+    await db.commit()
+    await bump_data_version(user.organization_id)
+    # Its links were deleted with it
+    await invalidate_riada_graph(user.organization_id)
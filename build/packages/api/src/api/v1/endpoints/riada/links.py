@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.riada import RiadaItem, RiadaLink
 from src.schemas.riada import (
@@ -20,8 +21,30 @@ from src.schemas.riada import (
     RiadaLinkedItemBrief,
     RiadaLinksResponse,
 )
+from src.services.riada_graph import get_riada_graph, invalidate_riada_graph
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+async def _reject_cycle(
+    db: AsyncSession, organization_id: str, source_id: str, target_id: str, link_type: str
+) -> None:
+    """409 if a source -> target link of this type would close a dependency cycle."""
+    graph = await get_riada_graph(db, organization_id)
+    cycle = graph.cycle_if_linked(source_id, target_id, link_type)
+    if not cycle:
+        return
+    result = await db.execute(
+        select(RiadaItem.id, RiadaItem.code).where(
+            RiadaItem.organization_id == organization_id,
+            RiadaItem.id.in_(cycle),
+        )
+    )
+    codes = dict(result.tuples().all())
+    raise HTTPException(
+        status_code=409,
+        detail=f"Link would create a cycle: {' -> '.join(codes.get(i, i) for i in cycle)}",
+    )
 
 
 @router.get("/{riada_id}/links", response_model=RiadaLinksResponse)
@@ -148,6 +171,8 @@ async def create_riada_link(
             status_code=409, detail="A link between these items already exists"
         )
 
+    await _reject_cycle(db, user.organization_id, riada_id, body.target_id, body.link_type)
+
     # Create link
     link = RiadaLink(
         id=str(uuid4()),
@@ -160,6 +185,8 @@ async def create_riada_link(
     db.add(link)
     await db.flush()
     await db.refresh(link)
+    await db.commit()
+    await invalidate_riada_graph(user.organization_id)
 
     return RiadaLinkResponse.model_validate(link)
 
@@ -190,6 +217,8 @@ async def delete_riada_link(
 
     await db.delete(link)
     await db.flush()
+    await db.commit()
+    await invalidate_riada_graph(user.organization_id)
 
 
 @router.patch("/{riada_id}/links/{link_id}", response_model=RiadaLinkResponse)
@@ -221,6 +250,9 @@ async def update_riada_link(
     if not link:
         raise HTTPException(status_code=404, detail="Link not found")
 
+    if body.link_type != link.link_type:
+        await _reject_cycle(db, user.organization_id, riada_id, link.target_id, body.link_type)
+
     # Update fields
     link.link_type = body.link_type
     if body.notes is not None:
@@ -228,5 +260,7 @@ async def update_riada_link(
 
     await db.flush()
     await db.refresh(link)
+    await db.commit()
+    await invalidate_riada_graph(user.organization_id)
 
     return RiadaLinkResponse.model_validate(link)
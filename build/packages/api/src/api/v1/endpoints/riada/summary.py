@@ -3,19 +3,22 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.serialization import ListSerializer
 from src.core.tenancy import get_tenant_db
 from src.models.riada import RiadaItem
-from src.schemas.riada import (
-    RiadaListResponse,
-    RiadaResponse,
-    RiadaSummary,
-)
+from src.schemas.riada import RiadaListResponse, RiadaSummary
+from src.services.aggregates import grouped_counts, unpack_grouped_counts
+from src.services.pagination import TotalMode, paginate
+from src.services.result_cache import cached_result
+from src.services.search import SEARCH_TARGETS, search_filter
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+_list_serializer = ListSerializer(RiadaListResponse)
 
 
 @router.get("/", response_model=RiadaListResponse)
@@ -30,11 +33,13 @@ async def list_riada_items(
     search: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: TotalMode = Query("exact", alias="total"),
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """List RIADA items with comprehensive filtering."""
-    query = select(RiadaItem).where(
+    query = _list_serializer.select(RiadaItem).where(
         RiadaItem.organization_id == user.organization_id
     )
 
@@ -53,25 +58,26 @@ async def list_riada_items(
     if assigned_to_id:
         query = query.where(RiadaItem.assigned_to_id == assigned_to_id)
     if search:
-        query = query.where(
-            RiadaItem.title.ilike(f"%{search}%")
-            | RiadaItem.description.ilike(f"%{search}%")
-        )
-
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    query = query.order_by(RiadaItem.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+        query = query.where(search_filter(SEARCH_TARGETS["riada"], search))
 
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    return RiadaListResponse(
-        items=[RiadaResponse.model_validate(i) for i in items],
-        total=total,
+    result = await paginate(
+        db,
+        query,
+        (RiadaItem.created_at, RiadaItem.id),
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        total_mode=total_mode,
+        descending=True,
+    )
+
+    return _list_serializer.response(
+        result.items,
+        total=result.total,
+        page=page,
+        per_page=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -82,20 +88,21 @@ async def get_riada_summary(
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """Get aggregated RIADA summary for dashboards and heatmaps."""
-    base_query = select(RiadaItem).where(
-        RiadaItem.organization_id == user.organization_id
-    )
-    if process_id:
-        base_query = base_query.where(RiadaItem.process_id == process_id)
+    org_id = user.organization_id
 
-    result = await db.execute(base_query)
-    items = result.scalars().all()
+    async def build() -> RiadaSummary:
+        criteria = [RiadaItem.organization_id == org_id]
+        if process_id:
+            criteria.append(RiadaItem.process_id == process_id)
 
-    summary = RiadaSummary(total=len(items))
-    for item in items:
-        summary.by_type[item.riada_type] = summary.by_type.get(item.riada_type, 0) + 1
-        summary.by_severity[item.severity] = summary.by_severity.get(item.severity, 0) + 1
-        summary.by_status[item.status] = summary.by_status.get(item.status, 0) + 1
-        summary.by_category[item.category] = summary.by_category.get(item.category, 0) + 1
+        query = grouped_counts(
+            [RiadaItem.riada_type, RiadaItem.severity, RiadaItem.status, RiadaItem.category],
+            *criteria,
+        )
+        rows = (await db.execute(query)).fetchall()
+        total, counts = unpack_grouped_counts(
+            rows, ["by_type", "by_severity", "by_status", "by_category"]
+        )
+        return RiadaSummary(total=total, **counts)
 
-    return summary
+    return await cached_result(RiadaSummary, "riada-summary", org_id, build, process_id)
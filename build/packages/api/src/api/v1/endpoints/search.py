@@ -0,0 +1,50 @@
+"""
+Unified search endpoint.
+Full-text and fuzzy matching across processes, RIADA items and reference catalogues.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.tenancy import get_tenant_db
+from src.schemas.search import SearchEntityType, SearchResponse, SearchResult
+from src.services.search import SEARCH_MAX_RESULTS, SEARCH_TARGETS, search_entities
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=2, max_length=200, description="Search text"),
+    types: Optional[list[SearchEntityType]] = Query(None, description="Entity types to search"),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_RESULTS),
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Search all entity types (or the given ones), ranked by relevance."""
+    term = q.strip()
+    rows = await search_entities(
+        db,
+        user.organization_id,
+        term,
+        list(dict.fromkeys(types or SEARCH_TARGETS)),
+        limit,
+    )
+
+    return SearchResponse(
+        query=term,
+        results=[
+            SearchResult(
+                entity_type=row.entity_type,
+                id=row.id,
+                code=row.code,
+                title=row.title,
+                rank=row.rank,
+            )
+            for row in rows
+        ],
+    )
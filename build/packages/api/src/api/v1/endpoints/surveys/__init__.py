@@ -13,6 +13,7 @@ from fastapi import APIRouter
 from .surveys import router as surveys_router
 from .questions import router as questions_router
 from .responses import router as responses_router
+from .results import router as results_router
 
 router = APIRouter()
 
@@ -20,3 +21,4 @@ router = APIRouter()
 router.include_router(surveys_router, tags=["surveys"])
 router.include_router(questions_router, tags=["survey-questions"])
 router.include_router(responses_router, tags=["survey-responses"])
+router.include_router(results_router, tags=["survey-results"])
@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.survey import Survey, SurveyResponse
 from src.schemas.survey import (
@@ -15,8 +16,9 @@ from src.schemas.survey import (
     SurveyResponseDetail,
     SurveyResponseSummary,
 )
+from src.services.survey_analytics import record_response
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 @router.get("/{survey_id}/responses", response_model=list[SurveyResponseSummary])
@@ -109,4 +111,7 @@ async def submit_response(
     await db.flush()
     await db.refresh(response)
 
+    # Last write of the request, so the hot stats rows stay locked only until commit
+    await record_response(db, survey, response)
+
     return SurveyResponseDetail.model_validate(response)
@@ -0,0 +1,116 @@
+"""Survey results from incrementally maintained aggregates."""
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth import CurrentUser, get_current_user, require_role
+from src.core.instrumentation import InstrumentedRoute
+from src.core.tenancy import get_tenant_db
+from src.models.survey import Survey, SurveyStats
+from src.schemas.survey import (
+    SurveyQuestionResult,
+    SurveyResultsRebuildJobResponse,
+    SurveyResultsRebuildRequest,
+    SurveyResultsResponse,
+)
+from src.services.survey_analytics import (
+    create_rebuild_job,
+    get_rebuild_job,
+    run_rebuild_job,
+    score_summary,
+)
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+
+@router.post(
+    "/results/rebuild",
+    response_model=SurveyResultsRebuildJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_results_rebuild(
+    body: SurveyResultsRebuildRequest,
+    background_tasks: BackgroundTasks,
+    user: CurrentUser = Depends(require_role("admin")),
+):
+    """Admin-only: Recompute survey results from stored responses in the background."""
+    job = await create_rebuild_job(user.organization_id)
+    background_tasks.add_task(run_rebuild_job, job, user.organization_id, body.survey_ids)
+    return SurveyResultsRebuildJobResponse(**job)
+
+
+@router.get("/results/rebuild/{job_id}", response_model=SurveyResultsRebuildJobResponse)
+async def get_results_rebuild(
+    job_id: str,
+    user: CurrentUser = Depends(require_role("admin")),
+):
+    """Admin-only: Poll progress of a results rebuild."""
+    job = await get_rebuild_job(user.organization_id, job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return SurveyResultsRebuildJobResponse(**job)
+
+
+@router.get("/{survey_id}/results", response_model=SurveyResultsResponse)
+async def get_survey_results(
+    survey_id: str,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """Per-question distributions and scores for a survey."""
+    result = await db.execute(
+        select(Survey).where(
+            Survey.id == survey_id,
+            Survey.organization_id == user.organization_id,
+        )
+    )
+    survey = result.scalar_one_or_none()
+
+    if not survey:
+        raise HTTPException(status_code=404, detail="Survey not found")
+
+    stats_result = await db.execute(
+        select(SurveyStats).where(
+            SurveyStats.survey_id == survey_id,
+            SurveyStats.organization_id == user.organization_id,
+        )
+    )
+    stats = {row.question_id: row for row in stats_result.scalars()}
+
+    questions = []
+    for question in survey.questions:
+        row = stats.get(question.id)
+        item = SurveyQuestionResult(
+            question_id=question.id,
+            question_text=question.question_text,
+            question_type=question.question_type,
+            sort_order=question.sort_order,
+        )
+        if row is not None:
+            item.answer_count, item.score_count = row.count, row.score_count
+            item.mean_score, item.score_stddev = score_summary(
+                row.score_count, row.score_sum, row.score_sq_sum
+            )
+            item.distribution = dict(
+                sorted(row.value_counts.items(), key=lambda kv: kv[1], reverse=True)
+            )
+        questions.append(item)
+
+    results = SurveyResultsResponse(
+        survey_id=survey.id,
+        mode=survey.mode,
+        linked_process_ids=survey.linked_process_ids or [],
+        questions=questions,
+    )
+    totals = stats.get(None)
+    if totals is not None:
+        results.response_count = totals.count
+        results.complete_count = totals.value_counts.get("complete", 0)
+        results.mean_score, results.score_stddev = score_summary(
+            totals.score_count, totals.score_sum, totals.score_sq_sum
+        )
+        results.updated_at = totals.updated_at
+    return results
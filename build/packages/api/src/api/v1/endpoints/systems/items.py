@@ -5,6 +5,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
+from src.core.serialization import ListSerializer
 from src.core.tenancy import get_tenant_db
 from src.models.system_catalogue import ProcessSystem, SystemCatalogue
 from src.schemas.system_catalogue import (
@@ -12,7 +14,9 @@ from src.schemas.system_catalogue import (
     SystemCatalogueResponse,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+_list_serializer = ListSerializer(SystemCatalogueListResponse)
 
 
 async def _get_process_count(
@@ -43,7 +47,15 @@ async def list_systems(
     db: AsyncSession = Depends(get_tenant_db),
 ):
     """List systems with optional filters."""
-    query = select(SystemCatalogue).where(
+    process_count = (
+        select(func.count())
+        .where(
+            ProcessSystem.system_id == SystemCatalogue.id,
+            ProcessSystem.organization_id == user.organization_id,
+        )
+        .scalar_subquery()
+    )
+    query = _list_serializer.select(SystemCatalogue, process_count=process_count).where(
         SystemCatalogue.organization_id == user.organization_id
     )
 
@@ -64,18 +76,10 @@ async def list_systems(
 
     offset = (page - 1) * per_page
     query = query.order_by(SystemCatalogue.name).offset(offset).limit(per_page)
-    result = await db.execute(query)
-    systems = result.scalars().all()
-
-    items = []
-    for sys in systems:
-        process_count = await _get_process_count(db, sys.id, user.organization_id)
-        response = SystemCatalogueResponse.model_validate(sys)
-        response.process_count = process_count
-        items.append(response)
-
-    return SystemCatalogueListResponse(
-        items=items,
+    systems = (await db.execute(query)).all()
+
+    return _list_serializer.response(
+        systems,
         total=total,
         page=page,
         per_page=per_page,
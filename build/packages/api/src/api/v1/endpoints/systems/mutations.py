@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, get_current_user
+from src.core.instrumentation import InstrumentedRoute
 from src.core.tenancy import get_tenant_db
 from src.models.system_catalogue import ProcessSystem, SystemCatalogue
 from src.schemas.system_catalogue import (
@@ -15,7 +16,7 @@ from src.schemas.system_catalogue import (
     SystemCatalogueUpdate,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 
 async def _get_process_count(
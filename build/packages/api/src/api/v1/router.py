@@ -15,6 +15,7 @@ from src.api.v1.endpoints import (
     prompts,
     reference,
     riada,
+    search,
     surveys,
     systems,
 )
@@ -36,6 +37,9 @@ api_router.include_router(business_model.router, prefix="/business-model", tags=
 # Reference data
 api_router.include_router(reference.router, prefix="/reference", tags=["Reference Data"])
 
+# Cross-entity search
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
+
 # Phase 2 features
 api_router.include_router(surveys.router, prefix="/surveys", tags=["Surveys"])
 api_router.include_router(prompts.router, prefix="/prompts", tags=["Prompt Library"])
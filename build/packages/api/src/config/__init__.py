@@ -42,11 +42,20 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     MAGIC_LINK_RATE_LIMIT: int = 5  # per hour per email
+    JWT_BACKEND: Literal["jose", "pyjwt"] = "jose"  # pyjwt requires the optional pyjwt package
+    TOKEN_CACHE_SIZE: int = 4096  # verified access tokens kept in memory; 0 disables
 
     # ── Email ────────────────────────────────────────
     EMAIL_PROVIDER: Literal["resend", "sendgrid", "alibaba_dm", "console"] = "console"
     RESEND_API_KEY: str = ""
     EMAIL_FROM: str = "noreply@processcatalogue.app"
+    EMAIL_WORKERS: int = 4  # concurrent deliveries per process
+    EMAIL_QUEUE_SIZE: int = 1000  # queued messages; further sends are dropped
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BASE_DELAY: float = 2.0  # seconds before the first retry; doubles per attempt
+    EMAIL_RETRY_MAX_DELAY: float = 300.0
+    EMAIL_BATCH_SIZE: int = 100  # recipients per notification batch (Resend's batch limit)
+    EMAIL_SPOOL_DIR: str = "email-spool"  # undelivered messages are kept here across restarts
 
     # ── CORS ─────────────────────────────────────────
     ALLOWED_ORIGINS: list[str] = ["http://localhost:3000"]
@@ -59,12 +68,19 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = ""
     DEFAULT_LLM_PROVIDER: str = "anthropic"
     DEFAULT_LLM_MODEL: str = "claude-sonnet-4-20250514"
+    LLM_TENANT_CONCURRENCY: int = 4  # in-flight LLM calls per tenant per worker
+    LLM_RESPONSE_CACHE_TTL: int = 86400  # seconds; temperature-0 responses only, 0 disables
+    LLM_MOCK_LATENCY_MS: int = 0  # simulated time to first token for the mock provider
 
     # ── Provider Abstractions (Global vs China) ──────
     STORAGE_PROVIDER: Literal["local", "r2", "oss"] = "local"
     CACHE_PROVIDER: Literal["memory", "redis"] = "memory"
     LLM_PROVIDER: Literal["mock", "anthropic", "openai", "qwen"] = "mock"
 
+    # ── Object Storage (all providers) ──────────────
+    STORAGE_CHUNK_SIZE: int = 1024 * 1024  # bytes per chunk streamed to or from storage
+    STORAGE_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # uploads larger than this go multipart
+
     # ── Object Storage (Cloudflare R2 - Global) ─────
     R2_ACCOUNT_ID: str = ""
     R2_ACCESS_KEY_ID: str = ""
@@ -88,8 +104,22 @@ class Settings(BaseSettings):
     # ── China LLM Providers ─────────────────────────
     DASHSCOPE_API_KEY: str = ""  # Alibaba Qwen
 
+    # ── Audit ────────────────────────────────────────
+    AUDIT_SINKS: list[str] = ["file"]  # file (rotating JSON lines), db (audit_logs table)
+    AUDIT_LOG_FILE: str = "audit.log"
+    AUDIT_LOG_MAX_BYTES: int = 10 * 1024 * 1024  # rotate the file at this size
+    AUDIT_LOG_BACKUP_COUNT: int = 5
+    AUDIT_QUEUE_SIZE: int = 10000  # events buffered in memory; further events are dropped and counted
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL: float = 1.0  # seconds an event may wait for its batch to fill
+
     # ── Monitoring ───────────────────────────────────
     SENTRY_DSN: str = ""
+    SERVER_TIMING: bool = True  # db/pool/serialization timings in a Server-Timing header
+    METRICS_TOKEN: str = ""  # bearer token required by /metrics; without one it is dev-only
+    SQL_WARNINGS: bool = False  # warn on query budget / repeated statements (tests enable this)
+    SQL_QUERY_BUDGET: int = 25  # statements per request before a warning
+    SQL_REPEAT_THRESHOLD: int = 10  # runs of one statement shape that suggest an N+1
 
     @property
     def is_production(self) -> bool:
@@ -2,29 +2,29 @@
 Audit logging for security events.
 
 Blueprint §Security: All auth events, data mutations, admin actions logged.
+
+Events are queued and written in batches by the audit pipeline
+(src/core/audit_pipeline.py), so logging one never waits on disk or DB.
 """
 
 import logging
+import re
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
+from urllib.parse import parse_qsl
 
 from fastapi import Request
 
 from src.config import settings
+from src.core.audit_pipeline import audit_pipeline
 
 
-# Audit logger - separate from application logs
+# Audit logger - separate from application logs. Events themselves go
+# through audit_pipeline; this is for diagnostics about auditing.
 audit_logger = logging.getLogger("audit")
 audit_logger.setLevel(logging.INFO)
 
-if not audit_logger.handlers:
-    handler = logging.FileHandler("audit.log")
-    handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
-    audit_logger.addHandler(handler)
-
 
 class AuditEvent:
     """Audit event types."""
@@ -54,7 +54,7 @@ def log_audit_event(
     details: Optional[dict] = None,
     success: bool = True,
 ):
-    """Log an audit event."""
+    """Queue an audit event for the pipeline; never blocks."""
     event = {
         "event_id": str(uuid.uuid4()),
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -70,7 +70,7 @@ def log_audit_event(
         "details": details or {},
     }
 
-    audit_logger.info(str(event))
+    audit_pipeline.submit(event)
 
     if settings.is_production:
         # TODO: Send to external audit service (SIEM)
@@ -88,42 +88,69 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-def detect_suspicious_activity(request: Request) -> Optional[str]:
+def log_request_audit_event(request: Request, event_type: str, **kwargs) -> None:
+    """log_audit_event with the client IP and user agent taken from the request."""
+    log_audit_event(
+        event_type,
+        ip_address=get_client_ip(request),
+        user_agent=request.headers.get("user-agent", "")[:500],
+        **kwargs,
+    )
+
+
+# Checks for SQL injection, XSS, path traversal, and command injection patterns
+SUSPICIOUS_PATTERNS = (
+    # SQL Injection
+    "' OR '1'='1",
+    "'; DROP TABLE",
+    "UNION SELECT",
+    "1=1--",
+    # XSS
+    "<script>",
+    "javascript:",
+    "onerror=",
+    "onload=",
+    # Path traversal
+    "../",
+    "..\\",
+    "%2e%2e%2f",
+    # Command injection
+    "; cat /etc/passwd",
+    "| ls -la",
+    "&& whoami",
+)
+
+# One case-insensitive alternation scans each string once for every pattern
+_SUSPICIOUS_RE = re.compile(
+    "|".join(re.escape(p) for p in SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+_PATTERN_BY_MATCH = {p.lower(): p for p in SUSPICIOUS_PATTERNS}
+
+
+def scan_for_suspicious_patterns(path: str, query_string: str = "") -> Optional[str]:
     """
-    Detect potentially suspicious activity.
+    Scan a decoded path and raw query string for suspicious patterns.
 
-    Checks for SQL injection, XSS, path traversal, and command injection patterns.
+    Returns a description of the first match, or None.
     """
-    suspicious_patterns = [
-        # SQL Injection
-        "' OR '1'='1",
-        "'; DROP TABLE",
-        "UNION SELECT",
-        "1=1--",
-        # XSS
-        "<script>",
-        "javascript:",
-        "onerror=",
-        "onload=",
-        # Path traversal
-        "../",
-        "..\\",
-        "%2e%2e%2f",
-        # Command injection
-        "; cat /etc/passwd",
-        "| ls -la",
-        "&& whoami",
-    ]
-
-    path = request.url.path.lower()
-    for pattern in suspicious_patterns:
-        if pattern.lower() in path:
-            return f"Suspicious pattern in path: {pattern}"
-
-    for key, value in request.query_params.items():
-        combined = f"{key}={value}".lower()
-        for pattern in suspicious_patterns:
-            if pattern.lower() in combined:
+    match = _SUSPICIOUS_RE.search(path)
+    if match:
+        return f"Suspicious pattern in path: {_PATTERN_BY_MATCH[match.group().lower()]}"
+
+    if query_string:
+        for key, value in parse_qsl(query_string, keep_blank_values=True):
+            match = _SUSPICIOUS_RE.search(f"{key}={value}")
+            if match:
+                pattern = _PATTERN_BY_MATCH[match.group().lower()]
                 return f"Suspicious pattern in query: {pattern}"
 
     return None
+
+
+def detect_suspicious_activity(request: Request) -> Optional[str]:
+    """
+    Detect potentially suspicious activity.
+
+    Checks for SQL injection, XSS, path traversal, and command injection patterns.
+    """
+    return scan_for_suspicious_patterns(request.url.path, request.url.query)
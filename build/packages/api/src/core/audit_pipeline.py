@@ -0,0 +1,310 @@
+"""
+Asynchronous, batched delivery of audit events.
+
+log_audit_event() only appends to a bounded in-memory queue; a background
+task drains it in batches of up to AUDIT_BATCH_SIZE, waiting at most
+AUDIT_FLUSH_INTERVAL for a batch to fill, and hands each batch to the
+configured sinks:
+
+- file: JSON lines appended to a size-rotated file, written off the event
+  loop so requests never wait on the disk
+- db:   one multi-row INSERT into audit_logs per organization (events
+  without an organization, e.g. anonymous suspicious requests, are file-only)
+
+A sink's write() returns how many events it could not write (raising counts
+the whole batch); failures are counted per sink, so one organization's
+failed insert neither loses the others nor marks the file copy as failed.
+
+When the queue is full new events are dropped rather than blocking the
+request; drops, queue depth and its high-water mark are reported by
+metrics(). The application lifespan starts the pipeline and stops it on
+shutdown, which flushes everything still queued.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Optional, Protocol, Sequence
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds shutdown waits for the queue to drain before giving up
+AUDIT_STOP_TIMEOUT = 10.0
+
+_STOP = object()
+
+
+class AuditSink(Protocol):
+    """Protocol for audit event destinations."""
+
+    name: str
+
+    async def write(self, events: Sequence[dict]) -> int:
+        """Write a batch. Returns how many events could not be written."""
+        ...
+
+    def close(self) -> None:
+        """Release files or connections on shutdown."""
+        ...
+
+
+class FileSink:
+    """JSON lines in a size-rotated file; one write and flush per batch."""
+
+    name = "file"
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int):
+        self._handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count,
+            encoding="utf-8", delay=True,
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def write_blocking(self, events: Sequence[dict]) -> None:
+        lines = "\n".join(json.dumps(e, default=str, separators=(",", ":")) for e in events)
+        self._handler.emit(logging.makeLogRecord({"msg": lines}))
+
+    async def write(self, events: Sequence[dict]) -> int:
+        await asyncio.to_thread(self.write_blocking, events)
+        return 0
+
+    def close(self) -> None:
+        self._handler.close()
+
+
+class DatabaseSink:
+    """
+    audit_logs rows, one multi-row INSERT and commit per organization.
+    created_at is the write time, within a flush interval of the event.
+    An organization whose insert fails is rolled back and logged; the
+    others are still written.
+    """
+
+    name = "db"
+
+    async def write(self, events: Sequence[dict]) -> int:
+        from sqlalchemy import insert
+
+        from src.core.database import async_session_factory
+        from src.core.security import validate_uuid
+        from src.core.tenancy import apply_tenant_context
+        from src.models.organization import AuditLog
+
+        by_org: dict[str, list[dict]] = {}
+        for e in events:
+            if not e.get("organization_id"):
+                continue
+            resource_id = e.get("resource_id")
+            details = e.get("details") or {}
+            if resource_id and not validate_uuid(resource_id):
+                details, resource_id = {**details, "resource_id": resource_id}, None
+            by_org.setdefault(e["organization_id"], []).append({
+                "id": e["event_id"],
+                "organization_id": e["organization_id"],
+                "user_id": e.get("user_id"),
+                "action": (e.get("action") or e["event_type"])[:50],
+                "event_type": e["event_type"],
+                "entity_type": e.get("resource_type"),
+                "entity_id": resource_id,
+                "success": e.get("success"),
+                "details": details,
+                "ip_address": e.get("ip_address"),
+                "user_agent": e.get("user_agent"),
+            })
+        if not by_org:
+            return 0
+
+        failed = 0
+        async with async_session_factory() as db:
+            for organization_id, rows in by_org.items():
+                try:
+                    await apply_tenant_context(db, organization_id)
+                    await db.execute(insert(AuditLog), rows)
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    failed += len(rows)
+                    logger.exception("Audit insert failed for %d events of organization %s",
+                                     len(rows), organization_id)
+        return failed
+
+    def close(self) -> None:
+        pass
+
+
+def _build_sinks(names: Sequence[str]) -> list[AuditSink]:
+    sinks: list[AuditSink] = []
+    for name in names:
+        if name == "file":
+            sinks.append(FileSink(
+                settings.AUDIT_LOG_FILE,
+                settings.AUDIT_LOG_MAX_BYTES,
+                settings.AUDIT_LOG_BACKUP_COUNT,
+            ))
+        elif name == "db":
+            sinks.append(DatabaseSink())
+        else:
+            raise ValueError(f"Unknown audit sink: {name}")
+    return sinks
+
+
+class AuditPipeline:
+    """Bounded queue plus a single background writer."""
+
+    def __init__(
+        self,
+        sinks: Sequence[AuditSink],
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.sinks = list(sinks)
+        self.queue_size = queue_size
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dropping = False
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = {sink.name: 0 for sink in self.sinks}  # events per sink
+        self.batches = 0
+        self.high_water = 0
+        self.last_flush_ms: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the writer on the running loop (no-op if already running there)."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = loop.create_task(self._run(), name="audit-pipeline")
+
+    async def stop(self) -> None:
+        """Flush everything queued, then stop the writer."""
+        if not self.running:
+            return
+        queue, task = self._queue, self._task
+        assert queue is not None and task is not None
+        await queue.put(_STOP)
+        try:
+            await asyncio.wait_for(asyncio.shield(task), AUDIT_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error("Audit pipeline did not drain in %ss; %d events lost",
+                         AUDIT_STOP_TIMEOUT, queue.qsize())
+            task.cancel()
+        self._task = None
+        for sink in self.sinks:
+            sink.close()
+
+    def submit(self, event: dict) -> None:
+        """Queue an event without blocking. Starts the writer on first use."""
+        self.submitted += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, sync callers): write to files directly
+            for sink in self.sinks:
+                if isinstance(sink, FileSink):
+                    sink.write_blocking([event])
+            self.written += 1
+            return
+
+        self.start()
+        queue = self._queue
+        assert queue is not None
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if not self._dropping:
+                self._dropping = True
+                logger.warning("Audit queue full (%d events); dropping events", self.queue_size)
+            return
+        if self._dropping:
+            self._dropping = False
+            logger.warning("Audit queue recovered; %d events dropped so far", self.dropped)
+        self.high_water = max(self.high_water, queue.qsize())
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "high_water": self.high_water,
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": dict(self.failed),
+            "batches": self.batches,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+    async def _flush(self, batch: list[dict]) -> None:
+        start = time.perf_counter()
+        most_failed = 0
+        for sink in self.sinks:
+            try:
+                failed = await sink.write(batch)
+            except Exception:
+                failed = len(batch)
+                logger.exception("Audit sink %s failed for %d events", sink.name, len(batch))
+            self.failed[sink.name] += failed
+            most_failed = max(most_failed, failed)
+        # Written means every sink took the event
+        self.written += len(batch) - most_failed
+        self.batches += 1
+        self.last_flush_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    async def _next_batch(self) -> tuple[list[dict], bool]:
+        """Wait for an event, then collect more until the batch fills or the interval ends."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        assert queue is not None
+        first = await queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _run(self) -> None:
+        while True:
+            batch, stopping = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+            if stopping:
+                return
+
+
+audit_pipeline = AuditPipeline(
+    _build_sinks(settings.AUDIT_SINKS),
+    queue_size=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+)
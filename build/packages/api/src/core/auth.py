@@ -17,8 +17,11 @@ Flow:
 import hashlib
 import hmac
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 from uuid import uuid4
 
 from fastapi import Depends, HTTPException, Request, status
@@ -113,10 +116,35 @@ def create_refresh_token(user_id: str, organization_id: str) -> str:
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
+@lru_cache
+def _jwt_decoder() -> Callable[[str], dict]:
+    """
+    Pick the JWT backend once (settings.JWT_BACKEND).
+
+    PyJWT is an optional, somewhat cheaper alternative to python-jose;
+    either way failures surface as JWTError.
+    """
+    if settings.JWT_BACKEND == "pyjwt":
+        try:
+            import jwt as pyjwt
+        except ImportError:
+            raise ImportError("pyjwt package required. Install with: pip install pyjwt")
+
+        def decode(token: str) -> dict:
+            try:
+                return pyjwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+            except pyjwt.PyJWTError as e:
+                raise JWTError(str(e)) from e
+
+        return decode
+
+    return lambda token: jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+
+
 def decode_token(token: str) -> dict:
     """Decode and validate a JWT token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _jwt_decoder()(token)
         return payload
     except JWTError:
         raise HTTPException(
@@ -129,6 +157,8 @@ def decode_token(token: str) -> dict:
 class CurrentUser:
     """Represents the authenticated user extracted from JWT."""
 
+    __slots__ = ("id", "organization_id", "role", "email")
+
     def __init__(self, user_id: str, organization_id: str, role: str, email: str):
         self.id = user_id
         self.organization_id = organization_id
@@ -136,6 +166,56 @@ class CurrentUser:
         self.email = email
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified access tokens.
+
+    Parallel API calls from one page carry the same token; a hit skips
+    signature verification and claim parsing. Keys are token digests so raw
+    tokens are not retained, and entries are dropped once the token's exp
+    passes.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[CurrentUser, float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[CurrentUser]:
+        """Return the cached user for a still-valid token, or None."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        user, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, token: str, user: CurrentUser, expires_at: float) -> None:
+        """Remember a verified token until its expiry."""
+        if self.maxsize <= 0:
+            return
+        key = self._key(token)
+        self._entries[key] = (user, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+token_cache = VerifiedTokenCache(settings.TOKEN_CACHE_SIZE)
+
+
 async def get_current_user(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -151,20 +231,28 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    payload = decode_token(credentials.credentials)
+    token = credentials.credentials
+    user = token_cache.get(token)
 
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-        )
+    if user is None:
+        payload = decode_token(token)
 
-    user = CurrentUser(
-        user_id=payload["sub"],
-        organization_id=payload["org"],
-        role=payload.get("role", "viewer"),
-        email=payload.get("email", ""),
-    )
+        if payload.get("type") != "access":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token type",
+            )
+
+        user = CurrentUser(
+            user_id=payload["sub"],
+            organization_id=payload["org"],
+            role=payload.get("role", "viewer"),
+            email=payload.get("email", ""),
+        )
+        # Tokens without an expiry are verified on every request
+        expires_at = payload.get("exp")
+        if expires_at is not None:
+            token_cache.put(token, user, expires_at)
 
     # Set org context for tenant middleware
     request.state.organization_id = user.organization_id
@@ -4,15 +4,16 @@ Uses async SQLAlchemy with asyncpg for PostgreSQL.
 """
 
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from uuid import uuid4
 
-from sqlalchemy import MetaData, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Computed, MetaData, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from src.config import settings
+from src.core.instrumentation import InstrumentedPool
 
 # Naming convention for Alembic auto-generation
 convention = {
@@ -31,6 +32,7 @@ engine = create_async_engine(
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,
+    poolclass=InstrumentedPool,
 )
 
 async_session_factory = async_sessionmaker(
@@ -88,6 +90,37 @@ class TenantModel(BaseModel, TenantMixin):
     __abstract__ = True
 
 
+# Text search configuration shared by search_vector columns and queries
+SEARCH_TEXT_CONFIG = "english"
+
+
+def search_vector_column(title_column: str) -> Mapped[Optional[str]]:
+    """
+    Generated full-text vector: code and title weighted A, description B.
+
+    Deferred so ordinary loads skip it. The expression must match
+    migration 020.
+    """
+    def weighted(column: str, weight: str) -> str:
+        return (
+            f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}'::regconfig, "
+            f"coalesce({column}, '')), '{weight}')"
+        )
+
+    return mapped_column(
+        TSVECTOR,
+        Computed(
+            " || ".join([
+                weighted("code", "A"),
+                weighted(title_column, "A"),
+                weighted("description", "B"),
+            ]),
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that yields a database session."""
     async with async_session_factory() as session:
@@ -6,12 +6,14 @@ Supports multiple providers via EMAIL_PROVIDER config:
 - console: Development — prints to console
 """
 
-from typing import Protocol
-
-import resend
+import asyncio
+from typing import TYPE_CHECKING, Protocol
 
 from src.config import settings
 
+if TYPE_CHECKING:
+    import resend
+
 
 class EmailProvider(Protocol):
     """Protocol for email providers."""
@@ -31,6 +33,9 @@ class ResendProvider:
     """Resend API email provider."""
 
     def __init__(self, api_key: str, from_email: str):
+        # Imported here so importing this module does not load the SDK
+        import resend
+        self.resend = resend
         self.from_email = from_email
         resend.api_key = api_key
 
@@ -50,7 +55,8 @@ class ResendProvider:
             }
             if text:
                 params["text"] = text
-            resend.Emails.send(params)
+            # The SDK is synchronous: keep its HTTP round trip off the event loop
+            await asyncio.to_thread(self.resend.Emails.send, params)
             return True
         except Exception as e:
             print(f"[Resend] Failed to send email to {to}: {e}")
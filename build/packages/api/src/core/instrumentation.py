@@ -0,0 +1,343 @@
+"""
+Request-level performance instrumentation.
+
+For every HTTP request InstrumentationMiddleware keeps a RequestMetrics in a
+contextvar (like the tenant in core/tenancy) that is filled in by:
+
+- SQLAlchemy engine events: statement count, time inside the driver, and
+  how often each statement shape ran
+- InstrumentedPool: time spent waiting for (or opening) a connection
+- InstrumentedRoute: when the endpoint function returned; the time from
+  there to the response start is response-model validation and encoding
+
+The middleware reports them as a Server-Timing header (db, pool, ser,
+total) and aggregates them per route for the Prometheus-style /metrics
+endpoint. With SQL_WARNINGS on (the test suite turns it on) a request that
+runs more than SQL_QUERY_BUDGET statements, or the same statement shape
+SQL_REPEAT_THRESHOLD times (usually an N+1 from lazy loads or per-row
+queries), raises a QueryBudgetWarning.
+"""
+
+import functools
+import inspect
+import re
+import threading
+import time
+import warnings
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bind parameters ($1, %(name)s, :name, ?) and expanded IN lists
+_PARAM = re.compile(r"\$\d+(?:::[\w\s\[\]]+?(?=[,)\s]|$))?|%\(\w+\)s|(?<!:):\w+|\?")
+_PARAM_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetWarning(UserWarning):
+    """A request ran too many statements or repeated one statement shape."""
+
+
+@dataclass
+class RequestMetrics:
+    """Timings for one request; durations in seconds."""
+
+    started: float = field(default_factory=time.perf_counter)
+    query_count: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    endpoint_returned: Optional[float] = None
+    serialization: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    """Metrics of the request being handled, or None outside a request."""
+    return _request_metrics.get()
+
+
+def statement_shape(statement: str) -> str:
+    """A statement with its parameters collapsed, so repeats compare equal."""
+    shape = _PARAM.sub("?", statement)
+    shape = _PARAM_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+# ── SQLAlchemy hooks ─────────────────────────────────────
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_metrics.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _request_metrics.get()
+    started = conn.info.get("query_started")
+    if metrics is None or not started:
+        return
+    metrics.db_time += time.perf_counter() - started.pop()
+    metrics.query_count += 1
+    metrics.statements[statement_shape(statement)] += 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _forget_failed_query(context):
+    started = context.connection.info.get("query_started") if context.connection else None
+    if started:
+        started.pop()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that adds checkout waits to the current request's metrics."""
+
+    def _do_get(self):
+        metrics = _request_metrics.get()
+        if metrics is None:
+            return super()._do_get()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.pool_wait += time.perf_counter() - start
+
+
+# ── Routes ───────────────────────────────────────────────
+
+
+def _mark_endpoint_returned() -> None:
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.endpoint_returned = time.perf_counter()
+
+
+def _marking_return(call: Callable) -> Callable:
+    if inspect.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def endpoint(*args, **kwargs):
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                _mark_endpoint_returned()
+    else:
+        @functools.wraps(call)
+        def endpoint(*args, **kwargs):
+            try:
+                return call(*args, **kwargs)
+            finally:
+                _mark_endpoint_returned()
+    return endpoint
+
+
+class InstrumentedRoute(APIRoute):
+    """APIRoute whose endpoint records when it returns (see module docstring)."""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        if not (inspect.isasyncgenfunction(endpoint) or inspect.isgeneratorfunction(endpoint)):
+            endpoint = _marking_return(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+# ── Aggregation ──────────────────────────────────────────
+
+
+@dataclass
+class _RouteStats:
+    requests: Counter = field(default_factory=Counter)  # by status code
+    duration: float = 0.0
+    buckets: list = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    queries: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    serialization: float = 0.0
+
+
+_route_stats: dict[tuple[str, str], _RouteStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(method: str, route: str, status: int, metrics: RequestMetrics, duration: float) -> None:
+    with _stats_lock:
+        stats = _route_stats.get((method, route))
+        if stats is None:
+            stats = _route_stats[(method, route)] = _RouteStats()
+        stats.requests[status] += 1
+        stats.duration += duration
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if duration <= bound:
+                stats.buckets[i] += 1
+        stats.queries += metrics.query_count
+        stats.db_time += metrics.db_time
+        stats.pool_wait += metrics.pool_wait
+        stats.serialization += metrics.serialization
+
+
+def _check_budget(method: str, route: str, metrics: RequestMetrics) -> None:
+    if metrics.query_count > settings.SQL_QUERY_BUDGET:
+        warnings.warn(QueryBudgetWarning(
+            f"{method} {route} ran {metrics.query_count} SQL statements "
+            f"(budget {settings.SQL_QUERY_BUDGET})"
+        ))
+    for shape, count in metrics.statements.items():
+        if count >= settings.SQL_REPEAT_THRESHOLD:
+            warnings.warn(QueryBudgetWarning(
+                f"{method} {route} ran the same statement {count} times "
+                f"(possible N+1): {shape[:200]}"
+            ))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(extra_gauges: Optional[dict[str, float]] = None) -> str:
+    """Aggregated per-route metrics in the Prometheus text exposition format."""
+    with _stats_lock:
+        stats = {key: (s.requests.copy(), s.duration, list(s.buckets), s.queries,
+                       s.db_time, s.pool_wait, s.serialization)
+                 for key, s in _route_stats.items()}
+
+    lines = [
+        "# HELP http_requests_total Requests by route and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route), (requests, *_rest) in sorted(stats.items()):
+        for status, count in sorted(requests.items()):
+            lines.append(
+                f'http_requests_total{{method="{method}",route="{_escape(route)}",'
+                f'status="{status}"}} {count}'
+            )
+
+    lines += [
+        "# HELP http_request_duration_seconds Time until the response finished.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route), (requests, duration, buckets, *_rest) in sorted(stats.items()):
+        labels = f'method="{method}",route="{_escape(route)}"'
+        for bound, count in zip(DURATION_BUCKETS, buckets):
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+        total = sum(requests.values())
+        lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {total}')
+        lines.append(f"http_request_duration_seconds_sum{{{labels}}} {duration:.6f}")
+        lines.append(f"http_request_duration_seconds_count{{{labels}}} {total}")
+
+    for name, index, help_text in (
+        ("db_queries_total", 3, "SQL statements run by requests."),
+        ("db_query_seconds_total", 4, "Time spent executing SQL statements."),
+        ("db_pool_wait_seconds_total", 5, "Time spent waiting for a pooled connection."),
+        ("http_serialization_seconds_total", 6, "Time from endpoint return to response start."),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for (method, route), values in sorted(stats.items()):
+            value = values[index]
+            formatted = str(value) if isinstance(value, int) else f"{value:.6f}"
+            lines.append(f'{name}{{method="{method}",route="{_escape(route)}"}} {formatted}')
+
+    for name, value in (extra_gauges or {}).items():
+        lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    with _stats_lock:
+        _route_stats.clear()
+
+
+# ── Middleware ───────────────────────────────────────────
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    Path template of the matched route, e.g. /api/v1/processes/{process_id}.
+
+    Recent FastAPI releases resolve included routers lazily: scope["route"]
+    is the route as declared on its own router, and the prefixed template
+    lives on the effective route context FastAPI keeps in its scope entry.
+    Elsewhere (older releases, plain Starlette routes) scope["route"]
+    already carries the full path.
+    """
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    template = getattr(context, "path_format", None)
+    if not template:
+        route = scope.get("route")
+        template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return template or "unmatched"
+
+
+def _server_timing(metrics: RequestMetrics, now: float) -> bytes:
+    parts = [
+        f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries"',
+        f"pool;dur={metrics.pool_wait * 1000:.1f}",
+    ]
+    if metrics.serialization:
+        parts.append(f"ser;dur={metrics.serialization * 1000:.1f}")
+    parts.append(f"total;dur={(now - metrics.started) * 1000:.1f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class InstrumentationMiddleware:
+    """
+    Collects RequestMetrics for each HTTP request, adds Server-Timing and
+    records the totals once the response has been sent.
+
+    Pure ASGI: only the response start message is touched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _request_metrics.set(metrics)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                status = message["status"]
+                if metrics.endpoint_returned is not None:
+                    metrics.serialization = now - metrics.endpoint_returned
+                if settings.SERVER_TIMING:
+                    headers = list(message.get("headers", ()))
+                    headers.append((b"server-timing", _server_timing(metrics, now)))
+                    message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body" and not message.get("more_body"):
+                self._finish(scope, status, metrics)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_metrics.reset(token)
+
+    @staticmethod
+    def _finish(scope: Scope, status: int, metrics: RequestMetrics) -> None:
+        method = scope["method"]
+        path = _route_template(scope)
+        _record(method, path, status, metrics, time.perf_counter() - metrics.started)
+        if settings.SQL_WARNINGS:
+            _check_budget(method, path, metrics)
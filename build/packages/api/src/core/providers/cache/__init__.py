@@ -5,13 +5,20 @@ Global: Upstash Redis
 China: Alibaba Redis
 """
 
+from functools import lru_cache
+
 from src.config import settings
 
 from .base import CacheProvider
 
 
+@lru_cache
 def get_cache_provider() -> CacheProvider:
-    """Factory function to get the configured cache provider."""
+    """
+    Factory function to get the configured cache provider.
+
+    Cached so every caller shares one store (and one Redis connection pool).
+    """
     provider = getattr(settings, "CACHE_PROVIDER", "memory")
 
     if provider == "redis":
@@ -22,6 +22,34 @@ class CacheProvider(ABC):
         """Set a value in cache with optional TTL in seconds."""
         pass
 
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get several values in one call; None for each missing key."""
+        return [await self.get(key) for key in keys]
+
+    async def set_many(
+        self,
+        values: dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Set several values with the same optional TTL in seconds."""
+        results = [await self.set(key, value, ttl) for key, value in values.items()]
+        return all(results)
+
+    @abstractmethod
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get a raw bytes value (no decoding)."""
+        pass
+
+    @abstractmethod
+    async def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Set a raw bytes value with optional TTL in seconds."""
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
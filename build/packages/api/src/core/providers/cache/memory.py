@@ -2,20 +2,34 @@
 
 import fnmatch
 import time
+from itertools import islice
 from typing import Any, Optional
 
 from .base import CacheProvider
 
+# Seconds between sweeps of expired keys, run from set()
+SWEEP_INTERVAL = 60
+
+# Entries kept before the oldest expiring ones are evicted early
+MAX_ENTRIES = 10_000
+
 
 class InMemoryCacheProvider(CacheProvider):
     """
     In-memory cache provider for development.
     Uses a simple dict with TTL support.
+
+    Versioned keys (tree snapshots, result caches) leave superseded entries
+    behind that are never read again, so set() sweeps expired keys every
+    SWEEP_INTERVAL and, past max_entries, evicts the oldest keys that carry
+    a TTL. Keys without one (version counters) are never evicted.
     """
 
-    def __init__(self):
+    def __init__(self, max_entries: int = MAX_ENTRIES):
         self._cache: dict[str, tuple[Any, Optional[float]]] = {}
         self._time = time
+        self.max_entries = max_entries
+        self._next_sweep = self._time.time() + SWEEP_INTERVAL
 
     def _is_expired(self, key: str) -> bool:
         if key not in self._cache:
@@ -35,6 +49,19 @@ class InMemoryCacheProvider(CacheProvider):
         for k in expired:
             del self._cache[k]
 
+    def _evict(self):
+        """Sweep expired keys on schedule, then trim expiring keys over the cap."""
+        now = self._time.time()
+        if now >= self._next_sweep:
+            self._next_sweep = now + SWEEP_INTERVAL
+            self._cleanup()
+        excess = len(self._cache) - self.max_entries
+        if excess <= 0:
+            return
+        expiring = (k for k, (_, exp) in self._cache.items() if exp is not None)
+        for k in list(islice(expiring, excess)):
+            del self._cache[k]
+
     async def get(self, key: str) -> Optional[Any]:
         if self._is_expired(key):
             if key in self._cache:
@@ -52,9 +79,22 @@ class InMemoryCacheProvider(CacheProvider):
         expiry = None
         if ttl:
             expiry = self._time.time() + ttl
+        self._cache.pop(key, None)  # re-insert so the dict stays oldest-first
         self._cache[key] = (value, expiry)
+        self._evict()
         return True
 
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        return await self.get(key)
+
+    async def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        return await self.set(key, value, ttl)
+
     async def delete(self, key: str) -> bool:
         if key in self._cache:
             del self._cache[key]
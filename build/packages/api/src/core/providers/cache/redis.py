@@ -1,12 +1,15 @@
 """Redis cache provider (Upstash Global / Alibaba China)."""
 
 import json
+import logging
 from typing import Any, Optional
 
 from src.config import settings
 
 from .base import CacheProvider
 
+logger = logging.getLogger(__name__)
+
 
 class RedisProvider(CacheProvider):
     """
@@ -22,11 +25,13 @@ class RedisProvider(CacheProvider):
                 encoding="utf-8",
                 decode_responses=True,
             )
+            # Separate client for pre-encoded payloads that must stay bytes
+            self.raw_redis = aioredis.from_url(settings.REDIS_URL)
         except ImportError:
             raise ImportError("redis package required. Install with: pip install redis")
 
-    async def get(self, key: str) -> Optional[Any]:
-        value = await self.redis.get(key)
+    @staticmethod
+    def _decode(value: Optional[str]) -> Optional[Any]:
         if value is None:
             return None
         try:
@@ -34,6 +39,14 @@ class RedisProvider(CacheProvider):
         except json.JSONDecodeError:
             return value
 
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            value = await self.redis.get(key)
+        except Exception:
+            logger.warning("Redis get failed for %s", key, exc_info=True)
+            return None
+        return self._decode(value)
+
     async def set(
         self,
         key: str,
@@ -51,6 +64,57 @@ class RedisProvider(CacheProvider):
         except Exception:
             return False
 
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        if not keys:
+            return []
+        try:
+            values = await self.redis.mget(keys)
+        except Exception:
+            logger.warning("Redis get_many failed for %d keys", len(keys), exc_info=True)
+            return [None] * len(keys)
+        return [self._decode(value) for value in values]
+
+    async def set_many(
+        self,
+        values: dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    if isinstance(value, (dict, list)):
+                        value = json.dumps(value)
+                    if ttl:
+                        pipe.setex(key, ttl, value)
+                    else:
+                        pipe.set(key, value)
+                await pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.raw_redis.get(key)
+        except Exception:
+            logger.warning("Redis get_bytes failed for %s", key, exc_info=True)
+            return None
+
+    async def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        try:
+            if ttl:
+                await self.raw_redis.setex(key, ttl, value)
+            else:
+                await self.raw_redis.set(key, value)
+            return True
+        except Exception:
+            return False
+
     async def delete(self, key: str) -> bool:
         try:
             await self.redis.delete(key)
@@ -62,7 +126,11 @@ class RedisProvider(CacheProvider):
         return await self.redis.exists(key) > 0
 
     async def incr(self, key: str) -> int:
-        return await self.redis.incr(key)
+        try:
+            return await self.redis.incr(key)
+        except Exception:
+            logger.warning("Redis incr failed for %s", key, exc_info=True)
+            return 0
 
     async def expire(self, key: str, ttl: int) -> bool:
         return await self.redis.expire(key, ttl)
@@ -7,6 +7,7 @@ China: Alibaba Qwen / Baidu ERNIE
 Provides a unified interface for text generation across providers.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from src.config import settings
@@ -15,10 +16,23 @@ from .base import LLMConfig, LLMProvider, LLMResponse
 from .mock import MockLLMProvider
 
 
+# Provider names used by tenant LLM configurations
+_PROVIDER_ALIASES = {"alibaba_qwen": "qwen"}
+
+
 def get_llm_provider(provider_name: Optional[str] = None) -> LLMProvider:
-    """Factory function to get the configured LLM provider."""
-    provider = provider_name or getattr(settings, "LLM_PROVIDER", "mock")
+    """
+    Factory function to get the configured LLM provider.
+
+    Each provider is built once per process, so its SDK client and HTTP
+    connection pool are shared by every caller.
+    """
+    provider = provider_name or settings.LLM_PROVIDER
+    return _build_provider(_PROVIDER_ALIASES.get(provider, provider))
+
 
+@lru_cache
+def _build_provider(provider: str) -> LLMProvider:
     if provider == "anthropic":
         from .anthropic import AnthropicProvider
         return AnthropicProvider()
@@ -29,12 +43,13 @@ def get_llm_provider(provider_name: Optional[str] = None) -> LLMProvider:
         from .qwen import QwenProvider
         return QwenProvider()
     else:
-        return MockLLMProvider()
+        return MockLLMProvider(latency=settings.LLM_MOCK_LATENCY_MS / 1000)
 
 
 __all__ = [
     "LLMConfig",
     "LLMProvider",
     "LLMResponse",
+    "MockLLMProvider",
     "get_llm_provider",
 ]
@@ -1,6 +1,6 @@
 """Anthropic Claude provider (Global deployment)."""
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Union
 
 from src.config import settings
 
@@ -59,7 +59,7 @@ class AnthropicProvider(LLMProvider):
         self,
         prompt: str,
         config: LLMConfig,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Union[str, LLMResponse], None]:
         messages = [{"role": "user", "content": prompt}]
 
         kwargs = {
@@ -72,10 +72,22 @@ class AnthropicProvider(LLMProvider):
             kwargs["system"] = config.system_prompt
         if config.temperature is not None:
             kwargs["temperature"] = config.temperature
+        if config.stop_sequences:
+            kwargs["stop_sequences"] = config.stop_sequences
 
         async with self.client.messages.stream(**kwargs) as stream:
             async for text in stream.text_stream:
                 yield text
+            message = await stream.get_final_message()
+
+        yield LLMResponse(
+            content="".join(block.text for block in message.content if block.type == "text"),
+            model=message.model,
+            prompt_tokens=message.usage.input_tokens,
+            completion_tokens=message.usage.output_tokens,
+            total_tokens=message.usage.input_tokens + message.usage.output_tokens,
+            finish_reason=message.stop_reason or "stop",
+        )
 
     def get_available_models(self) -> list[str]:
         return self.models
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import AsyncGenerator, Optional
+from typing import AsyncIterator, Optional, Union
 
 
 @dataclass
@@ -14,6 +14,7 @@ class LLMResponse:
     completion_tokens: int
     total_tokens: int
     finish_reason: str
+    cached: bool = False  # served from the response cache, not the provider
 
 
 @dataclass
@@ -39,12 +40,17 @@ class LLMProvider(ABC):
         pass
 
     @abstractmethod
-    async def generate_stream(
+    def generate_stream(
         self,
         prompt: str,
         config: LLMConfig,
-    ) -> AsyncGenerator[str, None]:
-        """Stream a completion for the given prompt."""
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream a completion for the given prompt.
+
+        Yields text chunks as they arrive, then one final LLMResponse with
+        the full content and token usage.
+        """
         pass
 
     @abstractmethod
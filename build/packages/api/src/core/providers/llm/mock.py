@@ -1,21 +1,49 @@
 """Mock LLM provider for testing and development."""
 
-from typing import AsyncGenerator
+import asyncio
+from typing import AsyncGenerator, Union
 
 from .base import LLMConfig, LLMProvider, LLMResponse
 
 
+class MockRateLimitError(Exception):
+    """Simulated provider 429, shaped like the SDK errors callers inspect."""
+
+    status_code = 429
+
+    def __init__(self, retry_after: float = 0.0):
+        super().__init__("Mock rate limit exceeded")
+        self.retry_after = retry_after
+
+
 class MockLLMProvider(LLMProvider):
-    """Mock LLM provider for testing and development."""
+    """
+    Mock LLM provider for testing and development.
 
-    def __init__(self):
-        self.models = ["mock-model"]
+    latency simulates time to first token and token_delay the gap between
+    streamed words, so concurrency limits and caching can be exercised
+    without a real provider. With rate_limit_every=n every nth call raises
+    MockRateLimitError. calls counts provider round trips.
+    """
 
-    async def generate(
+    def __init__(
         self,
-        prompt: str,
-        config: LLMConfig,
-    ) -> LLMResponse:
+        latency: float = 0.0,
+        token_delay: float = 0.0,
+        rate_limit_every: int = 0,
+    ):
+        self.models = ["mock-model"]
+        self.latency = latency
+        self.token_delay = token_delay
+        self.rate_limit_every = rate_limit_every
+        self.calls = 0
+
+    def _count_call(self) -> None:
+        self.calls += 1
+        if self.rate_limit_every and self.calls % self.rate_limit_every == 0:
+            raise MockRateLimitError()
+
+    def _respond(self, prompt: str) -> LLMResponse:
         response = f"[Mock Response] Received prompt with {len(prompt)} characters."
 
         return LLMResponse(
@@ -27,14 +55,32 @@ class MockLLMProvider(LLMProvider):
             finish_reason="stop",
         )
 
+    async def generate(
+        self,
+        prompt: str,
+        config: LLMConfig,
+    ) -> LLMResponse:
+        self._count_call()
+        response = self._respond(prompt)
+        delay = self.latency + self.token_delay * len(response.content.split())
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
     async def generate_stream(
         self,
         prompt: str,
         config: LLMConfig,
-    ) -> AsyncGenerator[str, None]:
-        response = f"[Mock Response] Received prompt with {len(prompt)} characters."
-        for word in response.split():
-            yield word + " "
+    ) -> AsyncGenerator[Union[str, LLMResponse], None]:
+        self._count_call()
+        response = self._respond(prompt)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for i, word in enumerate(response.content.split(" ")):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield word if i == 0 else " " + word
+        yield response
 
     def get_available_models(self) -> list[str]:
         return self.models
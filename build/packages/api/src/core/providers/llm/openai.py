@@ -1,6 +1,6 @@
 """OpenAI GPT provider (Global deployment alternative)."""
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Union
 
 from src.config import settings
 
@@ -55,7 +55,7 @@ class OpenAIProvider(LLMProvider):
         self,
         prompt: str,
         config: LLMConfig,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Union[str, LLMResponse], None]:
         messages = []
         if config.system_prompt:
             messages.append({"role": "system", "content": config.system_prompt})
@@ -66,12 +66,32 @@ class OpenAIProvider(LLMProvider):
             messages=messages,
             max_tokens=config.max_tokens,
             temperature=config.temperature,
+            stop=config.stop_sequences,
             stream=True,
+            stream_options={"include_usage": True},
         )
 
+        parts, model, finish_reason, usage = [], config.model, "stop", None
         async for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+            model = chunk.model or model
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            if choice.delta.content:
+                parts.append(choice.delta.content)
+                yield choice.delta.content
+
+        yield LLMResponse(
+            content="".join(parts),
+            model=model,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+            total_tokens=usage.total_tokens if usage else 0,
+            finish_reason=finish_reason,
+        )
 
     def get_available_models(self) -> list[str]:
         return self.models
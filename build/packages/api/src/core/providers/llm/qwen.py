@@ -1,6 +1,7 @@
 """Alibaba Qwen provider (China deployment)."""
 
-from typing import AsyncGenerator
+import asyncio
+from typing import AsyncGenerator, Union
 
 from src.config import settings
 
@@ -10,7 +11,8 @@ from .base import LLMConfig, LLMProvider, LLMResponse
 class QwenProvider(LLMProvider):
     """
     Alibaba Qwen provider (China deployment).
-    Uses DashScope API.
+    Uses DashScope API, whose SDK is blocking: calls run in worker threads
+    so a slow generation does not stall the event loop.
     """
 
     def __init__(self):
@@ -39,11 +41,13 @@ class QwenProvider(LLMProvider):
             messages.append({"role": "system", "content": config.system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = Generation.call(
+        response = await asyncio.to_thread(
+            Generation.call,
             model=config.model,
             messages=messages,
             max_tokens=config.max_tokens,
             temperature=config.temperature,
+            stop=config.stop_sequences,
             result_format="message",
         )
 
@@ -63,7 +67,7 @@ class QwenProvider(LLMProvider):
         self,
         prompt: str,
         config: LLMConfig,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Union[str, LLMResponse], None]:
         from dashscope import Generation
 
         messages = []
@@ -71,21 +75,36 @@ class QwenProvider(LLMProvider):
             messages.append({"role": "system", "content": config.system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        responses = Generation.call(
+        responses = await asyncio.to_thread(
+            Generation.call,
             model=config.model,
             messages=messages,
             max_tokens=config.max_tokens,
             temperature=config.temperature,
+            stop=config.stop_sequences,
             result_format="message",
             stream=True,
             incremental_output=True,
         )
 
-        for response in responses:
+        parts, finish_reason, usage = [], "stop", None
+        while (response := await asyncio.to_thread(next, responses, None)) is not None:
+            usage = response.usage or usage
             if response.output and response.output.choices:
-                content = response.output.choices[0].message.content
-                if content:
-                    yield content
+                choice = response.output.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                if choice.message.content:
+                    parts.append(choice.message.content)
+                    yield choice.message.content
+
+        yield LLMResponse(
+            content="".join(parts),
+            model=config.model,
+            prompt_tokens=usage.input_tokens if usage else 0,
+            completion_tokens=usage.output_tokens if usage else 0,
+            total_tokens=usage.total_tokens if usage else 0,
+            finish_reason=finish_reason,
+        )
 
     def get_available_models(self) -> list[str]:
         return self.models
@@ -5,13 +5,20 @@ Global: Cloudflare R2 (S3-compatible)
 China: Alibaba OSS
 """
 
+from functools import lru_cache
+
 from src.config import settings
 
-from .base import StorageProvider
+from .base import StorageProvider, iter_file, rechunk
 
 
+@lru_cache
 def get_storage_provider() -> StorageProvider:
-    """Factory function to get the configured storage provider."""
+    """
+    Factory function to get the configured storage provider.
+
+    Cached so every caller shares one SDK client and its connection pool.
+    """
     provider = getattr(settings, "STORAGE_PROVIDER", "local")
 
     if provider == "r2":
@@ -28,4 +35,6 @@ def get_storage_provider() -> StorageProvider:
 __all__ = [
     "StorageProvider",
     "get_storage_provider",
+    "iter_file",
+    "rechunk",
 ]
@@ -1,16 +1,17 @@
 """Alibaba OSS storage provider (China deployment)."""
 
-from typing import BinaryIO, Optional
+import asyncio
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, Optional
 
 from src.config import settings
 
-from .base import StorageProvider
+from .base import StorageProvider, rechunk
 
 
 class AlibabaOSSProvider(StorageProvider):
     """
     Alibaba OSS storage provider (China deployment).
-    Uses oss2 SDK.
+    Uses oss2 SDK, which is synchronous, so calls run in worker threads.
     """
 
     def __init__(self):
@@ -37,11 +38,14 @@ class AlibabaOSSProvider(StorageProvider):
             )
         return self._buckets[bucket_name]
 
-    async def upload_file(
+    def _url(self, bucket: str, key: str) -> str:
+        return f"https://{bucket}.{self.endpoint.replace('https://', '')}/{key}"
+
+    async def upload_stream(
         self,
         bucket: str,
         key: str,
-        file: BinaryIO,
+        chunks: AsyncIterable[bytes],
         content_type: Optional[str] = None,
     ) -> str:
         bucket_obj = self._get_bucket(bucket)
@@ -49,18 +53,56 @@ class AlibabaOSSProvider(StorageProvider):
         if content_type:
             headers["Content-Type"] = content_type
 
-        bucket_obj.put_object(key, file, headers=headers)
-        return f"https://{bucket}.{self.endpoint.replace('https://', '')}/{key}"
+        parts = rechunk(chunks, settings.STORAGE_MULTIPART_PART_SIZE)
+        first = await anext(parts, b"")
+        second = await anext(parts, None)
+        if second is None:
+            # Fits in one part: a single PUT
+            await asyncio.to_thread(bucket_obj.put_object, key, first, headers=headers)
+            return self._url(bucket, key)
+
+        upload = await asyncio.to_thread(bucket_obj.init_multipart_upload, key, headers=headers)
+        upload_id = upload.upload_id
+        completed = []
+        try:
+            async def send(number: int, body: bytes) -> None:
+                part = await asyncio.to_thread(
+                    bucket_obj.upload_part, key, upload_id, number, body
+                )
+                completed.append(self.oss2.models.PartInfo(number, part.etag))
+
+            await send(1, first)
+            await send(2, second)
+            number = 2
+            async for body in parts:
+                number += 1
+                await send(number, body)
 
-    async def download_file(self, bucket: str, key: str) -> bytes:
+            await asyncio.to_thread(bucket_obj.complete_multipart_upload, key, upload_id, completed)
+        except BaseException:
+            await asyncio.to_thread(bucket_obj.abort_multipart_upload, key, upload_id)
+            raise
+        return self._url(bucket, key)
+
+    async def download_stream(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or settings.STORAGE_CHUNK_SIZE
         bucket_obj = self._get_bucket(bucket)
-        result = bucket_obj.get_object(key)
-        return result.read()
+        result = await asyncio.to_thread(bucket_obj.get_object, key)
+        try:
+            while chunk := await asyncio.to_thread(result.read, chunk_size):
+                yield chunk
+        finally:
+            result.close()
 
     async def delete_file(self, bucket: str, key: str) -> bool:
         try:
             bucket_obj = self._get_bucket(bucket)
-            bucket_obj.delete_object(key)
+            await asyncio.to_thread(bucket_obj.delete_object, key)
             return True
         except Exception:
             return False
@@ -74,18 +116,28 @@ class AlibabaOSSProvider(StorageProvider):
         bucket_obj = self._get_bucket(bucket)
         return bucket_obj.sign_url("GET", key, expires_in)
 
-    async def list_files(
+    async def iter_files(
         self,
         bucket: str,
         prefix: str = "",
-        max_keys: int = 1000,
-    ) -> list[dict]:
+        page_size: int = 1000,
+    ) -> AsyncGenerator[list[dict], None]:
         bucket_obj = self._get_bucket(bucket)
-        result = []
-        for obj in self.oss2.ObjectIterator(bucket_obj, prefix=prefix, max_keys=max_keys):
-            result.append({
-                "key": obj.key,
-                "size": obj.size,
-                "last_modified": obj.last_modified,
-            })
-        return result
+        marker = ""
+        while True:
+            result = await asyncio.to_thread(
+                bucket_obj.list_objects, prefix=prefix, marker=marker, max_keys=page_size
+            )
+            page = [
+                {
+                    "key": obj.key,
+                    "size": obj.size,
+                    "last_modified": obj.last_modified,
+                }
+                for obj in result.object_list
+            ]
+            if page:
+                yield page
+            if not result.is_truncated:
+                return
+            marker = result.next_marker
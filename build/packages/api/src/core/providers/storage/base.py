@@ -1,26 +1,85 @@
-"""Storage provider base class."""
+"""
+Storage provider base class.
 
+Providers implement streaming primitives: uploads consume an async
+iterator of chunks, downloads and listings are async generators. The
+whole-file methods are built on them, so large files only need to be
+held in memory one chunk (or one multipart part) at a time when the
+streaming methods are used directly. Blocking SDK and filesystem calls
+run in worker threads, never on the event loop.
+"""
+
+import asyncio
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, BinaryIO, Optional
+
+from src.config import settings
+
+
+async def iter_file(file: BinaryIO, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+    """Read a file object in chunks, each read in a worker thread."""
+    chunk_size = chunk_size or settings.STORAGE_CHUNK_SIZE
+    while True:
+        chunk = await asyncio.to_thread(file.read, chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def rechunk(chunks: AsyncIterable[bytes], size: int) -> AsyncIterator[bytes]:
+    """
+    Regroup a stream into blocks of exactly size bytes (the last may be
+    shorter), e.g. multipart parts from arbitrarily sized upload chunks.
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
 
 
 class StorageProvider(ABC):
     """Abstract storage provider interface."""
 
     @abstractmethod
-    async def upload_file(
+    async def upload_stream(
         self,
         bucket: str,
         key: str,
-        file: BinaryIO,
+        chunks: AsyncIterable[bytes],
         content_type: Optional[str] = None,
     ) -> str:
-        """Upload a file and return its URL."""
+        """
+        Upload a stream of chunks and return the file's URL. Large
+        streams are sent as multipart uploads where the backend has them.
+        """
         pass
 
     @abstractmethod
-    async def download_file(self, bucket: str, key: str) -> bytes:
-        """Download a file and return its contents."""
+    def download_stream(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Async generator of the file's contents in chunks."""
+        pass
+
+    @abstractmethod
+    def iter_files(
+        self,
+        bucket: str,
+        prefix: str = "",
+        page_size: int = 1000,
+    ) -> AsyncGenerator[list[dict], None]:
+        """
+        Async generator of pages of files ({key, size, last_modified})
+        under a prefix, fetched one page at a time.
+        """
         pass
 
     @abstractmethod
@@ -38,12 +97,34 @@ class StorageProvider(ABC):
         """Get a presigned URL for temporary access."""
         pass
 
-    @abstractmethod
+    async def upload_file(
+        self,
+        bucket: str,
+        key: str,
+        file: BinaryIO,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """Upload a file and return its URL."""
+        return await self.upload_stream(bucket, key, iter_file(file), content_type)
+
+    async def download_file(self, bucket: str, key: str) -> bytes:
+        """
+        Download a file and return its contents. Holds the whole file in
+        memory; prefer download_stream for anything large.
+        """
+        return b"".join([chunk async for chunk in self.download_stream(bucket, key)])
+
     async def list_files(
         self,
         bucket: str,
         prefix: str = "",
         max_keys: int = 1000,
     ) -> list[dict]:
-        """List files in a bucket with optional prefix."""
-        pass
+        """List up to max_keys files in a bucket with optional prefix."""
+        result: list[dict] = []
+        async with aclosing(self.iter_files(bucket, prefix, min(max_keys, 1000))) as pages:
+            async for page in pages:
+                result.extend(page[:max_keys - len(result)])
+                if len(result) >= max_keys:
+                    break
+        return result
@@ -1,23 +1,26 @@
 """Cloudflare R2 storage provider (Global deployment)."""
 
-from io import BytesIO
-from typing import BinaryIO, Optional
-
-import boto3
-from botocore.config import Config
+import asyncio
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, Optional
 
 from src.config import settings
 
-from .base import StorageProvider
+from .base import StorageProvider, rechunk
 
 
 class CloudflareR2Provider(StorageProvider):
     """
     Cloudflare R2 storage provider (Global deployment).
-    S3-compatible API.
+    S3-compatible API. boto3 is synchronous, so calls run in worker threads.
     """
 
     def __init__(self):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise ImportError("boto3 package required for Cloudflare R2. Install with: pip install boto3")
+
         self.client = boto3.client(
             "s3",
             endpoint_url=settings.R2_ENDPOINT_URL,
@@ -30,29 +33,77 @@ class CloudflareR2Provider(StorageProvider):
         )
         self.public_url_base = settings.R2_PUBLIC_URL
 
-    async def upload_file(
+    async def upload_stream(
         self,
         bucket: str,
         key: str,
-        file: BinaryIO,
+        chunks: AsyncIterable[bytes],
         content_type: Optional[str] = None,
     ) -> str:
         extra_args = {}
         if content_type:
             extra_args["ContentType"] = content_type
 
-        self.client.upload_fileobj(file, bucket, key, ExtraArgs=extra_args)
+        parts = rechunk(chunks, settings.STORAGE_MULTIPART_PART_SIZE)
+        first = await anext(parts, b"")
+        second = await anext(parts, None)
+        if second is None:
+            # Fits in one part: a single PUT
+            await asyncio.to_thread(
+                self.client.put_object, Bucket=bucket, Key=key, Body=first, **extra_args
+            )
+            return f"{self.public_url_base}/{bucket}/{key}"
+
+        upload = await asyncio.to_thread(
+            self.client.create_multipart_upload, Bucket=bucket, Key=key, **extra_args
+        )
+        upload_id = upload["UploadId"]
+        completed = []
+        try:
+            async def send(number: int, body: bytes) -> None:
+                part = await asyncio.to_thread(
+                    self.client.upload_part,
+                    Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body,
+                )
+                completed.append({"PartNumber": number, "ETag": part["ETag"]})
+
+            await send(1, first)
+            await send(2, second)
+            number = 2
+            async for body in parts:
+                number += 1
+                await send(number, body)
+
+            await asyncio.to_thread(
+                self.client.complete_multipart_upload,
+                Bucket=bucket, Key=key, UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except BaseException:
+            await asyncio.to_thread(
+                self.client.abort_multipart_upload, Bucket=bucket, Key=key, UploadId=upload_id
+            )
+            raise
         return f"{self.public_url_base}/{bucket}/{key}"
 
-    async def download_file(self, bucket: str, key: str) -> bytes:
-        buffer = BytesIO()
-        self.client.download_fileobj(bucket, key, buffer)
-        buffer.seek(0)
-        return buffer.read()
+    async def download_stream(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or settings.STORAGE_CHUNK_SIZE
+        response = await asyncio.to_thread(self.client.get_object, Bucket=bucket, Key=key)
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
 
     async def delete_file(self, bucket: str, key: str) -> bool:
         try:
-            self.client.delete_object(Bucket=bucket, Key=key)
+            await asyncio.to_thread(self.client.delete_object, Bucket=bucket, Key=key)
             return True
         except Exception:
             return False
@@ -69,22 +120,25 @@ class CloudflareR2Provider(StorageProvider):
             ExpiresIn=expires_in,
         )
 
-    async def list_files(
+    async def iter_files(
         self,
         bucket: str,
         prefix: str = "",
-        max_keys: int = 1000,
-    ) -> list[dict]:
-        response = self.client.list_objects_v2(
-            Bucket=bucket,
-            Prefix=prefix,
-            MaxKeys=max_keys,
-        )
-        return [
-            {
-                "key": obj["Key"],
-                "size": obj["Size"],
-                "last_modified": obj["LastModified"],
-            }
-            for obj in response.get("Contents", [])
-        ]
+        page_size: int = 1000,
+    ) -> AsyncGenerator[list[dict], None]:
+        params = {"Bucket": bucket, "Prefix": prefix, "MaxKeys": page_size}
+        while True:
+            response = await asyncio.to_thread(self.client.list_objects_v2, **params)
+            page = [
+                {
+                    "key": obj["Key"],
+                    "size": obj["Size"],
+                    "last_modified": obj["LastModified"],
+                }
+                for obj in response.get("Contents", [])
+            ]
+            if page:
+                yield page
+            if not response.get("IsTruncated"):
+                return
+            params["ContinuationToken"] = response["NextContinuationToken"]
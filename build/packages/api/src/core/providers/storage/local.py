@@ -1,7 +1,9 @@
 """Local filesystem storage for development."""
 
+import asyncio
 import os
-from typing import BinaryIO, Optional
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, Iterator, Optional
+from uuid import uuid4
 
 from src.config import settings
 
@@ -9,39 +11,62 @@ from .base import StorageProvider
 
 
 class LocalStorageProvider(StorageProvider):
-    """Local filesystem storage for development."""
+    """
+    Local filesystem storage for development.
+
+    Every filesystem call runs in a worker thread. Uploads are written to a
+    temporary file and renamed into place, so readers never see a partial file.
+    Temporary files live in their own directory beside the buckets (bucket
+    names cannot start with a dot), so they never show up as keys.
+    """
 
     def __init__(self):
         self.base_path = settings.LOCAL_STORAGE_PATH or "/tmp/process-catalogue-storage"
-        os.makedirs(self.base_path, exist_ok=True)
+        self.temp_path = os.path.join(self.base_path, ".uploads")
+        os.makedirs(self.temp_path, exist_ok=True)
 
     def _get_path(self, bucket: str, key: str) -> str:
-        bucket_path = os.path.join(self.base_path, bucket)
-        os.makedirs(bucket_path, exist_ok=True)
-        return os.path.join(bucket_path, key.replace("/", os.sep))
+        return os.path.join(self.base_path, bucket, key.replace("/", os.sep))
 
-    async def upload_file(
+    async def upload_stream(
         self,
         bucket: str,
         key: str,
-        file: BinaryIO,
+        chunks: AsyncIterable[bytes],
         content_type: Optional[str] = None,
     ) -> str:
         path = self._get_path(bucket, key)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "wb") as f:
-            f.write(file.read())
+        partial = os.path.join(self.temp_path, f"{uuid4().hex}.part")
+        await asyncio.to_thread(os.makedirs, os.path.dirname(path), exist_ok=True)
+        f = await asyncio.to_thread(open, partial, "wb")
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, chunk)
+            await asyncio.to_thread(f.close)
+            await asyncio.to_thread(os.replace, partial, path)
+        except BaseException:
+            f.close()
+            await asyncio.to_thread(_remove_if_exists, partial)
+            raise
         return f"file://{path}"
 
-    async def download_file(self, bucket: str, key: str) -> bytes:
-        path = self._get_path(bucket, key)
-        with open(path, "rb") as f:
-            return f.read()
+    async def download_stream(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or settings.STORAGE_CHUNK_SIZE
+        f = await asyncio.to_thread(open, self._get_path(bucket, key), "rb")
+        try:
+            while chunk := await asyncio.to_thread(f.read, chunk_size):
+                yield chunk
+        finally:
+            f.close()
 
     async def delete_file(self, bucket: str, key: str) -> bool:
         try:
-            path = self._get_path(bucket, key)
-            os.remove(path)
+            await asyncio.to_thread(os.remove, self._get_path(bucket, key))
             return True
         except Exception:
             return False
@@ -54,28 +79,42 @@ class LocalStorageProvider(StorageProvider):
     ) -> str:
         return f"file://{self._get_path(bucket, key)}"
 
-    async def list_files(
+    async def iter_files(
         self,
         bucket: str,
         prefix: str = "",
-        max_keys: int = 1000,
-    ) -> list[dict]:
-        bucket_path = os.path.join(self.base_path, bucket)
-        if not os.path.exists(bucket_path):
-            return []
-
-        result = []
-        for root, _, files in os.walk(bucket_path):
-            for file in files:
+        page_size: int = 1000,
+    ) -> AsyncGenerator[list[dict], None]:
+        pages = self._walk_pages(os.path.join(self.base_path, bucket), prefix, page_size)
+        while page := await asyncio.to_thread(next, pages, None):
+            yield page
+
+    @staticmethod
+    def _walk_pages(bucket_path: str, prefix: str, page_size: int) -> Iterator[list[dict]]:
+        """Pages of files under bucket_path, in key order; runs in a worker thread."""
+        page: list[dict] = []
+        for root, dirs, files in os.walk(bucket_path):
+            dirs.sort()
+            for file in sorted(files):
                 full_path = os.path.join(root, file)
                 key = os.path.relpath(full_path, bucket_path).replace(os.sep, "/")
-                if key.startswith(prefix):
-                    stat = os.stat(full_path)
-                    result.append({
-                        "key": key,
-                        "size": stat.st_size,
-                        "last_modified": stat.st_mtime,
-                    })
-                    if len(result) >= max_keys:
-                        return result
-        return result
+                if not key.startswith(prefix):
+                    continue
+                stat = os.stat(full_path)
+                page.append({
+                    "key": key,
+                    "size": stat.st_size,
+                    "last_modified": stat.st_mtime,
+                })
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+        if page:
+            yield page
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
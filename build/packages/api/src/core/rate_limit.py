@@ -1,15 +1,23 @@
 """
-Rate limiting configuration and in-memory store.
+Rate limiting configuration and limiter backends.
 
 Blueprint §6.2: Auth endpoints 5 req/min, API 100 req/min per user.
 """
 
+import logging
+import math
 import time
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from fastapi import Request
 
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RateLimitConfig:
@@ -69,10 +77,23 @@ class TokenBucket:
         return int(tokens_needed / self.refill_rate) + 1
 
 
-class InMemoryRateLimiter:
+class RateLimiter(ABC):
+    """Rate limiter backend interface."""
+
+    @abstractmethod
+    async def is_allowed(self, key: str, config: RateLimitConfig) -> tuple[bool, int]:
+        """
+        Check if request is allowed.
+        Returns (allowed, retry_after_seconds).
+        """
+        pass
+
+
+class InMemoryRateLimiter(RateLimiter):
     """
     In-memory rate limiter using token bucket algorithm.
-    Suitable for single-instance development.
+    Suitable for single-instance development, and used as the fallback
+    when the shared store is unreachable.
     """
 
     def __init__(self):
@@ -82,40 +103,178 @@ class InMemoryRateLimiter:
 
     def _get_bucket(self, key: str, config: RateLimitConfig) -> TokenBucket:
         """Get or create a token bucket for the given key."""
-        if key not in self._buckets:
+        bucket = self._buckets.get(key)
+        if bucket is None:
             refill_rate = config.requests / config.window
-            self._buckets[key] = TokenBucket(
+            bucket = self._buckets[key] = TokenBucket(
                 tokens=config.requests,
                 last_refill=time.time(),
                 capacity=config.requests,
                 refill_rate=refill_rate,
             )
-        return self._buckets[key]
+        return bucket
 
-    def is_allowed(self, key: str, config: RateLimitConfig) -> tuple[bool, int]:
-        """
-        Check if request is allowed.
-        Returns (allowed, retry_after_seconds).
-        """
+    def check(self, key: str, config: RateLimitConfig) -> tuple[bool, int]:
+        """Synchronous check, for callers outside the event loop."""
         self._maybe_cleanup()
         bucket = self._get_bucket(key, config)
         allowed = bucket.consume()
         return allowed, bucket.retry_after
 
+    async def is_allowed(self, key: str, config: RateLimitConfig) -> tuple[bool, int]:
+        return self.check(key, config)
+
     def _maybe_cleanup(self):
-        """Periodically clean up old buckets."""
+        """Periodically drop idle buckets in place."""
         now = time.time()
         if now - self._last_cleanup > self._cleanup_interval:
             self._last_cleanup = now
             cutoff = now - 600
-            self._buckets = {
-                k: v for k, v in self._buckets.items()
-                if v.last_refill > cutoff
-            }
+            stale = [k for k, v in self._buckets.items() if v.last_refill <= cutoff]
+            for k in stale:
+                del self._buckets[k]
+
+
+# GCRA (generic cell rate algorithm) in one atomic round trip. State is a
+# single "theoretical arrival time" per key, in Redis server time so workers
+# never disagree about the clock.
+#   KEYS[1]  limiter key
+#   ARGV[1]  emission interval (window / requests), seconds
+#   ARGV[2]  window, seconds (burst capacity = requests)
+#   ARGV[3]  requests already admitted locally and not yet recorded
+# Returns {allowed, retry_after_ms, remaining}
+_GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local debt = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+tat = tat + debt * interval
+
+local new_tat = tat + interval
+local allow_at = new_tat - window
+local allowed = 0
+if allow_at <= now then
+    allowed = 1
+    tat = new_tat
+end
+
+if tat > now then
+    redis.call('SET', KEYS[1], tostring(tat), 'PX', math.ceil((tat - now) * 1000))
+end
+
+local remaining = math.floor((now + window - tat) / interval)
+if allowed == 1 then
+    return {1, 0, remaining}
+end
+return {0, math.ceil((allow_at - now) * 1000), 0}
+"""
+
+
+@dataclass
+class _LocalLease:
+    """Requests a worker may admit without a round trip."""
+    budget: int
+    expires_at: float
+    debt: int = 0  # admitted locally, not yet recorded in Redis
+
 
+class RedisRateLimiter(RateLimiter):
+    """
+    Distributed rate limiter shared by every worker through Redis.
 
-# Global rate limiter instance
-_rate_limiter = InMemoryRateLimiter()
+    Each check is one EVALSHA of an atomic GCRA script. When Redis reports a
+    key is far from its limit, the worker takes a small local lease and
+    admits the next few requests without a round trip; those are charged to
+    Redis on the next sync. Leases are capped at a fraction of the remaining
+    headroom and live for LOCAL_LEASE_TTL, which bounds any overshoot.
+
+    If Redis is unavailable, checks fall back to a per-process in-memory
+    limiter rather than failing requests.
+    """
+
+    KEY_PREFIX = "ratelimit:"
+    # Only lease when at least this fraction of capacity remains
+    LOCAL_LEASE_MIN_HEADROOM = 0.5
+    # Lease at most this fraction of the remaining headroom
+    LOCAL_LEASE_FRACTION = 0.1
+    LOCAL_LEASE_TTL = 1.0
+    # Seconds between sweeps of expired leases (keys that went quiet)
+    LOCAL_LEASE_PRUNE_INTERVAL = 60.0
+
+    def __init__(self, redis_client: Any):
+        self._script = redis_client.register_script(_GCRA_SCRIPT)
+        self._leases: dict[str, _LocalLease] = {}
+        self._next_prune = time.monotonic() + self.LOCAL_LEASE_PRUNE_INTERVAL
+        self._fallback = InMemoryRateLimiter()
+
+    def _maybe_prune(self, now: float) -> None:
+        """
+        Drop leases that expired over a sweep interval ago. Their keys have
+        gone quiet; any debt they carry (at most one lease budget) is not
+        charged.
+        """
+        if now < self._next_prune:
+            return
+        self._next_prune = now + self.LOCAL_LEASE_PRUNE_INTERVAL
+        cutoff = now - self.LOCAL_LEASE_PRUNE_INTERVAL
+        stale = [k for k, lease in self._leases.items() if lease.expires_at <= cutoff]
+        for k in stale:
+            del self._leases[k]
+
+    async def is_allowed(self, key: str, config: RateLimitConfig) -> tuple[bool, int]:
+        now = time.monotonic()
+        self._maybe_prune(now)
+        lease = self._leases.get(key)
+        if lease is not None and lease.budget > 0 and now < lease.expires_at:
+            lease.budget -= 1
+            lease.debt += 1
+            return True, 0
+
+        debt = lease.debt if lease is not None else 0
+        interval = config.window / config.requests
+        try:
+            allowed, retry_after_ms, remaining = await self._script(
+                keys=[self.KEY_PREFIX + key],
+                args=[interval, config.window, debt],
+            )
+        except Exception as e:
+            logger.warning(f"Rate limit store unavailable, using local limiter: {e}")
+            return self._fallback.check(key, config)
+
+        budget = 0
+        if allowed and remaining >= config.requests * self.LOCAL_LEASE_MIN_HEADROOM:
+            budget = int(remaining * self.LOCAL_LEASE_FRACTION)
+
+        if budget:
+            self._leases[key] = _LocalLease(budget, now + self.LOCAL_LEASE_TTL)
+        else:
+            self._leases.pop(key, None)
+
+        if not allowed:
+            return False, max(1, math.ceil(retry_after_ms / 1000))
+        return True, 0
+
+
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the configured rate limiter.
+
+    Shared through Redis when the cache provider is Redis, so the limit
+    holds across workers; otherwise per-process in memory.
+    """
+    if settings.CACHE_PROVIDER == "redis":
+        from src.core.providers.cache import get_cache_provider
+        from src.core.providers.cache.redis import RedisProvider
+
+        provider = get_cache_provider()
+        if isinstance(provider, RedisProvider):
+            return RedisRateLimiter(provider.redis)
+    return InMemoryRateLimiter()
 
 
 def get_rate_limit_key(request: Request, user_id: Optional[str] = None) -> str:
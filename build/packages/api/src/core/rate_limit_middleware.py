@@ -1,62 +1,92 @@
 """Rate limiting middleware and endpoint decorator."""
 
+from functools import lru_cache
 from typing import Callable
 
 from fastapi import HTTPException, Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.config import settings
 from src.core.rate_limit import (
     RATE_LIMITS,
-    _rate_limiter,
     get_rate_limit_key,
+    get_rate_limiter,
     get_rate_limit_type,
 )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# Paths never rate limited (health checks and docs)
+EXEMPT_PATHS = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
+
+
+class RateLimitMiddleware:
     """
     Rate limiting middleware.
 
     Applies different limits based on endpoint:
     - /auth/* endpoints: 5 req/min (prevent brute force)
     - Other API endpoints: 100 req/min per user
+
+    Pure ASGI: rejections are answered directly and allowed responses only
+    have their start message touched.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        # Skip rate limiting for health checks and docs
-        path = request.url.path
-        if path in ("/health", "/docs", "/redoc", "/openapi.json"):
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Skip in test environment
-        if settings.ENVIRONMENT == "test":
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip non-HTTP scopes, exempt paths and the test environment
+        if (
+            scope["type"] != "http"
+            or scope["path"] in EXEMPT_PATHS
+            or settings.ENVIRONMENT == "test"
+        ):
+            await self.app(scope, receive, send)
+            return
 
         # Determine rate limit type and config
-        limit_type = get_rate_limit_type(path)
+        limit_type = get_rate_limit_type(scope["path"])
         config = RATE_LIMITS.get(limit_type, RATE_LIMITS["api"])
 
         # Get rate limit key (try to use user ID from token if available)
-        user_id = getattr(request.state, "user_id", None)
+        request = Request(scope)
+        user_id = scope.get("state", {}).get("user_id")
         key = f"{limit_type}:{get_rate_limit_key(request, user_id)}"
 
         # Check rate limit
-        allowed, retry_after = _rate_limiter.is_allowed(key, config)
+        allowed, retry_after = await get_rate_limiter().is_allowed(key, config)
 
         if not allowed:
-            raise HTTPException(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Try again in {retry_after} seconds.",
+                content={"detail": f"Rate limit exceeded. Try again in {retry_after} seconds."},
                 headers={"Retry-After": str(retry_after)},
             )
+            await response(scope, receive, send)
+            return
 
         # Add rate limit headers to response
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(config.requests)
-        response.headers["X-RateLimit-Window"] = str(config.window)
+        limit_headers = _limit_headers(config.requests, config.window)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", ()), *limit_headers],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
 
-        return response
+@lru_cache
+def _limit_headers(requests: int, window: int) -> tuple[tuple[bytes, bytes], ...]:
+    """Encoded X-RateLimit headers, built once per limit."""
+    return (
+        (b"x-ratelimit-limit", str(requests).encode()),
+        (b"x-ratelimit-window", str(window).encode()),
+    )
 
 
 def rate_limit(limit_type: str = "api"):
@@ -80,7 +110,7 @@ def rate_limit(limit_type: str = "api"):
             user_id = getattr(request.state, "user_id", None)
             key = f"{limit_type}:{get_rate_limit_key(request, user_id)}"
 
-            allowed, retry_after = _rate_limiter.is_allowed(key, config)
+            allowed, retry_after = await get_rate_limiter().is_allowed(key, config)
             if not allowed:
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
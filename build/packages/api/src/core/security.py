@@ -8,10 +8,9 @@ Implements security hardening per OWASP Top 10:
 """
 
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.config import settings
 
@@ -24,13 +23,31 @@ from src.core.encryption import (  # noqa: F401
 from src.core.audit import (  # noqa: F401
     AuditEvent,
     audit_logger,
-    detect_suspicious_activity,
     get_client_ip,
     log_audit_event,
+    scan_for_suspicious_patterns,
 )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+def _security_headers() -> list[tuple[bytes, bytes]]:
+    """Encoded security headers, built once at startup."""
+    headers = {
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": "DENY",
+        "X-XSS-Protection": "1; mode=block",
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+        "Content-Security-Policy": "default-src 'none'; frame-ancestors 'none'",
+        "Permissions-Policy": (
+            "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
+            "magnetometer=(), microphone=(), payment=(), usb=()"
+        ),
+    }
+    if settings.is_production:
+        headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+    return [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+
+class SecurityHeadersMiddleware:
     """
     Add security headers to all responses.
 
@@ -42,53 +59,61 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Content-Security-Policy: Restrict resource loading
     - Referrer-Policy: Control referrer information
     - Permissions-Policy: Restrict browser features
-    """
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
 
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        if settings.is_production:
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains"
-            )
+    Pure ASGI: rewrites only the response start message, so streaming
+    bodies pass through untouched.
+    """
 
-        response.headers["Content-Security-Policy"] = "default-src 'none'; frame-ancestors 'none'"
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.headers = _security_headers()
+        # Headers replaced by ours, plus the server banner
+        self.strip = frozenset(name for name, _ in self.headers) | {b"server"}
 
-        response.headers["Permissions-Policy"] = (
-            "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
-            "magnetometer=(), microphone=(), payment=(), usb=()"
-        )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        if "server" in response.headers:
-            del response.headers["server"]
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value) for name, value in message.get("headers", ())
+                    if name.lower() not in self.strip
+                ]
+                headers.extend(self.headers)
+                message = {**message, "headers": headers}
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
-class SuspiciousActivityMiddleware(BaseHTTPMiddleware):
+class SuspiciousActivityMiddleware:
     """Detect and log suspicious activity."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        suspicious = detect_suspicious_activity(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        if suspicious:
-            log_audit_event(
-                event_type=AuditEvent.SUSPICIOUS_ACTIVITY,
-                ip_address=get_client_ip(request),
-                user_agent=request.headers.get("user-agent", "")[:500],
-                details={"reason": suspicious, "path": request.url.path},
-                success=False,
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            suspicious = scan_for_suspicious_patterns(
+                scope["path"], scope.get("query_string", b"").decode("latin-1")
             )
 
-            if settings.is_production:
-                pass  # Consider blocking or additional validation
+            if suspicious:
+                request = Request(scope)
+                log_audit_event(
+                    event_type=AuditEvent.SUSPICIOUS_ACTIVITY,
+                    ip_address=get_client_ip(request),
+                    user_agent=request.headers.get("user-agent", "")[:500],
+                    details={"reason": suspicious, "path": scope["path"]},
+                    success=False,
+                )
+
+                if settings.is_production:
+                    pass  # Consider blocking or additional validation
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def validate_uuid(value: str) -> bool:
@@ -10,8 +10,9 @@ from contextvars import ContextVar
 from typing import Optional
 
 from fastapi import Depends, HTTPException, Request, status
-from sqlalchemy import event, text
+from sqlalchemy import Connection, Engine, Pool, event, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from src.core.database import get_db
 
@@ -45,15 +46,97 @@ async def get_tenant_db(
             detail="Organization context required",
         )
 
-    # Set PostgreSQL session variable for Row-Level Security
-    # Note: SET doesn't support parameterized queries, so we use string formatting
-    # The org_id is a UUID from our auth system, so it's safe to interpolate
-    await db.execute(text(f"SET app.current_organization_id = '{org_id}'"))
-    set_current_org_id(org_id)
+    await apply_tenant_context(db, org_id)
 
     return db
 
 
+async def apply_tenant_context(db: AsyncSession, org_id: str) -> None:
+    """
+    Scope a session to an organization for RLS and the tenant contextvar.
+    Also used by background jobs that open their own sessions.
+
+    Nothing is sent to the database here: the setting is applied when the
+    session's transaction begins on a connection, and only if that pooled
+    connection is not already scoped to this organization.
+    """
+    db.info[_SESSION_TENANT_KEY] = org_id
+    set_current_org_id(org_id)
+
+    # Transaction already open (e.g. a test savepoint): apply right away
+    if db.in_transaction():
+        connection = await db.connection()
+        await connection.run_sync(_ensure_connection_tenant, org_id)
+
+
+# ── Per-connection tenant tracking ─────────────────────
+#
+# The RLS setting is session-level on the pooled connection, and the
+# connection records which organization it carries. A checkout for the same
+# organization skips the round trip; a different organization (or a session
+# with no tenant) re-scopes it before its first statement, so a setting
+# never carries over to another tenant's request. A transaction-local
+# set_config(..., true) would be discarded at every commit and could not be
+# reused across checkouts.
+#
+# A set_config only survives if its transaction commits, so it is recorded
+# as pending and promoted on commit; rollbacks and pool resets drop it.
+
+_SESSION_TENANT_KEY = "organization_id"
+_CONNECTION_TENANT_KEY = "tenant_organization_id"
+_PENDING_TENANT_KEY = "pending_tenant_organization_id"
+
+_SET_TENANT = text(
+    "SELECT set_config('app.current_organization_id', :org_id, false)"
+)
+
+
+def _connection_tenant(info: dict) -> Optional[str]:
+    """Organization the connection is currently scoped to ("" when cleared)."""
+    if _PENDING_TENANT_KEY in info:
+        return info[_PENDING_TENANT_KEY]
+    return info.get(_CONNECTION_TENANT_KEY)
+
+
+def _ensure_connection_tenant(connection: Connection, org_id: Optional[str]) -> None:
+    """Scope a connection to org_id (or clear it), skipping if already scoped."""
+    current = _connection_tenant(connection.info)
+    if current == org_id or (not current and not org_id):
+        return
+
+    connection.execute(_SET_TENANT, {"org_id": org_id or ""})
+    connection.info[_PENDING_TENANT_KEY] = org_id or ""
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_session_tenant(session: Session, transaction, connection: Connection) -> None:
+    _ensure_connection_tenant(connection, session.info.get(_SESSION_TENANT_KEY))
+
+
+@event.listens_for(Engine, "commit")
+def _confirm_tenant_on_commit(connection: Connection) -> None:
+    pending = connection.info.pop(_PENDING_TENANT_KEY, None)
+    if pending is not None:
+        connection.info[_CONNECTION_TENANT_KEY] = pending
+
+
+@event.listens_for(Engine, "rollback")
+def _forget_tenant_on_rollback(connection: Connection) -> None:
+    connection.info.pop(_PENDING_TENANT_KEY, None)
+
+
+@event.listens_for(Engine, "rollback_savepoint")
+def _forget_tenant_on_savepoint_rollback(connection: Connection, name, context) -> None:
+    # The set_config may have run inside the savepoint; re-apply next time
+    connection.info.pop(_PENDING_TENANT_KEY, None)
+    connection.info.pop(_CONNECTION_TENANT_KEY, None)
+
+
+@event.listens_for(Pool, "reset")
+def _forget_tenant_on_reset(dbapi_connection, connection_record, reset_state) -> None:
+    connection_record.info.pop(_PENDING_TENANT_KEY, None)
+
+
 def apply_tenant_filter(query, model_class, org_id: str):
     """
     Apply organization filter to any query.
@@ -6,14 +6,19 @@ See Blueprint.md for complete specification.
 """
 
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.v1.router import api_router
 from src.config import settings
+from src.core.audit_pipeline import audit_pipeline
+from src.core.instrumentation import InstrumentationMiddleware, render_metrics
 from src.core.rate_limit import RateLimitMiddleware
 from src.core.security import SecurityHeadersMiddleware, SuspiciousActivityMiddleware
+from src.services.email_queue import email_queue
 
 
 @asynccontextmanager
@@ -22,9 +27,13 @@ async def lifespan(app: FastAPI):
     # Startup: verify DB connection, warm caches
     print(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     print(f"   Environment: {settings.ENVIRONMENT}")
+    audit_pipeline.start()
+    email_queue.start()
     yield
     # Shutdown: cleanup
     print("Shutting down")
+    await email_queue.stop()
+    await audit_pipeline.stop()
 
 
 app = FastAPI(
@@ -54,6 +63,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL/pool/serialization timings (outermost, so totals cover everything)
+app.add_middleware(InstrumentationMiddleware)
+
 # API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -65,4 +77,32 @@ async def health_check():
         "status": "healthy",
         "version": settings.APP_VERSION,
         "environment": settings.ENVIRONMENT,
+        "audit": audit_pipeline.metrics(),
+        "email": email_queue.metrics(),
     }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(default=None)):
+    """
+    Prometheus scrape endpoint: per-route request, SQL and timing counters.
+    Open without METRICS_TOKEN only in development; elsewhere it needs one.
+    """
+    if not settings.METRICS_TOKEN:
+        if settings.ENVIRONMENT not in ("development", "local", "test"):
+            raise HTTPException(status_code=404, detail="Not found")
+    elif authorization != f"Bearer {settings.METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    audit = audit_pipeline.metrics()
+    email = email_queue.metrics()
+    return render_metrics({
+        "audit_queue_depth": audit["queue_depth"],
+        "audit_queue_high_water": audit["high_water"],
+        "audit_events_dropped": audit["dropped"],
+        **{f"audit_events_failed_{sink}": n for sink, n in audit["failed"].items()},
+        "email_queue_depth": email["queue_depth"],
+        "email_retrying": email["retrying"],
+        "email_sent": email["sent"],
+        "email_failed": email["failed"],
+        "email_dropped": email["dropped"],
+    })
@@ -28,10 +28,12 @@ from src.models.survey import (
     Survey,
     SurveyQuestion,
     SurveyResponse,
+    SurveyStats,
 )
 from src.models.reference import (
     LLMConfiguration,
     PromptExecution,
+    PromptBatchJob,
     PromptTemplate,
     ReferenceCatalogue,
 )
@@ -77,10 +79,12 @@ __all__ = [
     "Survey",
     "SurveyQuestion",
     "SurveyResponse",
+    "SurveyStats",
     # Reference & Prompts
     "ReferenceCatalogue",
     "PromptTemplate",
     "PromptExecution",
+    "PromptBatchJob",
     "LLMConfiguration",
     # System Catalogue
     "SystemCatalogue",
@@ -171,6 +171,7 @@ class AuditLog(BaseModel):
     """
     Comprehensive audit trail for all CRUD operations.
     Blueprint §8.2: All CRUD operations logged with user/timestamp.
+    Security events from the audit pipeline (src/core/audit.py) land here too.
     """
 
     __tablename__ = "audit_logs"
@@ -179,9 +180,12 @@ class AuditLog(BaseModel):
         UUID(as_uuid=False), ForeignKey("organizations.id"), nullable=False, index=True
     )
     user_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False))
-    action: Mapped[str] = mapped_column(String(20), nullable=False)  # create, update, delete
-    entity_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    entity_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    action: Mapped[str] = mapped_column(String(50), nullable=False)  # create, update, delete
+    entity_type: Mapped[Optional[str]] = mapped_column(String(50), index=True)
+    entity_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False))
     changes: Mapped[Optional[dict]] = mapped_column(JSONB)  # {field: {old, new}}
+    event_type: Mapped[Optional[str]] = mapped_column(String(50))  # AuditEvent.*, for security events
+    success: Mapped[Optional[bool]] = mapped_column(Boolean)
+    details: Mapped[Optional[dict]] = mapped_column(JSONB)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45))
     user_agent: Mapped[Optional[str]] = mapped_column(String(500))
@@ -14,7 +14,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String,
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database import TenantModel
+from src.core.database import TenantModel, search_vector_column
 
 import enum
 
@@ -60,6 +60,7 @@ class Process(TenantModel):
     code: Mapped[str] = mapped_column(String(20), nullable=False, index=True)  # e.g., L2-10
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
+    search_vector: Mapped[Optional[str]] = search_vector_column("name")
 
     # ── Hierarchy ───────────────────────────────────
     level: Mapped[str] = mapped_column(String(5), nullable=False, index=True)
@@ -14,7 +14,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String,
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database import TenantModel
+from src.core.database import TenantModel, search_vector_column
 
 
 # ── Reference Data Catalogues (Blueprint §5.2) ──────
@@ -32,6 +32,7 @@ class ReferenceCatalogue(TenantModel):
     code: Mapped[str] = mapped_column(String(50), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
+    search_vector: Mapped[Optional[str]] = search_vector_column("name")
     status: Mapped[str] = mapped_column(String(20), default="active")
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
     parent_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False))
@@ -112,6 +113,37 @@ class PromptExecution(TenantModel):
     # Execution metadata
     execution_time_ms: Mapped[Optional[int]] = mapped_column(Integer)
     error_message: Mapped[Optional[str]] = mapped_column(Text)
+    batch_job_id: Mapped[Optional[str]] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("prompt_batch_jobs.id", ondelete="CASCADE")
+    )
+
+
+class PromptBatchJob(TenantModel):
+    """
+    A prompt template fanned out over many processes in the background.
+    Completed calls are PromptExecution rows with this batch_job_id; they
+    are the checkpoint a resumed job skips.
+    """
+
+    __tablename__ = "prompt_batch_jobs"
+
+    template_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("prompt_templates.id"), nullable=False
+    )
+    user_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="running")
+    # running, completed, failed
+
+    target_ids: Mapped[list] = mapped_column(JSONB, nullable=False)  # process IDs, in run order
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    completed: Mapped[int] = mapped_column(Integer, default=0)
+    failed: Mapped[int] = mapped_column(Integer, default=0)
+
+    temperature: Mapped[Optional[float]] = mapped_column(Numeric(3, 2))
+    max_tokens: Mapped[Optional[int]] = mapped_column(Integer)
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
 
 # ── LLM Configuration (Blueprint §6.4.11) ────────────
@@ -14,7 +14,7 @@ from sqlalchemy import Date, ForeignKey, Integer, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database import TenantModel
+from src.core.database import TenantModel, search_vector_column
 
 import enum
 
@@ -107,6 +107,7 @@ class RiadaItem(TenantModel):
     code: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
+    search_vector: Mapped[Optional[str]] = search_vector_column("title")
 
     # ── Classification ───────────────────────────────
     riada_type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
@@ -14,7 +14,7 @@ Blueprint §4.7.8: Survey data model.
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -118,3 +118,28 @@ class SurveyResponse(TenantModel):
     answers: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
 
     survey: Mapped["Survey"] = relationship(back_populates="responses")
+
+
+class SurveyStats(TenantModel):
+    """
+    Running aggregates of a survey's responses, updated on submit.
+
+    One row per answered question, plus one row with question_id NULL for the
+    survey as a whole (count = responses, score = total_score, value_counts
+    = {"complete": n}). Every column is additive, so a submission is a single
+    upsert that adds its deltas; see services/survey_analytics.
+    """
+
+    __tablename__ = "survey_stats"
+
+    survey_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("surveys.id", ondelete="CASCADE"), nullable=False
+    )
+    question_id: Mapped[Optional[str]] = mapped_column(
+        UUID(as_uuid=False), ForeignKey("survey_questions.id", ondelete="CASCADE")
+    )
+    count: Mapped[int] = mapped_column(BigInteger, default=0)  # responses / answers
+    score_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    score_sq_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    value_counts: Mapped[dict] = mapped_column(JSONB, default=dict)  # answer value -> count
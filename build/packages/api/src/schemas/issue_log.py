@@ -195,6 +195,30 @@ class HeatmapResponse(BaseModel):
     rollup: bool = False  # True if includes descendant rollup
 
 
+class HeatmapColumnarResponse(BaseModel):
+    """
+    Process-issue heatmap as parallel arrays (index i = one process).
+
+    Same fields as HeatmapCell without repeating keys per row.
+    """
+    process_id: list[str] = Field(default_factory=list)
+    process_ref: list[str] = Field(default_factory=list)
+    process_name: list[str] = Field(default_factory=list)
+    level: list[str] = Field(default_factory=list)
+    parent_id: list[Optional[str]] = Field(default_factory=list)
+    people_count: list[int] = Field(default_factory=list)
+    process_count: list[int] = Field(default_factory=list)
+    system_count: list[int] = Field(default_factory=list)
+    data_count: list[int] = Field(default_factory=list)
+    total_issues: list[int] = Field(default_factory=list)
+    people_colour: list[str] = Field(default_factory=list)
+    process_colour: list[str] = Field(default_factory=list)
+    system_colour: list[str] = Field(default_factory=list)
+    data_colour: list[str] = Field(default_factory=list)
+    overall_colour: list[str] = Field(default_factory=list)
+    rollup: bool = False
+
+
 class IssueExportRequest(BaseModel):
     """Export request parameters."""
     format: str = Field("csv", pattern="^(csv|xlsx)$")
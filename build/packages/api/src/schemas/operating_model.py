@@ -9,7 +9,7 @@ Summary schema aggregates relational + JSONB sources.
 from datetime import datetime
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class OperatingModelComponentCreate(BaseModel):
@@ -48,6 +48,23 @@ class OperatingModelSummary(BaseModel):
     completion_percentage: int
 
 
+class OperatingModelCompletenessRequest(BaseModel):
+    """Processes to summarise: an explicit list, or a process and its descendants."""
+    process_ids: Optional[list[str]] = Field(None, min_length=1, max_length=1000)
+    root_id: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_selection(self) -> "OperatingModelCompletenessRequest":
+        if (self.process_ids is None) == (self.root_id is None):
+            raise ValueError("Provide exactly one of process_ids or root_id")
+        return self
+
+
+class OperatingModelCompletenessResponse(BaseModel):
+    """Completeness for each requested process that exists, in request/tree order."""
+    items: list[OperatingModelSummary]
+
+
 class RoleCatalogueCreate(BaseModel):
     name: str
     scope: Optional[str] = None
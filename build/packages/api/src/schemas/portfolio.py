@@ -87,10 +87,11 @@ class PortfolioItemResponse(BaseModel):
 class PortfolioListResponse(BaseModel):
     """Paginated list of portfolio items."""
     items: list[PortfolioItemResponse]
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 50
     has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class PortfolioTreeNode(BaseModel):
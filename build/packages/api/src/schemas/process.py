@@ -118,10 +118,11 @@ ProcessTreeNode.model_rebuild()
 class ProcessListResponse(BaseModel):
     """Paginated list of processes."""
     items: list[ProcessResponse]
-    total: int = Field(..., ge=0)
+    total: Optional[int] = Field(None, ge=0)
     page: int = Field(1, ge=1)
-    per_page: int = Field(50, ge=1, le=100)
+    per_page: int = Field(50, ge=1, le=200)
     has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class OperatingModelData(BaseModel):
@@ -135,3 +136,24 @@ class ProcessDetailResponse(ProcessResponse):
     """Extended response with operating model components."""
     operating_model: list[OperatingModelData] = []
     children: list[ProcessResponse] = []
+
+
+class ProcessImportError(BaseModel):
+    """A problem with one row of an imported catalogue."""
+    sheet: str
+    row: int
+    message: str
+
+
+class ProcessImportResponse(BaseModel):
+    """Outcome of a bulk catalogue import."""
+    committed: bool
+    dry_run: bool = False
+    processes: int = 0
+    raci_entries: int = 0
+    kpis: int = 0
+    system_links: int = 0
+    issues: int = 0
+    errors: list[ProcessImportError] = []
+    # Processes given RACI, KPI or system rows, for cache invalidation
+    operating_model_process_ids: list[str] = Field(default_factory=list, exclude=True)
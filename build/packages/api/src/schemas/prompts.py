@@ -8,7 +8,7 @@ Blueprint §6.4.11: LLM configuration.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # ── Prompt Templates ────────────────────────────────────
@@ -90,6 +90,8 @@ class PromptExecutionCreate(BaseModel):
     target_entity_type: str  # process, riada, portfolio, business_model
     target_entity_id: str
     prompt_text: str  # The actual prompt to send
+    temperature: Optional[float] = Field(None, ge=0, le=2)  # 0 makes responses cacheable
+    max_tokens: Optional[int] = Field(None, ge=1, le=32000)
 
 
 class PromptExecutionResponse(BaseModel):
@@ -110,11 +112,50 @@ class PromptExecutionResponse(BaseModel):
     is_saved: bool
     execution_time_ms: Optional[int]
     error_message: Optional[str]
+    batch_job_id: Optional[str] = None
     created_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+# ── Batch Execution ─────────────────────────────────────
+
+
+class PromptBatchCreate(BaseModel):
+    """Run a template over processes: a list, a subtree and/or a level (filters combine)."""
+    template_id: str
+    process_ids: Optional[list[str]] = Field(None, min_length=1, max_length=5000)
+    root_id: Optional[str] = None
+    level: Optional[str] = Field(None, pattern=r"^L[0-5]$")
+    temperature: Optional[float] = Field(None, ge=0, le=2)
+    max_tokens: Optional[int] = Field(None, ge=1, le=32000)
+
+    @model_validator(mode="after")
+    def check_selection(self) -> "PromptBatchCreate":
+        if self.process_ids is None and self.root_id is None and self.level is None:
+            raise ValueError("Provide process_ids, root_id or level")
+        return self
+
+
+class PromptBatchJobResponse(BaseModel):
+    id: str
+    template_id: str
+    user_id: str
+    status: str  # running, completed, failed
+    total: int
+    completed: int
+    failed: int
+    temperature: Optional[float]
+    max_tokens: Optional[int]
+    error_message: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
 # ── LLM Configuration ───────────────────────────────────
 
 
@@ -88,7 +88,7 @@ class RAGSummaryResponse(BaseModel):
 class RAGRecalculateRequest(BaseModel):
     """Request to recalculate RAG statuses (admin only)."""
     process_ids: Optional[list[str]] = Field(
-        None, description="Specific processes, or None for all"
+        None, description="Specific processes; None or empty for all"
     )
 
 
@@ -96,3 +96,15 @@ class RAGRecalculateResponse(BaseModel):
     """Result of RAG recalculation."""
     processes_updated: int
     errors: list[str] = []
+
+
+class RAGRecalculateJobResponse(BaseModel):
+    """Progress of a background RAG recalculation."""
+    job_id: str
+    status: str  # pending, running, completed, failed
+    total: int = 0
+    processed: int = 0
+    processes_updated: int = 0
+    errors: list[str] = []
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -63,7 +63,8 @@ class ReferenceCatalogueResponse(BaseModel):
 class ReferenceCatalogueListResponse(BaseModel):
     """Paginated list of reference catalogue entries."""
     items: list[ReferenceCatalogueResponse]
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 50
     has_more: bool = False
+    next_cursor: Optional[str] = None
@@ -86,10 +86,11 @@ class RiadaResponse(BaseModel):
 class RiadaListResponse(BaseModel):
     """Paginated list of RIADA items."""
     items: list[RiadaResponse]
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 50
     has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class RiadaSummary(BaseModel):
@@ -150,3 +151,45 @@ class RiadaLinksResponse(BaseModel):
 class RiadaDetailResponse(RiadaResponse):
     """Extended response including linked items."""
     linked_items: RiadaLinksResponse | None = None
+
+
+# ── Link Graph Schemas ──────────────────────────────────
+
+
+class RiadaGraphItem(BaseModel):
+    """A RIADA item reached through the link graph."""
+    id: str
+    code: str
+    title: str
+    riada_type: str
+    severity: str
+    status: str
+    depth: int  # Hops from the starting item
+    via_id: Optional[str] = None  # Item it was reached from
+    link_type: Optional[str] = None  # Type of the link it was reached by
+    link_direction: Optional[str] = None  # "outgoing" or "incoming" relative to via_id
+
+
+class RiadaImpactResponse(BaseModel):
+    """Items transitively linked to a RIADA item, nearest first."""
+    riada_id: str
+    direction: str
+    max_depth: int
+    items: list[RiadaGraphItem] = []
+    total: int = 0
+    truncated: bool = False
+
+
+class RiadaPathResponse(BaseModel):
+    """Shortest chain of links between two RIADA items."""
+    source_id: str
+    target_id: str
+    found: bool
+    length: Optional[int] = None  # Number of links; None when unreachable
+    items: list[RiadaGraphItem] = []  # source ... target
+
+
+class RiadaCyclesResponse(BaseModel):
+    """Groups of items that reach each other through directed links."""
+    cycles: list[list[str]] = []
+    total: int = 0
@@ -0,0 +1,25 @@
+"""
+Unified search API schemas.
+Ranked matches across processes, RIADA items and reference catalogues.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+SearchEntityType = Literal["process", "riada", "reference"]
+
+
+class SearchResult(BaseModel):
+    """One ranked match."""
+    entity_type: SearchEntityType
+    id: str
+    code: str
+    title: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    """Ranked matches for a query, best first."""
+    query: str
+    results: list[SearchResult]
@@ -128,3 +128,50 @@ class SurveyResponseDetail(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+# ── Results ─────────────────────────────────────────────
+
+
+class SurveyQuestionResult(BaseModel):
+    question_id: str
+    question_text: str
+    question_type: str
+    sort_order: int
+    answer_count: int = 0
+    score_count: int = 0
+    mean_score: Optional[float] = None
+    score_stddev: Optional[float] = None
+    distribution: dict[str, int] = {}  # answer value -> count (not kept for text questions)
+
+
+class SurveyResultsResponse(BaseModel):
+    """Aggregated results, read from survey_stats rather than the responses."""
+    survey_id: str
+    mode: str
+    response_count: int = 0
+    complete_count: int = 0
+    mean_score: Optional[float] = None  # Mean total_score (0-100): readiness of the linked processes
+    score_stddev: Optional[float] = None
+    linked_process_ids: list[str] = []
+    questions: list[SurveyQuestionResult]
+    updated_at: Optional[datetime] = None
+
+
+class SurveyResultsRebuildRequest(BaseModel):
+    """Request to recompute survey results from responses (admin only)."""
+    survey_ids: Optional[list[str]] = Field(
+        None, description="Specific surveys, or None for all"
+    )
+
+
+class SurveyResultsRebuildJobResponse(BaseModel):
+    """Progress of a background results rebuild."""
+    job_id: str
+    status: str  # pending, running, completed, failed
+    total: int = 0
+    processed: int = 0
+    responses: int = 0
+    errors: list[str] = []
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
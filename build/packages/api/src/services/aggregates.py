@@ -0,0 +1,64 @@
+"""
+Single-scan aggregation helpers for dashboard endpoints.
+
+Builds "count by each of these columns, plus a grand total" as one
+GROUPING SETS query instead of one GROUP BY round trip per column.
+"""
+
+from typing import Any, Sequence
+
+from sqlalchemy import Select, SQLColumnExpression, func, select, tuple_
+
+
+def grouped_counts(
+    columns: Sequence[SQLColumnExpression[Any]],
+    *criteria: Any,
+) -> Select:
+    """
+    Build a GROUPING SETS query counting rows per value of each column.
+
+    Each output row carries the column values, one GROUPING() flag per
+    column and the count. The empty grouping set yields the grand total.
+    Extra columns (e.g. scalar subqueries) can be appended with add_columns.
+    """
+    return (
+        select(
+            *columns,
+            *(func.grouping(col) for col in columns),
+            func.count(),
+        )
+        .where(*criteria)
+        .group_by(func.grouping_sets(*(tuple_(col) for col in columns), tuple_()))
+    )
+
+
+def unpack_grouped_counts(
+    rows: Sequence[Any],
+    names: Sequence[str],
+    default: str = "unknown",
+) -> tuple[int, dict[str, dict[str, int]]]:
+    """
+    Split grouped_counts rows into a total and per-column distributions.
+
+    Args:
+        rows: Result rows from a grouped_counts query
+        names: Output key for each grouped column, in query order
+        default: Label used for NULL values
+
+    Returns:
+        (total, {name: {value: count}})
+    """
+    width = len(names)
+    total = 0
+    counts: dict[str, dict[str, int]] = {name: {} for name in names}
+
+    for row in rows:
+        values, flags, count = row[:width], row[width:2 * width], row[2 * width]
+        if all(flags):
+            total = count
+            continue
+        idx = flags.index(0)
+        value = values[idx] if values[idx] is not None else default
+        counts[names[idx]][value] = counts[names[idx]].get(value, 0) + count
+
+    return total, counts
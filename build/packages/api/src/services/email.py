@@ -6,15 +6,23 @@ Supports multiple providers:
 - console: Print to console (development)
 
 Blueprint §6.2.4: Magic link delivery via email.
+
+Sending is asynchronous: the convenience functions below queue messages for
+the background workers in email_queue and return immediately.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-
-import resend
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from src.config import settings
 
+if TYPE_CHECKING:
+    import resend
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +41,18 @@ class EmailProvider(ABC):
         """Send a notification email. Returns True on success."""
         pass
 
+    async def send_notifications(
+        self, to_emails: Sequence[str], subject: str, body_html: str
+    ) -> list[str]:
+        """
+        Send one notification to many recipients. Returns the recipients
+        it could not be sent to. Providers with a batch API override this.
+        """
+        return [
+            to_email for to_email in to_emails
+            if not await self.send_notification(to_email, subject, body_html)
+        ]
+
 
 class ConsoleEmailProvider(EmailProvider):
     """Development provider that prints to console."""
@@ -55,22 +75,28 @@ class ConsoleEmailProvider(EmailProvider):
 
 
 class ResendEmailProvider(EmailProvider):
-    """Production provider using Resend.com."""
+    """
+    Production provider using Resend.com.
+    The SDK is synchronous, so calls run in worker threads.
+    """
 
     def __init__(self, api_key: str, from_email: str):
+        # Imported here: the SDK (and requests) cost ~150ms, paid only where email is sent
+        import resend
+        self.resend = resend
         self.from_email = from_email
         resend.api_key = api_key
 
     async def send_magic_link(self, to_email: str, magic_link_url: str) -> bool:
         """Send magic link via Resend."""
         try:
-            params = {
+            params: resend.Emails.SendParams = {
                 "from": self.from_email,
                 "to": [to_email],
                 "subject": "Sign in to Process Catalogue",
                 "html": self._magic_link_template(magic_link_url),
             }
-            response = resend.Emails.send(params)
+            response = await asyncio.to_thread(self.resend.Emails.send, params)
             logger.info(f"Magic link sent to {to_email}, id: {response.get('id')}")
             return True
         except Exception as e:
@@ -82,19 +108,40 @@ class ResendEmailProvider(EmailProvider):
     ) -> bool:
         """Send notification via Resend."""
         try:
-            params = {
+            params: resend.Emails.SendParams = {
                 "from": self.from_email,
                 "to": [to_email],
                 "subject": subject,
                 "html": body_html,
             }
-            response = resend.Emails.send(params)
+            response = await asyncio.to_thread(self.resend.Emails.send, params)
             logger.info(f"Notification sent to {to_email}, id: {response.get('id')}")
             return True
         except Exception as e:
             logger.error(f"Failed to send notification to {to_email}: {e}")
             return False
 
+    async def send_notifications(
+        self, to_emails: Sequence[str], subject: str, body_html: str
+    ) -> list[str]:
+        """Send via the Resend batch API: one request for the whole list."""
+        try:
+            params: list[resend.Emails.SendParams] = [
+                {
+                    "from": self.from_email,
+                    "to": [to_email],
+                    "subject": subject,
+                    "html": body_html,
+                }
+                for to_email in to_emails
+            ]
+            await asyncio.to_thread(self.resend.Batch.send, params)
+            logger.info(f"Notification sent to {len(params)} recipients")
+            return []
+        except Exception as e:
+            logger.error(f"Failed to send notification to {len(to_emails)} recipients: {e}")
+            return list(to_emails)
+
     def _magic_link_template(self, magic_link_url: str) -> str:
         """HTML template for magic link emails."""
         return f"""
@@ -133,8 +180,14 @@ class ResendEmailProvider(EmailProvider):
 """
 
 
+@lru_cache
 def get_email_provider() -> EmailProvider:
-    """Factory function to get the configured email provider."""
+    """
+    Factory function to get the configured email provider.
+
+    Built on first use rather than at import, and cached so every caller
+    shares one instance.
+    """
     if settings.EMAIL_PROVIDER == "resend" and settings.RESEND_API_KEY:
         return ResendEmailProvider(
             api_key=settings.RESEND_API_KEY,
@@ -144,17 +197,47 @@ def get_email_provider() -> EmailProvider:
         return ConsoleEmailProvider()
 
 
-# Global instance
-email_provider = get_email_provider()
-
-
-async def send_magic_link_email(to_email: str, magic_link_url: str) -> bool:
-    """Convenience function to send a magic link email."""
-    return await email_provider.send_magic_link(to_email, magic_link_url)
+async def send_magic_link_email(
+    to_email: str, magic_link_url: str, expires_at: Optional[datetime] = None
+) -> bool:
+    """
+    Queue a magic link email. Returns True once queued (False if the queue
+    is full); delivery is retried in the background but abandoned once the
+    link has expired.
+    """
+    # Imported here: email_queue imports this module
+    from src.services.email_queue import EmailMessage, email_queue
+
+    return await email_queue.submit(EmailMessage(
+        kind="magic_link",
+        to=[to_email],
+        body=magic_link_url,
+        expires_at=expires_at.timestamp() if expires_at else None,
+    ))
 
 
 async def send_notification_email(
     to_email: str, subject: str, body_html: str
 ) -> bool:
-    """Convenience function to send a notification email."""
-    return await email_provider.send_notification(to_email, subject, body_html)
+    """Queue a notification email. Returns True once queued."""
+    return await send_notification_emails([to_email], subject, body_html) > 0
+
+
+async def send_notification_emails(
+    to_emails: Sequence[str], subject: str, body_html: str
+) -> int:
+    """
+    Queue one notification for many recipients, batched EMAIL_BATCH_SIZE
+    recipients per message. Returns the number of messages queued; batches
+    that found the queue full are dropped.
+    """
+    from src.services.email_queue import EmailMessage, email_queue
+
+    batch_size = max(settings.EMAIL_BATCH_SIZE, 1)
+    queued = 0
+    for i in range(0, len(to_emails), batch_size):
+        queued += await email_queue.submit(EmailMessage(
+            kind="notification", to=list(to_emails[i:i + batch_size]),
+            subject=subject, body=body_html,
+        ))
+    return queued
@@ -0,0 +1,332 @@
+"""
+Background email delivery.
+
+send_magic_link_email() and the notification helpers in services/email only
+put an EmailMessage on a bounded in-memory queue; a pool of EMAIL_WORKERS
+tasks delivers it through the configured EmailProvider, so a request never
+waits on the provider's HTTP round trip. Providers that wrap a synchronous
+SDK run it in a worker thread (see ResendEmailProvider).
+
+- A failed send is retried with exponential backoff and jitter, starting at
+  EMAIL_RETRY_BASE_DELAY, for up to EMAIL_MAX_ATTEMPTS attempts; only the
+  recipients that failed are retried. Messages with an expiry (magic
+  links) are dropped once it passes instead of being sent late.
+- Notification fan-out is queued one message per EMAIL_BATCH_SIZE
+  recipients and handed to the provider's batch send.
+- submit() never waits: when the queue is full the message is dropped,
+  counted and logged, and submit() returns False.
+- On shutdown the queue drains for up to EMAIL_STOP_TIMEOUT; notifications
+  still undelivered (queued, in flight, or waiting to retry) are written to
+  an owner-only spool file in EMAIL_SPOOL_DIR, and the next start re-queues
+  them. Magic links are bearer credentials and are never written to disk;
+  undelivered ones are dropped and the user requests a new link. Spool
+  files are claimed by rename, so with several processes each message is
+  picked up once; unreadable lines are logged and skipped. Delivery is at
+  least once; a crash without a shutdown still loses what was queued in
+  memory.
+
+The application lifespan starts and stops the queue; metrics() reports its
+depth, retries and failures.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Literal, Optional, Sequence
+from uuid import uuid4
+
+from src.config import settings
+from src.services.email import EmailProvider, get_email_provider
+
+logger = logging.getLogger(__name__)
+
+# Seconds shutdown waits for the queue to drain before spooling the rest
+EMAIL_STOP_TIMEOUT = 10.0
+
+
+@dataclass
+class EmailMessage:
+    """One queued email: a magic link, or a notification to a batch of recipients."""
+
+    kind: Literal["magic_link", "notification"]
+    to: list[str]
+    subject: str = ""
+    body: str = ""  # the link URL for magic links, the HTML for notifications
+    expires_at: Optional[float] = None  # epoch seconds; not sent after this
+    attempts: int = 0
+    id: str = field(default_factory=lambda: uuid4().hex)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+
+class EmailQueue:
+    """Bounded queue, a pool of delivery workers, retry timers and the spool."""
+
+    def __init__(
+        self,
+        provider: Optional[EmailProvider] = None,
+        *,
+        workers: int,
+        queue_size: int,
+        max_attempts: int,
+        retry_base_delay: float,
+        retry_max_delay: float,
+        spool_dir: str,
+    ):
+        self._provider = provider
+        self.workers = max(workers, 1)
+        self.queue_size = queue_size
+        self.max_attempts = max(max_attempts, 1)
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.spool_dir = spool_dir
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight: dict[str, EmailMessage] = {}
+        self._retrying: dict[str, tuple[asyncio.TimerHandle, EmailMessage]] = {}
+        self._stopping = False
+        self._undelivered: list[EmailMessage] = []
+        self.submitted = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.expired = 0
+        self.restored = 0
+        self.spooled = 0
+        self.dropped = 0
+        self.high_water = 0
+
+    @property
+    def provider(self) -> EmailProvider:
+        return self._provider or get_email_provider()
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Start the workers on the running loop and re-queue spooled messages."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._stopping = False
+        self._in_flight.clear()
+        self._retrying.clear()
+        self._tasks = [
+            loop.create_task(self._work(), name=f"email-worker-{n}")
+            for n in range(self.workers)
+        ]
+        self._tasks.append(loop.create_task(self._restore(), name="email-restore"))
+
+    async def stop(self) -> None:
+        """Deliver what is queued (within EMAIL_STOP_TIMEOUT) and spool the rest."""
+        if not self.running:
+            return
+        queue = self._queue
+        assert queue is not None
+        self._stopping = True
+        for handle, message in self._retrying.values():
+            handle.cancel()
+            self._undelivered.append(message)
+        self._retrying.clear()
+
+        try:
+            await asyncio.wait_for(queue.join(), EMAIL_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Email queue did not drain in %ss; spooling the rest", EMAIL_STOP_TIMEOUT)
+        self._undelivered.extend(self._in_flight.values())
+        while not queue.empty():
+            self._undelivered.append(queue.get_nowait())
+            queue.task_done()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        undelivered, self._undelivered = self._undelivered, []
+        links = [m for m in undelivered if m.kind == "magic_link"]
+        if links:
+            self.dropped += len(links)
+            logger.warning("Dropped %d undelivered magic link emails at shutdown", len(links))
+            undelivered = [m for m in undelivered if m.kind != "magic_link"]
+        if undelivered:
+            await asyncio.to_thread(self._write_spool, undelivered)
+            self.spooled += len(undelivered)
+            logger.warning("Spooled %d undelivered emails to %s", len(undelivered), self.spool_dir)
+
+    async def submit(self, message: EmailMessage) -> bool:
+        """
+        Queue a message without waiting; False if the queue is full and it
+        was dropped. Starts the workers on first use.
+        """
+        self.start()
+        queue = self._queue
+        assert queue is not None
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += len(message.to)
+            logger.error("Email queue full (%d); dropped %s email %s",
+                         self.queue_size, message.kind, message.id)
+            return False
+        self.submitted += 1
+        self.high_water = max(self.high_water, queue.qsize())
+        return True
+
+    async def join(self) -> None:
+        """Wait until everything queued has been handled (retries still pending excluded)."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "high_water": self.high_water,
+            "in_flight": len(self._in_flight),
+            "retrying": len(self._retrying),
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "expired": self.expired,
+            "restored": self.restored,
+            "spooled": self.spooled,
+            "dropped": self.dropped,
+        }
+
+    # ── Delivery ─────────────────────────────────────────
+
+    async def _work(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            message = await queue.get()
+            self._in_flight[message.id] = message
+            try:
+                await self._send(message)
+            finally:
+                self._in_flight.pop(message.id, None)
+                queue.task_done()
+
+    async def _deliver(self, message: EmailMessage) -> list[str]:
+        """Hand a message to the provider; return the recipients that failed."""
+        if message.kind == "magic_link":
+            sent = await self.provider.send_magic_link(message.to[0], message.body)
+            return [] if sent else message.to
+        return await self.provider.send_notifications(message.to, message.subject, message.body)
+
+    async def _send(self, message: EmailMessage) -> None:
+        if message.expired:
+            self.expired += len(message.to)
+            logger.warning("Dropping expired %s email %s", message.kind, message.id)
+            return
+
+        message.attempts += 1
+        try:
+            failed = await self._deliver(message)
+        except Exception:
+            logger.exception("Email provider raised for %s email %s", message.kind, message.id)
+            failed = message.to
+        self.sent += len(message.to) - len(failed)
+        if not failed:
+            return
+
+        message.to = list(failed)
+        if message.attempts >= self.max_attempts:
+            self.failed += len(failed)
+            logger.error("Giving up on %s email %s to %d recipients after %d attempts",
+                         message.kind, message.id, len(failed), message.attempts)
+            return
+
+        self.retried += 1
+        if self._stopping:
+            self._undelivered.append(message)
+            return
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (message.attempts - 1))
+        self._retry_later(message, delay * random.uniform(0.5, 1.0))
+
+    def _retry_later(self, message: EmailMessage, delay: float) -> None:
+        assert self._loop is not None
+        handle = self._loop.call_later(delay, self._requeue, message)
+        self._retrying[message.id] = (handle, message)
+
+    def _requeue(self, message: EmailMessage) -> None:
+        self._retrying.pop(message.id, None)
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._retry_later(message, self.retry_base_delay)
+
+    # ── Spool ────────────────────────────────────────────
+
+    async def _restore(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        messages = await asyncio.to_thread(self._claim_spool)
+        if messages:
+            logger.info("Re-queueing %d spooled emails", len(messages))
+        for message in messages:
+            self.restored += 1
+            await queue.put(message)
+
+    def _write_spool(self, messages: Sequence[EmailMessage]) -> None:
+        os.makedirs(self.spool_dir, mode=0o700, exist_ok=True)
+        path = os.path.join(self.spool_dir, f"{uuid4().hex}.jsonl")
+        # Owner-only from creation: messages carry recipients and content
+        fd = os.open(f"{path}.part", os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            for message in messages:
+                f.write(json.dumps(asdict(message), separators=(",", ":")) + "\n")
+        os.replace(f"{path}.part", path)
+
+    def _claim_spool(self) -> list[EmailMessage]:
+        """Read and remove every spool file this process manages to claim."""
+        try:
+            names = sorted(os.listdir(self.spool_dir))
+        except FileNotFoundError:
+            return []
+        messages = []
+        for name in names:
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(self.spool_dir, name)
+            claimed = f"{path}.{os.getpid()}.claimed"
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue  # claimed by another process
+            try:
+                with open(claimed, encoding="utf-8") as f:
+                    for number, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        try:
+                            messages.append(EmailMessage(**json.loads(line)))
+                        except (ValueError, TypeError):
+                            logger.warning("Skipping unreadable line %d of spool file %s", number, name)
+            finally:
+                os.remove(claimed)
+        return messages
+
+
+email_queue = EmailQueue(
+    workers=settings.EMAIL_WORKERS,
+    queue_size=settings.EMAIL_QUEUE_SIZE,
+    max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+    retry_base_delay=settings.EMAIL_RETRY_BASE_DELAY,
+    retry_max_delay=settings.EMAIL_RETRY_MAX_DELAY,
+    spool_dir=settings.EMAIL_SPOOL_DIR,
+)
@@ -0,0 +1,134 @@
+"""
+Process-issue heatmap computation.
+
+Direct counts come from v_process_issue_heatmap in one query. The rollup
+(descendant issues added to every ancestor) is a single children-before-
+parents pass over those rows in memory, instead of re-running the recursive
+v_process_issue_heatmap_rollup view per request. Results are cached per
+tenant in column-oriented form under the tenant data version.
+"""
+
+from collections import deque
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.issue_log import HeatmapColumnarResponse
+from src.services.result_cache import cached_result
+
+DIMENSIONS = ("people", "process", "system", "data")
+
+# Issue and process writes bump the data version, so this only bounds
+# staleness for changes made outside the API
+HEATMAP_CACHE_TTL = 300
+
+_DIRECT_HEATMAP = text("""
+    SELECT
+        process_id::text AS process_id, process_ref, process_name, level,
+        parent_id::text AS parent_id,
+        people_count, process_count, system_count, data_count,
+        people_colour, process_colour, system_colour, data_colour
+    FROM v_process_issue_heatmap
+    WHERE organization_id = :org_id
+    ORDER BY process_ref
+""")
+
+
+def _colour(count: int, has_high: bool) -> str:
+    """Addendum colour rule: any high = red, any issue = amber."""
+    if has_high:
+        return "red"
+    return "amber" if count else "neutral"
+
+
+def _children_first(parents: Sequence[Optional[int]]) -> list[int]:
+    """
+    Order node indexes so every child precedes its parent.
+
+    Nodes caught in a (corrupt) parent cycle are left out.
+    """
+    pending = [0] * len(parents)
+    for parent in parents:
+        if parent is not None:
+            pending[parent] += 1
+
+    queue = deque(i for i, n in enumerate(pending) if n == 0)
+    order = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        parent = parents[i]
+        if parent is not None:
+            pending[parent] -= 1
+            if pending[parent] == 0:
+                queue.append(parent)
+    return order
+
+
+def build_heatmap(rows: Sequence[Any], rollup: bool) -> HeatmapColumnarResponse:
+    """
+    Build the columnar heatmap from direct per-process rows.
+
+    With rollup, every process also counts the open issues of its
+    (non-archived) descendants, and is red if any of them is high.
+    """
+    counts = {dim: [getattr(r, f"{dim}_count") or 0 for r in rows] for dim in DIMENSIONS}
+    high = {dim: [getattr(r, f"{dim}_colour") == "red" for r in rows] for dim in DIMENSIONS}
+
+    if rollup:
+        index = {r.process_id: i for i, r in enumerate(rows)}
+        parents = [index.get(r.parent_id) for r in rows]
+        for i in _children_first(parents):
+            parent = parents[i]
+            if parent is None:
+                continue
+            for dim in DIMENSIONS:
+                counts[dim][parent] += counts[dim][i]
+                high[dim][parent] = high[dim][parent] or high[dim][i]
+
+    totals = [sum(values) for values in zip(*counts.values())] if rows else []
+    colours = {
+        dim: [_colour(c, h) for c, h in zip(counts[dim], high[dim])] for dim in DIMENSIONS
+    }
+    any_high = [any(flags) for flags in zip(*high.values())] if rows else []
+
+    return HeatmapColumnarResponse(
+        process_id=[r.process_id for r in rows],
+        process_ref=[r.process_ref for r in rows],
+        process_name=[r.process_name for r in rows],
+        level=[r.level for r in rows],
+        parent_id=[r.parent_id for r in rows],
+        people_count=counts["people"],
+        process_count=counts["process"],
+        system_count=counts["system"],
+        data_count=counts["data"],
+        total_issues=totals,
+        people_colour=colours["people"],
+        process_colour=colours["process"],
+        system_colour=colours["system"],
+        data_colour=colours["data"],
+        overall_colour=[_colour(t, h) for t, h in zip(totals, any_high)],
+        rollup=rollup,
+    )
+
+
+async def get_heatmap(
+    db: AsyncSession,
+    organization_id: str,
+    rollup: bool = False,
+) -> HeatmapColumnarResponse:
+    """Cached columnar heatmap for a tenant."""
+
+    async def build() -> HeatmapColumnarResponse:
+        rows = (await db.execute(_DIRECT_HEATMAP, {"org_id": organization_id})).fetchall()
+        return build_heatmap(rows, rollup)
+
+    return await cached_result(
+        HeatmapColumnarResponse,
+        "issue-heatmap",
+        organization_id,
+        build,
+        "rollup" if rollup else "direct",
+        ttl=HEATMAP_CACHE_TTL,
+    )
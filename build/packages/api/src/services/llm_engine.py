@@ -0,0 +1,131 @@
+"""
+LLM execution engine.
+
+Runs prompts through the shared provider clients (see get_llm_provider)
+with:
+
+- a per-tenant concurrency limit: at most LLM_TENANT_CONCURRENCY calls in
+  flight per tenant per worker, further calls wait for a slot, so one
+  tenant's batch cannot monopolise the provider connections
+- a content-addressed response cache for deterministic calls (temperature
+  0), keyed on the tenant, provider, model, system prompt, prompt,
+  temperature and max_tokens
+- streaming that yields text chunks and ends with the full LLMResponse
+
+Both generate() and stream() return responses with cached=True when they
+were served from the cache.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict
+from typing import AsyncGenerator, Optional, Union
+
+from src.config import settings
+from src.core.providers.cache import get_cache_provider
+from src.core.providers.llm import LLMConfig, LLMResponse, get_llm_provider
+
+# One semaphore per tenant, created on first use
+_tenant_slots: dict[str, asyncio.Semaphore] = {}
+
+
+def resolve_provider_name(configured: str) -> str:
+    """
+    Provider to call for a tenant's configuration.
+
+    A deployment running the mock provider (development, tests) uses it
+    for every tenant regardless of what the tenant configured.
+    """
+    return "mock" if settings.LLM_PROVIDER == "mock" else configured
+
+
+def _tenant_slot(organization_id: str) -> asyncio.Semaphore:
+    slot = _tenant_slots.get(organization_id)
+    if slot is None:
+        slot = _tenant_slots[organization_id] = asyncio.Semaphore(
+            max(settings.LLM_TENANT_CONCURRENCY, 1)
+        )
+    return slot
+
+
+def _cache_key(
+    organization_id: str,
+    provider_name: str,
+    prompt: str,
+    config: LLMConfig,
+) -> Optional[str]:
+    """Cache key for a deterministic call, or None if it must not be cached."""
+    if config.temperature != 0 or settings.LLM_RESPONSE_CACHE_TTL <= 0:
+        return None
+    identity = json.dumps(
+        [
+            provider_name, config.model, config.system_prompt, prompt,
+            config.temperature, config.max_tokens, config.stop_sequences,
+        ],
+        separators=(",", ":"),
+    )
+    digest = hashlib.sha256(identity.encode()).hexdigest()
+    return f"llm:response:{organization_id}:{digest}"
+
+
+async def _cached(key: Optional[str]) -> Optional[LLMResponse]:
+    if key is None:
+        return None
+    value = await get_cache_provider().get(key)
+    if value is None:
+        return None
+    return LLMResponse(**{**value, "cached": True})
+
+
+async def _store(key: Optional[str], response: LLMResponse) -> None:
+    if key is not None:
+        await get_cache_provider().set(
+            key, asdict(response), ttl=settings.LLM_RESPONSE_CACHE_TTL
+        )
+
+
+async def generate(
+    organization_id: str,
+    provider_name: str,
+    prompt: str,
+    config: LLMConfig,
+) -> LLMResponse:
+    """Complete a prompt, from cache when deterministic and seen before."""
+    key = _cache_key(organization_id, provider_name, prompt, config)
+    cached = await _cached(key)
+    if cached is not None:
+        return cached
+
+    provider = get_llm_provider(provider_name)
+    async with _tenant_slot(organization_id):
+        response = await provider.generate(prompt, config)
+    await _store(key, response)
+    return response
+
+
+async def stream(
+    organization_id: str,
+    provider_name: str,
+    prompt: str,
+    config: LLMConfig,
+) -> AsyncGenerator[Union[str, LLMResponse], None]:
+    """
+    Stream a completion: text chunks, then the final LLMResponse.
+
+    A cached response is replayed as a single chunk. The tenant slot is held
+    until the stream finishes or the consumer stops iterating.
+    """
+    key = _cache_key(organization_id, provider_name, prompt, config)
+    cached = await _cached(key)
+    if cached is not None:
+        yield cached.content
+        yield cached
+        return
+
+    provider = get_llm_provider(provider_name)
+    async with _tenant_slot(organization_id):
+        async for item in provider.generate_stream(prompt, config):
+            if isinstance(item, LLMResponse):
+                await _store(key, item)
+            yield item
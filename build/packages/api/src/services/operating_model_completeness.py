@@ -0,0 +1,220 @@
+"""
+Operating model completeness for many processes at once.
+
+One query reports, for any number of processes, which of the 10 components
+each defines and which JSONB components have a current/future gap: an
+EXISTS per relational table and one grouped pass over the JSONB rows,
+joined to the requested processes.
+
+Summaries are cached per process in the configured CacheProvider. Each
+process has a version counter that operating model writers bump after
+their transaction commits; entries are stored under the version read before
+the query, so a summary that raced a write is never served.
+"""
+
+import logging
+from typing import Optional, Sequence
+
+from sqlalchemy import and_, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.providers.cache import get_cache_provider
+from src.models.operating_model import (
+    ProcessGovernance,
+    ProcessKpi,
+    ProcessPolicy,
+    ProcessRaci,
+    ProcessSipoc,
+    ProcessTiming,
+)
+from src.models.process import Process, ProcessOperatingModel
+from src.models.system_catalogue import ProcessSystem
+from src.schemas.operating_model import OperatingModelSummary
+
+logger = logging.getLogger(__name__)
+
+# All 10 component types
+ALL_COMPONENTS = {
+    "sipoc", "raci", "kpis", "systems", "policies",
+    "timing", "governance", "security", "data", "resources",
+}
+
+# Relational model → component type mapping
+RELATIONAL_MODELS = {
+    "raci": ProcessRaci,
+    "kpis": ProcessKpi,
+    "governance": ProcessGovernance,
+    "policies": ProcessPolicy,
+    "timing": ProcessTiming,
+    "sipoc": ProcessSipoc,
+}
+
+# Components that only exist as JSONB rows
+JSONB_COMPONENTS = {"resources", "security", "data"}
+
+# Bounds staleness for changes that bypass the operating model endpoints
+# (cascading deletes, imports, scripts)
+COMPLETENESS_CACHE_TTL = 600
+
+
+def _version_key(organization_id: str, process_id: str) -> str:
+    return f"completeness:{organization_id}:{process_id}:version"
+
+
+def _entry_key(organization_id: str, process_id: str, version: int) -> str:
+    return f"completeness:{organization_id}:{process_id}:v{version}"
+
+
+def build_summary(
+    process_id: str,
+    defined_components: set[str],
+    components_with_gaps: list[str],
+) -> OperatingModelSummary:
+    return OperatingModelSummary(
+        process_id=process_id,
+        total_components=len(ALL_COMPONENTS),
+        defined_components=sorted(defined_components),
+        missing_components=sorted(ALL_COMPONENTS - defined_components),
+        components_with_gaps=components_with_gaps,
+        completion_percentage=round(len(defined_components) / len(ALL_COMPONENTS) * 100),
+    )
+
+
+async def query_completeness(
+    db: AsyncSession,
+    organization_id: str,
+    process_ids: Sequence[str],
+) -> dict[str, OperatingModelSummary]:
+    """Compute summaries for the given processes in one query (uncached)."""
+    if not process_ids:
+        return {}
+
+    component = ProcessOperatingModel
+    has_gap = and_(
+        func.jsonb_typeof(component.future_state) == "object",
+        component.future_state != literal({}, component.future_state.type),
+        component.current_state.is_distinct_from(component.future_state),
+    )
+    jsonb = (
+        select(
+            component.process_id,
+            func.array_agg(component.component_type).label("defined"),
+            func.array_agg(component.component_type).filter(has_gap).label("gaps"),
+        )
+        .where(
+            component.organization_id == organization_id,
+            component.process_id.in_(process_ids),
+        )
+        .group_by(component.process_id)
+        .subquery()
+    )
+
+    def defined(model):
+        return exists().where(
+            model.process_id == Process.id,
+            model.organization_id == organization_id,
+        )
+
+    relational = {**RELATIONAL_MODELS, "systems": ProcessSystem}
+    query = (
+        select(
+            Process.id,
+            *(defined(model).label(name) for name, model in relational.items()),
+            jsonb.c.defined,
+            jsonb.c.gaps,
+        )
+        .outerjoin(jsonb, jsonb.c.process_id == Process.id)
+        .where(
+            Process.organization_id == organization_id,
+            Process.id.in_(process_ids),
+        )
+    )
+
+    summaries = {}
+    for row in (await db.execute(query)).mappings():
+        components = {name for name in relational if row[name]}
+        components |= JSONB_COMPONENTS.intersection(row["defined"] or ())
+        summaries[row["id"]] = build_summary(row["id"], components, sorted(row["gaps"] or ()))
+    return summaries
+
+
+async def get_completeness(
+    db: AsyncSession,
+    organization_id: str,
+    process_ids: Sequence[str],
+) -> dict[str, OperatingModelSummary]:
+    """
+    Summaries for the given processes, from cache where current.
+
+    Processes that do not exist in the organization are omitted.
+    """
+    process_ids = list(dict.fromkeys(process_ids))
+    if not process_ids:
+        return {}
+
+    cache = get_cache_provider()
+    versions = [
+        int(v or 0)
+        for v in await cache.get_many([_version_key(organization_id, p) for p in process_ids])
+    ]
+    entry_keys = {
+        p: _entry_key(organization_id, p, v) for p, v in zip(process_ids, versions)
+    }
+    cached = await cache.get_many(list(entry_keys.values()))
+
+    summaries: dict[str, OperatingModelSummary] = {}
+    missed = []
+    for process_id, value in zip(process_ids, cached):
+        if value is not None:
+            summaries[process_id] = OperatingModelSummary.model_validate(value)
+        else:
+            missed.append(process_id)
+
+    if missed:
+        built = await query_completeness(db, organization_id, missed)
+        if built:
+            await cache.set_many(
+                {entry_keys[p]: s.model_dump(mode="json") for p, s in built.items()},
+                ttl=COMPLETENESS_CACHE_TTL,
+            )
+        summaries.update(built)
+
+    return {p: summaries[p] for p in process_ids if p in summaries}
+
+
+async def get_subtree_ids(
+    db: AsyncSession,
+    organization_id: str,
+    root_id: str,
+) -> list[str]:
+    """A process and all its descendants, depth-first in display order."""
+    tree = (
+        select(Process.id, Process.code, array([Process.sort_order]).label("path"))
+        .where(Process.id == root_id, Process.organization_id == organization_id)
+        .cte("subtree", recursive=True)
+    )
+    child = Process.__table__.alias("child")
+    tree = tree.union_all(
+        select(child.c.id, child.c.code, func.array_append(tree.c.path, child.c.sort_order))
+        .where(child.c.parent_id == tree.c.id, child.c.organization_id == organization_id)
+    )
+    result = await db.execute(select(tree.c.id).order_by(tree.c.path, tree.c.code))
+    return list(result.scalars().all())
+
+
+async def invalidate_completeness(organization_id: str, *process_ids: Optional[str]) -> None:
+    """
+    Retire cached summaries. Call after the write has committed.
+
+    Failures are logged, not raised: the write is already durable and
+    COMPLETENESS_CACHE_TTL bounds how long a missed bump stays stale.
+    """
+    cache = get_cache_provider()
+    for process_id in dict.fromkeys(p for p in process_ids if p):
+        try:
+            await cache.incr(_version_key(organization_id, process_id))
+        except Exception:
+            logger.warning(
+                "Completeness invalidation failed for %s", process_id, exc_info=True
+            )
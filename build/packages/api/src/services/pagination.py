@@ -0,0 +1,164 @@
+"""
+Shared pagination for list endpoints.
+
+Two ways to page through a list ordered by a fixed set of keys:
+
+- Page number: OFFSET/LIMIT, kept for backward compatibility. Cost grows
+  with the offset.
+- Cursor: an opaque token carrying the last row's ORDER BY key values.
+  The next page is fetched with a row-value comparison on those keys, so
+  with a matching index page 500 costs the same as page 1.
+
+Every page carries a next_cursor, so clients opt in by following it.
+
+The total is selectable because counting can cost more than the page itself:
+"exact" runs count(*), "estimate" reads the planner's row estimate (falling
+back to count(*) for small results), and "none" skips it.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Literal, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+TotalMode = Literal["exact", "estimate", "none"]
+
+# Below this planner estimate an exact count is cheap enough to run instead
+ESTIMATE_EXACT_BELOW = 1000
+
+
+@dataclass
+class Page:
+    """One page of rows plus the paging metadata for the response."""
+
+    items: list[Any]
+    total: Optional[int]
+    has_more: bool
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode ORDER BY key values as an opaque URL-safe cursor."""
+    payload = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence[InstrumentedAttribute]) -> list[Any]:
+    """Decode a cursor back into bind values typed for each key column."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        return [_bind_value(key, value) for key, value in zip(keys, payload)]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def _bind_value(key: InstrumentedAttribute, value: Any) -> Any:
+    python_type = key.type.python_type
+    if python_type is datetime:
+        # Bind with the value's own awareness; the column may be timestamptz
+        value = datetime.fromisoformat(value)
+        return literal(value, DateTime(timezone=value.tzinfo is not None))
+    if python_type is date:
+        return literal(date.fromisoformat(value), key.type)
+    if python_type is int and not isinstance(value, int):
+        raise TypeError("expected integer key")
+    return literal(value, key.type)
+
+
+async def count_rows(db: AsyncSession, query: Select, mode: TotalMode) -> Optional[int]:
+    """Count the rows a filtered (unordered, unpaged) query would return."""
+    if mode == "none":
+        return None
+
+    if mode == "estimate":
+        estimate = await _planner_estimate(db, query)
+        if estimate >= ESTIMATE_EXACT_BELOW:
+            return estimate
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar() or 0
+
+
+async def _planner_estimate(db: AsyncSession, query: Select) -> int:
+    """Top-level "Plan Rows" from EXPLAIN; no rows are read."""
+    connection = await db.connection()
+    # Expand IN lists into one placeholder per value; left to execution
+    # time, they would be missing from the statement and its parameters
+    compiled = query.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", params
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _rows(query: Select, result) -> list[Any]:
+    """ORM instances for select(Model), Row tuples for column selects."""
+    if len(query.column_descriptions) == 1:
+        return list(result.scalars().all())
+    return list(result.all())
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    keys: Sequence[InstrumentedAttribute],
+    *,
+    page: int = 1,
+    page_size: Optional[int] = 50,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = "exact",
+    descending: bool = False,
+) -> Page:
+    """
+    Run one page of a filtered select(Model) query, or of a column-only
+    select whose key columns are labelled with their attribute names.
+
+    keys are the ORDER BY columns, all sorted the same direction; end them
+    with a unique column (e.g. the primary key) so the order is total and
+    cursors never skip or repeat rows. With a cursor, page is ignored;
+    a page_size of None returns every remaining row.
+    """
+    total = await count_rows(db, query, total_mode)
+
+    ordered = query.order_by(*(key.desc() if descending else key for key in keys))
+    if cursor:
+        after = tuple_(*keys)
+        values = tuple_(*decode_cursor(cursor, keys))
+        ordered = ordered.where(after < values if descending else after > values)
+    elif page_size is not None:
+        ordered = ordered.offset((page - 1) * page_size)
+
+    if page_size is None:
+        items = _rows(query, await db.execute(ordered))
+        return Page(items=items, total=total, has_more=False, next_cursor=None)
+
+    # One extra row tells us whether another page exists
+    items = _rows(query, await db.execute(ordered.limit(page_size + 1)))
+    has_more = len(items) > page_size
+    del items[page_size:]
+
+    next_cursor = None
+    if has_more:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+
+    return Page(items=items, total=total, has_more=has_more, next_cursor=next_cursor)
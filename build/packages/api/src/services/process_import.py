@@ -0,0 +1,524 @@
+"""
+Bulk process catalogue import.
+
+Reads an XLSX, CSV or JSON catalogue, e.g. the seed JSON written by
+reference/convert_v4_excel_to_json.py. The ref/parent/level hierarchy is
+resolved in memory against the tenant's existing processes. Processes,
+RACI entries, KPIs, system links and issues are then loaded with batched
+multi-row INSERTs (a per-row trigger numbers the issues), all in the
+caller's transaction. COPY is not an option: it is refused on tables
+with row level security for roles that do not bypass it.
+
+Imports are all-or-nothing: every row problem is reported and nothing is
+written unless the whole catalogue is valid.
+
+Process rows (XLSX first sheet or "Processes", CSV, JSON list or
+{"processes": [...]}):
+    ref, name, description, level, parent_ref, process_type, status,
+    responsible, accountable, consulted, informed, activity, kpi, systems
+
+Rows without a ref get the next code under parent_ref (or the next root).
+
+Issue rows (XLSX "Issues" sheet, JSON {"issues": [...]}):
+    process_ref, title, description, issue_classification,
+    issue_criticality, issue_complexity, issue_status, date_raised
+"""
+
+import csv
+import io
+import json
+import re
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+from uuid import uuid4
+
+from sqlalchemy import column, insert, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.issue_log import (
+    IssueClassification,
+    IssueComplexity,
+    IssueCriticality,
+    IssueLog,
+    IssueStatus,
+)
+from src.models.process import AutomationLevel, LifecycleStatus, Process, ProcessType
+from src.models.system_catalogue import (
+    ProcessSystemStatus,
+    SystemCatalogue,
+    SystemCriticality,
+    SystemRole,
+)
+from src.schemas.process import ProcessImportError, ProcessImportResponse
+
+PROCESS_SHEET = "Processes"
+ISSUE_SHEET = "Issues"
+
+# Imported catalogues describe live processes unless a row says otherwise
+DEFAULT_IMPORT_STATUS = LifecycleStatus.ACTIVE.value
+
+# Deepest supported level (L0-L5)
+MAX_DEPTH = 5
+
+# Widest values the target columns accept
+MAX_CODE_LENGTH = 20
+MAX_TEXT_LENGTH = 255
+
+REF_PATTERN = re.compile(r"^\d+(\.\d+)*$")
+
+# Alternative header spellings, after normalisation to snake_case
+PROCESS_ALIASES = {
+    "code": "ref",
+    "process_name": "name",
+    "parent": "parent_ref",
+    "parent_code": "parent_ref",
+    "type": "process_type",
+    "r": "responsible",
+    "a": "accountable",
+    "c": "consulted",
+    "i": "informed",
+    "system": "systems",
+}
+ISSUE_ALIASES = {
+    "process": "process_ref",
+    "process_code": "process_ref",
+    "classification": "issue_classification",
+    "criticality": "issue_criticality",
+    "complexity": "issue_complexity",
+    "status": "issue_status",
+}
+
+# Column orders of the planned records
+PROCESS_COLUMNS = (
+    "id", "organization_id", "code", "name", "description", "level",
+    "parent_id", "sort_order", "process_type", "status", "current_automation",
+)
+RACI_COLUMNS = (
+    "id", "organization_id", "process_id", "activity",
+    "responsible", "accountable", "consulted", "informed",
+)
+KPI_COLUMNS = ("id", "organization_id", "process_id", "name")
+SYSTEM_LINK_COLUMNS = (
+    "id", "organization_id", "process_id", "system_id",
+    "system_role", "criticality", "status",
+)
+
+RACI_FIELDS = ("responsible", "accountable", "consulted", "informed")
+
+
+@dataclass
+class Catalogue:
+    """Parsed rows as (row number, normalised fields) per sheet."""
+
+    processes: list[tuple[int, dict[str, Any]]]
+    issues: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass
+class _Node:
+    """A process the import can hang children and issues on."""
+
+    id: str
+    code: str
+    level: int
+    name: str
+    process_type: str
+
+
+@dataclass
+class ImportPlan:
+    """Records ready to load, or the errors that prevent it."""
+
+    processes: list[tuple] = field(default_factory=list)
+    raci: list[tuple] = field(default_factory=list)
+    kpis: list[tuple] = field(default_factory=list)
+    system_links: list[tuple] = field(default_factory=list)
+    issues: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[ProcessImportError] = field(default_factory=list)
+
+
+# ── Reading ─────────────────────────────────────────
+
+
+def read_catalogue(filename: str, stream: BinaryIO) -> Catalogue:
+    """
+    Parse a catalogue file by extension.
+
+    Raises ValueError for unsupported or unreadable files.
+    """
+    suffix = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if suffix == "xlsx":
+        return _read_xlsx(stream)
+    if suffix == "csv":
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        rows = ((row, data) for row, data in enumerate(csv.DictReader(text), start=2))
+        return Catalogue(processes=list(_normalise(rows, PROCESS_ALIASES)))
+    if suffix == "json":
+        return _read_json(stream)
+    raise ValueError(f"Unsupported catalogue format '{filename}': use .xlsx, .csv or .json")
+
+
+def _read_json(stream: BinaryIO) -> Catalogue:
+    data = json.load(stream)
+    if isinstance(data, list):
+        data = {"processes": data}
+    if not isinstance(data, dict) or not isinstance(data.get("processes", []), list):
+        raise ValueError("JSON catalogue must be a list of processes or an object with 'processes'")
+
+    def numbered(items: list) -> Iterator[tuple[int, dict]]:
+        for row, item in enumerate(items, start=1):
+            yield row, item if isinstance(item, dict) else {}
+
+    return Catalogue(
+        processes=list(_normalise(numbered(data.get("processes", [])), PROCESS_ALIASES)),
+        issues=list(_normalise(numbered(data.get("issues", [])), ISSUE_ALIASES)),
+    )
+
+
+def _read_xlsx(stream: BinaryIO) -> Catalogue:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("openpyxl package required. Install with: pip install openpyxl")
+
+    try:
+        wb = load_workbook(stream, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, KeyError, OSError) as e:
+        raise ValueError(f"Unreadable XLSX file: {e}")
+
+    try:
+        sheets = {ws.title.strip().lower(): ws for ws in wb.worksheets}
+        process_ws = (
+            sheets.get("processes") or sheets.get("process catalogue") or wb.worksheets[0]
+        )
+        issue_ws = sheets.get("issues") or sheets.get("issue log")
+        return Catalogue(
+            processes=list(_normalise(_sheet_rows(process_ws), PROCESS_ALIASES)),
+            issues=list(_normalise(_sheet_rows(issue_ws), ISSUE_ALIASES)) if issue_ws else [],
+        )
+    finally:
+        wb.close()
+
+
+def _sheet_rows(ws: Any) -> Iterator[tuple[int, dict]]:
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if not header:
+        return
+    for row, values in enumerate(rows, start=2):
+        if any(v not in (None, "") for v in values):
+            yield row, dict(zip(header, values))
+
+
+def _normalise(
+    rows: Iterable[tuple[int, dict]],
+    aliases: dict[str, str],
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """snake_case headers, apply aliases and drop blank cells."""
+    for row, data in rows:
+        fields = {}
+        for key, value in data.items():
+            if key is None:
+                continue
+            name = re.sub(r"[^a-z0-9]+", "_", str(key).strip().lower()).strip("_")
+            value = _text(value) if not isinstance(value, (date, datetime)) else value
+            if value is not None:
+                fields[aliases.get(name, name)] = value
+        yield row, fields
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+# ── Planning ────────────────────────────────────────
+
+
+def _parse_level(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    text = str(value).strip().upper().removeprefix("L")
+    if not text.isdigit():
+        raise ValueError(f"invalid level '{value}'")
+    return int(text)
+
+
+def _parse_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def _choice(value: Optional[str], choices: type[Enum], default: str, label: str) -> str:
+    """Validate an optional enum value (case-insensitive), or use the default."""
+    if value is None:
+        return default
+    value = value.strip().lower().replace(" ", "_")
+    allowed = [c.value for c in choices]
+    if value not in allowed:
+        raise ValueError(f"invalid {label} '{value}' (expected one of: {', '.join(allowed)})")
+    return value
+
+
+def plan_import(
+    catalogue: Catalogue,
+    organization_id: str,
+    user_id: str,
+    existing: dict[str, _Node],
+    systems: dict[str, str],
+) -> ImportPlan:
+    """
+    Resolve the catalogue against existing processes and build load records.
+
+    existing maps process code to node; systems maps lowercased system name
+    to id. A row that fails also fails its descendants and issues, since
+    they have nothing to attach to.
+    """
+    plan = ImportPlan()
+    nodes = dict(existing)
+
+    def fail(sheet: str, row: int, message: str) -> None:
+        plan.errors.append(ProcessImportError(sheet=sheet, row=row, message=message))
+
+    def add_process(row: int, data: dict, code: str, parent: Optional[_Node], sort_order: int):
+        try:
+            if len(code) > MAX_CODE_LENGTH:
+                raise ValueError(f"ref '{code}' is longer than {MAX_CODE_LENGTH} characters")
+            inherited = parent.process_type if parent else ProcessType.PRIMARY.value
+            process_type = _choice(data.get("process_type"), ProcessType, inherited, "process_type")
+            status = _choice(data.get("status"), LifecycleStatus, DEFAULT_IMPORT_STATUS, "status")
+            for key in ("name", "activity", "kpi", *RACI_FIELDS):
+                if len(data.get(key) or "") > MAX_TEXT_LENGTH:
+                    raise ValueError(f"{key} is longer than {MAX_TEXT_LENGTH} characters")
+            system_ids = []
+            for system_name in re.split(r"[,;]", data.get("systems") or ""):
+                if system_name.strip():
+                    system_id = systems.get(system_name.strip().lower())
+                    if system_id is None:
+                        raise ValueError(f"unknown system '{system_name.strip()}'")
+                    system_ids.append(system_id)
+        except ValueError as e:
+            fail(PROCESS_SHEET, row, str(e))
+            return
+
+        depth = code.count(".")
+        node = _Node(str(uuid4()), code, depth, data["name"], process_type)
+        nodes[code] = node
+        plan.processes.append((
+            node.id, organization_id, code, node.name, data.get("description"),
+            f"L{depth}", parent.id if parent else None, sort_order, process_type,
+            status, AutomationLevel.MANUAL.value,
+        ))
+        if any(data.get(key) for key in RACI_FIELDS):
+            plan.raci.append((
+                str(uuid4()), organization_id, node.id, data.get("activity") or node.name,
+                *(data.get(key) for key in RACI_FIELDS),
+            ))
+        if data.get("kpi"):
+            plan.kpis.append((str(uuid4()), organization_id, node.id, data["kpi"]))
+        for system_id in dict.fromkeys(system_ids):
+            plan.system_links.append((
+                str(uuid4()), organization_id, node.id, system_id,
+                SystemRole.PRIMARY.value, SystemCriticality.MEDIUM.value,
+                ProcessSystemStatus.ACTIVE.value,
+            ))
+
+    # 1. Validate rows; explicit refs are keyed so order in the file is irrelevant
+    explicit: dict[str, tuple[int, dict]] = {}
+    rejected: set[str] = set()
+    generated: list[tuple[int, dict]] = []
+    for row, data in catalogue.processes:
+        ref = data.get("ref")
+        if not data.get("name"):
+            fail(PROCESS_SHEET, row, "name is required")
+            continue
+        if ref is None:
+            generated.append((row, data))
+            continue
+        try:
+            if not REF_PATTERN.match(ref):
+                raise ValueError(f"invalid ref '{ref}' (expected dotted numbers such as 1.2.3)")
+            depth = ref.count(".")
+            level = _parse_level(data.get("level"))
+            if depth > MAX_DEPTH:
+                raise ValueError(f"ref '{ref}' is deeper than L{MAX_DEPTH}")
+            if level is not None and level != depth:
+                raise ValueError(f"level L{level} does not match ref '{ref}'")
+            parent_ref = data.get("parent_ref")
+            if parent_ref is not None and parent_ref != ref.rpartition(".")[0]:
+                raise ValueError(f"parent_ref '{parent_ref}' does not match ref '{ref}'")
+            if ref in explicit:
+                raise ValueError(f"duplicate ref '{ref}' (first on row {explicit[ref][0]})")
+            if ref in existing:
+                raise ValueError(f"process '{ref}' already exists")
+        except ValueError as e:
+            fail(PROCESS_SHEET, row, str(e))
+            rejected.add(ref)
+            continue
+        explicit[ref] = (row, data)
+
+    # 2. Shallowest first, so every parent is resolved before its children
+    for ref in sorted(explicit, key=lambda r: r.count(".")):
+        row, data = explicit[ref]
+        parent_ref, _, suffix = ref.rpartition(".")
+        parent = nodes.get(parent_ref) if parent_ref else None
+        if parent_ref and parent is None:
+            imported = parent_ref in explicit or parent_ref in rejected
+            reason = "was not imported" if imported else "not found"
+            fail(PROCESS_SHEET, row, f"parent '{parent_ref}' {reason}")
+            continue
+        add_process(row, data, ref, parent, max(int(suffix) - 1, 0))
+
+    # 3. Rows without a ref take the next free position under their parent
+    # Existing codes that are not dotted numbers (older schemes) take no position
+    next_position: dict[str, int] = {}
+    for code in nodes:
+        if not REF_PATTERN.match(code):
+            continue
+        parent_code, _, suffix = code.rpartition(".")
+        next_position[parent_code] = max(next_position.get(parent_code, 1), int(suffix) + 1)
+
+    for row, data in generated:
+        parent_ref = data.get("parent_ref") or ""
+        parent = nodes.get(parent_ref) if parent_ref else None
+        if parent_ref and parent is None:
+            fail(PROCESS_SHEET, row, f"parent '{parent_ref}' not found")
+            continue
+        if parent_ref and not REF_PATTERN.match(parent_ref):
+            fail(PROCESS_SHEET, row, f"parent '{parent_ref}' has no numeric code; give the row a ref")
+            continue
+        if parent and parent.level >= MAX_DEPTH:
+            fail(PROCESS_SHEET, row, f"parent '{parent_ref}' is already at L{MAX_DEPTH}")
+            continue
+        position = next_position.get(parent_ref, 1)
+        next_position[parent_ref] = position + 1
+        code = f"{parent_ref}.{position}" if parent_ref else str(position)
+        add_process(row, data, code, parent, position - 1)
+
+    # 4. Issues hang off imported or existing processes
+    today = date.today()
+    for row, data in catalogue.issues:
+        try:
+            title = data.get("title")
+            if not title:
+                raise ValueError("title is required")
+            if len(title) > MAX_TEXT_LENGTH:
+                raise ValueError(f"title is longer than {MAX_TEXT_LENGTH} characters")
+            node = nodes.get(data.get("process_ref") or "")
+            if node is None:
+                raise ValueError(f"process '{data.get('process_ref')}' not found")
+            if data.get("issue_classification") is None:
+                raise ValueError("issue_classification is required")
+            plan.issues.append({
+                "id": str(uuid4()),
+                "organization_id": organization_id,
+                "title": title,
+                "description": data.get("description"),
+                "issue_classification": _choice(
+                    data["issue_classification"], IssueClassification, "", "issue_classification"
+                ),
+                "issue_criticality": _choice(
+                    data.get("issue_criticality"), IssueCriticality,
+                    IssueCriticality.MEDIUM.value, "issue_criticality",
+                ),
+                "issue_complexity": _choice(
+                    data.get("issue_complexity"), IssueComplexity,
+                    IssueComplexity.MEDIUM.value, "issue_complexity",
+                ),
+                "issue_status": _choice(
+                    data.get("issue_status"), IssueStatus, IssueStatus.OPEN.value, "issue_status"
+                ),
+                "process_id": node.id,
+                "process_level": node.level,
+                "process_ref": node.code,
+                "process_name": node.name,
+                "raised_by_id": user_id,
+                "created_by": user_id,
+                "date_raised": _parse_date(data["date_raised"]) if data.get("date_raised") else today,
+                "opportunity_flag": False,
+            })
+        except ValueError as e:
+            fail(ISSUE_SHEET, row, str(e))
+
+    plan.errors.sort(key=lambda e: (e.sheet != PROCESS_SHEET, e.row))
+    return plan
+
+
+# ── Loading ─────────────────────────────────────────
+
+
+async def _insert(db: AsyncSession, name: str, columns: tuple[str, ...], records: list[tuple]):
+    """
+    INSERT records through the tenant session, so RLS policies apply.
+    A bare table() keeps the models' Python-side defaults out of the
+    statement; the database fills the unlisted columns.
+    """
+    if not records:
+        return
+    target = table(name, *(column(c) for c in columns))
+    await db.execute(insert(target), [dict(zip(columns, record)) for record in records])
+
+
+async def import_catalogue(
+    db: AsyncSession,
+    organization_id: str,
+    user_id: str,
+    catalogue: Catalogue,
+    dry_run: bool = False,
+) -> ProcessImportResponse:
+    """
+    Plan and, unless dry_run or invalid, load a catalogue. Does not commit.
+
+    Loads the tenant's existing process codes and system names once, so the
+    number of queries does not depend on the catalogue size.
+    """
+    process_result = await db.execute(
+        select(Process.id, Process.code, Process.level, Process.name, Process.process_type)
+        .where(Process.organization_id == organization_id)
+    )
+    existing = {
+        code: _Node(id, code, int(level.removeprefix("L") or 0), name, process_type)
+        for id, code, level, name, process_type in process_result.all()
+    }
+    system_result = await db.execute(
+        select(SystemCatalogue.id, SystemCatalogue.name)
+        .where(SystemCatalogue.organization_id == organization_id)
+    )
+    systems = {name.strip().lower(): id for id, name in system_result.all()}
+
+    plan = plan_import(catalogue, organization_id, user_id, existing, systems)
+
+    response = ProcessImportResponse(
+        committed=False,
+        dry_run=dry_run,
+        processes=len(plan.processes),
+        raci_entries=len(plan.raci),
+        kpis=len(plan.kpis),
+        system_links=len(plan.system_links),
+        issues=len(plan.issues),
+        errors=plan.errors,
+        operating_model_process_ids=list(dict.fromkeys(
+            record[2] for record in (*plan.raci, *plan.kpis, *plan.system_links)
+        )),
+    )
+    if plan.errors or dry_run:
+        return response
+
+    await _insert(db, "processes", PROCESS_COLUMNS, plan.processes)
+    await _insert(db, "process_raci", RACI_COLUMNS, plan.raci)
+    await _insert(db, "process_kpi", KPI_COLUMNS, plan.kpis)
+    await _insert(db, "process_system", SYSTEM_LINK_COLUMNS, plan.system_links)
+    if plan.issues:
+        await db.execute(insert(IssueLog), plan.issues)
+
+    return response
@@ -8,10 +8,12 @@ Generates auto-numbered hierarchical codes for processes:
 - And so on through L5
 """
 
-from typing import Optional
+from typing import Any, Iterable, Optional, Sequence
 
-from sqlalchemy import func, select, update
+from sqlalchemy import Integer, String, bindparam, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.models.process import Process
 
@@ -70,51 +72,149 @@ async def generate_process_code(
     return f"{parent_code}.{position}"
 
 
-async def renumber_siblings(
+# Single-statement write-back for renumbering. Arrays keep the parameter
+# count at three regardless of how many processes change.
+_BULK_RENUMBER = text("""
+    UPDATE processes AS p
+    SET code = v.code,
+        sort_order = v.sort_order,
+        updated_at = now()
+    FROM unnest(:ids, :codes, :sort_orders) AS v(id, code, sort_order)
+    WHERE p.id = v.id
+""").bindparams(
+    bindparam("ids", type_=ARRAY(UUID(as_uuid=False))),
+    bindparam("codes", type_=ARRAY(String)),
+    bindparam("sort_orders", type_=ARRAY(Integer)),
+)
+
+
+def compute_renumbering(
+    rows: Sequence[Any],
+    parent_ids: Optional[Iterable[Optional[str]]] = None,
+) -> dict[str, tuple[str, int]]:
+    """
+    Compute new (code, sort_order) pairs for everything under the given parents.
+
+    Args:
+        rows: Flat hierarchy rows exposing id, parent_id, code, sort_order and
+            status, already sorted in sibling order
+        parent_ids: Parents whose children (and all descendants) are renumbered.
+            None renumbers the whole tree from the roots.
+
+    Returns:
+        Mapping of process ID to (code, sort_order) for rows that change
+    """
+    by_id = {row.id: row for row in rows}
+    children: dict[Optional[str], list[Any]] = {}
+    for row in rows:
+        if row.status != "archived":
+            children.setdefault(row.parent_id, []).append(row)
+
+    targets = {None} if parent_ids is None else set(parent_ids)
+
+    def depth(parent_id: Optional[str]) -> int:
+        seen: set[str] = set()
+        while parent_id is not None and parent_id in by_id and parent_id not in seen:
+            seen.add(parent_id)
+            parent_id = by_id[parent_id].parent_id
+        return len(seen)
+
+    # Shallowest parents first, so a target that sits inside another target's
+    # subtree is already covered (with its new code) when we reach it
+    changes: dict[str, tuple[str, int]] = {}
+    visited: set[Optional[str]] = set()
+    for target in sorted(targets, key=lambda pid: (pid is not None, depth(pid))):
+        if target in visited:
+            continue
+        if target is None:
+            stack: list[tuple[Optional[str], Optional[str]]] = [(None, None)]
+        elif target in by_id:
+            stack = [(target, by_id[target].code)]
+        else:
+            continue
+
+        while stack:
+            parent_id, parent_code = stack.pop()
+            if parent_id in visited:
+                continue  # Guards against corrupt parent cycles
+            visited.add(parent_id)
+
+            for idx, child in enumerate(children.get(parent_id, [])):
+                position = idx + 1  # 1-based
+                new_code = f"{parent_code}.{position}" if parent_code else str(position)
+                if child.code != new_code or child.sort_order != idx:
+                    changes[child.id] = (new_code, idx)
+                stack.append((child.id, new_code))
+
+    return changes
+
+
+async def renumber_processes(
     db: AsyncSession,
     organization_id: str,
-    parent_id: Optional[str],
-) -> list[str]:
+    parent_ids: Optional[Iterable[Optional[str]]] = None,
+) -> set[str]:
     """
-    Renumber all siblings under a parent based on sort_order.
+    Renumber processes under the given parents, cascading to all descendants.
 
-    Returns list of process IDs that were renumbered (for cascading to children).
+    Loads the organization's hierarchy in one query, computes codes in memory
+    and writes every change back with a single UPDATE, so the number of round
+    trips does not grow with tree size or depth.
+
+    Returns the set of process IDs whose code or sort_order changed.
     """
-    # Get all siblings ordered by sort_order
-    query = select(Process).where(
-        Process.organization_id == organization_id,
-        Process.status != "archived",
-    ).order_by(Process.sort_order)
+    result = await db.execute(
+        select(
+            Process.id,
+            Process.parent_id,
+            Process.code,
+            Process.sort_order,
+            Process.status,
+        )
+        .where(Process.organization_id == organization_id)
+        .order_by(Process.sort_order, Process.created_at)
+    )
+    changes = compute_renumbering(result.all(), parent_ids)
+
+    if changes:
+        ids = list(changes)
+        await db.execute(
+            _BULK_RENUMBER,
+            {
+                "ids": ids,
+                "codes": [changes[pid][0] for pid in ids],
+                "sort_orders": [changes[pid][1] for pid in ids],
+            },
+        )
+        _sync_loaded_processes(db, changes)
 
-    if parent_id:
-        query = query.where(Process.parent_id == parent_id)
-    else:
-        query = query.where(Process.parent_id.is_(None))
+    return set(changes)
 
-    result = await db.execute(query)
-    siblings = result.scalars().all()
 
-    # Get parent code if exists
-    parent_code = None
-    if parent_id:
-        parent_result = await db.execute(
-            select(Process.code).where(Process.id == parent_id)
-        )
-        parent_code = parent_result.scalar_one_or_none()
+def _sync_loaded_processes(
+    db: AsyncSession,
+    changes: dict[str, tuple[str, int]],
+) -> None:
+    """Mirror bulk-updated values onto Process objects already in the session."""
+    for obj in db.sync_session.identity_map.values():
+        if isinstance(obj, Process) and obj.id in changes:
+            code, sort_order = changes[obj.id]
+            set_committed_value(obj, "code", code)
+            set_committed_value(obj, "sort_order", sort_order)
 
-    updated_ids = []
-    for idx, process in enumerate(siblings):
-        position = idx + 1  # 1-based
-        new_code = f"{parent_code}.{position}" if parent_code else str(position)
 
-        if process.code != new_code:
-            process.code = new_code
-            process.sort_order = idx
-            updated_ids.append(process.id)
-        elif process.sort_order != idx:
-            process.sort_order = idx
+async def renumber_siblings(
+    db: AsyncSession,
+    organization_id: str,
+    parent_id: Optional[str],
+) -> list[str]:
+    """
+    Renumber all siblings under a parent based on sort_order.
 
-    return updated_ids
+    Descendants of renumbered siblings are cascaded in the same pass.
+    Returns list of process IDs that were renumbered.
+    """
+    return list(await renumber_processes(db, organization_id, [parent_id]))
 
 
 async def renumber_subtree(
@@ -123,40 +223,11 @@ async def renumber_subtree(
     process_id: str,
 ) -> None:
     """
-    Recursively update codes for a process's children.
+    Update codes for all of a process's descendants.
 
     Called when a process code changes to cascade the change to all descendants.
     """
-    # Get this process's current code
-    result = await db.execute(
-        select(Process.code).where(Process.id == process_id)
-    )
-    parent_code = result.scalar_one_or_none()
-
-    if not parent_code:
-        return
-
-    # Get all children ordered by sort_order
-    result = await db.execute(
-        select(Process).where(
-            Process.parent_id == process_id,
-            Process.status != "archived",
-        ).order_by(Process.sort_order)
-    )
-    children = result.scalars().all()
-
-    for idx, child in enumerate(children):
-        position = idx + 1
-        new_code = f"{parent_code}.{position}"
-
-        if child.code != new_code:
-            child.code = new_code
-
-        if child.sort_order != idx:
-            child.sort_order = idx
-
-        # Recursively update this child's descendants
-        await renumber_subtree(db, organization_id, child.id)
+    await renumber_processes(db, organization_id, [process_id])
 
 
 async def renumber_all_processes(
@@ -168,64 +239,7 @@ async def renumber_all_processes(
 
     Used for migration/data repair. Returns count of updated processes.
     """
-    count = 0
-
-    # Start with L0 processes (no parent)
-    result = await db.execute(
-        select(Process).where(
-            Process.organization_id == organization_id,
-            Process.parent_id.is_(None),
-            Process.status != "archived",
-        ).order_by(Process.sort_order, Process.created_at)
-    )
-    roots = result.scalars().all()
-
-    for idx, root in enumerate(roots):
-        position = idx + 1
-        new_code = str(position)
-
-        if root.code != new_code or root.sort_order != idx:
-            root.code = new_code
-            root.sort_order = idx
-            count += 1
-
-        # Process descendants recursively
-        count += await _renumber_children(db, organization_id, root.id, new_code)
-
-    return count
-
-
-async def _renumber_children(
-    db: AsyncSession,
-    organization_id: str,
-    parent_id: str,
-    parent_code: str,
-) -> int:
-    """Helper to recursively renumber children."""
-    count = 0
-
-    result = await db.execute(
-        select(Process).where(
-            Process.organization_id == organization_id,
-            Process.parent_id == parent_id,
-            Process.status != "archived",
-        ).order_by(Process.sort_order, Process.created_at)
-    )
-    children = result.scalars().all()
-
-    for idx, child in enumerate(children):
-        position = idx + 1
-        new_code = f"{parent_code}.{position}"
-
-        if child.code != new_code or child.sort_order != idx:
-            child.code = new_code
-            child.sort_order = idx
-            count += 1
-
-        # Recurse to children
-        count += await _renumber_children(db, organization_id, child.id, new_code)
-
-    return count
+    return len(await renumber_processes(db, organization_id))
 
 
 def calculate_level_from_parent(parent_level: Optional[str]) -> str:
@@ -0,0 +1,484 @@
+"""
+Batch prompt execution: one template run over many processes.
+
+A job snapshots its target process IDs and runs in the background:
+
+- prompt context (process fields, systems, RACI, KPIs, RIADA items and
+  operating model completeness) is loaded in bulk, one query per table per
+  chunk of targets, and rendered into the template's {{placeholders}}
+- a pool of worker tasks sends the prompts through the LLM engine (tenant
+  concurrency limit, response cache), spaced to the tenant's rate_limit_rpm
+  and backing off on rate-limit and overload errors
+- a single writer saves results as PromptExecution rows and commits a
+  checkpoint every BATCH_CHECKPOINT_SIZE results or BATCH_CHECKPOINT_INTERVAL
+  seconds, updating the job's counters and heartbeat (updated_at)
+
+A failed job, a completed one with failed prompts, or one whose heartbeat
+went stale because its worker died can be resumed: targets that already
+have a successful execution in the job are skipped.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
+from uuid import uuid4
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.database import async_session_factory
+from src.core.providers.llm import LLMConfig
+from src.core.tenancy import apply_tenant_context
+from src.models.operating_model import ProcessKpi, ProcessRaci
+from src.models.process import Process
+from src.models.reference import (
+    LLMConfiguration,
+    PromptBatchJob,
+    PromptExecution,
+    PromptTemplate,
+)
+from src.models.riada import RiadaItem
+from src.models.system_catalogue import ProcessSystem, SystemCatalogue
+from src.services import llm_engine
+from src.services.operating_model_completeness import get_completeness, get_subtree_ids
+
+logger = logging.getLogger(__name__)
+
+# Largest process set one job may target
+BATCH_MAX_TARGETS = 5000
+
+# Targets whose prompt context is loaded together
+BATCH_CONTEXT_CHUNK = 500
+
+# A checkpoint commits after this many results or seconds, whichever comes first
+BATCH_CHECKPOINT_SIZE = 20
+BATCH_CHECKPOINT_INTERVAL = 2.0
+
+# Attempts per prompt when the provider is rate limiting or overloaded
+BATCH_MAX_ATTEMPTS = 5
+
+# Exponential backoff bounds (seconds); jittered unless the provider says when to retry
+BATCH_BACKOFF_BASE = 1.0
+BATCH_BACKOFF_MAX = 30.0
+
+# A running job whose heartbeat is older than this (seconds) may be resumed
+BATCH_STALE_AFTER = 300
+
+# Provider statuses worth retrying: timeouts, rate limits, server overload
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+_NONE_RECORDED = "None recorded"
+
+
+def render_prompt(template_text: str, context: dict[str, str]) -> str:
+    """Fill {{name}} placeholders; unknown placeholders are left as written."""
+    return _PLACEHOLDER.sub(lambda m: context.get(m.group(1), m.group(0)), template_text)
+
+
+def _bullets(lines: Sequence[str]) -> str:
+    return "\n".join(f"- {line}" for line in lines) if lines else _NONE_RECORDED
+
+
+def _group(rows) -> dict[str, list]:
+    grouped: dict[str, list] = {}
+    for row in rows:
+        grouped.setdefault(row.process_id, []).append(row)
+    return grouped
+
+
+async def load_contexts(
+    db: AsyncSession,
+    organization_id: str,
+    template: PromptTemplate,
+    process_ids: Sequence[str],
+) -> dict[str, dict[str, str]]:
+    """
+    Template variables for each process, keyed by process ID.
+
+    Always: code, name, description, level, process_type, status (also with
+    a process_ prefix), systems, completeness and missing_components. raci,
+    kpis and riada follow the template's include_* flags.
+    """
+    processes = (await db.execute(
+        select(
+            Process.id, Process.code, Process.name, Process.description,
+            Process.level, Process.process_type, Process.status,
+        ).where(Process.organization_id == organization_id, Process.id.in_(process_ids))
+    )).all()
+
+    systems = _group((await db.execute(
+        select(ProcessSystem.process_id, SystemCatalogue.name)
+        .join(SystemCatalogue, SystemCatalogue.id == ProcessSystem.system_id)
+        .where(
+            ProcessSystem.organization_id == organization_id,
+            ProcessSystem.process_id.in_(process_ids),
+        )
+        .order_by(SystemCatalogue.name)
+    )).all())
+
+    raci = kpis = riada = {}
+    if template.include_raci:
+        raci = _group((await db.execute(
+            select(
+                ProcessRaci.process_id, ProcessRaci.activity, ProcessRaci.responsible,
+                ProcessRaci.accountable, ProcessRaci.consulted, ProcessRaci.informed,
+            )
+            .where(
+                ProcessRaci.organization_id == organization_id,
+                ProcessRaci.process_id.in_(process_ids),
+            )
+            .order_by(ProcessRaci.created_at)
+        )).all())
+    if template.include_kpis:
+        kpis = _group((await db.execute(
+            select(
+                ProcessKpi.process_id, ProcessKpi.name, ProcessKpi.target_value,
+                ProcessKpi.current_value, ProcessKpi.unit,
+            )
+            .where(
+                ProcessKpi.organization_id == organization_id,
+                ProcessKpi.process_id.in_(process_ids),
+            )
+            .order_by(ProcessKpi.name)
+        )).all())
+    if template.include_riada:
+        riada = _group((await db.execute(
+            select(
+                RiadaItem.process_id, RiadaItem.code, RiadaItem.title,
+                RiadaItem.riada_type, RiadaItem.status,
+            )
+            .where(
+                RiadaItem.organization_id == organization_id,
+                RiadaItem.process_id.in_(process_ids),
+            )
+            .order_by(RiadaItem.code)
+        )).all())
+
+    completeness = await get_completeness(db, organization_id, process_ids)
+
+    contexts = {}
+    for p in processes:
+        fields = {
+            "code": p.code,
+            "name": p.name,
+            "description": p.description or "",
+            "level": p.level,
+            "process_type": p.process_type or "",
+            "status": p.status or "",
+        }
+        context = {**fields, **{f"process_{k}": v for k, v in fields.items()}}
+        context["systems"] = _bullets([s.name for s in systems.get(p.id, ())])
+
+        summary = completeness.get(p.id)
+        if summary is not None:
+            context["completeness"] = f"{summary.completion_percentage}%"
+            context["missing_components"] = ", ".join(summary.missing_components) or "none"
+
+        if template.include_raci:
+            context["raci"] = _bullets([
+                f"{r.activity}: R={r.responsible or '-'}, A={r.accountable or '-'}, "
+                f"C={r.consulted or '-'}, I={r.informed or '-'}"
+                for r in raci.get(p.id, ())
+            ])
+        if template.include_kpis:
+            context["kpis"] = _bullets([
+                f"{k.name}: target {k.target_value or '-'}, current {k.current_value or '-'}"
+                + (f" {k.unit}" if k.unit else "")
+                for k in kpis.get(p.id, ())
+            ])
+        if template.include_riada:
+            context["riada"] = _bullets([
+                f"{r.code} [{r.riada_type}, {r.status}] {r.title}"
+                for r in riada.get(p.id, ())
+            ])
+        contexts[p.id] = context
+    return contexts
+
+
+async def resolve_targets(
+    db: AsyncSession,
+    organization_id: str,
+    process_ids: Optional[Sequence[str]] = None,
+    root_id: Optional[str] = None,
+    level: Optional[str] = None,
+) -> list[str]:
+    """
+    Non-archived processes matching every given filter, in display order
+    (subtree order when root_id is given).
+    """
+    query = select(Process.id).where(
+        Process.organization_id == organization_id,
+        Process.status != "archived",
+    )
+    if process_ids is not None:
+        query = query.where(Process.id.in_(process_ids))
+    if level is not None:
+        query = query.where(Process.level == level)
+
+    if root_id is None:
+        query = query.order_by(Process.level, Process.sort_order, Process.code)
+        return list((await db.execute(query)).scalars().all())
+
+    subtree = await get_subtree_ids(db, organization_id, root_id)
+    matching = set((await db.execute(query.where(Process.id.in_(subtree)))).scalars().all())
+    return [p for p in subtree if p in matching]
+
+
+async def claim_job(db: AsyncSession, organization_id: str, job_id: str) -> bool:
+    """
+    Mark a job running if it may be resumed: failed, completed with failed
+    prompts, or running with a stale heartbeat. Atomic, so concurrent resumes
+    cannot both win.
+    """
+    stale = func.now() - timedelta(seconds=BATCH_STALE_AFTER)
+    result = await db.execute(
+        update(PromptBatchJob)
+        .where(
+            PromptBatchJob.id == job_id,
+            PromptBatchJob.organization_id == organization_id,
+            or_(
+                PromptBatchJob.status == "failed",
+                (PromptBatchJob.status == "completed") & (PromptBatchJob.failed > 0),
+                (PromptBatchJob.status == "running") & (PromptBatchJob.updated_at < stale),
+            ),
+        )
+        .values(status="running", error_message=None, finished_at=None, updated_at=func.now())
+        .returning(PromptBatchJob.id)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+class _Pacer:
+    """Spaces call starts to stay under a requests-per-minute limit."""
+
+    def __init__(self, rpm: Optional[int]):
+        self.interval = 60.0 / rpm if rpm and rpm > 0 else 0.0
+        self.next_at = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        start = max(now, self.next_at)
+        self.next_at = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def hold(self, delay: float) -> None:
+        """Pause every worker, e.g. after the provider signalled a rate limit."""
+        self.next_at = max(self.next_at, time.monotonic() + delay)
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying, or None if the error is final."""
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    transient = isinstance(error, (asyncio.TimeoutError, ConnectionError))
+    if attempt >= BATCH_MAX_ATTEMPTS or not (transient or status in _RETRYABLE_STATUS):
+        return None
+
+    retry_after = getattr(error, "retry_after", None)
+    headers = getattr(response, "headers", None)
+    if retry_after is None and headers is not None:
+        try:
+            retry_after = float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            retry_after = None
+    if retry_after:
+        return min(float(retry_after), BATCH_BACKOFF_MAX)
+
+    backoff = min(BATCH_BACKOFF_BASE * 2 ** (attempt - 1), BATCH_BACKOFF_MAX)
+    return backoff * random.uniform(0.5, 1.0)
+
+
+async def create_job(
+    db: AsyncSession,
+    organization_id: str,
+    user_id: str,
+    template_id: str,
+    target_ids: list[str],
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> PromptBatchJob:
+    """Record a running job; the caller commits and starts run_job."""
+    job = PromptBatchJob(
+        id=str(uuid4()),
+        organization_id=organization_id,
+        template_id=template_id,
+        user_id=user_id,
+        status="running",
+        target_ids=target_ids,
+        total=len(target_ids),
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    db.add(job)
+    await db.flush()
+    await db.refresh(job)
+    return job
+
+
+async def _execute_job(db: AsyncSession, job: PromptBatchJob, workers: int) -> None:
+    organization_id = job.organization_id
+    template = await db.get(PromptTemplate, job.template_id)
+    llm_config = (await db.execute(
+        select(LLMConfiguration).where(
+            LLMConfiguration.organization_id == organization_id,
+            LLMConfiguration.is_enabled == True,
+        )
+    )).scalars().first()
+    if template is None:
+        raise ValueError("Prompt template no longer exists")
+    if llm_config is None:
+        raise ValueError("No LLM configuration found. Please configure an LLM provider.")
+
+    config = LLMConfig(
+        model=llm_config.model,
+        temperature=float(llm_config.default_temperature),
+        max_tokens=llm_config.default_max_tokens,
+        system_prompt=template.system_prompt,
+    )
+    if template.default_temperature is not None:
+        config.temperature = float(template.default_temperature)
+    if template.default_max_tokens:
+        config.max_tokens = template.default_max_tokens
+    if job.temperature is not None:
+        config.temperature = float(job.temperature)
+    if job.max_tokens is not None:
+        config.max_tokens = job.max_tokens
+    provider_name = llm_engine.resolve_provider_name(llm_config.provider)
+
+    # Resume point: earlier failures are retried, successes are kept
+    done = set((await db.execute(
+        select(PromptExecution.target_entity_id).where(
+            PromptExecution.batch_job_id == job.id,
+            PromptExecution.error_message.is_(None),
+        )
+    )).scalars().all())
+    remaining = [p for p in job.target_ids if p not in done]
+
+    prompts: list[tuple[str, str]] = []
+    for start in range(0, len(remaining), BATCH_CONTEXT_CHUNK):
+        chunk = remaining[start:start + BATCH_CONTEXT_CHUNK]
+        contexts = await load_contexts(db, organization_id, template, chunk)
+        prompts.extend(
+            (p, render_prompt(template.user_prompt_template, contexts[p]))
+            for p in chunk if p in contexts
+        )
+
+    job.completed = len(done)
+    job.failed = 0
+    job.total = len(done) + len(prompts)
+    job.started_at = job.started_at or datetime.now(timezone.utc)
+    await db.commit()
+
+    pending: asyncio.Queue = asyncio.Queue()
+    for item in prompts:
+        pending.put_nowait(item)
+    results: asyncio.Queue = asyncio.Queue()
+    pacer = _Pacer(llm_config.rate_limit_rpm)
+
+    async def run_prompt(process_id: str, prompt: str) -> PromptExecution:
+        execution = PromptExecution(
+            id=str(uuid4()),
+            organization_id=organization_id,
+            template_id=template.id,
+            user_id=job.user_id,
+            target_entity_type="process",
+            target_entity_id=process_id,
+            prompt_sent=prompt,
+            model_used=config.model,
+            batch_job_id=job.id,
+        )
+        start = time.perf_counter()
+        for attempt in range(1, BATCH_MAX_ATTEMPTS + 1):
+            await pacer.wait()
+            try:
+                response = await llm_engine.generate(organization_id, provider_name, prompt, config)
+            except Exception as e:
+                delay = _retry_delay(e, attempt)
+                if delay is None:
+                    execution.error_message = str(e)
+                    break
+                logger.info("Batch %s: retrying %s in %.1fs (%s)", job.id, process_id, delay, e)
+                pacer.hold(delay)
+            else:
+                execution.response_received = response.content
+                execution.model_used = response.model
+                execution.prompt_tokens = response.prompt_tokens
+                execution.completion_tokens = response.completion_tokens
+                execution.total_tokens = response.total_tokens
+                break
+        execution.execution_time_ms = round((time.perf_counter() - start) * 1000)
+        return execution
+
+    async def worker() -> None:
+        try:
+            while not pending.empty():
+                process_id, prompt = pending.get_nowait()
+                await results.put(await run_prompt(process_id, prompt))
+        except Exception as e:
+            # Hand the error to the writer, which would otherwise wait forever
+            await results.put(e)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(min(workers, len(prompts)))]
+    try:
+        # Workers never touch the session: this loop is the only writer
+        last_checkpoint = time.monotonic()
+        unsaved = 0
+        for written in range(1, len(prompts) + 1):
+            execution = await results.get()
+            if isinstance(execution, Exception):
+                raise execution
+            db.add(execution)
+            if execution.error_message:
+                job.failed += 1
+            else:
+                job.completed += 1
+            unsaved += 1
+            if (
+                unsaved >= BATCH_CHECKPOINT_SIZE
+                or written == len(prompts)
+                or time.monotonic() - last_checkpoint >= BATCH_CHECKPOINT_INTERVAL
+            ):
+                template.usage_count += unsaved
+                await db.commit()
+                unsaved, last_checkpoint = 0, time.monotonic()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    job.status = "completed"
+    job.finished_at = datetime.now(timezone.utc)
+    await db.commit()
+
+
+async def run_job(organization_id: str, job_id: str, workers: Optional[int] = None) -> None:
+    """
+    Run (or resume) a claimed job to completion with a pool of workers.
+
+    Opens its own session so it can outlive the request that started it.
+    Defaults to one worker per tenant concurrency slot.
+    """
+    workers = max(workers or settings.LLM_TENANT_CONCURRENCY, 1)
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, organization_id)
+        job = await db.get(PromptBatchJob, job_id)
+        if job is None:
+            return
+        try:
+            await _execute_job(db, job, workers)
+        except Exception as e:
+            logger.exception("Prompt batch %s failed", job_id)
+            await db.rollback()
+            await db.refresh(job)
+            job.status = "failed"
+            job.error_message = str(e)
+            job.finished_at = datetime.now(timezone.utc)
+            await db.commit()
@@ -0,0 +1,200 @@
+"""
+Set-based process RAG recalculation.
+
+Recomputes the rag_* dimensions from open issues with one aggregate over
+issue_log and one UPDATE, mirroring the trg_issue_rag_sync trigger rules:
+- BR-11: open high-criticality issue -> RED, any other open issue -> AMBER
+- BR-12: GREEN survives only when explicitly reviewed and no issues are open
+- BR-15: otherwise the dimension reverts to NEUTRAL
+
+Large recalculations can run as a background job that works in batches and
+reports progress through the CacheProvider.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+from uuid import uuid4
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import async_session_factory
+from src.core.providers.cache import get_cache_provider
+from src.core.tenancy import apply_tenant_context
+from src.models.process import Process
+from src.services.result_cache import bump_data_version
+
+RAG_JOB_BATCH_SIZE = 1000
+RAG_JOB_TTL = 3600
+
+# Only rows whose RAG actually changes are written and returned
+_RECALCULATE_RAG = text("""
+    WITH targets AS (
+        SELECT id, rag_last_reviewed, rag_people, rag_process, rag_system, rag_data
+        FROM processes
+        WHERE organization_id = :org_id
+          AND (
+              (CAST(:process_ids AS uuid[]) IS NULL AND status != 'archived')
+              OR id = ANY(:process_ids)
+          )
+    ),
+    agg AS (
+        SELECT
+            il.process_id,
+            bool_or(il.issue_classification = 'people' AND il.issue_criticality = 'high') AS high_people,
+            bool_or(il.issue_classification = 'process' AND il.issue_criticality = 'high') AS high_process,
+            bool_or(il.issue_classification = 'system' AND il.issue_criticality = 'high') AS high_system,
+            bool_or(il.issue_classification = 'data' AND il.issue_criticality = 'high') AS high_data,
+            bool_or(il.issue_classification = 'people') AS any_people,
+            bool_or(il.issue_classification = 'process') AS any_process,
+            bool_or(il.issue_classification = 'system') AS any_system,
+            bool_or(il.issue_classification = 'data') AS any_data
+        FROM issue_log il
+        JOIN targets t ON t.id = il.process_id
+        WHERE il.organization_id = :org_id
+          AND il.issue_status IN ('open', 'in_progress')
+        GROUP BY il.process_id
+    ),
+    computed AS (
+        SELECT
+            t.id,
+            CASE
+                WHEN a.high_people THEN 'red'
+                WHEN a.any_people THEN 'amber'
+                WHEN t.rag_last_reviewed IS NOT NULL AND t.rag_people = 'green' THEN 'green'
+                ELSE 'neutral'
+            END::rag_status AS rag_people,
+            CASE
+                WHEN a.high_process THEN 'red'
+                WHEN a.any_process THEN 'amber'
+                WHEN t.rag_last_reviewed IS NOT NULL AND t.rag_process = 'green' THEN 'green'
+                ELSE 'neutral'
+            END::rag_status AS rag_process,
+            CASE
+                WHEN a.high_system THEN 'red'
+                WHEN a.any_system THEN 'amber'
+                WHEN t.rag_last_reviewed IS NOT NULL AND t.rag_system = 'green' THEN 'green'
+                ELSE 'neutral'
+            END::rag_status AS rag_system,
+            CASE
+                WHEN a.high_data THEN 'red'
+                WHEN a.any_data THEN 'amber'
+                WHEN t.rag_last_reviewed IS NOT NULL AND t.rag_data = 'green' THEN 'green'
+                ELSE 'neutral'
+            END::rag_status AS rag_data
+        FROM targets t
+        LEFT JOIN agg a ON a.process_id = t.id
+    )
+    UPDATE processes p
+    SET rag_people = c.rag_people,
+        rag_process = c.rag_process,
+        rag_system = c.rag_system,
+        rag_data = c.rag_data
+    FROM computed c
+    WHERE p.id = c.id
+      AND (p.rag_people, p.rag_process, p.rag_system, p.rag_data)
+          IS DISTINCT FROM (c.rag_people, c.rag_process, c.rag_system, c.rag_data)
+    RETURNING p.id
+""").bindparams(bindparam("process_ids", type_=ARRAY(UUID(as_uuid=False))))
+
+
+async def recalculate_rag(
+    db: AsyncSession,
+    organization_id: str,
+    process_ids: Optional[Sequence[str]] = None,
+) -> list[str]:
+    """
+    Recalculate RAG for the given processes (or, when None or empty, every
+    non-archived one).
+
+    Returns the IDs of processes whose RAG changed.
+    """
+    result = await db.execute(
+        _RECALCULATE_RAG,
+        {
+            "org_id": organization_id,
+            "process_ids": list(process_ids) if process_ids else None,
+        },
+    )
+    return [row[0] for row in result.fetchall()]
+
+
+# ── Background jobs ─────────────────────────────────────
+
+
+def _job_key(organization_id: str, job_id: str) -> str:
+    return f"rag-recalc:{organization_id}:{job_id}"
+
+
+async def create_recalculation_job(organization_id: str) -> dict:
+    """Register a pending job and return its initial state."""
+    job_id = str(uuid4())
+    job = {
+        "job_id": job_id,
+        "status": "pending",
+        "total": 0,
+        "processed": 0,
+        "processes_updated": 0,
+        "errors": [],
+        "started_at": None,
+        "finished_at": None,
+    }
+    await get_cache_provider().set(
+        _job_key(organization_id, job_id), job, ttl=RAG_JOB_TTL
+    )
+    return job
+
+
+async def get_recalculation_job(organization_id: str, job_id: str) -> Optional[dict]:
+    """Fetch job state, or None if unknown or expired."""
+    return await get_cache_provider().get(_job_key(organization_id, job_id))
+
+
+async def run_recalculation_job(
+    job: dict,
+    organization_id: str,
+    process_ids: Optional[Sequence[str]] = None,
+    batch_size: int = RAG_JOB_BATCH_SIZE,
+) -> None:
+    """
+    Run a recalculation in committed batches, publishing progress after each.
+
+    Opens its own session so it can outlive the request that started it.
+    """
+    cache = get_cache_provider()
+    key = _job_key(organization_id, job["job_id"])
+    job.update(status="running", started_at=datetime.now(timezone.utc).isoformat())
+
+    try:
+        async with async_session_factory() as db:
+            await apply_tenant_context(db, organization_id)
+
+            query = select(Process.id).where(Process.organization_id == organization_id)
+            if process_ids:
+                query = query.where(Process.id.in_(process_ids))
+            else:
+                query = query.where(Process.status != "archived")
+            targets = [row[0] for row in (await db.execute(query)).fetchall()]
+
+            job["total"] = len(targets)
+            await cache.set(key, job, ttl=RAG_JOB_TTL)
+
+            for start in range(0, len(targets), batch_size):
+                batch = targets[start:start + batch_size]
+                updated = await recalculate_rag(db, organization_id, batch)
+                await db.commit()
+                if updated:
+                    await bump_data_version(organization_id)
+
+                job["processed"] += len(batch)
+                job["processes_updated"] += len(updated)
+                await cache.set(key, job, ttl=RAG_JOB_TTL)
+
+        job["status"] = "completed"
+    except Exception as e:
+        job["status"] = "failed"
+        job["errors"].append(str(e))
+
+    job["finished_at"] = datetime.now(timezone.utc).isoformat()
+    await cache.set(key, job, ttl=RAG_JOB_TTL)
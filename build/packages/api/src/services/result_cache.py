@@ -0,0 +1,85 @@
+"""
+Short-TTL per-tenant cache for dashboard aggregates.
+
+Results are keyed on a per-tenant data version that write endpoints bump
+after committing, so a user's own change shows on their next dashboard load.
+The TTL bounds staleness for changes that bypass the API (DB triggers,
+migrations, seeds).
+"""
+
+import logging
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from src.core.providers.cache import get_cache_provider
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_TTL = 30
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _version_key(organization_id: str) -> str:
+    return f"data-version:{organization_id}"
+
+
+async def get_data_version(organization_id: str) -> int:
+    """Current data version for a tenant (0 if never bumped or unreadable)."""
+    try:
+        return int(await get_cache_provider().get(_version_key(organization_id)) or 0)
+    except Exception:
+        logger.warning("Data version read failed for %s", organization_id, exc_info=True)
+        return 0
+
+
+async def bump_data_version(organization_id: str) -> None:
+    """
+    Retire every cached result for a tenant. Call after the write commits.
+
+    A failed bump is logged rather than raised: the write has already
+    committed, and RESULT_CACHE_TTL bounds how long stale results survive.
+    """
+    try:
+        await get_cache_provider().incr(_version_key(organization_id))
+    except Exception:
+        logger.warning("Data version bump failed for %s", organization_id, exc_info=True)
+
+
+async def cached_result(
+    model: type[M],
+    name: str,
+    organization_id: str,
+    build: Callable[[], Awaitable[M]],
+    *key_parts: Optional[str],
+    ttl: int = RESULT_CACHE_TTL,
+) -> M:
+    """
+    Return a cached aggregate for the tenant's current data version.
+
+    Args:
+        model: Response model used to rehydrate cached results
+        name: Result name, unique per endpoint
+        organization_id: Tenant the result belongs to
+        build: Coroutine factory computing the result on a miss
+        key_parts: Request parameters the result depends on
+        ttl: Seconds to keep the result
+    """
+    cache = get_cache_provider()
+    version = await get_data_version(organization_id)
+    key = ":".join(
+        ["result", name, organization_id, str(version), *(part or "" for part in key_parts)]
+    )
+
+    try:
+        cached = await cache.get(key)
+    except Exception:
+        logger.warning("Result cache read failed for %s", key, exc_info=True)
+        cached = None
+    if cached is not None:
+        return model.model_validate(cached)
+
+    result = await build()
+    await cache.set(key, result.model_dump(mode="json"), ttl=ttl)
+    return result
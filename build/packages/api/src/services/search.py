@@ -0,0 +1,114 @@
+"""
+Indexed text search over processes, RIADA items and reference catalogues.
+
+Each searchable table carries a generated, weighted search_vector (GIN) and
+pg_trgm indexes on its text columns (migration 020). Matching combines:
+
+- full-text: search_vector @@ websearch_to_tsquery(term), stemmed words
+- substring: ILIKE '%term%' on the list endpoints' columns (trigram index)
+- fuzzy: term <% title (word_similarity), which tolerates typos
+
+Results are ranked by ts_rank_cd plus title similarity, with an exact code
+match first.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, Select, case, func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from src.core.database import SEARCH_TEXT_CONFIG
+from src.models.process import Process
+from src.models.reference import ReferenceCatalogue
+from src.models.riada import RiadaItem
+
+# Upper bound on results returned by the unified search
+SEARCH_MAX_RESULTS = 100
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """How one entity type is matched and labelled in search results."""
+
+    entity_type: str
+    model: Any
+    title: InstrumentedAttribute
+    substring_columns: tuple[InstrumentedAttribute, ...]
+
+
+SEARCH_TARGETS = {
+    "process": SearchTarget(
+        "process", Process, Process.name, (Process.name, Process.description)
+    ),
+    "riada": SearchTarget(
+        "riada", RiadaItem, RiadaItem.title, (RiadaItem.title, RiadaItem.description)
+    ),
+    "reference": SearchTarget(
+        "reference",
+        ReferenceCatalogue,
+        ReferenceCatalogue.name,
+        (ReferenceCatalogue.name, ReferenceCatalogue.code),
+    ),
+}
+
+
+def _tsquery(term: str) -> ColumnElement:
+    return func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, term)
+
+
+def search_filter(target: SearchTarget, term: str) -> ColumnElement[bool]:
+    """
+    WHERE clause for a list endpoint's search parameter.
+
+    Keeps the existing substring behaviour (now trigram-indexed) and adds
+    full-text matches on the weighted vector.
+    """
+    pattern = f"%{term}%"
+    return or_(
+        target.model.search_vector.bool_op("@@")(_tsquery(term)),
+        *(column.ilike(pattern) for column in target.substring_columns),
+    )
+
+
+def _ranked_matches(target: SearchTarget, organization_id: str, term: str) -> Select:
+    model = target.model
+    tsquery = _tsquery(term)
+    rank = (
+        func.ts_rank_cd(model.search_vector, tsquery)
+        + func.word_similarity(term, target.title)
+        + case((func.lower(model.code) == term.lower(), 1.0), else_=0.0)
+    )
+    return select(
+        literal(target.entity_type).label("entity_type"),
+        model.id.label("id"),
+        model.code.label("code"),
+        target.title.label("title"),
+        rank.label("rank"),
+    ).where(
+        model.organization_id == organization_id,
+        or_(
+            search_filter(target, term),
+            literal(term).bool_op("<%")(target.title),
+        ),
+    )
+
+
+async def search_entities(
+    db: AsyncSession,
+    organization_id: str,
+    term: str,
+    entity_types: Sequence[str],
+    limit: int,
+) -> list[Any]:
+    """Ranked matches across entity types, best first."""
+    matches = union_all(
+        *(_ranked_matches(SEARCH_TARGETS[t], organization_id, term) for t in entity_types)
+    ).subquery()
+    query = (
+        select(matches)
+        .order_by(matches.c.rank.desc(), matches.c.title)
+        .limit(min(limit, SEARCH_MAX_RESULTS))
+    )
+    return list((await db.execute(query)).all())
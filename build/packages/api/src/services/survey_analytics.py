@@ -0,0 +1,325 @@
+"""
+Incremental survey analytics.
+
+Each submitted response adds its deltas to survey_stats in the same
+transaction: per question the number of answers, score count, sum and sum
+of squares and a histogram of answer values; per survey the number of
+responses, completions and total_score statistics. Results are read from
+those rows alone, so reporting cost does not grow with the number of
+responses.
+
+Existing data (or stats that drifted, e.g. after editing responses in the
+database) is folded in by a rebuild, which recomputes a survey's rows from
+its responses in keyset batches. A per-survey advisory lock keeps
+submissions (shared) out of a running rebuild (exclusive), so no response
+is counted twice or missed. Rebuilds of many surveys run as a background
+job reporting progress through the CacheProvider.
+"""
+
+import json
+import math
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Optional, Sequence
+from uuid import uuid4
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import async_session_factory
+from src.core.providers.cache import get_cache_provider
+from src.core.tenancy import apply_tenant_context
+from src.models.survey import QuestionType, Survey, SurveyResponse, SurveyStats
+
+# Responses read per round trip while rebuilding
+REBUILD_BATCH_SIZE = 2000
+REBUILD_JOB_TTL = 3600
+
+# Answer values are truncated to this many characters in histograms
+BUCKET_MAX_LENGTH = 100
+
+# Free text is counted but never bucketed
+_UNBUCKETED_TYPES = {QuestionType.TEXT.value}
+
+# Adds one delta row per question (question_id NULL: the survey row).
+# Rows are written in key order so concurrent submissions lock them in the
+# same order and cannot deadlock.
+_ADD_STATS = text("""
+    INSERT INTO survey_stats AS s (
+        id, organization_id, survey_id, question_id,
+        count, score_count, score_sum, score_sq_sum, value_counts
+    )
+    SELECT gen_random_uuid(), :org_id, :survey_id, d.question_id,
+           d.count, d.score_count, d.score_sum, d.score_sq_sum, d.value_counts
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS d(
+        question_id uuid, count bigint, score_count bigint,
+        score_sum float8, score_sq_sum float8, value_counts jsonb
+    )
+    ORDER BY d.question_id NULLS FIRST
+    ON CONFLICT (survey_id, question_id) DO UPDATE SET
+        count = s.count + EXCLUDED.count,
+        score_count = s.score_count + EXCLUDED.score_count,
+        score_sum = s.score_sum + EXCLUDED.score_sum,
+        score_sq_sum = s.score_sq_sum + EXCLUDED.score_sq_sum,
+        value_counts = (
+            SELECT coalesce(jsonb_object_agg(
+                k,
+                coalesce((s.value_counts ->> k)::bigint, 0)
+                + coalesce((EXCLUDED.value_counts ->> k)::bigint, 0)
+            ), '{}'::jsonb)
+            FROM jsonb_object_keys(s.value_counts || EXCLUDED.value_counts) AS k
+        ),
+        updated_at = now()
+""")
+
+_LOCK_SHARED = text("SELECT pg_advisory_xact_lock_shared(hashtext(:key))")
+_LOCK_EXCLUSIVE = text("SELECT pg_advisory_xact_lock(hashtext(:key))")
+
+
+def _lock_key(survey_id: str) -> str:
+    return f"survey-stats:{survey_id}"
+
+
+def _bucket(value: Any) -> str:
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)[:BUCKET_MAX_LENGTH]
+
+
+def answer_buckets(question_type: str, value: Any) -> list[str]:
+    """Histogram keys for one answer: one per selected option or matrix cell."""
+    if question_type in _UNBUCKETED_TYPES or value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [_bucket(v) for v in value if v is not None and v != ""]
+    if isinstance(value, dict):
+        return [_bucket(f"{row}:{column}") for row, column in value.items()]
+    return [_bucket(value)]
+
+
+def _score(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+class StatsDelta:
+    """Additive survey_stats deltas for any number of responses."""
+
+    def __init__(self) -> None:
+        # question_id (None: the survey) -> [count, score_count, score_sum, score_sq_sum, Counter]
+        self.rows: dict[Optional[str], list] = {}
+
+    def _row(self, question_id: Optional[str]) -> list:
+        row = self.rows.get(question_id)
+        if row is None:
+            row = self.rows[question_id] = [0, 0, 0.0, 0.0, Counter()]
+        return row
+
+    def _add(self, row: list, score: Optional[float], buckets: Sequence[str]) -> None:
+        row[0] += 1
+        if score is not None:
+            row[1] += 1
+            row[2] += score
+            row[3] += score * score
+        row[4].update(buckets)
+
+    def add_response(
+        self,
+        question_types: dict[str, str],
+        answers: Optional[list],
+        total_score: Optional[float],
+        is_complete: bool,
+    ) -> None:
+        """
+        Count one response. Answers are {question_id, value, score} dicts;
+        those for questions not in question_types are ignored.
+        """
+        self._add(self._row(None), _score(total_score), ["complete"] if is_complete else [])
+        for answer in answers or ():
+            if not isinstance(answer, dict):
+                continue
+            question_id = answer.get("question_id")
+            question_type = question_types.get(question_id) if isinstance(question_id, str) else None
+            if question_type is None:
+                continue
+            value, score = answer.get("value"), _score(answer.get("score"))
+            buckets = answer_buckets(question_type, value)
+            if not buckets and score is None and value in (None, ""):
+                continue  # skipped question
+            self._add(self._row(question_id), score, buckets)
+
+    def as_rows(self) -> list[dict]:
+        return [
+            {
+                "question_id": question_id,
+                "count": count,
+                "score_count": score_count,
+                "score_sum": score_sum,
+                "score_sq_sum": score_sq_sum,
+                "value_counts": dict(buckets),
+            }
+            for question_id, (count, score_count, score_sum, score_sq_sum, buckets)
+            in self.rows.items()
+        ]
+
+
+async def _add_stats(
+    db: AsyncSession, organization_id: str, survey_id: str, delta: StatsDelta
+) -> None:
+    if delta.rows:
+        await db.execute(_ADD_STATS, {
+            "org_id": organization_id,
+            "survey_id": survey_id,
+            "rows": json.dumps(delta.as_rows()),
+        })
+
+
+async def record_response(
+    db: AsyncSession, survey: Survey, response: SurveyResponse
+) -> None:
+    """Add a new response to its survey's stats, in the caller's transaction."""
+    await db.execute(_LOCK_SHARED, {"key": _lock_key(survey.id)})
+    delta = StatsDelta()
+    delta.add_response(
+        {q.id: q.question_type for q in survey.questions},
+        response.answers, response.total_score, response.is_complete,
+    )
+    await _add_stats(db, survey.organization_id, survey.id, delta)
+
+
+async def rebuild_survey_stats(
+    db: AsyncSession,
+    organization_id: str,
+    survey: Survey,
+    batch_size: int = REBUILD_BATCH_SIZE,
+) -> int:
+    """
+    Recompute a survey's stats from its responses, in the caller's
+    transaction. Submissions to the survey wait until it commits.
+
+    Returns the number of responses read.
+    """
+    await db.execute(_LOCK_EXCLUSIVE, {"key": _lock_key(survey.id)})
+    question_types = {q.id: q.question_type for q in survey.questions}
+    delta = StatsDelta()
+    read, last_id = 0, None
+    while True:
+        query = (
+            select(
+                SurveyResponse.id, SurveyResponse.answers,
+                SurveyResponse.total_score, SurveyResponse.is_complete,
+            )
+            .where(
+                SurveyResponse.organization_id == organization_id,
+                SurveyResponse.survey_id == survey.id,
+            )
+            .order_by(SurveyResponse.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            query = query.where(SurveyResponse.id > last_id)
+        rows = (await db.execute(query)).all()
+        for row in rows:
+            delta.add_response(question_types, row.answers, row.total_score, bool(row.is_complete))
+        read += len(rows)
+        if len(rows) < batch_size:
+            break
+        last_id = rows[-1].id
+
+    await db.execute(
+        delete(SurveyStats).where(
+            SurveyStats.organization_id == organization_id,
+            SurveyStats.survey_id == survey.id,
+        )
+    )
+    await _add_stats(db, organization_id, survey.id, delta)
+    return read
+
+
+def score_summary(count: int, total: float, sq_total: float) -> tuple[Optional[float], Optional[float]]:
+    """(mean, population standard deviation) from running sums."""
+    if not count:
+        return None, None
+    mean = total / count
+    variance = max(sq_total / count - mean * mean, 0.0)
+    return round(mean, 4), round(math.sqrt(variance), 4)
+
+
+# ── Background jobs ─────────────────────────────────────
+
+
+def _job_key(organization_id: str, job_id: str) -> str:
+    return f"survey-stats-rebuild:{organization_id}:{job_id}"
+
+
+async def create_rebuild_job(organization_id: str) -> dict:
+    """Register a pending job and return its initial state."""
+    job_id = str(uuid4())
+    job = {
+        "job_id": job_id,
+        "status": "pending",
+        "total": 0,
+        "processed": 0,
+        "responses": 0,
+        "errors": [],
+        "started_at": None,
+        "finished_at": None,
+    }
+    await get_cache_provider().set(
+        _job_key(organization_id, job_id), job, ttl=REBUILD_JOB_TTL
+    )
+    return job
+
+
+async def get_rebuild_job(organization_id: str, job_id: str) -> Optional[dict]:
+    """Fetch job state, or None if unknown or expired."""
+    return await get_cache_provider().get(_job_key(organization_id, job_id))
+
+
+async def run_rebuild_job(
+    job: dict,
+    organization_id: str,
+    survey_ids: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Rebuild the stats of the given surveys (default: all of the tenant's),
+    committing after each survey and publishing progress.
+
+    Opens its own session so it can outlive the request that started it.
+    """
+    cache = get_cache_provider()
+    key = _job_key(organization_id, job["job_id"])
+    job.update(status="running", started_at=datetime.now(timezone.utc).isoformat())
+
+    try:
+        async with async_session_factory() as db:
+            await apply_tenant_context(db, organization_id)
+
+            query = select(Survey.id).where(Survey.organization_id == organization_id)
+            if survey_ids is not None:
+                query = query.where(Survey.id.in_(survey_ids))
+            targets = [row[0] for row in (await db.execute(query.order_by(Survey.created_at)))]
+
+            job["total"] = len(targets)
+            await cache.set(key, job, ttl=REBUILD_JOB_TTL)
+
+            for survey_id in targets:
+                survey = await db.get(Survey, survey_id)
+                if survey is not None:
+                    job["responses"] += await rebuild_survey_stats(db, organization_id, survey)
+                    await db.commit()
+                    db.expunge_all()
+
+                job["processed"] += 1
+                await cache.set(key, job, ttl=REBUILD_JOB_TTL)
+
+        job["status"] = "completed"
+    except Exception as e:
+        job["status"] = "failed"
+        job["errors"].append(str(e))
+
+    job["finished_at"] = datetime.now(timezone.utc).isoformat()
+    await cache.set(key, job, ttl=REBUILD_JOB_TTL)
@@ -0,0 +1,92 @@
+"""
+Per-tenant tree snapshot cache.
+
+Serves the process and portfolio trees as pre-encoded JSON held in the
+configured CacheProvider, so canvas opens skip the row load, tree build and
+serialization entirely.
+
+Each (tree, organization) pair has a version counter. Snapshots are stored
+under the version that was current *before* the rows were read, and writers
+bump the version after their transaction commits, so a build that raced a
+write is never served.
+"""
+
+import hashlib
+from typing import Awaitable, Callable, NamedTuple
+
+from fastapi import Request, Response
+
+from src.core.providers.cache import get_cache_provider
+
+PROCESS_TREE = "processes"
+PORTFOLIO_TREE = "portfolio"
+
+# Snapshots of superseded versions simply age out
+TREE_CACHE_TTL = 3600
+
+# ETag is a fixed-width hex digest prefixed onto the cached payload
+_ETAG_LENGTH = 32
+
+
+class TreeSnapshot(NamedTuple):
+    """Pre-encoded tree payload with its ETag."""
+    etag: str
+    payload: bytes
+
+
+def _version_key(tree: str, organization_id: str) -> str:
+    return f"tree:{tree}:{organization_id}:version"
+
+
+def _snapshot_key(tree: str, organization_id: str, version: int) -> str:
+    return f"tree:{tree}:{organization_id}:v{version}"
+
+
+async def get_tree_snapshot(
+    tree: str,
+    organization_id: str,
+    build: Callable[[], Awaitable[bytes]],
+) -> TreeSnapshot:
+    """
+    Return the cached snapshot for a tenant's tree, building it on a miss.
+
+    Args:
+        tree: Tree name (PROCESS_TREE or PORTFOLIO_TREE)
+        organization_id: Tenant the tree belongs to
+        build: Coroutine factory returning the JSON-encoded tree
+    """
+    cache = get_cache_provider()
+    version = int(await cache.get(_version_key(tree, organization_id)) or 0)
+    key = _snapshot_key(tree, organization_id, version)
+
+    cached = await cache.get_bytes(key)
+    if cached:
+        return TreeSnapshot(cached[:_ETAG_LENGTH].decode(), cached[_ETAG_LENGTH:])
+
+    payload = await build()
+    etag = hashlib.blake2b(payload, digest_size=_ETAG_LENGTH // 2).hexdigest()
+    await cache.set_bytes(key, etag.encode() + payload, ttl=TREE_CACHE_TTL)
+    return TreeSnapshot(etag, payload)
+
+
+async def invalidate_tree(tree: str, organization_id: str) -> None:
+    """Retire the current snapshot. Call after the write has committed."""
+    await get_cache_provider().incr(_version_key(tree, organization_id))
+
+
+def snapshot_response(request: Request, snapshot: TreeSnapshot) -> Response:
+    """Serve a snapshot, answering 304 when the client already holds it."""
+    etag = f'"{snapshot.etag}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=snapshot.payload,
+        media_type="application/json",
+        headers=headers,
+    )
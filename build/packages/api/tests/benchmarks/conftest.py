@@ -0,0 +1,191 @@
+"""
+Fixtures for the performance benchmark suite.
+
+Benchmarks only run when BENCH_SCALE names a scale from seed.SCALES
+(small, medium, large); otherwise they are skipped so the regular test run
+is unaffected. They need a PostgreSQL database migrated to head: the schema
+relies on RLS, JSONB, enum types and triggers, so there is no SQLite
+stand-in. A throwaway pgserver or docker instance is enough:
+
+    DATABASE_URL=postgresql+asyncpg://... BENCH_SCALE=medium pytest tests/benchmarks
+
+Environment:
+    BENCH_SCALE    tenant size to benchmark against
+    BENCH_ROUNDS   timed rounds per benchmark after one warm-up (default 5)
+    BENCH_OUTPUT   results file (default bench-results-<scale>.json)
+    BENCH_RESEED   set to 1 to drop and re-seed the bench-<scale> tenant
+
+Results are written as JSON when the session ends; compare two runs with
+python -m scripts.bench_compare old.json new.json.
+"""
+
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional, Union
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import text
+
+from src.core.auth import create_access_token
+from src.core.database import async_session_factory
+from src.main import app
+
+from .seed import SCALES, BenchTenant, drop_tenant, find_tenant, seed_tenant, tenant_sizes
+
+BENCH_SCALE = os.environ.get("BENCH_SCALE", "")
+BENCH_ROUNDS = int(os.environ.get("BENCH_ROUNDS", "5"))
+BENCH_OUTPUT = os.environ.get("BENCH_OUTPUT") or f"bench-results-{BENCH_SCALE}.json"
+
+_BENCH_DIR = os.path.dirname(__file__)
+
+# Filled by the bench fixture, written by pytest_sessionfinish
+_results: dict[str, dict[str, Any]] = {}
+_meta: dict[str, Any] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless BENCH_SCALE is set."""
+    if BENCH_SCALE and BENCH_SCALE not in SCALES:
+        raise pytest.UsageError(f"BENCH_SCALE must be one of {', '.join(SCALES)}")
+    skip = pytest.mark.skip(reason="set BENCH_SCALE to run benchmarks")
+    for item in items:
+        if not BENCH_SCALE and str(item.path).startswith(_BENCH_DIR):
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+    with open(BENCH_OUTPUT, "w") as f:
+        json.dump({"meta": _meta, "results": _results}, f, indent=2, sort_keys=True)
+    print(f"\nBenchmark results written to {BENCH_OUTPUT}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=_BENCH_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _query_count(response: Response) -> Optional[int]:
+    """SQL statements the request ran, from the Server-Timing db entry."""
+    for entry in response.headers.get("server-timing", "").split(","):
+        name, _, params = entry.strip().partition(";")
+        if name == "db" and 'desc="' in params:
+            return int(params.split('desc="')[1].split()[0])
+    return None
+
+
+class BenchRecorder:
+    """Times a callable over BENCH_ROUNDS rounds after one warm-up run."""
+
+    def __init__(self, rounds: int):
+        self.rounds = rounds
+
+    async def __call__(
+        self,
+        name: str,
+        run: Callable[[], Union[Any, Awaitable[Any]]],
+        setup: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> dict[str, Any]:
+        """
+        Record timings for `run` under `name`.
+
+        Args:
+            name: Unique benchmark name (the key in the results file)
+            run: Sync or async callable being measured
+            setup: Untimed coroutine factory run before every round,
+                e.g. to invalidate a cache
+        """
+        samples, cpu_samples = [], []
+        result = None
+        for round_ in range(self.rounds + 1):
+            if setup is not None:
+                await setup()
+            start, cpu_start = time.perf_counter(), time.process_time()
+            result = run()
+            if inspect.isawaitable(result):
+                result = await result
+            if round_:
+                samples.append((time.perf_counter() - start) * 1000)
+                cpu_samples.append((time.process_time() - cpu_start) * 1000)
+
+        samples.sort()
+        stats: dict[str, Any] = {
+            "rounds": len(samples),
+            "min_ms": round(samples[0], 3),
+            "median_ms": round(statistics.median(samples), 3),
+            "mean_ms": round(statistics.fmean(samples), 3),
+            "max_ms": round(samples[-1], 3),
+            # CPU of this process only; the database's own work is not included
+            "cpu_median_ms": round(statistics.median(cpu_samples), 3),
+        }
+        if isinstance(result, Response):
+            stats["status"] = result.status_code
+            stats["bytes"] = len(result.content)
+            stats["queries"] = _query_count(result)
+        _results[name] = stats
+        return stats
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bench_tenant() -> BenchTenant:
+    """The seeded bench-<scale> tenant, created on first use and then reused."""
+    async with async_session_factory() as db:
+        tenant = await find_tenant(db, BENCH_SCALE)
+        if tenant and os.environ.get("BENCH_RESEED") == "1":
+            await drop_tenant(db, tenant)
+            await db.commit()
+            tenant = None
+        if tenant is None:
+            start = time.perf_counter()
+            tenant = await seed_tenant(db, BENCH_SCALE)
+            await db.commit()
+            print(f"\nSeeded bench-{BENCH_SCALE} in {time.perf_counter() - start:.1f}s")
+
+    async with async_session_factory() as db:
+        _meta.update({
+            "scale": BENCH_SCALE,
+            "sizes": await tenant_sizes(db, tenant.organization_id),
+            "rounds": BENCH_ROUNDS,
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "postgres": (await db.execute(text("SHOW server_version"))).scalar(),
+        })
+    return tenant
+
+
+@pytest.fixture(scope="session")
+def bench() -> BenchRecorder:
+    return BenchRecorder(BENCH_ROUNDS)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bench_client(bench_tenant: BenchTenant) -> AsyncGenerator[AsyncClient, None]:
+    """API client authenticated as the bench tenant's admin."""
+    token = create_access_token(
+        user_id=bench_tenant.user_id,
+        organization_id=bench_tenant.organization_id,
+        role="admin",
+        email=bench_tenant.email,
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=None,
+    ) as ac:
+        yield ac
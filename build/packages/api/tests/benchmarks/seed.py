@@ -0,0 +1,236 @@
+"""
+Synthetic tenants for the benchmark suite.
+
+A tenant holds a process forest (8 roots, 6 children per node, levels L0-L5),
+issues spread over those processes, RIADA items and a RIADA link graph with
+a few heavily linked hubs. Data comes from a fixed random seed, so every run
+at a scale sees the same shape.
+
+Tenants are named bench-<scale> and kept after a run: seeding the larger
+scales takes minutes (the issue triggers run per row), and comparing
+commits is only meaningful on identical data.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.tenancy import apply_tenant_context
+from src.models.issue_log import IssueLog
+from src.models.organization import Organization, User, UserOrganization
+from src.models.process import Process
+from src.models.riada import RiadaItem, RiadaLink, RiadaLinkType
+
+# Root processes and children per process in the synthetic hierarchy
+ROOTS = 8
+FANOUT = 6
+
+# Rows per INSERT when seeding
+SEED_CHUNK = 2000
+
+WORDS = (
+    "vendor", "quote", "brief", "invoice", "contract", "supplier", "client",
+    "review", "approval", "payment", "onboarding", "forecast", "audit",
+    "delivery", "schedule", "budget", "compliance", "report", "intake",
+    "reconciliation", "planning", "sourcing", "tender", "claim",
+)
+
+# Plain SQL: the ORM would send the rag_* columns as VARCHAR, not rag_status
+_INSERT_PROCESS = text("""
+    INSERT INTO processes (id, organization_id, parent_id, code, name, description, level, sort_order)
+    VALUES (:id, :organization_id, :parent_id, :code, :name, :description, :level, :sort_order)
+""")
+
+# Children first so foreign keys never block the cleanup
+_TENANT_TABLES = (
+    "issue_log_history", "issue_log", "riada_links", "riada_items",
+    "processes", "user_organizations",
+)
+
+
+class BenchScale(NamedTuple):
+    """Row counts of a synthetic tenant."""
+    processes: int
+    issues: int
+    riada_items: int
+    riada_links: int
+
+
+SCALES = {
+    "small": BenchScale(processes=1_000, issues=5_000, riada_items=1_000, riada_links=3_000),
+    "medium": BenchScale(processes=10_000, issues=100_000, riada_items=10_000, riada_links=30_000),
+    "large": BenchScale(processes=50_000, issues=100_000, riada_items=25_000, riada_links=100_000),
+}
+
+
+class BenchTenant(NamedTuple):
+    """A seeded tenant and the admin user the benchmarks act as."""
+    organization_id: str
+    user_id: str
+    email: str
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _process_rows(org: str, count: int, rng: random.Random) -> list[dict]:
+    """A complete FANOUT-ary forest in breadth-first order, with hierarchical codes."""
+    rows: list[dict] = []
+    for i in range(count):
+        parent = rows[(i - ROOTS) // FANOUT] if i >= ROOTS else None
+        position = i if parent is None else (i - ROOTS) % FANOUT
+        level = 0 if parent is None else min(int(parent["level"][1]) + 1, 5)
+        rows.append({
+            "id": str(uuid4()),
+            "organization_id": org,
+            "parent_id": parent["id"] if parent else None,
+            "code": f"{parent['code']}.{position + 1}" if parent else str(position + 1),
+            "name": f"{_phrase(rng, 2).capitalize()} {i}",
+            "description": f"Handles {_phrase(rng, 4)}",
+            "level": f"L{level}",
+            "sort_order": position,
+        })
+    return rows
+
+
+def _issue_rows(
+    org: str, user: str, processes: list[dict], count: int, rng: random.Random
+) -> list[dict]:
+    today = date.today()
+    return [
+        {
+            "id": str(uuid4()),
+            "organization_id": org,
+            "issue_number": 0,  # assigned by trg_issue_number
+            "title": f"{_phrase(rng, 3).capitalize()} issue",
+            "description": f"Observed {_phrase(rng, 6)}",
+            "issue_classification": rng.choice(("people", "process", "system", "data")),
+            "issue_criticality": rng.choices(("high", "medium", "low"), (1, 3, 4))[0],
+            "issue_complexity": rng.choice(("high", "medium", "low")),
+            "issue_status": rng.choices(
+                ("open", "in_progress", "resolved", "closed"), (4, 2, 2, 2)
+            )[0],
+            "process_id": process["id"],
+            "process_level": int(process["level"][1]),
+            "process_ref": process["code"][:20],
+            "process_name": process["name"],
+            "raised_by_id": user,
+            "created_by": user,
+            "date_raised": today - timedelta(days=rng.randrange(365)),
+        }
+        for process in (rng.choice(processes) for _ in range(count))
+    ]
+
+
+def _riada_rows(org: str, processes: list[dict], count: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "id": str(uuid4()),
+            "organization_id": org,
+            "code": f"R-{i + 1}",
+            "title": f"{_phrase(rng, 3).capitalize()} {i}",
+            "description": f"Concerns {_phrase(rng, 5)}",
+            "riada_type": rng.choice(("risk", "issue", "action", "dependency", "assumption")),
+            "category": rng.choice(("people", "process", "system", "data")),
+            "severity": rng.choice(("critical", "high", "medium", "low")),
+            "status": rng.choice(("open", "in_progress", "resolved", "closed")),
+            "process_id": rng.choice(processes)["id"],
+        }
+        for i in range(count)
+    ]
+
+
+def _link_rows(org: str, items: list[dict], count: int, rng: random.Random) -> list[dict]:
+    """Links with preferential attachment, so a few items become hubs."""
+    ids = [item["id"] for item in items]
+    targets: list[str] = []
+    seen: set[tuple[str, str]] = set()
+    link_types = [t.value for t in RiadaLinkType]
+    rows = []
+    while len(rows) < min(count, len(ids) * (len(ids) - 1)):
+        source = rng.choice(ids)
+        target = rng.choice(targets) if targets and rng.random() < 0.5 else rng.choice(ids)
+        if source == target or (source, target) in seen:
+            continue
+        seen.add((source, target))
+        targets.append(target)
+        rows.append({
+            "id": str(uuid4()),
+            "organization_id": org,
+            "source_id": source,
+            "target_id": target,
+            "link_type": rng.choice(link_types),
+        })
+    return rows
+
+
+async def _insert(db: AsyncSession, statement, rows: list[dict]) -> None:
+    for start in range(0, len(rows), SEED_CHUNK):
+        await db.execute(statement, rows[start:start + SEED_CHUNK])
+
+
+async def find_tenant(db: AsyncSession, scale: str) -> Optional[BenchTenant]:
+    row = (await db.execute(
+        select(Organization.id, User.id, User.email)
+        .join(User, User.default_organization_id == Organization.id)
+        .where(Organization.slug == f"bench-{scale}")
+    )).first()
+    return BenchTenant(*row) if row else None
+
+
+async def seed_tenant(db: AsyncSession, scale: str) -> BenchTenant:
+    """Create the bench-<scale> tenant. The caller commits."""
+    sizes = SCALES[scale]
+    rng = random.Random(f"bench-{scale}")
+    tenant = BenchTenant(str(uuid4()), str(uuid4()), f"bench-{scale}@bench.local")
+    org, user = tenant.organization_id, tenant.user_id
+
+    db.add(Organization(id=org, name=f"Benchmark ({scale})", slug=f"bench-{scale}"))
+    await db.flush()
+    db.add(User(id=user, email=tenant.email, display_name="Benchmark", default_organization_id=org))
+    await db.flush()
+    db.add(UserOrganization(user_id=user, organization_id=org, role="admin", status="active"))
+    await apply_tenant_context(db, org)
+
+    processes = _process_rows(org, sizes.processes, rng)
+    await _insert(db, _INSERT_PROCESS, processes)
+    await _insert(db, insert(IssueLog), _issue_rows(org, user, processes, sizes.issues, rng))
+    items = _riada_rows(org, processes, sizes.riada_items, rng)
+    await _insert(db, insert(RiadaItem), items)
+    await _insert(db, insert(RiadaLink), _link_rows(org, items, sizes.riada_links, rng))
+
+    for table in ("processes", "issue_log", "riada_items", "riada_links"):
+        await db.execute(text(f"ANALYZE {table}"))
+    return tenant
+
+
+async def drop_tenant(db: AsyncSession, tenant: BenchTenant) -> None:
+    """Delete a tenant and everything the suite seeded for it. The caller commits."""
+    await apply_tenant_context(db, tenant.organization_id)
+    for table in _TENANT_TABLES:
+        await db.execute(
+            text(f"DELETE FROM {table} WHERE organization_id = :org"),
+            {"org": tenant.organization_id},
+        )
+    await db.execute(text("DELETE FROM users WHERE id = :id"), {"id": tenant.user_id})
+    await db.execute(
+        text("DELETE FROM organizations WHERE id = :id"), {"id": tenant.organization_id}
+    )
+
+
+async def tenant_sizes(db: AsyncSession, organization_id: str) -> dict[str, int]:
+    """Actual row counts, recorded with the results."""
+    sizes = {}
+    for name, model in (
+        ("processes", Process), ("issues", IssueLog),
+        ("riada_items", RiadaItem), ("riada_links", RiadaLink),
+    ):
+        sizes[name] = (await db.execute(
+            select(func.count()).select_from(model).where(model.organization_id == organization_id)
+        )).scalar_one()
+    return sizes
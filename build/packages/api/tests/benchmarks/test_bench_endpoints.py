@@ -0,0 +1,87 @@
+"""
+Benchmarks for the API endpoints behind the canvas, lists, search,
+dashboards and export. Cached endpoints are measured cold: their cache
+is invalidated (untimed) before every round.
+"""
+
+import pytest
+from sqlalchemy import func, select, text
+
+from src.core.database import async_session_factory
+from src.core.tenancy import apply_tenant_context
+from src.models.riada import RiadaLink
+from src.services.result_cache import bump_data_version
+from src.services.tree_cache import PROCESS_TREE, invalidate_tree
+
+# Share the session loop with the seeded tenant and the app's engine
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# (benchmark name, path, result-cached)
+GET_ENDPOINTS = (
+    ("processes_list", "/api/v1/processes/?page_size=200", False),
+    ("processes_list_search", "/api/v1/processes/?search=vendor", False),
+    ("processes_rag_summary", "/api/v1/processes/rag-summary", True),
+    ("search", "/api/v1/search/?q=invoice&limit=50", False),
+    ("issues_list", "/api/v1/issues/?per_page=100", False),
+    ("issues_summary", "/api/v1/issues/summary", True),
+    ("issues_heatmap", "/api/v1/issues/heatmap", True),
+    ("issues_heatmap_rollup", "/api/v1/issues/heatmap?rollup=true&columnar=true", True),
+    ("riada_list", "/api/v1/riada/", False),
+    ("riada_summary", "/api/v1/riada/summary", True),
+)
+
+
+@pytest.mark.parametrize("name,path,cached", GET_ENDPOINTS, ids=[e[0] for e in GET_ENDPOINTS])
+async def test_get_endpoint(bench, bench_client, bench_tenant, name, path, cached):
+    if name == "search":
+        async with async_session_factory() as db:
+            if not (await db.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            )).scalar():
+                pytest.skip("pg_trgm extension not installed")
+
+    async def invalidate():
+        await bump_data_version(bench_tenant.organization_id)
+
+    stats = await bench(name, lambda: bench_client.get(path), setup=invalidate if cached else None)
+    assert stats["status"] == 200
+
+
+async def test_process_tree(bench, bench_client, bench_tenant):
+    """Full tree build and encode, then the cached snapshot."""
+    async def invalidate():
+        await invalidate_tree(PROCESS_TREE, bench_tenant.organization_id)
+
+    cold = await bench("processes_tree", lambda: bench_client.get("/api/v1/processes/tree"), invalidate)
+    warm = await bench("processes_tree_cached", lambda: bench_client.get("/api/v1/processes/tree"))
+    assert cold["status"] == warm["status"] == 200
+
+
+async def test_riada_links_hub(bench, bench_client, bench_tenant):
+    """Links of the most connected RIADA item in the graph."""
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, bench_tenant.organization_id)
+        hub = (await db.execute(
+            select(RiadaLink.target_id)
+            .where(RiadaLink.organization_id == bench_tenant.organization_id)
+            .group_by(RiadaLink.target_id)
+            .order_by(func.count().desc()).limit(1)
+        )).scalar_one()
+
+    stats = await bench("riada_links_hub", lambda: bench_client.get(f"/api/v1/riada/{hub}/links"))
+    assert stats["status"] == 200
+
+    impact = await bench(
+        "riada_impact_hub",
+        lambda: bench_client.get(f"/api/v1/riada/{hub}/impact?depth=5&direction=both"),
+    )
+    assert impact["status"] == 200
+
+
+async def test_issue_export(bench, bench_client):
+    """CSV export of every issue, streamed to completion."""
+    stats = await bench(
+        "issues_export_csv",
+        lambda: bench_client.post("/api/v1/issues/export", json={"format": "csv"}),
+    )
+    assert stats["status"] == 200
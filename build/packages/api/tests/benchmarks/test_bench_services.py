@@ -0,0 +1,132 @@
+"""
+Benchmarks for the in-process hot paths: tree building, renumbering and
+list serialization.
+"""
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import String, func, literal_column, select, update
+
+from src.core.database import async_session_factory
+from src.core.serialization import ListSerializer
+from src.core.tenancy import apply_tenant_context
+from src.models.process import Process
+from src.schemas.process import ProcessListResponse, ProcessResponse, ProcessTreeNode
+from src.services.process_numbering import compute_renumbering, renumber_processes
+from src.services.tree_builder import build_tree
+
+# Share the session loop with the seeded tenant and the app's engine
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _node(p: Process, children: list[ProcessTreeNode]) -> ProcessTreeNode:
+    return ProcessTreeNode(
+        id=p.id,
+        code=p.code,
+        name=p.name,
+        level=p.level,
+        process_type=p.process_type,
+        status=p.status,
+        current_automation=p.current_automation,
+        sort_order=p.sort_order,
+        children=children,
+    )
+
+
+async def test_build_tree(bench, bench_tenant):
+    """build_tree over every process, with the tree endpoint's node factory."""
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, bench_tenant.organization_id)
+        processes = (await db.execute(
+            select(Process)
+            .where(Process.organization_id == bench_tenant.organization_id)
+            .order_by(Process.level, Process.sort_order)
+        )).scalars().all()
+
+    stats = await bench("build_tree", lambda: build_tree(list(processes), _node))
+    assert stats["rounds"]
+
+
+async def test_compute_renumbering(bench, bench_tenant):
+    """In-memory renumbering of the whole hierarchy (no changes to write)."""
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, bench_tenant.organization_id)
+        rows = (await db.execute(
+            select(Process.id, Process.parent_id, Process.code, Process.sort_order, Process.status)
+            .where(Process.organization_id == bench_tenant.organization_id)
+            .order_by(Process.sort_order, Process.created_at)
+        )).all()
+
+    await bench("compute_renumbering", lambda: compute_renumbering(rows))
+    assert compute_renumbering(rows) == {}
+
+
+async def test_renumber_subtree(bench, bench_tenant):
+    """renumber_processes restoring every code under one root (rolled back)."""
+    org = bench_tenant.organization_id
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, org)
+        root = (await db.execute(
+            select(Process.id, Process.code)
+            .where(Process.organization_id == org, Process.parent_id.is_(None))
+            .order_by(Process.sort_order)
+        )).first()
+
+        async def scramble_codes():
+            # Codes are unique per tenant, so move them aside rather than swap them
+            await db.rollback()
+            await db.execute(
+                update(Process)
+                .where(Process.organization_id == org, Process.code.like(f"{root.code}.%"))
+                .values(code=func.left(func.cast(Process.id, String), 20))
+            )
+
+        changed: set[str] = set()
+
+        async def renumber():
+            changed.update(await renumber_processes(db, org, [root.id]))
+
+        await bench("renumber_processes_subtree", renumber, setup=scramble_codes)
+        await db.rollback()
+
+    assert changed
+
+
+async def test_list_serialization(bench, bench_tenant):
+    """
+    A 200-row process page: ORM rows validated per item and again against
+    response_model (the old list path) vs the column-only ListSerializer.
+    Compare cpu_median_ms of the two entries.
+    """
+    org = bench_tenant.organization_id
+    order = (Process.level, Process.sort_order, Process.code, Process.id)
+    page_adapter = TypeAdapter(ProcessListResponse)
+    serializer = ListSerializer(ProcessListResponse)
+    entities = select(Process).where(Process.organization_id == org).order_by(*order).limit(200)
+    columns = (
+        serializer.select(Process, rag_overall=literal_column("processes.rag_overall", String))
+        .where(Process.organization_id == org)
+        .order_by(*order)
+        .limit(200)
+    )
+
+    async with async_session_factory() as db:
+        await apply_tenant_context(db, org)
+
+        async def orm_path() -> bytes:
+            db.expunge_all()  # a request starts with an empty identity map
+            rows = (await db.execute(entities)).scalars().all()
+            page = ProcessListResponse(
+                items=[ProcessResponse.model_validate(p) for p in rows], per_page=200
+            )
+            return page_adapter.dump_json(page_adapter.validate_python(page))
+
+        async def column_path() -> bytes:
+            rows = (await db.execute(columns)).all()
+            return serializer.response(rows, page=1, per_page=200).body
+
+        before = await bench("list_serialization_orm", orm_path)
+        after = await bench("list_serialization_columns", column_path)
+        assert await orm_path() == await column_path()
+
+    assert before["rounds"] and after["rounds"]
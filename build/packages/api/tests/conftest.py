@@ -13,6 +13,8 @@ import os
 # Set test environment before app/settings are imported.
 # This disables rate limiting middleware and decorator checks.
 os.environ["ENVIRONMENT"] = "test"
+# Warn when an endpoint exceeds its SQL budget or repeats a statement (N+1).
+os.environ.setdefault("SQL_WARNINGS", "true")
 
 from typing import AsyncGenerator
 from uuid import uuid4
@@ -0,0 +1,117 @@
+"""
+Unit tests for the batched audit pipeline.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from src.core.audit import AuditEvent
+from src.core.audit_pipeline import AuditPipeline, DatabaseSink, FileSink, audit_pipeline
+from src.core.database import async_session_factory
+from src.core.tenancy import apply_tenant_context
+from src.models.organization import AuditLog
+
+
+def _event(n: int, **extra) -> dict:
+    return {
+        "event_id": str(uuid.uuid4()),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "event_type": AuditEvent.LOGIN_SUCCESS,
+        "details": {"n": n},
+        **extra,
+    }
+
+
+class TestAuditPipeline:
+    """Test batching, back-pressure and shutdown flushing."""
+
+    @pytest.mark.asyncio
+    async def test_batches_to_json_lines(self, tmp_path):
+        """Queued events are written as JSON lines in batches, all of them on stop."""
+        path = tmp_path / "audit.log"
+        pipeline = AuditPipeline(
+            [FileSink(str(path), 1_000_000, 1)], queue_size=100, batch_size=3, flush_interval=0.01
+        )
+        for n in range(7):
+            pipeline.submit(_event(n))
+        await pipeline.stop()
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["details"]["n"] for line in lines] == list(range(7))
+        metrics = pipeline.metrics()
+        assert (metrics["written"], metrics["batches"], metrics["dropped"]) == (7, 3, 0)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self, tmp_path):
+        """Submitting never blocks: events beyond the queue bound are dropped."""
+        pipeline = AuditPipeline(
+            [FileSink(str(tmp_path / "audit.log"), 1_000_000, 1)],
+            queue_size=2, batch_size=10, flush_interval=0.01,
+        )
+        for n in range(5):
+            pipeline.submit(_event(n))
+
+        metrics = pipeline.metrics()
+        assert (metrics["queue_depth"], metrics["high_water"], metrics["dropped"]) == (2, 2, 3)
+        await pipeline.stop()
+        assert pipeline.metrics()["written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_database_sink(self, client: AsyncClient, headers):
+        """Events with an organization become audit_logs rows."""
+        me = (await client.get("/api/v1/auth/me", headers=headers)).json()
+        org = me["default_organization_id"]
+        event = _event(1, organization_id=org, user_id=me["id"], resource_id="not-a-uuid")
+        anonymous = _event(2, event_type=AuditEvent.SUSPICIOUS_ACTIVITY)
+
+        await DatabaseSink().write([event, anonymous])
+
+        async with async_session_factory() as db:
+            await apply_tenant_context(db, org)
+            row = (await db.execute(
+                select(AuditLog).where(AuditLog.id == event["event_id"])
+            )).scalar_one()
+            assert (row.event_type, row.action, row.entity_id) == (
+                "login_success", "login_success", None
+            )
+            assert row.details == {"n": 1, "resource_id": "not-a-uuid"}
+
+    @pytest.mark.asyncio
+    async def test_failed_organization_is_counted_per_sink(
+        self, client: AsyncClient, headers, tmp_path
+    ):
+        """An organization whose insert fails does not cost the others or the file copy."""
+        me = (await client.get("/api/v1/auth/me", headers=headers)).json()
+        org = me["default_organization_id"]
+        good = _event(1, organization_id=org)
+        orphan = _event(2, organization_id=str(uuid.uuid4()))  # no such organization
+
+        path = tmp_path / "audit.log"
+        pipeline = AuditPipeline(
+            [FileSink(str(path), 1_000_000, 1), DatabaseSink()],
+            queue_size=10, batch_size=10, flush_interval=0.01,
+        )
+        pipeline.submit(orphan)
+        pipeline.submit(good)
+        await pipeline.stop()
+
+        metrics = pipeline.metrics()
+        assert metrics["failed"] == {"file": 0, "db": 1}
+        assert metrics["written"] == 1
+        assert len(path.read_text().splitlines()) == 2
+        async with async_session_factory() as db:
+            await apply_tenant_context(db, org)
+            written = await db.get(AuditLog, good["event_id"])
+            assert written is not None
+
+    @pytest.mark.asyncio
+    async def test_login_is_audited(self, client: AsyncClient):
+        """dev-login queues a login_success event."""
+        submitted = audit_pipeline.metrics()["submitted"]
+        await client.post("/api/v1/auth/dev-login")
+        assert audit_pipeline.metrics()["submitted"] == submitted + 1
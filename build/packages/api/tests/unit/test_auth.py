@@ -2,10 +2,27 @@
 Unit tests for authentication flow.
 """
 
+import time
+
 import pytest
 from httpx import AsyncClient
 
-from src.core.auth import create_access_token, decode_token, verify_magic_link_token, create_magic_link_token
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+from starlette.requests import Request
+
+from src.config import settings
+from src.core.auth import (
+    ALGORITHM,
+    CurrentUser,
+    VerifiedTokenCache,
+    create_access_token,
+    create_magic_link_token,
+    decode_token,
+    get_current_user,
+    token_cache,
+    verify_magic_link_token,
+)
 
 
 class TestMagicLinkTokens:
@@ -76,6 +93,48 @@ class TestJWT:
         assert exc.value.status_code == 401
 
 
+class TestVerifiedTokenCache:
+    """Test the verified-token LRU."""
+
+    def test_hit_until_expiry(self):
+        """Cached users are returned until the token's exp passes."""
+        cache = VerifiedTokenCache(maxsize=4)
+        user = CurrentUser("u", "o", "admin", "a@example.com")
+
+        cache.put("tok", user, time.time() + 60)
+        assert cache.get("tok") is user
+
+        cache.put("old", user, time.time() - 1)
+        assert cache.get("old") is None
+
+    def test_bounded_lru(self):
+        """The least recently used token is evicted beyond maxsize."""
+        cache = VerifiedTokenCache(maxsize=2)
+        user = CurrentUser("u", "o", "admin", "a@example.com")
+        expires = time.time() + 60
+
+        cache.put("a", user, expires)
+        cache.put("b", user, expires)
+        cache.get("a")
+        cache.put("c", user, expires)
+
+        assert cache.get("a") is user
+        assert cache.get("b") is None
+        assert cache.get("c") is user
+
+    @pytest.mark.asyncio
+    async def test_token_without_exp_is_not_cached(self):
+        """A token with no exp claim is accepted but verified every time."""
+        token = jwt.encode(
+            {"sub": "u", "org": "o", "type": "access"}, settings.SECRET_KEY, algorithm=ALGORITHM
+        )
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        user = await get_current_user(Request({"type": "http"}), credentials)
+        assert (user.id, user.organization_id) == ("u", "o")
+        assert token_cache.get(token) is None
+
+
 @pytest.mark.asyncio
 class TestAuthEndpoints:
     """Test authentication API endpoints."""
@@ -0,0 +1,157 @@
+"""
+Unit tests for background email delivery.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.email import ConsoleEmailProvider
+from src.services.email_queue import EmailMessage, EmailQueue
+
+
+class LatencyEmailProvider(ConsoleEmailProvider):
+    """Console provider behind a blocking, SDK-like call that can be made to fail."""
+
+    def __init__(self, latency: float = 0.0, failures: int = 0):
+        self.latency = latency
+        self.failures = failures
+        self.calls: list[list[str]] = []
+
+    def _send_blocking(self, to_emails: list[str]) -> bool:
+        time.sleep(self.latency)
+        self.calls.append(list(to_emails))
+        if self.failures:
+            self.failures -= 1
+            return False
+        return True
+
+    async def send_magic_link(self, to_email: str, magic_link_url: str) -> bool:
+        if not await asyncio.to_thread(self._send_blocking, [to_email]):
+            return False
+        return await super().send_magic_link(to_email, magic_link_url)
+
+    async def send_notifications(self, to_emails, subject, body_html) -> list[str]:
+        sent = await asyncio.to_thread(self._send_blocking, to_emails)
+        return [] if sent else list(to_emails)
+
+
+def _queue(provider, tmp_path, **overrides) -> EmailQueue:
+    options = dict(
+        workers=4, queue_size=100, max_attempts=3,
+        retry_base_delay=0.01, retry_max_delay=0.05, spool_dir=str(tmp_path / "spool"),
+    )
+    options.update(overrides)
+    return EmailQueue(provider, **options)
+
+
+def _magic_link(n: int, **extra) -> EmailMessage:
+    return EmailMessage(kind="magic_link", to=[f"user{n}@test.local"], body=f"https://x/{n}", **extra)
+
+
+def _notification(n: int) -> EmailMessage:
+    return EmailMessage(kind="notification", to=[f"user{n}@test.local"], subject="Hi", body="<p>Hi</p>")
+
+
+class TestEmailQueue:
+    """Test off-loop delivery, retries, batching and the restart spool."""
+
+    @pytest.mark.asyncio
+    async def test_slow_provider_does_not_block_the_loop(self, tmp_path):
+        """Four 200ms sends run in parallel workers while the loop stays responsive."""
+        provider = LatencyEmailProvider(latency=0.2)
+        queue = _queue(provider, tmp_path)
+
+        start = time.perf_counter()
+        for n in range(4):
+            await queue.submit(_magic_link(n))
+        assert time.perf_counter() - start < 0.05
+
+        tick = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - tick < 0.1
+
+        await queue.join()
+        assert time.perf_counter() - start < 0.6
+        assert queue.metrics()["sent"] == 4
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff_then_gives_up(self, tmp_path):
+        provider = LatencyEmailProvider(failures=2)
+        queue = _queue(provider, tmp_path)
+        await queue.submit(_magic_link(1))
+        await asyncio.sleep(0.2)
+        metrics = queue.metrics()
+        assert (metrics["sent"], metrics["retried"], metrics["failed"]) == (1, 2, 0)
+
+        provider.failures = 10
+        await queue.submit(_magic_link(2))
+        await asyncio.sleep(0.2)
+        assert queue.metrics()["failed"] == 1
+        assert len(provider.calls) == 3 + 3
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_expired_messages_are_dropped(self, tmp_path):
+        provider = LatencyEmailProvider()
+        queue = _queue(provider, tmp_path)
+        await queue.submit(_magic_link(1, expires_at=time.time() - 1))
+        await queue.join()
+        assert provider.calls == [] and queue.metrics()["expired"] == 1
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_notification_fan_out_is_batched(self, tmp_path, monkeypatch):
+        from src.services import email, email_queue
+
+        provider = LatencyEmailProvider()
+        queue = _queue(provider, tmp_path, workers=1)
+        monkeypatch.setattr(email_queue, "email_queue", queue)
+        monkeypatch.setattr(email.settings, "EMAIL_BATCH_SIZE", 100)
+
+        recipients = [f"user{n}@test.local" for n in range(250)]
+        assert await email.send_notification_emails(recipients, "Review due", "<p>Hi</p>") == 3
+        await queue.join()
+        assert [len(batch) for batch in provider.calls] == [100, 100, 50]
+        assert sorted(sum(provider.calls, [])) == sorted(recipients)
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_without_waiting(self, tmp_path):
+        queue = _queue(LatencyEmailProvider(latency=0.2), tmp_path, workers=1, queue_size=1)
+        assert await queue.submit(_magic_link(1))
+        await asyncio.sleep(0.01)  # the worker takes the first message
+        assert await queue.submit(_magic_link(2))
+        assert not await queue.submit(_magic_link(3))
+        assert queue.metrics()["dropped"] == 1
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_undelivered_messages_survive_a_restart(self, tmp_path):
+        """Notifications waiting to retry at shutdown are spooled and sent by the next start."""
+        failing = _queue(LatencyEmailProvider(failures=100), tmp_path, retry_base_delay=60)
+        for n in range(3):
+            await failing.submit(_notification(n))
+        await failing.submit(_magic_link(9))
+        await failing.join()
+        assert failing.metrics()["retrying"] == 4
+        await failing.stop()
+        assert (failing.metrics()["spooled"], failing.metrics()["dropped"]) == (3, 1)
+
+        [spool] = (tmp_path / "spool").iterdir()
+        assert spool.stat().st_mode & 0o777 == 0o600
+        assert "https://x/9" not in spool.read_text()
+        with spool.open("a") as f:
+            f.write("not json\n")
+
+        provider = LatencyEmailProvider()
+        restarted = _queue(provider, tmp_path)
+        restarted.start()
+        await asyncio.sleep(0.05)
+        await restarted.join()
+        assert sorted(call[0] for call in provider.calls) == [f"user{n}@test.local" for n in range(3)]
+        assert restarted.metrics()["restored"] == 3
+        assert list((tmp_path / "spool").iterdir()) == []
+        await restarted.stop()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the in-memory heatmap rollup.
+"""
+
+from collections import namedtuple
+
+from src.services.heatmap import build_heatmap
+
+Row = namedtuple(
+    "Row",
+    "process_id process_ref process_name level parent_id "
+    "people_count process_count system_count data_count "
+    "people_colour process_colour system_colour data_colour",
+)
+
+
+def _row(pid, parent, people=0, data=0, people_colour="neutral", data_colour="neutral"):
+    return Row(
+        pid, pid, pid, "L1", parent,
+        people, 0, 0, data,
+        people_colour, "neutral", "neutral", data_colour,
+    )
+
+
+def _rows():
+    return [
+        _row("1", None),
+        _row("1.1", "1", data=1, data_colour="amber"),
+        _row("1.1.1", "1.1", people=2, people_colour="red"),
+        _row("2", None),
+    ]
+
+
+class TestBuildHeatmap:
+    """Test direct and rolled-up columnar heatmaps."""
+
+    def test_direct_counts(self):
+        heatmap = build_heatmap(_rows(), rollup=False)
+
+        assert heatmap.total_issues == [0, 1, 2, 0]
+        assert heatmap.overall_colour == ["neutral", "amber", "red", "neutral"]
+
+    def test_rollup_adds_descendants(self):
+        heatmap = build_heatmap(_rows(), rollup=True)
+
+        assert heatmap.people_count == [2, 2, 2, 0]
+        assert heatmap.data_count == [1, 1, 0, 0]
+        assert heatmap.people_colour == ["red", "red", "red", "neutral"]
+        assert heatmap.overall_colour == ["red", "red", "red", "neutral"]
+
+    def test_missing_parent_is_a_root(self):
+        """Children of archived (absent) processes stop the rollup there."""
+        rows = [_row("1.1", "1", data=1, data_colour="amber")]
+
+        heatmap = build_heatmap(rows, rollup=True)
+
+        assert heatmap.data_count == [1]
+        assert heatmap.parent_id == ["1"]
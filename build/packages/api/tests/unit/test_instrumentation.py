@@ -0,0 +1,61 @@
+"""
+Unit tests for request instrumentation (Server-Timing, /metrics, SQL warnings).
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.instrumentation import QueryBudgetWarning, _route_template, statement_shape
+
+
+def test_statement_shape_collapses_parameters():
+    """Statements differing only in bound values share one shape."""
+    a = statement_shape("SELECT * FROM processes WHERE id = $1::UUID AND level IN ($2, $3)")
+    b = statement_shape("SELECT *  FROM processes\n WHERE id = $7::UUID AND level IN ($8)")
+    assert a == b == "SELECT * FROM processes WHERE id = ? AND level IN (?)"
+
+
+def test_route_template_falls_back_to_route_path():
+    """Without FastAPI's effective route context the matched route's path is used."""
+    class Route:
+        path = "/api/v1/issues/{issue_id}"
+
+    assert _route_template({"route": Route()}) == "/api/v1/issues/{issue_id}"
+    assert _route_template({}) == "unmatched"
+
+
+class TestInstrumentation:
+    """Test the per-request timings and the aggregated metrics."""
+
+    @pytest.mark.asyncio
+    async def test_server_timing_and_metrics(self, client: AsyncClient, headers):
+        """API responses carry Server-Timing and are counted per route template."""
+        response = await client.get("/api/v1/processes/", headers=headers)
+        timing = response.headers["server-timing"]
+        assert "db;dur=" in timing and "queries" in timing and "total;dur=" in timing
+
+        body = (await client.get("/metrics")).text
+        assert 'http_requests_total{method="GET",route="/api/v1/processes/",status="200"}' in body
+        assert 'db_queries_total{method="GET",route="/api/v1/processes/"}' in body
+        assert "audit_queue_depth" in body
+
+    @pytest.mark.asyncio
+    async def test_metrics_need_a_token_outside_development(self, client: AsyncClient, monkeypatch):
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+        assert (await client.get("/metrics")).status_code == 404
+
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        assert (await client.get("/metrics")).status_code == 401
+        scraped = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert scraped.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_repeated_statement_warns(self, client: AsyncClient, headers, monkeypatch):
+        """A statement shape repeated past the threshold is reported as a likely N+1."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "SQL_REPEAT_THRESHOLD", 1)
+        with pytest.warns(QueryBudgetWarning, match="possible N\\+1"):
+            await client.get("/api/v1/processes/", headers=headers)
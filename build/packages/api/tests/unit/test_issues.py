@@ -0,0 +1,77 @@
+"""
+Unit tests for the Issue Log export.
+"""
+
+import csv
+import io
+import json
+import random
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _process_id(client: AsyncClient, headers) -> str:
+    root = str(random.randint(10_000, 99_999_999))
+    rows = [{"ref": root, "name": f"Export target {root}"}]
+    response = await client.post(
+        "/api/v1/processes/import",
+        files={"file": ("catalogue.json", json.dumps(rows), "application/json")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    listed = await client.get(f"/api/v1/processes/?search=Export target {root}", headers=headers)
+    return listed.json()["items"][0]["id"]
+
+
+class TestIssueExport:
+    """Test POST /issues/export."""
+
+    @pytest.mark.asyncio
+    async def test_csv_export_streams_rows(self, client: AsyncClient, headers):
+        """The streamed CSV carries the header and every matching issue."""
+        process_id = await _process_id(client, headers)
+        titles = [f"Export issue {n}" for n in range(3)]
+        for title in titles:
+            created = await client.post(
+                "/api/v1/issues/",
+                json={"title": title, "issue_classification": "system", "process_id": process_id},
+                headers=headers,
+            )
+            assert created.status_code == 201
+
+        response = await client.post(
+            "/api/v1/issues/export",
+            json={"format": "csv", "process_ids": [process_id]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        header, *rows = csv.reader(io.StringIO(response.text))
+        assert header[:2] == ["ID", "Title"]
+        assert [row[1] for row in rows] == titles
+        assert all(row[0].startswith("OPS-") for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_xlsx_export_streams_rows(self, client: AsyncClient, headers):
+        """The XLSX workbook has the header row followed by the issues."""
+        openpyxl = pytest.importorskip("openpyxl")
+        process_id = await _process_id(client, headers)
+        await client.post(
+            "/api/v1/issues/",
+            json={"title": "Workbook issue", "issue_classification": "system", "process_id": process_id},
+            headers=headers,
+        )
+
+        response = await client.post(
+            "/api/v1/issues/export",
+            json={"format": "xlsx", "process_ids": [process_id]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+        sheet = openpyxl.load_workbook(io.BytesIO(response.content))["Issue Log"]
+        header, *rows = sheet.iter_rows(values_only=True)
+        assert header[:2] == ("ID", "Title")
+        assert [row[1] for row in rows] == ["Workbook issue"]
@@ -0,0 +1,113 @@
+"""
+Unit tests for operating model completeness (batch and per-process summary).
+"""
+
+import json
+import random
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _import_subtree(client: AsyncClient, headers) -> dict[str, str]:
+    """Create a root with two children via the bulk import; returns code -> id."""
+    root = str(random.randint(10_000, 99_999_999))
+    rows = [
+        {"ref": root, "name": f"Completeness root {root}", "kpi": "Lead time"},
+        {"ref": f"{root}.1", "name": f"Completeness child {root}"},
+        {"ref": f"{root}.2", "name": f"Completeness child {root}"},
+    ]
+    body = json.dumps(rows)
+    response = await client.post(
+        "/api/v1/processes/import",
+        files={"file": ("catalogue.json", body, "application/json")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    listed = await client.get(
+        f"/api/v1/processes/?search=Completeness {root}&per_page=10", headers=headers
+    )
+    return {p["code"][len(root):] or "root": p["id"] for p in listed.json()["items"]}
+
+
+class TestCompleteness:
+    """Test POST /processes/operating-model/completeness."""
+
+    @pytest.mark.asyncio
+    async def test_subtree_completeness(self, client: AsyncClient, headers):
+        """A subtree is summarised root first, in display order."""
+        ids = await _import_subtree(client, headers)
+
+        response = await client.post(
+            "/api/v1/processes/operating-model/completeness",
+            json={"root_id": ids["root"]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [i["process_id"] for i in items] == [ids["root"], ids[".1"], ids[".2"]]
+        assert items[0]["defined_components"] == ["kpis"]
+        assert items[0]["completion_percentage"] == 10
+        assert items[1]["defined_components"] == []
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_summary(self, client: AsyncClient, headers):
+        """Adding a RACI entry shows up in both the batch and single summaries."""
+        ids = await _import_subtree(client, headers)
+        child = ids[".1"]
+        batch = {"process_ids": [child, ids[".2"]]}
+
+        before = await client.post(
+            "/api/v1/processes/operating-model/completeness", json=batch, headers=headers
+        )
+        assert "raci" in before.json()["items"][0]["missing_components"]
+
+        await client.post(
+            f"/api/v1/processes/{child}/operating-model/raci",
+            json={"activity": "Approve", "accountable": "COO"},
+            headers=headers,
+        )
+
+        after = await client.post(
+            "/api/v1/processes/operating-model/completeness", json=batch, headers=headers
+        )
+        assert after.json()["items"][0]["defined_components"] == ["raci"]
+        assert after.json()["items"][1]["defined_components"] == []
+
+        single = await client.get(
+            f"/api/v1/processes/{child}/operating-model/summary", headers=headers
+        )
+        assert single.json()["defined_components"] == ["raci"]
+
+    @pytest.mark.asyncio
+    async def test_write_survives_failed_invalidation(
+        self, client: AsyncClient, headers, monkeypatch
+    ):
+        """A cache outage after commit does not turn the write into a 500."""
+        from src.core.providers.cache.memory import InMemoryCacheProvider
+        from src.services import operating_model_completeness
+
+        class UnreachableCache(InMemoryCacheProvider):
+            async def incr(self, key):
+                raise ConnectionError("cache down")
+
+        ids = await _import_subtree(client, headers)
+        monkeypatch.setattr(
+            operating_model_completeness, "get_cache_provider", UnreachableCache
+        )
+
+        response = await client.post(
+            f"/api/v1/processes/{ids['root']}/operating-model/raci",
+            json={"activity": "Approve", "accountable": "COO"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    @pytest.mark.asyncio
+    async def test_requires_one_selection(self, client: AsyncClient, headers):
+        """Exactly one of process_ids or root_id must be given."""
+        response = await client.post(
+            "/api/v1/processes/operating-model/completeness", json={}, headers=headers
+        )
+        assert response.status_code == 422
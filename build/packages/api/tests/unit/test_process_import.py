@@ -0,0 +1,179 @@
+"""
+Unit tests for the bulk process catalogue import.
+"""
+
+import json
+import random
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+
+from src.core.database import async_session_factory
+from src.core.tenancy import apply_tenant_context
+from src.models.process import Process
+from src.services.process_import import Catalogue, _Node, import_catalogue, plan_import
+
+# A role without BYPASSRLS, so imports run under the tenant policies as in production
+_RLS_ROLE = "process_import_rls_test"
+
+
+def _upload(rows: list[dict], issues: list[dict] = ()) -> dict:
+    body = json.dumps({"processes": rows, "issues": list(issues)})
+    return {"file": ("catalogue.json", body, "application/json")}
+
+
+class TestPlanImport:
+    """Test hierarchy resolution without a database."""
+
+    def test_generated_codes_follow_siblings(self):
+        """Rows without a ref take the next position under their parent."""
+        catalogue = Catalogue(processes=[
+            (1, {"ref": "1.2", "name": "Child"}),
+            (2, {"ref": "1", "name": "Root"}),
+            (3, {"parent_ref": "1", "name": "Appended"}),
+        ])
+        plan = plan_import(catalogue, "org", "user", {}, {})
+
+        assert plan.errors == []
+        codes = {record[2]: record for record in plan.processes}
+        assert set(codes) == {"1", "1.2", "1.3"}
+        assert codes["1.3"][6] == codes["1"][0]  # parent_id
+        assert codes["1.3"][5] == "L1"
+
+    def test_invalid_rows_fail_their_descendants(self):
+        """A rejected parent is reported on its children too."""
+        catalogue = Catalogue(processes=[
+            (1, {"ref": "1", "name": "Root", "level": "L2"}),
+            (2, {"ref": "1.1", "name": "Orphan"}),
+        ])
+        plan = plan_import(catalogue, "org", "user", {}, {})
+
+        assert [(e.row, e.message) for e in plan.errors] == [
+            (1, "level L2 does not match ref '1'"),
+            (2, "parent '1' was not imported"),
+        ]
+
+
+    def test_non_numeric_existing_codes(self):
+        """Older codes such as L2-10 take no position and cannot parent generated codes."""
+        existing = {"L2-10": _Node("p1", "L2-10", 2, "Legacy", "primary")}
+        catalogue = Catalogue(processes=[
+            (1, {"name": "New root"}),
+            (2, {"parent_ref": "L2-10", "name": "Under legacy"}),
+        ])
+        plan = plan_import(catalogue, "org", "user", existing, {})
+
+        assert [record[2] for record in plan.processes] == ["1"]
+        assert [(e.row, e.message) for e in plan.errors] == [
+            (2, "parent 'L2-10' has no numeric code; give the row a ref"),
+        ]
+
+
+class TestImportEndpoint:
+    """Test POST /processes/import."""
+
+    @pytest.mark.asyncio
+    async def test_import_catalogue(self, client: AsyncClient, headers):
+        """Processes, RACI, KPIs and issues are imported in one request."""
+        root = str(random.randint(10_000, 99_999_999))
+        rows = [
+            {"ref": root, "level": 0, "name": f"Imported root {root}"},
+            {
+                "ref": f"{root}.1", "name": f"Imported child {root}",
+                "responsible": "Ops", "accountable": "COO", "kpi": "Cycle time",
+            },
+            {"parent_ref": f"{root}.1", "name": f"Imported grandchild {root}"},
+        ]
+        issues = [
+            {"process_ref": f"{root}.1.1", "title": "Manual rekeying",
+             "issue_classification": "process"},
+        ]
+
+        dry = await client.post(
+            "/api/v1/processes/import?dry_run=true", files=_upload(rows, issues), headers=headers
+        )
+        assert dry.status_code == 200
+        assert dry.json()["committed"] is False
+
+        response = await client.post(
+            "/api/v1/processes/import", files=_upload(rows, issues), headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["committed"] is True
+        assert (data["processes"], data["raci_entries"], data["kpis"], data["issues"]) == (
+            3, 1, 1, 1
+        )
+
+        listed = await client.get(
+            f"/api/v1/processes/?search={root}&per_page=10", headers=headers
+        )
+        codes = {p["code"] for p in listed.json()["items"]}
+        assert {root, f"{root}.1", f"{root}.1.1"} <= codes
+
+    @pytest.mark.asyncio
+    async def test_import_rejects_whole_file(self, client: AsyncClient, headers):
+        """One bad row means nothing is written."""
+        root = str(random.randint(10_000, 99_999_999))
+        rows = [
+            {"ref": root, "name": f"Would be imported {root}"},
+            {"ref": f"{root}.1.1", "name": "Missing parent"},
+        ]
+
+        response = await client.post(
+            "/api/v1/processes/import", files=_upload(rows), headers=headers
+        )
+        assert response.status_code == 422
+        data = response.json()
+        assert data["committed"] is False
+        assert data["errors"][0]["message"] == f"parent '{root}.1' not found"
+
+        listed = await client.get(f"/api/v1/processes/?search={root}", headers=headers)
+        assert all(p["code"] != root for p in listed.json()["items"])
+
+    @pytest.mark.asyncio
+    async def test_import_unsupported_format(self, client: AsyncClient, headers):
+        """Unknown file types are rejected before parsing."""
+        response = await client.post(
+            "/api/v1/processes/import",
+            files={"file": ("catalogue.txt", b"ref,name", "text/plain")},
+            headers=headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_import_under_row_level_security(self, client: AsyncClient, headers):
+        """The load goes through INSERTs a non-superuser role may run under RLS."""
+        me = (await client.get("/api/v1/auth/me", headers=headers)).json()
+        org = me["default_organization_id"]
+        root = str(random.randint(10_000, 99_999_999))
+        catalogue = Catalogue(processes=[
+            (1, {"ref": root, "name": f"RLS root {root}", "kpi": "Throughput"}),
+            (2, {"parent_ref": root, "name": f"RLS child {root}", "responsible": "Ops"}),
+        ])
+
+        async with async_session_factory() as db:
+            for statement in (
+                f"""DO $$ BEGIN
+                    IF NOT EXISTS (SELECT FROM pg_roles WHERE rolname = '{_RLS_ROLE}') THEN
+                        CREATE ROLE {_RLS_ROLE} NOLOGIN NOBYPASSRLS;
+                    END IF;
+                END $$""",
+                f"GRANT USAGE ON SCHEMA public TO {_RLS_ROLE}",
+                f"GRANT SELECT, INSERT ON ALL TABLES IN SCHEMA public TO {_RLS_ROLE}",
+                f"GRANT USAGE ON ALL SEQUENCES IN SCHEMA public TO {_RLS_ROLE}",
+            ):
+                await db.execute(text(statement))
+            await db.execute(text(f"SET LOCAL ROLE {_RLS_ROLE}"))
+            await apply_tenant_context(db, org)
+
+            result = await import_catalogue(db, org, me["id"], catalogue)
+            assert result.errors == []
+            assert (result.processes, result.kpis, result.raci_entries) == (2, 1, 1)
+            assert len(result.operating_model_process_ids) == 2
+            codes = (await db.execute(
+                select(Process.code).where(Process.code.like(f"{root}%"))
+            )).scalars().all()
+            assert sorted(codes) == [root, f"{root}.1"]
+            await db.rollback()
@@ -0,0 +1,75 @@
+"""
+Unit tests for the in-memory process renumbering engine.
+"""
+
+from collections import namedtuple
+
+from src.services.process_numbering import compute_renumbering
+
+Row = namedtuple("Row", "id parent_id code sort_order status")
+
+
+def _tree() -> list[Row]:
+    """Two roots with a small subtree, rows in sibling order."""
+    return [
+        Row("a", None, "1", 0, "active"),
+        Row("b", None, "2", 1, "active"),
+        Row("a1", "a", "1.1", 0, "active"),
+        Row("a2", "a", "1.2", 1, "active"),
+        Row("a2x", "a2", "1.2.1", 0, "active"),
+    ]
+
+
+class TestComputeRenumbering:
+    """Test code/sort_order computation over a flat hierarchy."""
+
+    def test_consistent_tree_has_no_changes(self):
+        """An already-numbered tree produces no updates."""
+        assert compute_renumbering(_tree()) == {}
+
+    def test_gap_cascades_to_descendants(self):
+        """Archiving a sibling shifts later siblings and their subtrees."""
+        rows = [r._replace(status="archived") if r.id == "a1" else r for r in _tree()]
+
+        changes = compute_renumbering(rows, ["a"])
+
+        assert changes == {
+            "a2": ("1.1", 0),
+            "a2x": ("1.1.1", 0),
+        }
+
+    def test_full_renumber_from_roots(self):
+        """None renumbers every non-archived process from the roots."""
+        rows = [r._replace(status="archived") if r.id == "a" else r for r in _tree()]
+
+        changes = compute_renumbering(rows)
+
+        assert changes == {"b": ("1", 0)}
+
+    def test_nested_targets_use_new_parent_code(self):
+        """A target inside another target's subtree picks up the new code."""
+        rows = [
+            Row("a", None, "1", 0, "archived"),
+            Row("b", None, "2", 1, "active"),
+            Row("b1", "b", "2.1", 0, "active"),
+            Row("b1x", "b1", "2.1.1", 0, "active"),
+        ]
+
+        changes = compute_renumbering(rows, ["b1", None])
+
+        assert changes == {
+            "b": ("1", 0),
+            "b1": ("1.1", 0),
+            "b1x": ("1.1.1", 0),
+        }
+
+    def test_parent_cycle_terminates(self):
+        """Corrupt parent cycles do not loop forever."""
+        rows = [
+            Row("x", "y", "9", 0, "active"),
+            Row("y", "x", "9.1", 0, "active"),
+        ]
+
+        changes = compute_renumbering(rows, ["x"])
+
+        assert changes == {"x": ("9.1.1", 0)}
@@ -212,6 +212,75 @@ class TestProcessTree:
         data = response.json()
         assert isinstance(data, list)
 
+    @pytest.mark.asyncio
+    async def test_tree_etag_not_modified(self, client: AsyncClient, headers):
+        """Repeat tree requests with a matching ETag return 304."""
+        first = await client.get("/api/v1/processes/tree", headers=headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = await client.get(
+            "/api/v1/processes/tree",
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_tree_cache_invalidated_on_write(self, client: AsyncClient, headers):
+        """Creating a process retires the cached tree snapshot."""
+        before = await client.get("/api/v1/processes/tree", headers=headers)
+
+        await client.post(
+            "/api/v1/processes/",
+            json={"code": "L0-50", "name": "Cache Buster", "level": "L0"},
+            headers=headers,
+        )
+
+        after = await client.get(
+            "/api/v1/processes/tree",
+            headers={**headers, "If-None-Match": before.headers["etag"]},
+        )
+        assert after.status_code == 200
+        assert any(node["name"] == "Cache Buster" for node in after.json())
+
+    @pytest.mark.asyncio
+    async def test_tree_served_when_cache_unreachable(
+        self, client: AsyncClient, headers, monkeypatch
+    ):
+        """A Redis outage degrades the tree to uncached builds instead of 500s."""
+        from src.config import settings
+        from src.core.providers.cache.redis import RedisProvider
+        from src.services import tree_cache
+
+        monkeypatch.setattr(settings, "REDIS_URL", "redis://127.0.0.1:1/0")
+        unreachable = RedisProvider()
+        monkeypatch.setattr(tree_cache, "get_cache_provider", lambda: unreachable)
+
+        response = await client.get("/api/v1/processes/tree", headers=headers)
+        assert response.status_code == 200
+
+        await tree_cache.invalidate_tree(tree_cache.PROCESS_TREE, "org")
+
+    @pytest.mark.asyncio
+    async def test_superseded_snapshots_are_evicted(self, monkeypatch):
+        """The in-memory store sweeps expired snapshots and caps expiring keys."""
+        from src.core.providers.cache import memory
+
+        cache = memory.InMemoryCacheProvider(max_entries=3)
+        await cache.incr("tree:processes:org:version")
+        for version in range(5):
+            await cache.set_bytes(f"tree:processes:org:v{version}", b"{}", ttl=60)
+        assert await cache.get("tree:processes:org:version") == 1
+        assert sorted(cache._cache) == [
+            "tree:processes:org:v3", "tree:processes:org:v4", "tree:processes:org:version",
+        ]
+
+        now = memory.time.time()
+        monkeypatch.setattr(memory.time, "time", lambda: now + memory.SWEEP_INTERVAL + 61)
+        await cache.set("other", 1)
+        assert sorted(cache._cache) == ["other", "tree:processes:org:version"]
+
 
 class TestProcessHierarchy:
     """Test parent-child relationships."""
@@ -0,0 +1,157 @@
+"""
+Unit tests for batch prompt execution (mock provider).
+"""
+
+import json
+import random
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.providers.llm import MockLLMProvider
+from src.core.providers.llm.mock import MockRateLimitError
+from src.services import llm_engine, prompt_batch
+
+
+async def _setup(client: AsyncClient, headers) -> tuple[str, dict[str, str]]:
+    """A fast LLM config, a template and a three-process subtree."""
+    configs = (await client.get("/api/v1/prompts/llm-config", headers=headers)).json()
+    enabled = [c for c in configs if c["is_enabled"]]
+    if enabled:
+        await client.patch(
+            f"/api/v1/prompts/llm-config/{enabled[0]['id']}",
+            json={"rate_limit_rpm": 60_000},
+            headers=headers,
+        )
+    else:
+        await client.post(
+            "/api/v1/prompts/llm-config",
+            json={"provider": "anthropic", "model": "mock-model", "rate_limit_rpm": 60_000},
+            headers=headers,
+        )
+
+    template = await client.post(
+        "/api/v1/prompts/templates",
+        json={
+            "name": "Agentic opportunities",
+            "category": "analysis",
+            "user_prompt_template": "Find agentic opportunities in {{code}} {{name}}.\nKPIs:\n{{kpis}}",
+            "include_kpis": True,
+        },
+        headers=headers,
+    )
+    assert template.status_code == 201
+
+    root = str(random.randint(10_000, 99_999_999))
+    rows = [
+        {"ref": root, "name": f"Batch root {root}", "kpi": "Lead time"},
+        {"ref": f"{root}.1", "name": f"Batch child {root}"},
+        {"ref": f"{root}.2", "name": f"Batch child {root}"},
+    ]
+    response = await client.post(
+        "/api/v1/processes/import",
+        files={"file": ("catalogue.json", json.dumps(rows), "application/json")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    listed = await client.get(f"/api/v1/processes/?search=Batch {root}", headers=headers)
+    ids = {p["code"][len(root):] or "root": p["id"] for p in listed.json()["items"]}
+    return template.json()["id"], ids
+
+
+class TestRenderPrompt:
+    """Test placeholder rendering and retry decisions without a database."""
+
+    def test_unknown_placeholders_are_kept(self):
+        assert prompt_batch.render_prompt(
+            "{{ name }} uses {{systems}} for {{unknown}}",
+            {"name": "Invoicing", "systems": "- SAP"},
+        ) == "Invoicing uses - SAP for {{unknown}}"
+
+    def test_retry_delay(self):
+        """Rate limits are retried until attempts run out; other errors are not."""
+        assert prompt_batch._retry_delay(MockRateLimitError(retry_after=3), 1) == 3
+        assert prompt_batch._retry_delay(MockRateLimitError(), 1) <= prompt_batch.BATCH_BACKOFF_BASE
+        assert prompt_batch._retry_delay(
+            MockRateLimitError(), prompt_batch.BATCH_MAX_ATTEMPTS
+        ) is None
+        assert prompt_batch._retry_delay(ValueError("bad prompt"), 1) is None
+
+
+class TestBatchEndpoints:
+    """Test POST /prompts/batches and friends."""
+
+    @pytest.mark.asyncio
+    async def test_subtree_batch(self, client: AsyncClient, headers):
+        """Every process in the subtree gets a rendered prompt and a response."""
+        template_id, ids = await _setup(client, headers)
+
+        response = await client.post(
+            "/api/v1/prompts/batches",
+            json={"template_id": template_id, "root_id": ids["root"]},
+            headers=headers,
+        )
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        assert response.json()["total"] == 3
+
+        # The ASGI test transport runs background tasks before returning
+        job = (await client.get(f"/api/v1/prompts/batches/{job_id}", headers=headers)).json()
+        assert (job["status"], job["completed"], job["failed"]) == ("completed", 3, 0)
+
+        executions = (await client.get(
+            f"/api/v1/prompts/executions?batch_job_id={job_id}", headers=headers
+        )).json()
+        prompts = {e["target_entity_id"]: e["prompt_sent"] for e in executions}
+        assert set(prompts) == set(ids.values())
+        assert "Batch root" in prompts[ids["root"]]
+        assert "- Lead time: target -, current -" in prompts[ids["root"]]
+        assert all(e["response_received"] for e in executions)
+
+        events = await client.get(f"/api/v1/prompts/batches/{job_id}/events", headers=headers)
+        assert events.text.startswith("event: done\n")
+
+    @pytest.mark.asyncio
+    async def test_resume_retries_failures(self, client: AsyncClient, headers, monkeypatch):
+        """Prompts that exhausted their retries are rerun by a resume, the rest skipped."""
+        template_id, ids = await _setup(client, headers)
+        provider = MockLLMProvider(rate_limit_every=2)
+        monkeypatch.setattr(llm_engine, "get_llm_provider", lambda name: provider)
+        monkeypatch.setattr(prompt_batch, "BATCH_MAX_ATTEMPTS", 1)
+
+        response = await client.post(
+            "/api/v1/prompts/batches",
+            json={"template_id": template_id, "process_ids": list(ids.values())},
+            headers=headers,
+        )
+        job_id = response.json()["id"]
+        job = (await client.get(f"/api/v1/prompts/batches/{job_id}", headers=headers)).json()
+        assert (job["completed"], job["failed"]) == (2, 1)
+
+        provider.rate_limit_every = 0
+        resumed = await client.post(f"/api/v1/prompts/batches/{job_id}/resume", headers=headers)
+        assert resumed.status_code == 202
+        job = (await client.get(f"/api/v1/prompts/batches/{job_id}", headers=headers)).json()
+        assert (job["status"], job["completed"], job["failed"]) == ("completed", 3, 0)
+        assert provider.calls == 4
+
+        again = await client.post(f"/api/v1/prompts/batches/{job_id}/resume", headers=headers)
+        assert again.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_worker_error_fails_the_job(self, client: AsyncClient, headers, monkeypatch):
+        """A worker that raises ends the job as failed instead of stalling the writer."""
+        template_id, ids = await _setup(client, headers)
+
+        async def broken_wait(self):
+            raise RuntimeError("pacer broke")
+
+        monkeypatch.setattr(prompt_batch._Pacer, "wait", broken_wait)
+        response = await client.post(
+            "/api/v1/prompts/batches",
+            json={"template_id": template_id, "process_ids": list(ids.values())},
+            headers=headers,
+        )
+        job_id = response.json()["id"]
+        job = (await client.get(f"/api/v1/prompts/batches/{job_id}", headers=headers)).json()
+        assert (job["status"], job["error_message"]) == ("failed", "pacer broke")
@@ -0,0 +1,149 @@
+"""
+Unit tests for prompt execution through the LLM engine (mock provider).
+"""
+
+import asyncio
+import json
+import time
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.providers.llm import LLMConfig, MockLLMProvider, get_llm_provider
+from src.services import llm_engine
+
+
+async def _ensure_llm_config(client: AsyncClient, headers) -> None:
+    configs = (await client.get("/api/v1/prompts/llm-config", headers=headers)).json()
+    if not any(c["is_enabled"] for c in configs):
+        response = await client.post(
+            "/api/v1/prompts/llm-config",
+            json={"provider": "anthropic", "model": "mock-model"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+
+def _execution(prompt: str, **extra) -> dict:
+    return {
+        "target_entity_type": "process",
+        "target_entity_id": str(uuid4()),
+        "prompt_text": prompt,
+        **extra,
+    }
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields.get("event", "message"), json.loads(fields["data"])))
+    return events
+
+
+class TestExecute:
+    """Test POST /prompts/execute and /prompts/execute/stream."""
+
+    @pytest.mark.asyncio
+    async def test_execute_records_response(self, client: AsyncClient, headers):
+        """The response and token usage are written to the execution."""
+        await _ensure_llm_config(client, headers)
+
+        response = await client.post(
+            "/api/v1/prompts/execute", json=_execution("Summarise the process"), headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response_received"].startswith("[Mock Response]")
+        assert data["total_tokens"] > 0
+        assert data["execution_time_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_deterministic_responses_are_cached(self, client: AsyncClient, headers):
+        """A repeated temperature-0 prompt does not reach the provider again."""
+        await _ensure_llm_config(client, headers)
+        provider = get_llm_provider("mock")
+        body = _execution(f"Cache me {uuid4()}", temperature=0)
+
+        first = await client.post("/api/v1/prompts/execute", json=body, headers=headers)
+        calls = provider.calls
+        second = await client.post("/api/v1/prompts/execute", json=body, headers=headers)
+
+        assert provider.calls == calls
+        assert second.json()["response_received"] == first.json()["response_received"]
+        assert second.json()["id"] != first.json()["id"]
+
+    @pytest.mark.asyncio
+    async def test_stream_writes_usage(self, client: AsyncClient, headers):
+        """Streamed tokens add up to the recorded response."""
+        await _ensure_llm_config(client, headers)
+
+        response = await client.post(
+            "/api/v1/prompts/execute/stream", json=_execution("Stream this"), headers=headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = _parse_sse(response.text)
+        assert events[0][0] == "execution"
+        text = "".join(data["text"] for event, data in events if event == "message")
+        name, done = events[-1]
+        assert name == "done"
+        assert done["id"] == events[0][1]["id"]
+        assert done["response_received"] == text
+        assert done["total_tokens"] > 0
+
+        recorded = (await client.get("/api/v1/prompts/executions", headers=headers)).json()
+        [stored] = [e for e in recorded if e["id"] == done["id"]]
+        assert (stored["response_received"], stored["total_tokens"]) == (text, done["total_tokens"])
+
+    @pytest.mark.asyncio
+    async def test_stream_disconnect_is_recorded(self, client: AsyncClient, headers):
+        """A client leaving mid-stream still leaves a finished execution row."""
+        from src.api.v1.endpoints.prompts.execution import execute_prompt_stream
+        from src.core.auth import CurrentUser, decode_token
+        from src.core.database import async_session_factory
+        from src.core.tenancy import apply_tenant_context
+        from src.schemas.prompts import PromptExecutionCreate
+
+        await _ensure_llm_config(client, headers)
+        claims = decode_token(headers["Authorization"].removeprefix("Bearer "))
+        user = CurrentUser(claims["sub"], claims["org"], claims["role"], claims["email"])
+
+        async with async_session_factory() as db:
+            await apply_tenant_context(db, user.organization_id)
+            response = await execute_prompt_stream(
+                PromptExecutionCreate(**_execution("Hang up on this")), user, db
+            )
+            chunks = response.body_iterator
+            started = json.loads((await anext(chunks)).split("data: ", 1)[1])
+            await anext(chunks)
+            await chunks.aclose()
+
+        recorded = (await client.get("/api/v1/prompts/executions", headers=headers)).json()
+        [stored] = [e for e in recorded if e["id"] == started["id"]]
+        assert stored["error_message"] == "client disconnected"
+        assert stored["execution_time_ms"] is not None
+
+
+class TestTenantConcurrency:
+    """Test the per-tenant concurrency limit."""
+
+    @pytest.mark.asyncio
+    async def test_calls_beyond_limit_wait(self, monkeypatch):
+        """With a limit of 2, six 50ms calls take three rounds."""
+        monkeypatch.setattr(llm_engine.settings, "LLM_TENANT_CONCURRENCY", 2)
+        provider = MockLLMProvider(latency=0.05)
+        monkeypatch.setattr(llm_engine, "get_llm_provider", lambda name: provider)
+        config = LLMConfig(model="mock-model")
+        org = str(uuid4())
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(llm_engine.generate(org, "mock", f"prompt {i}", config) for i in range(6))
+        )
+        elapsed = time.perf_counter() - start
+
+        assert provider.calls == 6
+        assert elapsed >= 0.15
@@ -0,0 +1,69 @@
+"""
+Unit tests for RAG recalculation (/processes/rag-recalculate).
+"""
+
+import json
+import random
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.core.database import async_session_factory
+
+
+async def _stale_process(client: AsyncClient, headers) -> str:
+    """A process with no issues whose system RAG is left red."""
+    root = str(random.randint(10_000, 99_999_999))
+    rows = [{"ref": root, "name": f"RAG target {root}"}]
+    response = await client.post(
+        "/api/v1/processes/import",
+        files={"file": ("catalogue.json", json.dumps(rows), "application/json")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    listed = await client.get(f"/api/v1/processes/?search=RAG target {root}", headers=headers)
+    process_id = listed.json()["items"][0]["id"]
+
+    async with async_session_factory() as db:
+        await db.execute(
+            text("UPDATE processes SET rag_system = 'red', rag_last_reviewed = NULL WHERE id = :id"),
+            {"id": process_id},
+        )
+        await db.commit()
+    return process_id
+
+
+async def _rag_system(process_id: str) -> str:
+    async with async_session_factory() as db:
+        return (await db.execute(
+            text("SELECT rag_system::text FROM processes WHERE id = :id"), {"id": process_id}
+        )).scalar_one()
+
+
+class TestRagRecalculate:
+    """An empty process_ids list means every process, as when it is omitted."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [{}, {"process_ids": []}])
+    async def test_recalculate_all(self, client: AsyncClient, headers, body):
+        process_id = await _stale_process(client, headers)
+
+        response = await client.post("/api/v1/processes/rag-recalculate", json=body, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["processes_updated"] >= 1
+        assert await _rag_system(process_id) == "neutral"
+
+    @pytest.mark.asyncio
+    async def test_job_with_empty_list_covers_all(self, client: AsyncClient, headers):
+        process_id = await _stale_process(client, headers)
+
+        response = await client.post(
+            "/api/v1/processes/rag-recalculate/jobs", json={"process_ids": []}, headers=headers
+        )
+        assert response.status_code == 202
+        job = (await client.get(
+            f"/api/v1/processes/rag-recalculate/jobs/{response.json()['job_id']}", headers=headers
+        )).json()
+        assert job["status"] == "completed" and job["total"] >= 1
+        assert await _rag_system(process_id) == "neutral"
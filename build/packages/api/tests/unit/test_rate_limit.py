@@ -0,0 +1,97 @@
+"""
+Unit tests for the shared rate limiter's local fast path and fallback.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.rate_limit import RateLimitConfig, RedisRateLimiter
+
+
+class FakeScript:
+    """Stands in for the registered GCRA script with a fixed-window count."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        self.used += int(args[2])
+        if self.used >= self.limit:
+            return [0, 5000, 0]
+        self.used += 1
+        return [1, 0, self.limit - self.used]
+
+
+class FakeRedis:
+    def __init__(self, script):
+        self.script = script
+
+    def register_script(self, source):
+        return self.script
+
+
+class BrokenScript:
+    async def __call__(self, keys, args):
+        raise ConnectionError("redis down")
+
+
+class TestRedisRateLimiter:
+    """Test round-trip batching and degradation."""
+
+    @pytest.mark.asyncio
+    async def test_local_lease_skips_round_trips(self):
+        """Clearly-under-limit keys are admitted locally between syncs."""
+        script = FakeScript(limit=100)
+        limiter = RedisRateLimiter(FakeRedis(script))
+        config = RateLimitConfig(requests=100, window=60)
+
+        results = [await limiter.is_allowed("k", config) for _ in range(20)]
+
+        assert all(allowed for allowed, _ in results)
+        assert script.calls < 20
+
+    @pytest.mark.asyncio
+    async def test_locally_admitted_requests_are_charged(self):
+        """Leased requests count against the shared limit."""
+        script = FakeScript(limit=100)
+        limiter = RedisRateLimiter(FakeRedis(script))
+        config = RateLimitConfig(requests=100, window=60)
+
+        results = [await limiter.is_allowed("k", config) for _ in range(150)]
+
+        assert sum(allowed for allowed, _ in results) == 100
+        assert results[-1] == (False, 5)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_store_unavailable(self):
+        """Redis errors degrade to the in-memory limiter instead of failing."""
+        limiter = RedisRateLimiter(FakeRedis(BrokenScript()))
+        config = RateLimitConfig(requests=3, window=60)
+
+        results = [(await limiter.is_allowed("k", config))[0] for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_expired_leases_are_pruned(self, monkeypatch):
+        """Leases of keys that went quiet do not accumulate."""
+        from src.core import rate_limit
+
+        clock = [1000.0]
+        fake_time = SimpleNamespace(monotonic=lambda: clock[0], time=time.time)
+        monkeypatch.setattr(rate_limit, "time", fake_time)
+        limiter = RedisRateLimiter(FakeRedis(FakeScript(limit=1000)))
+        config = RateLimitConfig(requests=100, window=60)
+
+        for n in range(50):
+            await limiter.is_allowed(f"client-{n}", config)
+        assert len(limiter._leases) == 50
+
+        clock[0] += 2 * RedisRateLimiter.LOCAL_LEASE_PRUNE_INTERVAL
+        await limiter.is_allowed("client-new", config)
+        assert list(limiter._leases) == ["client-new"]
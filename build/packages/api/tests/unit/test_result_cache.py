@@ -0,0 +1,56 @@
+"""
+Unit tests for the per-tenant dashboard result cache.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from src.core.providers.cache.memory import InMemoryCacheProvider
+from src.services import result_cache
+
+
+class Total(BaseModel):
+    value: int
+
+
+class UnreachableCache(InMemoryCacheProvider):
+    """Cache whose reads and counters fail, as during a Redis outage."""
+
+    async def get(self, key):
+        raise ConnectionError("cache down")
+
+    async def incr(self, key):
+        raise ConnectionError("cache down")
+
+
+class TestResultCache:
+    """Test cached_result and the data version helpers."""
+
+    @pytest.mark.asyncio
+    async def test_bump_retires_cached_result(self, monkeypatch):
+        cache = InMemoryCacheProvider()
+        monkeypatch.setattr(result_cache, "get_cache_provider", lambda: cache)
+        values = iter([1, 2])
+
+        async def build():
+            return Total(value=next(values))
+
+        first = await result_cache.cached_result(Total, "total", "org", build)
+        again = await result_cache.cached_result(Total, "total", "org", build)
+        await result_cache.bump_data_version("org")
+        fresh = await result_cache.cached_result(Total, "total", "org", build)
+
+        assert (first.value, again.value, fresh.value) == (1, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_cache_outage_builds_uncached(self, monkeypatch):
+        cache = UnreachableCache()
+        monkeypatch.setattr(result_cache, "get_cache_provider", lambda: cache)
+
+        async def build():
+            return Total(value=7)
+
+        await result_cache.bump_data_version("org")
+        assert await result_cache.get_data_version("org") == 0
+        result = await result_cache.cached_result(Total, "total", "org", build)
+        assert result.value == 7
@@ -5,6 +5,11 @@ Uses the shared 'headers' fixture from conftest.py.
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from src.core.database import async_session_factory
+from src.models.riada import RiadaItem
+from src.services.pagination import count_rows
 
 
 class TestRiadaList:
@@ -25,6 +30,48 @@ class TestRiadaList:
         assert "items" in data
         assert "total" in data
 
+    @pytest.mark.asyncio
+    async def test_list_riada_cursor_pages(self, client: AsyncClient, headers):
+        """Following next_cursor yields the same order as offset pages."""
+        for i in range(5):
+            await client.post(
+                "/api/v1/riada/",
+                json={"title": f"Risk {i}", "riada_type": "risk", "category": "process"},
+                headers=headers,
+            )
+
+        first = (await client.get("/api/v1/riada/?page_size=6", headers=headers)).json()
+        expected = [item["id"] for item in first["items"]]
+
+        seen, cursor = [], None
+        for _ in range(3):
+            params = {"page_size": 2, "total": "none"}
+            if cursor:
+                params["cursor"] = cursor
+            data = (await client.get("/api/v1/riada/", params=params, headers=headers)).json()
+            assert data["total"] is None
+            assert data["has_more"]
+            seen += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+
+        assert seen == expected
+
+    @pytest.mark.asyncio
+    async def test_estimated_total_with_in_filter(self):
+        """The planner estimate handles expanding IN parameters."""
+        def query(*statuses):
+            return select(RiadaItem).where(RiadaItem.status.in_(statuses))
+
+        async with async_session_factory() as db:
+            assert await count_rows(db, query("no-such-status", "another"), "estimate") == 0
+            assert await count_rows(db, query("open", "closed", "in_progress"), "estimate") >= 0
+
+    @pytest.mark.asyncio
+    async def test_list_riada_invalid_cursor(self, client: AsyncClient, headers):
+        """A malformed cursor is rejected rather than ignored."""
+        response = await client.get("/api/v1/riada/?cursor=not-a-cursor", headers=headers)
+        assert response.status_code == 400
+
 
 class TestRiadaCRUD:
     """Test full CRUD operations."""
@@ -316,3 +363,21 @@ class TestRiadaSummary:
         assert "by_severity" in data
         assert "by_status" in data
         assert "by_category" in data
+
+    @pytest.mark.asyncio
+    async def test_summary_reflects_writes(self, client: AsyncClient, headers):
+        """A cached summary is refreshed once a RIADA item is created."""
+        before = await client.get("/api/v1/riada/summary", headers=headers)
+        assert before.status_code == 200
+
+        await client.post(
+            "/api/v1/riada/",
+            json={"title": "D1", "riada_type": "dependency", "category": "data"},
+            headers=headers,
+        )
+
+        after = await client.get("/api/v1/riada/summary", headers=headers)
+        assert after.json()["total"] == before.json()["total"] + 1
+        assert after.json()["by_type"].get("dependency", 0) == (
+            before.json()["by_type"].get("dependency", 0) + 1
+        )
@@ -0,0 +1,135 @@
+"""
+Unit tests for the RIADA link graph: the in-memory index and its endpoints.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from src.services.riada_graph import BOTH, INCOMING, RiadaGraph
+
+# a -> b -> c -> d, plus a symmetric related_to edge d -- e
+LINKS = [
+    ("a", "b", "blocks"),
+    ("b", "c", "depends_on"),
+    ("c", "d", "blocks"),
+    ("d", "e", "related_to"),
+]
+
+
+class TestRiadaGraphIndex:
+    """Traversals over the packed adjacency arrays."""
+
+    def test_reachable_respects_depth_and_direction(self):
+        graph = RiadaGraph(LINKS)
+        reached, truncated = graph.reachable("a", 2)
+        assert [(r.id, r.depth, r.via_id) for r in reached] == [("b", 1, "a"), ("c", 2, "b")]
+        assert not truncated
+
+        upstream, _ = graph.reachable("d", 5, INCOMING)
+        assert [r.id for r in upstream] == ["c", "b", "a"]
+        assert {r.direction for r in upstream} == {"incoming"}
+
+    def test_reachable_limit_and_link_types(self):
+        graph = RiadaGraph(LINKS)
+        reached, truncated = graph.reachable("a", 10, limit=2)
+        assert len(reached) == 2 and truncated
+
+        only_blocks, _ = graph.reachable("a", 10, link_types=["blocks"])
+        assert [r.id for r in only_blocks] == ["b"]
+
+    def test_shortest_path(self):
+        graph = RiadaGraph(LINKS)
+        path = graph.shortest_path("a", "e")
+        assert [step.id for step in path] == ["a", "b", "c", "d", "e"]
+        assert path[0].link_type is None and path[-1].link_type == "related_to"
+        assert graph.shortest_path("e", "a") is None
+        assert [step.id for step in graph.shortest_path("e", "a", BOTH)] == ["e", "d", "c", "b", "a"]
+
+    def test_cycle_detection(self):
+        graph = RiadaGraph(LINKS)
+        assert graph.cycle_if_linked("d", "a", "blocks") == ["d", "a", "b", "c", "d"]
+        # Symmetric links never close a cycle
+        assert graph.cycle_if_linked("d", "a", "related_to") is None
+        assert graph.cycle_if_linked("e", "a", "blocks") is None
+        assert graph.cycles() == []
+
+        cyclic = RiadaGraph(LINKS + [("d", "b", "blocks"), ("e", "d", "related_to")])
+        assert [sorted(c) for c in cyclic.cycles()] == [["b", "c", "d"]]
+
+
+async def _create_item(client: AsyncClient, headers, title: str, riada_type: str = "risk") -> str:
+    response = await client.post(
+        "/api/v1/riada/",
+        json={"title": title, "riada_type": riada_type, "category": "process"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+async def _link(client: AsyncClient, headers, source: str, target: str, link_type: str = "blocks"):
+    return await client.post(
+        f"/api/v1/riada/{source}/links",
+        json={"target_id": target, "link_type": link_type},
+        headers=headers,
+    )
+
+
+class TestRiadaGraphEndpoints:
+    """Impact, path and cycle checks through the API."""
+
+    @pytest.mark.asyncio
+    async def test_impact_and_path(self, client: AsyncClient, headers):
+        a, b, c = [await _create_item(client, headers, f"Graph item {n}") for n in "abc"]
+        assert (await _link(client, headers, a, b)).status_code == 201
+        assert (await _link(client, headers, b, c, "depends_on")).status_code == 201
+
+        response = await client.get(f"/api/v1/riada/{a}/impact?depth=5", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [(i["id"], i["depth"], i["via_id"]) for i in data["items"]] == [(b, 1, a), (c, 2, b)]
+        assert data["total"] == 2 and not data["truncated"]
+
+        path = (await client.get(f"/api/v1/riada/{a}/path/{c}", headers=headers)).json()
+        assert path["found"] and path["length"] == 2
+        assert [i["id"] for i in path["items"]] == [a, b, c]
+
+        missing = await client.get(
+            "/api/v1/riada/00000000-0000-0000-0000-000000000000/impact", headers=headers
+        )
+        assert missing.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_link_closing_cycle_rejected(self, client: AsyncClient, headers):
+        a, b, c = [await _create_item(client, headers, f"Cycle item {n}") for n in "abc"]
+        await _link(client, headers, a, b)
+        await _link(client, headers, b, c)
+
+        response = await _link(client, headers, c, a)
+        assert response.status_code == 409
+        assert "cycle" in response.json()["detail"]
+
+        # A symmetric link between the same items is fine
+        assert (await _link(client, headers, c, a, "related_to")).status_code == 201
+        cycles = (await client.get("/api/v1/riada/graph/cycles", headers=headers)).json()
+        assert not any(a in cycle for cycle in cycles["cycles"])
+
+    @pytest.mark.asyncio
+    async def test_cache_outage_rebuilds_graph(self, client: AsyncClient, headers, monkeypatch):
+        """Without the version counter, links are still written and traversed."""
+        from src.core.providers.cache.memory import InMemoryCacheProvider
+        from src.services import riada_graph
+
+        class UnreachableCache(InMemoryCacheProvider):
+            async def get(self, key):
+                raise ConnectionError("cache down")
+
+            async def incr(self, key):
+                raise ConnectionError("cache down")
+
+        a, b = [await _create_item(client, headers, f"Outage item {n}") for n in "ab"]
+        monkeypatch.setattr(riada_graph, "get_cache_provider", UnreachableCache)
+
+        assert (await _link(client, headers, a, b)).status_code == 201
+        response = await client.get(f"/api/v1/riada/{a}/impact", headers=headers)
+        assert [i["id"] for i in response.json()["items"]] == [b]
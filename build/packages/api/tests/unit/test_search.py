@@ -0,0 +1,73 @@
+"""
+Unit tests for indexed search: list filters and the unified /search endpoint.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _has_pg_trgm(db_session: AsyncSession) -> bool:
+    result = await db_session.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    )
+    return result.scalar() is not None
+
+
+class TestListSearch:
+    """Test the search parameter on list endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_riada_search_matches_word_forms(self, client: AsyncClient, headers):
+        """Full-text matching finds stemmed forms, not just substrings."""
+        await client.post(
+            "/api/v1/riada/",
+            json={
+                "title": "Vendor insolvency",
+                "description": "Key suppliers may fail to deliver",
+                "riada_type": "risk",
+                "category": "process",
+            },
+            headers=headers,
+        )
+
+        response = await client.get("/api/v1/riada/?search=supplier", headers=headers)
+        assert response.status_code == 200
+        titles = [item["title"] for item in response.json()["items"]]
+        assert "Vendor insolvency" in titles
+
+
+class TestUnifiedSearch:
+    """Test the cross-entity /search endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_search_requires_query(self, client: AsyncClient, headers):
+        """Single-character queries are rejected."""
+        response = await client.get("/api/v1/search/?q=a", headers=headers)
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_across_types(
+        self, client: AsyncClient, headers, db_session: AsyncSession
+    ):
+        """Matches come back ranked and labelled with their entity type."""
+        if not await _has_pg_trgm(db_session):
+            pytest.skip("pg_trgm extension not installed")
+
+        await client.post(
+            "/api/v1/riada/",
+            json={"title": "Warehouse flooding", "riada_type": "risk", "category": "process"},
+            headers=headers,
+        )
+
+        response = await client.get(
+            "/api/v1/search/", params={"q": "warehouse", "types": "riada"}, headers=headers
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results
+        assert results[0]["entity_type"] == "riada"
+        assert results[0]["title"] == "Warehouse flooding"
+        ranks = [r["rank"] for r in results]
+        assert ranks == sorted(ranks, reverse=True)
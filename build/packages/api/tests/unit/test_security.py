@@ -0,0 +1,40 @@
+"""
+Unit tests for the security middleware stack.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.audit import scan_for_suspicious_patterns
+
+
+class TestSecurityHeaders:
+    """Test headers added by SecurityHeadersMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_headers_on_response(self, client: AsyncClient):
+        """Every response carries the security headers, and no server banner."""
+        response = await client.get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert response.headers["x-frame-options"] == "DENY"
+        assert "content-security-policy" in response.headers
+        assert "server" not in response.headers
+
+
+class TestSuspiciousPatterns:
+    """Test the compiled suspicious-pattern matcher."""
+
+    def test_path_match_is_case_insensitive(self):
+        assert scan_for_suspicious_patterns("/api/UNION select") == (
+            "Suspicious pattern in path: UNION SELECT"
+        )
+
+    def test_query_values_are_decoded(self):
+        assert scan_for_suspicious_patterns("/api", "q=%3CScript%3E") == (
+            "Suspicious pattern in query: <script>"
+        )
+
+    def test_clean_request(self):
+        assert scan_for_suspicious_patterns("/api/v1/processes", "search=order+to+cash") is None
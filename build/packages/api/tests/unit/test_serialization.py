@@ -0,0 +1,103 @@
+"""
+Unit tests for the fast list serialization path (core/serialization).
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import orjson
+from httpx import AsyncClient
+from sqlalchemy import literal
+
+from src.core.serialization import ListSerializer, ORJSONResponse
+from src.models.riada import RiadaItem
+from src.schemas.riada import RiadaListResponse, RiadaResponse
+
+NOW = datetime(2026, 10, 17, 9, 30, tzinfo=timezone.utc)
+
+
+def _riada_row(**overrides) -> SimpleNamespace:
+    values = {name: None for name in RiadaResponse.model_fields}
+    values.update(
+        id=str(uuid4()), code="R-001", title="Vendor risk", riada_type="risk",
+        category="process", severity="high", status="open", tags=["vendor"],
+        created_at=NOW, updated_at=NOW,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestListSerializer:
+    """Column selection and one-pass encoding."""
+
+    def test_select_reads_only_schema_columns(self):
+        query = ListSerializer(RiadaListResponse).select(RiadaItem, tags=literal(["x"]))
+        names = [c.name for c in query.selected_columns]
+        assert names == [n for n in RiadaResponse.model_fields if n in names]
+        assert "organization_id" not in names and "search_vector" not in names
+        assert "tags" in names
+
+    def test_response_matches_default_encoding(self):
+        rows = [_riada_row(), _riada_row(code="R-002", tags=[])]
+        fields = dict(total=2, page=1, per_page=50, has_more=False, next_cursor=None)
+
+        response = ListSerializer(RiadaListResponse).response(rows, **fields)
+
+        expected = RiadaListResponse(
+            items=[RiadaResponse.model_validate(r) for r in rows], **fields
+        )
+        assert response.body == expected.model_dump_json().encode()
+        assert response.media_type == "application/json"
+
+    def test_orjson_response_content(self):
+        assert ORJSONResponse(b'{"a":1}').body == b'{"a":1}'
+        body = orjson.loads(ORJSONResponse({"at": NOW, "cost": Decimal("1.50")}).body)
+        assert body == {"at": "2026-10-17T09:30:00Z", "cost": 1.5}
+
+
+async def test_list_endpoints_match_item_endpoints(client: AsyncClient, headers):
+    """List rows carry the same values as the single-item responses."""
+    tag = uuid4().hex[:8]
+    system = await client.post(
+        "/api/v1/systems/",
+        json={"name": f"Ledger {tag}", "system_type": f"erp-{tag}"},
+        headers=headers,
+    )
+    assert system.status_code == 201
+    processes = (await client.get("/api/v1/processes/?page_size=1", headers=headers)).json()
+    if processes["items"]:
+        link = await client.post(
+            f"/api/v1/systems/{system.json()['id']}/processes",
+            json={"process_id": processes["items"][0]["id"]},
+            headers=headers,
+        )
+        assert link.status_code == 201
+
+    portfolio = await client.post(
+        "/api/v1/portfolio/",
+        json={
+            "code": f"P-{tag}", "name": "Finance uplift", "level": f"project-{tag}",
+            "business_value": 8, "time_criticality": 5, "risk_reduction": 3,
+            "job_size": 4, "budget_approved": 1250.5,
+        },
+        headers=headers,
+    )
+    assert portfolio.status_code == 201
+
+    for path, params, created in (
+        ("/api/v1/systems/", {"system_type": f"erp-{tag}"}, system.json()),
+        ("/api/v1/portfolio/", {"level": f"project-{tag}"}, portfolio.json()),
+    ):
+        response = await client.get(path, params=params, headers=headers)
+        assert response.status_code == 200
+        [listed] = response.json()["items"]
+        detail = (await client.get(path + created["id"], headers=headers)).json()
+        assert listed == detail
+
+    assert detail["budget_approved"] == 1250.5
+    systems = (await client.get(
+        "/api/v1/systems/", params={"system_type": f"erp-{tag}"}, headers=headers
+    )).json()
+    assert systems["items"][0]["process_count"] == (1 if processes["items"] else 0)
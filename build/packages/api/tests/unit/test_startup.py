@@ -0,0 +1,26 @@
+"""
+Startup budget: importing the app must stay fast and must not load
+optional SDKs (they are imported where they are used).
+"""
+
+import os
+
+from scripts.import_profile import time_import
+
+# Seconds a cold `import src.main` may take; generous for slow CI runners
+STARTUP_BUDGET = float(os.environ.get("STARTUP_BUDGET_SECONDS", "5.0"))
+
+
+def test_app_import_within_budget():
+    # Best of two: the first run may also be writing bytecode caches
+    (first, loaded), (second, _) = time_import("src.main"), time_import("src.main")
+    assert loaded == [], f"optional SDKs imported at startup: {loaded}"
+    assert min(first, second) < STARTUP_BUDGET
+
+
+def test_providers_are_singletons():
+    from src.core.providers import get_cache_provider, get_llm_provider, get_storage_provider
+    from src.services.email import get_email_provider
+
+    for factory in (get_storage_provider, get_cache_provider, get_llm_provider, get_email_provider):
+        assert factory() is factory()
@@ -0,0 +1,280 @@
+"""
+Unit tests for streaming storage: chunk helpers, the local provider, and
+the R2 and OSS chunked paths against in-memory fakes of their SDK clients.
+"""
+
+import io
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import settings
+from src.core.providers.storage import rechunk
+from src.core.providers.storage.alibaba_oss import AlibabaOSSProvider
+from src.core.providers.storage.cloudflare_r2 import CloudflareR2Provider
+from src.core.providers.storage.local import LocalStorageProvider
+
+CHUNK = 64 * 1024
+
+
+async def _stream(total: int, size: int):
+    sent = 0
+    while sent < total:
+        block = min(size, total - sent)
+        yield bytes([sent // size % 256]) * block
+        sent += block
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOCAL_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setattr(settings, "STORAGE_CHUNK_SIZE", CHUNK)
+    return LocalStorageProvider()
+
+
+class TestChunking:
+    @pytest.mark.asyncio
+    async def test_rechunk_regroups_exact_parts(self):
+        parts = [part async for part in rechunk(_stream(10_000, 3_000), 4_096)]
+        assert [len(p) for p in parts] == [4_096, 4_096, 1_808]
+        assert b"".join(parts) == b"".join([c async for c in _stream(10_000, 3_000)])
+
+
+class TestLocalStorage:
+    @pytest.mark.asyncio
+    async def test_upload_download_round_trip(self, storage):
+        data = bytes(range(256)) * 1000
+        url = await storage.upload_file("docs", "a/b.bin", io.BytesIO(data))
+        assert url.startswith("file://")
+        assert await storage.download_file("docs", "a/b.bin") == data
+
+        chunks = [c async for c in storage.download_stream("docs", "a/b.bin", chunk_size=50_000)]
+        assert [len(c) for c in chunks] == [50_000] * 5 + [6_000]
+
+        assert await storage.delete_file("docs", "a/b.bin")
+        assert not await storage.delete_file("docs", "a/b.bin")
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_leaves_nothing(self, storage):
+        async def broken():
+            yield b"partial"
+            raise RuntimeError("client went away")
+
+        with pytest.raises(RuntimeError):
+            await storage.upload_stream("docs", "broken.bin", broken())
+        assert await storage.list_files("docs") == []
+
+    @pytest.mark.asyncio
+    async def test_list_files_pages(self, storage):
+        for i in range(5):
+            await storage.upload_stream("docs", f"p/{i}.txt", _stream(10, 10))
+        await storage.upload_stream("docs", "other.txt", _stream(10, 10))
+
+        pages = [page async for page in storage.iter_files("docs", "p/", page_size=2)]
+        assert [[f["key"] for f in page] for page in pages] == [
+            ["p/0.txt", "p/1.txt"], ["p/2.txt", "p/3.txt"], ["p/4.txt"],
+        ]
+        assert len(await storage.list_files("docs", max_keys=4)) == 4
+
+    @pytest.mark.asyncio
+    async def test_part_suffix_is_an_ordinary_key(self, storage):
+        """Temporary files are kept out of the buckets, so no key is hidden."""
+        await storage.upload_stream("docs", "draft.part", _stream(10, 10))
+        assert [f["key"] for f in await storage.list_files("docs")] == ["draft.part"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_memory_stays_near_chunk_size(self, storage):
+        total = 32 * 1024 * 1024
+        tracemalloc.start()
+        try:
+            await storage.upload_stream("docs", "big.bin", _stream(total, CHUNK))
+            received = 0
+            async for chunk in storage.download_stream("docs", "big.bin"):
+                received += len(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert received == total
+        assert peak < 8 * CHUNK
+
+
+PART = 1000
+
+
+class FakeS3:
+    """The boto3 S3 client calls the R2 provider makes, kept in memory."""
+
+    def __init__(self, fail_on_part: int = 0):
+        self.objects: dict[str, bytes] = {}
+        self.parts: dict[int, bytes] = {}
+        self.fail_on_part = fail_on_part
+        self.calls: list[str] = []
+
+    def put_object(self, Bucket, Key, Body, **extra):
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key, **extra):
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "u1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.calls.append("upload_part")
+        if PartNumber == self.fail_on_part:
+            raise ConnectionError("part upload failed")
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls.append("complete_multipart_upload")
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        assert [p["ETag"] for p in MultipartUpload["Parts"]] == [f"etag-{n}" for n in numbers]
+        self.objects[Key] = b"".join(self.parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.calls.append("abort_multipart_upload")
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys, ContinuationToken=None):
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + MaxKeys]
+        truncated = start + MaxKeys < len(keys)
+        return {
+            "Contents": [{"Key": k, "Size": len(self.objects[k]), "LastModified": 0} for k in page],
+            "IsTruncated": truncated,
+            **({"NextContinuationToken": str(start + MaxKeys)} if truncated else {}),
+        }
+
+
+class FakeOSSBucket:
+    """The oss2.Bucket calls the OSS provider makes, kept in memory."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.parts: dict[int, bytes] = {}
+        self.calls: list[str] = []
+
+    def put_object(self, key, data, headers=None):
+        self.calls.append("put_object")
+        self.objects[key] = data
+
+    def init_multipart_upload(self, key, headers=None):
+        self.calls.append("init_multipart_upload")
+        return SimpleNamespace(upload_id="u1")
+
+    def upload_part(self, key, upload_id, number, data):
+        self.calls.append("upload_part")
+        self.parts[number] = data
+        return SimpleNamespace(etag=f"etag-{number}")
+
+    def complete_multipart_upload(self, key, upload_id, parts):
+        self.calls.append("complete_multipart_upload")
+        self.objects[key] = b"".join(self.parts[p.part_number] for p in parts)
+
+    def abort_multipart_upload(self, key, upload_id):
+        self.calls.append("abort_multipart_upload")
+
+    def get_object(self, key):
+        return io.BytesIO(self.objects[key])
+
+    def list_objects(self, prefix, marker, max_keys):
+        keys = sorted(k for k in self.objects if k.startswith(prefix) and k > marker)
+        page = keys[:max_keys]
+        return SimpleNamespace(
+            object_list=[SimpleNamespace(key=k, size=len(self.objects[k]), last_modified=0) for k in page],
+            is_truncated=len(keys) > max_keys,
+            next_marker=page[-1] if page else "",
+        )
+
+
+def _r2(client: FakeS3) -> CloudflareR2Provider:
+    # boto3 is optional: skip __init__ and hand the provider a fake client
+    provider = CloudflareR2Provider.__new__(CloudflareR2Provider)
+    provider.client = client
+    provider.public_url_base = "https://files.example"
+    return provider
+
+
+def _oss(bucket: FakeOSSBucket) -> AlibabaOSSProvider:
+    provider = AlibabaOSSProvider.__new__(AlibabaOSSProvider)
+    provider.oss2 = SimpleNamespace(models=SimpleNamespace(
+        PartInfo=lambda number, etag: SimpleNamespace(part_number=number, etag=etag),
+    ))
+    provider.endpoint = "https://oss-cn-hangzhou.aliyuncs.com"
+    provider._buckets = {"docs": bucket}
+    return provider
+
+
+@pytest.fixture
+def part_size(monkeypatch):
+    monkeypatch.setattr(settings, "STORAGE_MULTIPART_PART_SIZE", PART)
+    monkeypatch.setattr(settings, "STORAGE_CHUNK_SIZE", 400)
+
+
+class TestObjectStorageProviders:
+    """Multipart uploads, chunked downloads and paged listings."""
+
+    @pytest.mark.asyncio
+    async def test_r2_small_upload_is_one_put(self, part_size):
+        client = FakeS3()
+        url = await _r2(client).upload_stream("docs", "a.txt", _stream(PART, 300))
+        assert url == "https://files.example/docs/a.txt"
+        assert client.calls == ["put_object"] and len(client.objects["a.txt"]) == PART
+
+    @pytest.mark.asyncio
+    async def test_r2_multipart_round_trip(self, part_size):
+        client = FakeS3()
+        provider = _r2(client)
+        data = b"".join([c async for c in _stream(2_500, 300)])
+        await provider.upload_stream("docs", "big.bin", _stream(2_500, 300))
+
+        assert client.calls == ["create_multipart_upload"] + ["upload_part"] * 3 + [
+            "complete_multipart_upload"
+        ]
+        assert [len(p) for p in client.parts.values()] == [PART, PART, 500]
+        chunks = [c async for c in provider.download_stream("docs", "big.bin")]
+        assert [len(c) for c in chunks] == [400] * 6 + [100]
+        assert b"".join(chunks) == data
+
+    @pytest.mark.asyncio
+    async def test_r2_failed_part_aborts(self, part_size):
+        client = FakeS3(fail_on_part=2)
+        with pytest.raises(ConnectionError):
+            await _r2(client).upload_stream("docs", "big.bin", _stream(2_500, 300))
+        assert client.calls[-1] == "abort_multipart_upload"
+        assert "big.bin" not in client.objects
+
+    @pytest.mark.asyncio
+    async def test_r2_listing_follows_continuation(self, part_size):
+        client = FakeS3()
+        client.objects = {f"p/{i}.txt": b"x" for i in range(5)} | {"other.txt": b"x"}
+        pages = [page async for page in _r2(client).iter_files("docs", "p/", page_size=2)]
+        assert [[f["key"] for f in page] for page in pages] == [
+            ["p/0.txt", "p/1.txt"], ["p/2.txt", "p/3.txt"], ["p/4.txt"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_oss_multipart_round_trip(self, part_size):
+        bucket = FakeOSSBucket()
+        provider = _oss(bucket)
+        data = b"".join([c async for c in _stream(2_500, 300)])
+        url = await provider.upload_stream("docs", "big.bin", _stream(2_500, 300))
+
+        assert url == "https://docs.oss-cn-hangzhou.aliyuncs.com/big.bin"
+        assert bucket.calls == ["init_multipart_upload"] + ["upload_part"] * 3 + [
+            "complete_multipart_upload"
+        ]
+        assert b"".join([c async for c in provider.download_stream("docs", "big.bin")]) == data
+
+    @pytest.mark.asyncio
+    async def test_oss_listing_follows_marker(self, part_size):
+        bucket = FakeOSSBucket()
+        bucket.objects = {f"p/{i}.txt": b"x" for i in range(5)}
+        pages = [page async for page in _oss(bucket).iter_files("docs", "p/", page_size=2)]
+        assert [[f["key"] for f in page] for page in pages] == [
+            ["p/0.txt", "p/1.txt"], ["p/2.txt", "p/3.txt"], ["p/4.txt"],
+        ]
@@ -0,0 +1,119 @@
+"""
+Unit tests for incremental survey results: delta accumulation and the
+results / rebuild endpoints.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from src.services.survey_analytics import StatsDelta, answer_buckets, score_summary
+
+
+class TestStatsDelta:
+    """Per-response deltas, before they reach the database."""
+
+    def test_buckets_by_question_type(self):
+        assert answer_buckets("likert_5", 4.0) == ["4"]
+        assert answer_buckets("yes_no", True) == ["true"]
+        assert answer_buckets("multiple_choice", ["a", "b", ""]) == ["a", "b"]
+        assert answer_buckets("matrix", {"speed": "high"}) == ["speed:high"]
+        assert answer_buckets("text", "free text is not bucketed") == []
+
+    def test_add_responses(self):
+        types = {"q1": "likert_5", "q2": "text"}
+        delta = StatsDelta()
+        delta.add_response(types, [
+            {"question_id": "q1", "value": 4, "score": 4},
+            {"question_id": "q2", "value": "Great"},
+            {"question_id": "unknown", "value": 1},
+        ], total_score=80.0, is_complete=True)
+        delta.add_response(types, [
+            {"question_id": "q1", "value": 2, "score": 2},
+            {"question_id": "q2", "value": ""},
+        ], total_score=40.0, is_complete=False)
+
+        rows = {row["question_id"]: row for row in delta.as_rows()}
+        assert set(rows) == {None, "q1", "q2"}
+        assert rows[None]["count"] == 2 and rows[None]["value_counts"] == {"complete": 1}
+        assert rows["q1"]["score_sum"] == 6 and rows["q1"]["value_counts"] == {"4": 1, "2": 1}
+        assert rows["q2"]["count"] == 1 and rows["q2"]["value_counts"] == {}
+
+    def test_score_summary(self):
+        assert score_summary(0, 0.0, 0.0) == (None, None)
+        assert score_summary(2, 6.0, 20.0) == (3.0, 1.0)
+
+
+async def _active_survey(client: AsyncClient, headers) -> tuple[str, str, str]:
+    survey = (await client.post(
+        "/api/v1/surveys/",
+        json={"title": "Pulse", "mode": "change_readiness", "is_anonymous": True},
+        headers=headers,
+    )).json()
+    ids = []
+    for text, question_type in (("How ready are you?", "likert_5"), ("Comments", "text")):
+        response = await client.post(
+            f"/api/v1/surveys/{survey['id']}/questions",
+            json={"question_text": text, "question_type": question_type},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    await client.patch(f"/api/v1/surveys/{survey['id']}", json={"status": "active"}, headers=headers)
+    return survey["id"], ids[0], ids[1]
+
+
+class TestSurveyResults:
+    """Results and rebuild through the API."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_submissions(self, client: AsyncClient, headers):
+        survey_id, likert, text = await _active_survey(client, headers)
+        for score in (5, 3, 4):
+            response = await client.post(
+                f"/api/v1/surveys/{survey_id}/responses",
+                json={
+                    "answers": [
+                        {"question_id": likert, "value": score, "score": score},
+                        {"question_id": text, "value": "ok"},
+                    ],
+                    "is_complete": score != 3,
+                },
+                headers=headers,
+            )
+            assert response.status_code == 201
+
+        data = (await client.get(f"/api/v1/surveys/{survey_id}/results", headers=headers)).json()
+        assert data["response_count"] == 3
+        assert data["complete_count"] == 2
+        assert data["mean_score"] == 40.0  # unscored answers count as 0 in total_score
+        likert_result, text_result = data["questions"]
+        assert likert_result["answer_count"] == 3
+        assert likert_result["mean_score"] == 4.0
+        assert likert_result["distribution"] == {"5": 1, "3": 1, "4": 1}
+        assert text_result["answer_count"] == 3 and text_result["distribution"] == {}
+
+        # A rebuild from the stored responses reproduces the same results
+        job = (await client.post(
+            "/api/v1/surveys/results/rebuild", json={"survey_ids": [survey_id]}, headers=headers
+        )).json()
+        status = (await client.get(
+            f"/api/v1/surveys/results/rebuild/{job['job_id']}", headers=headers
+        )).json()
+        assert status["status"] == "completed"
+        assert status["processed"] == 1 and status["responses"] == 3
+
+        rebuilt = (await client.get(f"/api/v1/surveys/{survey_id}/results", headers=headers)).json()
+        assert {k: v for k, v in rebuilt.items() if k != "updated_at"} == \
+            {k: v for k, v in data.items() if k != "updated_at"}
+
+    @pytest.mark.asyncio
+    async def test_results_without_responses(self, client: AsyncClient, headers):
+        survey_id, _, _ = await _active_survey(client, headers)
+        data = (await client.get(f"/api/v1/surveys/{survey_id}/results", headers=headers)).json()
+        assert data["response_count"] == 0 and data["mean_score"] is None
+        assert [q["answer_count"] for q in data["questions"]] == [0, 0]
+
+        missing = await client.get(
+            "/api/v1/surveys/00000000-0000-0000-0000-000000000000/results", headers=headers
+        )
+        assert missing.status_code == 404
@@ -0,0 +1,58 @@
+"""
+Unit tests for per-connection tenant scoping.
+"""
+
+from src.core.tenancy import (
+    _confirm_tenant_on_commit,
+    _ensure_connection_tenant,
+    _forget_tenant_on_rollback,
+)
+
+ORG_A = "11111111-1111-1111-1111-111111111111"
+ORG_B = "22222222-2222-2222-2222-222222222222"
+
+
+class FakeConnection:
+    """Records statements; info persists like a pooled connection record."""
+
+    def __init__(self):
+        self.info = {}
+        self.executed = []
+
+    def execute(self, statement, params):
+        self.executed.append(params["org_id"])
+
+
+class TestConnectionTenant:
+    """Test when the tenant setting is (re)applied."""
+
+    def test_same_tenant_skips_round_trip(self):
+        conn = FakeConnection()
+
+        _ensure_connection_tenant(conn, ORG_A)
+        _confirm_tenant_on_commit(conn)
+        _ensure_connection_tenant(conn, ORG_A)
+
+        assert conn.executed == [ORG_A]
+
+    def test_other_tenant_and_no_tenant_rescope(self):
+        conn = FakeConnection()
+
+        _ensure_connection_tenant(conn, ORG_A)
+        _confirm_tenant_on_commit(conn)
+        _ensure_connection_tenant(conn, ORG_B)
+        _confirm_tenant_on_commit(conn)
+        _ensure_connection_tenant(conn, None)
+        _confirm_tenant_on_commit(conn)
+        _ensure_connection_tenant(conn, None)
+
+        assert conn.executed == [ORG_A, ORG_B, ""]
+
+    def test_rolled_back_setting_is_reapplied(self):
+        conn = FakeConnection()
+
+        _ensure_connection_tenant(conn, ORG_A)
+        _forget_tenant_on_rollback(conn)
+        _ensure_connection_tenant(conn, ORG_A)
+
+        assert conn.executed == [ORG_A, ORG_A]
@@ -6,6 +6,7 @@ export interface PaginatedResponse<T> {
   page: number;
   per_page: number;
   has_more: boolean;
+  next_cursor?: string | null;
 }
 
 export interface ApiError {
@@ -446,9 +447,36 @@ export interface PromptExecution {
   execution_time_ms?: number;
   status: "pending" | "completed" | "failed";
   error_message?: string;
+  batch_job_id?: string;
   created_at: string;
 }
 
+export interface PromptBatchRequest {
+  template_id: string;
+  process_ids?: string[];
+  root_id?: string;
+  level?: string;
+  temperature?: number;
+  max_tokens?: number;
+}
+
+export interface PromptBatchJob {
+  id: string;
+  template_id: string;
+  user_id: string;
+  status: "running" | "completed" | "failed";
+  total: number;
+  completed: number;
+  failed: number;
+  temperature?: number;
+  max_tokens?: number;
+  error_message?: string;
+  started_at?: string;
+  finished_at?: string;
+  created_at: string;
+  updated_at: string;
+}
+
 export interface PromptExecutionRequest {
   template_id?: string;
   custom_prompt?: string;
@@ -544,6 +572,15 @@ export interface OperatingModelSummary {
   completion_percentage: number;
 }
 
+export interface OperatingModelCompletenessRequest {
+  process_ids?: string[];
+  root_id?: string;
+}
+
+export interface OperatingModelCompletenessResponse {
+  items: OperatingModelSummary[];
+}
+
 // Operating Model — relational component types
 
 export interface ProcessRaci {